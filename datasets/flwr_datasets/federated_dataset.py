@@ -15,19 +15,30 @@
 """FederatedDataset."""
 
 
-from typing import Any, Optional, Union
+import json
+import os
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union, cast
 
 import datasets
-from datasets import Dataset, DatasetDict
+from datasets import Dataset, DatasetDict, IterableDataset, IterableDatasetDict
 from flwr_datasets.common import EventType, event
-from flwr_datasets.partitioner import Partitioner
+from flwr_datasets.partitioner import IterablePartitioner, Partitioner
 from flwr_datasets.preprocessor import Preprocessor
 from flwr_datasets.utils import (
     _check_if_dataset_tested,
+    _get_digest,
+    _get_partitioner_settings,
+    _get_preprocessor_digest,
     _instantiate_merger_if_needed,
     _instantiate_partitioners,
 )
 
+# Name of the file describing the partitions materialized in a split directory
+PARTITIONS_METADATA_FILE = "metadata.json"
+
 
 # noqa: E501
 # pylint: disable=line-too-long
@@ -52,13 +63,15 @@ class FederatedDataset:
         features, creating new features, performing any other preprocessing operation,
         or configuration dict for `Merger`. Applied after shuffling. If None,
         no operation is applied.
-    partitioners : Dict[str, Union[Partitioner, int]]
+    partitioners : Dict[str, Union[Partitioner, IterablePartitioner, int]]
         A dictionary mapping the Dataset split (a `str`) to a `Partitioner` or an `int`
         (representing the number of IID partitions that this split should be
         partitioned into, i.e., using the default partitioner
         `IidPartitioner <https://flower.ai/docs/datasets/ref-api/flwr_
         datasets.partitioner.IidPartitioner.html>`_). One or multiple `Partitioner`
-        objects can be specified in that manner, but at most, one per split.
+        objects can be specified in that manner, but at most, one per split. If
+        `streaming` is True, `IterablePartitioner` objects are expected instead (and
+        an `int` selects the `IterableIidPartitioner`).
     shuffle : bool
         Whether to randomize the order of samples. Applied prior to preprocessing
         operations, speratelly to each of the present splits in the dataset. It uses
@@ -67,6 +80,22 @@ class FederatedDataset:
         Seed used for dataset shuffling. It has no effect if `shuffle` is False. The
         seed cannot be set in the later stages. If `None`, then fresh, unpredictable
         entropy will be pulled from the OS. Defaults to 42.
+    streaming : bool
+        Whether to stream the dataset instead of downloading it. The splits are then
+        `IterableDataset` objects, partitioned on the fly by `IterablePartitioner`
+        objects, and each partition is read lazily from the stream. Shuffling uses a
+        buffer of `shuffle_buffer_size` samples. Defaults to False.
+    shuffle_buffer_size : int
+        The size of the buffer used to shuffle streamed splits. It has no effect if
+        `streaming` or `shuffle` is False. Defaults to 10_000.
+    partitions_dir : Optional[Union[str, os.PathLike[str]]]
+        Directory of the partitions written by `materialize_partitions`. If the
+        requested partition was materialized there (for the same dataset, subset,
+        shuffling, preprocessor, `load_dataset_kwargs`, and partitioner settings),
+        `load_partition` memory-maps it directly instead of preparing the dataset and
+        selecting the partition's rows. Remove the directory if the code of the
+        preprocessor or an argument that is not JSON-serializable (e.g., a function)
+        changes. Defaults to None.
     load_dataset_kwargs : Any
         Additional keyword arguments passed to `datasets.load_dataset` function.
         Currently used parameters used are dataset => path (in load_dataset),
@@ -105,6 +134,28 @@ class FederatedDataset:
     >>>     label_name="label",
     >>>     legend=True,
     >>> )
+
+    Stream a web-scale dataset and read a partition lazily, without a download:
+
+    >>> from flwr_datasets import FederatedDataset
+    >>>
+    >>> fds = FederatedDataset(
+    >>>     dataset="vicgalle/alpaca-gpt4", partitioners={"train": 1000}, streaming=True
+    >>> )
+    >>> partition = fds.load_partition(0)
+    >>> first_example = next(iter(partition))
+
+    Write each partition once as a contiguous Arrow file, e.g., before a simulation
+    in which many clients load their partitions in every round:
+
+    >>> from flwr_datasets import FederatedDataset
+    >>>
+    >>> fds = FederatedDataset(
+    >>>     dataset="mnist", partitioners={"train": 1000}, partitions_dir="./partitions"
+    >>> )
+    >>> fds.materialize_partitions()
+    >>> # Memory-mapped, does not load the dataset (also in other processes)
+    >>> partition = fds.load_partition(0)
     """
 
     # pylint: disable=too-many-instance-attributes, too-many-arguments
@@ -114,9 +165,12 @@ class FederatedDataset:
         dataset: str,
         subset: Optional[str] = None,
         preprocessor: Optional[Union[Preprocessor, dict[str, tuple[str, ...]]]] = None,
-        partitioners: dict[str, Union[Partitioner, int]],
+        partitioners: Mapping[str, Union[Partitioner, IterablePartitioner, int]],
         shuffle: bool = True,
         seed: Optional[int] = 42,
+        streaming: bool = False,
+        shuffle_buffer_size: int = 10_000,
+        partitions_dir: Optional[Union[str, os.PathLike[str]]] = None,
         **load_dataset_kwargs: Any,
     ) -> None:
         _check_if_dataset_tested(dataset)
@@ -125,27 +179,45 @@ class FederatedDataset:
         self._preprocessor: Optional[Preprocessor] = _instantiate_merger_if_needed(
             preprocessor
         )
-        self._partitioners: dict[str, Partitioner] = _instantiate_partitioners(
-            partitioners
+        self._partitioners: dict[str, Union[Partitioner, IterablePartitioner]] = (
+            _instantiate_partitioners(partitioners, streaming=streaming)
         )
         self._check_partitioners_correctness()
+        # Captured before any dataset is assigned, to validate materialized partitions
+        self._partitioners_settings = {
+            split: _get_partitioner_settings(partitioner)
+            for split, partitioner in self._partitioners.items()
+        }
         self._shuffle = shuffle
         self._seed = seed
+        self._streaming = streaming
+        self._shuffle_buffer_size = shuffle_buffer_size
+        self._partitions_dir = (
+            Path(partitions_dir) if partitions_dir is not None else None
+        )
+        if streaming and shuffle and seed is None:
+            raise ValueError(
+                "Streamed datasets need a `seed` when `shuffle` is True. Otherwise, "
+                "the order of the stream, and therefore the partitions, would differ "
+                "between the processes loading them."
+            )
         #  _dataset is prepared lazily on the first call to `load_partition`
         #  or `load_split`. See _prepare_datasets for more details
-        self._dataset: Optional[DatasetDict] = None
+        self._dataset: Optional[Union[DatasetDict, IterableDatasetDict]] = None
         # Indicate if the dataset is prepared for `load_partition` or `load_split`
         self._dataset_prepared: bool = False
         self._event = {
             "load_partition": {split: False for split in self._partitioners},
         }
         self._load_dataset_kwargs = load_dataset_kwargs
+        # Also captured upfront, as preprocessors may update themselves when called
+        self._preprocessor_digest = _get_preprocessor_digest(self._preprocessor)
 
     def load_partition(
         self,
         partition_id: int,
         split: Optional[str] = None,
-    ) -> Dataset:
+    ) -> Union[Dataset, IterableDataset]:
         """Load the partition specified by the idx in the selected split.
 
         The dataset is downloaded only when the first call to `load_partition` or
@@ -170,21 +242,26 @@ class FederatedDataset:
 
         Returns
         -------
-        partition : Dataset
-            Single partition from the dataset split.
+        partition : Union[Dataset, IterableDataset]
+            Single partition from the dataset split. It is an `IterableDataset` if
+            `streaming` is True.
         """
-        if not self._dataset_prepared:
-            self._prepare_dataset()
-        if self._dataset is None:
-            raise ValueError("Dataset is not loaded yet.")
         if split is None:
             self._check_if_no_split_keyword_possible()
             split = list(self._partitioners.keys())[0]
-        self._check_if_split_present(split)
         self._check_if_split_possible_to_federate(split)
-        partitioner: Partitioner = self._partitioners[split]
-        self._assign_dataset_to_partitioner(split)
-        partition = partitioner.load_partition(partition_id)
+        partitioner = self._partitioners[split]
+        materialized_partition = self._load_materialized_partition(partition_id, split)
+        if materialized_partition is not None:
+            partition: Union[Dataset, IterableDataset] = materialized_partition
+        else:
+            if not self._dataset_prepared:
+                self._prepare_dataset()
+            if self._dataset is None:
+                raise ValueError("Dataset is not loaded yet.")
+            self._check_if_split_present(split)
+            self._assign_dataset_to_partitioner(split)
+            partition = partitioner.load_partition(partition_id)
         if not self._event["load_partition"][split]:
             event(
                 EventType.LOAD_PARTITION_CALLED,
@@ -193,13 +270,61 @@ class FederatedDataset:
                     "dataset_name": self._dataset_name,
                     "split": split,
                     "partitioner": partitioner.__class__.__name__,
-                    "num_partitions": partitioner.num_partitions,
+                    "num_partitions": (
+                        partitioner.num_partitions
+                        if materialized_partition is None
+                        else None
+                    ),
                 },
             )
             self._event["load_partition"][split] = True
         return partition
 
-    def load_split(self, split: str) -> Dataset:
+    def materialize_partitions(self, split: Optional[str] = None) -> None:
+        """Write each partition of the split(s) as a contiguous Arrow file.
+
+        Partitioners select the rows of a partition through an indices mapping, so
+        loading a partition reads scattered rows of the dataset. This method writes
+        every partition to `partitions_dir/<split>/partition_<partition_id>` (only
+        its rows, in order), so that later calls to `load_partition`, also from
+        other processes using the same `partitions_dir`, memory-map it directly.
+
+        Parameters
+        ----------
+        split : Optional[str]
+            Name of the (partitioned) split to materialize. If None, all splits with
+            a partitioner are materialized.
+        """
+        if self._partitions_dir is None:
+            raise ValueError(
+                "Set `partitions_dir` in the constructor to materialize partitions."
+            )
+        if self._streaming:
+            raise ValueError("Partitions of streamed datasets can't be materialized.")
+        splits = list(self._partitioners.keys()) if split is None else [split]
+        for split_to_materialize in splits:
+            self._check_if_split_possible_to_federate(split_to_materialize)
+        if not self._dataset_prepared:
+            self._prepare_dataset()
+
+        for split_to_materialize in splits:
+            self._check_if_split_present(split_to_materialize)
+            self._assign_dataset_to_partitioner(split_to_materialize)
+            partitioner = self._partitioners[split_to_materialize]
+            assert isinstance(partitioner, Partitioner)
+            split_dir = self._partitions_dir / split_to_materialize
+            # Invalidate the split first, so that partially written partitions are
+            # never loaded
+            (split_dir / PARTITIONS_METADATA_FILE).unlink(missing_ok=True)
+            for partition_id in range(partitioner.num_partitions):
+                partition = partitioner.load_partition(partition_id)
+                # Saving flattens the indices mapping into a contiguous Arrow file
+                partition.save_to_disk(split_dir / f"partition_{partition_id}")
+            metadata = self._partitions_metadata(split_to_materialize)
+            metadata["num_partitions"] = partitioner.num_partitions
+            (split_dir / PARTITIONS_METADATA_FILE).write_text(json.dumps(metadata))
+
+    def load_split(self, split: str) -> Union[Dataset, IterableDataset]:
         """Load the full split of the dataset.
 
         The dataset is downloaded only when the first call to `load_partition` or
@@ -217,8 +342,9 @@ class FederatedDataset:
 
         Returns
         -------
-        dataset_split : Dataset
-            Part of the dataset identified by its split name.
+        dataset_split : Union[Dataset, IterableDataset]
+            Part of the dataset identified by its split name. It is an
+            `IterableDataset` if `streaming` is True.
         """
         if not self._dataset_prepared:
             self._prepare_dataset()
@@ -241,7 +367,7 @@ class FederatedDataset:
         return dataset_split
 
     @property
-    def partitioners(self) -> dict[str, Partitioner]:
+    def partitioners(self) -> dict[str, Union[Partitioner, IterablePartitioner]]:
         """Dictionary mapping each split to its associated partitioner.
 
         The returned partitioners have the splits of the dataset assigned to them.
@@ -311,26 +437,77 @@ class FederatedDataset:
         Therefore, for such edge cases (for which we have split) the split should
         happen before the resplitting.
         """
-        self._dataset = datasets.load_dataset(
-            path=self._dataset_name, name=self._subset, **self._load_dataset_kwargs
+        dataset = datasets.load_dataset(
+            path=self._dataset_name,
+            name=self._subset,
+            streaming=self._streaming,
+            **self._load_dataset_kwargs,
         )
-        if not isinstance(self._dataset, datasets.DatasetDict):
+        expected_type = IterableDatasetDict if self._streaming else DatasetDict
+        if not isinstance(dataset, expected_type):
             raise ValueError(
                 "Probably one of the specified parameter in `load_dataset_kwargs` "
                 "change the return type of the datasets.load_dataset function. "
-                "Make sure to use parameter such that the return type is DatasetDict. "
-                f"The return type is currently: {type(self._dataset)}."
+                "Make sure to use parameter such that the return type is "
+                f"{expected_type.__name__}. "
+                f"The return type is currently: {type(dataset)}."
             )
         if self._shuffle:
-            # Note it shuffles all the splits. The self._dataset is DatasetDict
+            # Note it shuffles all the splits. The dataset is a DatasetDict
             # so e.g. {"train": train_data, "test": test_data}. All splits get shuffled.
-            self._dataset = self._dataset.shuffle(seed=self._seed)
+            if isinstance(dataset, IterableDatasetDict):
+                # Streamed splits are shuffled approximately, through a buffer
+                dataset = dataset.shuffle(
+                    seed=self._seed, buffer_size=self._shuffle_buffer_size
+                )
+            else:
+                dataset = dataset.shuffle(seed=self._seed)
         if self._preprocessor:
-            self._dataset = self._preprocessor(self._dataset)
+            # Preprocessors built on `datasets` operations (e.g., `Merger`) also work
+            # on streamed splits
+            dataset = self._preprocessor(cast(DatasetDict, dataset))
+        self._dataset = dataset
         available_splits = list(self._dataset.keys())
         self._event["load_split"] = {split: False for split in available_splits}
         self._dataset_prepared = True
 
+    def _partitions_metadata(self, split: str) -> dict[str, Any]:
+        """Describe the partitions of the split, to validate materialized ones."""
+        return {
+            "dataset": self._dataset_name,
+            "subset": self._subset,
+            "shuffle": self._shuffle,
+            "seed": self._seed,
+            "partitioner": self._partitioners[split].__class__.__name__,
+            "partitioner_settings": self._partitioners_settings[split],
+            "load_dataset_kwargs": _get_digest(self._load_dataset_kwargs),
+            "preprocessor": self._preprocessor_digest,
+        }
+
+    def _load_materialized_partition(
+        self, partition_id: int, split: str
+    ) -> Optional[Dataset]:
+        """Load the partition from `partitions_dir` if it was materialized there."""
+        if self._partitions_dir is None or self._streaming:
+            return None
+        split_dir = self._partitions_dir / split
+        metadata_path = split_dir / PARTITIONS_METADATA_FILE
+        if not metadata_path.exists():
+            return None
+        metadata = json.loads(metadata_path.read_text())
+        expected_metadata = self._partitions_metadata(split)
+        if any(metadata.get(key) != value for key, value in expected_metadata.items()):
+            warnings.warn(
+                f"The partitions materialized in '{split_dir}' were created with "
+                f"different settings ({metadata}) and are ignored. Call "
+                "`materialize_partitions` to update them.",
+                stacklevel=2,
+            )
+            return None
+        if not 0 <= partition_id < metadata["num_partitions"]:
+            return None
+        return datasets.load_from_disk(str(split_dir / f"partition_{partition_id}"))
+
     def _check_if_no_split_keyword_possible(self) -> None:
         if len(self._partitioners) != 1:
             raise ValueError(
@@ -16,8 +16,9 @@
 # pylint: disable=W0212, C0103, C0206
 
 
+import tempfile
 import unittest
-from typing import Union
+from typing import Any, Callable, Union
 from unittest.mock import Mock, patch
 
 import numpy as np
@@ -25,13 +26,25 @@ import pytest
 from parameterized import parameterized, parameterized_class
 
 import datasets
-from datasets import Dataset, DatasetDict, concatenate_datasets
+from datasets import (
+    Dataset,
+    DatasetDict,
+    IterableDataset,
+    IterableDatasetDict,
+    concatenate_datasets,
+)
 from flwr_datasets.federated_dataset import FederatedDataset
 from flwr_datasets.mock_utils_test import (
     _load_mocked_dataset,
     _load_mocked_dataset_dict_by_partial_download,
 )
-from flwr_datasets.partitioner import IidPartitioner, NaturalIdPartitioner, Partitioner
+from flwr_datasets.partitioner import (
+    DirichletPartitioner,
+    IidPartitioner,
+    IterableIidPartitioner,
+    NaturalIdPartitioner,
+    Partitioner,
+)
 from flwr_datasets.preprocessor.divider import Divider
 
 mocked_datasets = ["cifar100", "svhn", "sentiment140", "speech_commands"]
@@ -376,6 +389,187 @@ class ShufflingResplittingOnArtificialDatasetTest(unittest.TestCase):
         self.assertEqual(expected_result, result)
 
 
+class StreamingFederatedDatasetTest(unittest.TestCase):
+    """Test `FederatedDataset` in the streaming mode on an artificial dataset."""
+
+    def _dummy_setup(self, train_rows: int = 100) -> IterableDatasetDict:
+        """Create a dummy IterableDatasetDict with a train split."""
+        train = Dataset.from_dict({"features": list(range(train_rows))})
+        return IterableDatasetDict({"train": train.to_iterable_dataset(num_shards=4)})
+
+    @patch("datasets.load_dataset")
+    def test_partitions_are_streamed(self, mock_func: Mock) -> None:
+        """Test if the partitions are streamed and cover the whole split."""
+        mock_func.return_value = self._dummy_setup()
+        fds = FederatedDataset(
+            dataset="does-not-matter", partitioners={"train": 10}, streaming=True
+        )
+
+        partitions = [fds.load_partition(partition_id) for partition_id in range(10)]
+
+        self.assertTrue(mock_func.call_args.kwargs["streaming"])
+        self.assertIsInstance(fds.partitioners["train"], IterableIidPartitioner)
+        self.assertTrue(all(isinstance(p, IterableDataset) for p in partitions))
+        features = [example["features"] for p in partitions for example in p]
+        self.assertEqual(sorted(features), list(range(100)))
+
+    def test_map_style_partitioner_raises(self) -> None:
+        """Test if a Partitioner (for map-style datasets) is rejected."""
+        with self.assertRaises(ValueError):
+            FederatedDataset(
+                dataset="does-not-matter",
+                partitioners={"train": IidPartitioner(num_partitions=10)},
+                streaming=True,
+            )
+
+    def test_shuffle_without_seed_raises(self) -> None:
+        """Test if shuffling a stream without a seed is rejected."""
+        with self.assertRaises(ValueError):
+            FederatedDataset(
+                dataset="does-not-matter",
+                partitioners={"train": 10},
+                streaming=True,
+                seed=None,
+            )
+
+
+class MaterializedPartitionsTest(unittest.TestCase):
+    """Test materializing the partitions of `FederatedDataset` on disk."""
+
+    def setUp(self) -> None:
+        """Mock the dataset download and create a directory for the partitions."""
+        self.dataset = DatasetDict(
+            {
+                "train": Dataset.from_dict(
+                    {
+                        "features": list(range(100)),
+                        "label": [i % 4 for i in range(100)],
+                    }
+                )
+            }
+        )
+        self.patcher = patch("datasets.load_dataset")
+        self.mock_load_dataset = self.patcher.start()
+        self.mock_load_dataset.return_value = self.dataset
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    def tearDown(self) -> None:
+        """Clean up the mock and the directory."""
+        patch.stopall()
+        self.tmp_dir.cleanup()
+
+    def _federated_dataset(
+        self,
+        seed: int = 42,
+        partitioner: Union[Partitioner, int] = 10,
+        **kwargs: Any,
+    ) -> FederatedDataset:
+        return FederatedDataset(
+            dataset="does-not-matter",
+            partitioners={"train": partitioner},
+            seed=seed,
+            partitions_dir=self.tmp_dir.name,
+            **kwargs,
+        )
+
+    def test_load_materialized_partition(self) -> None:
+        """Test if materialized partitions are loaded without preparing the data."""
+        fds = self._federated_dataset()
+        expected = fds.load_partition(3)["features"]
+        fds.materialize_partitions()
+        self.mock_load_dataset.reset_mock()
+
+        partition = self._federated_dataset().load_partition(3)
+
+        self.mock_load_dataset.assert_not_called()
+        self.assertIsInstance(partition, Dataset)
+        self.assertIsNone(partition._indices)
+        self.assertEqual(partition["features"], expected)
+
+    def test_materialized_partitions_with_other_settings_are_ignored(self) -> None:
+        """Test if partitions materialized with another seed are not used."""
+        self._federated_dataset(seed=42).materialize_partitions()
+        fds = self._federated_dataset(seed=7)
+        expected = self.dataset["train"].shuffle(seed=7)["features"][:10]
+
+        with self.assertWarns(UserWarning):
+            partition = fds.load_partition(0)
+
+        self.assertEqual(partition["features"], expected)
+
+    @parameterized.expand(  # type: ignore
+        [
+            ("num_partitions", lambda: 10, lambda: 5),
+            (
+                "alpha",
+                lambda: _dirichlet_partitioner(alpha=0.5, seed=42),
+                lambda: _dirichlet_partitioner(alpha=1.0, seed=42),
+            ),
+            (
+                "seed",
+                lambda: _dirichlet_partitioner(alpha=0.5, seed=42),
+                lambda: _dirichlet_partitioner(alpha=0.5, seed=7),
+            ),
+        ]
+    )
+    def test_materialized_partitions_with_other_partitioner_are_ignored(
+        self,
+        _: str,
+        materialized_partitioner_fn: Callable[[], Union[Partitioner, int]],
+        partitioner_fn: Callable[[], Union[Partitioner, int]],
+    ) -> None:
+        """Test if partitions materialized with another partitioner are not used."""
+        self._federated_dataset(
+            partitioner=materialized_partitioner_fn()
+        ).materialize_partitions()
+        fds = self._federated_dataset(partitioner=partitioner_fn())
+        expected = FederatedDataset(
+            dataset="does-not-matter", partitioners={"train": partitioner_fn()}
+        ).load_partition(3)
+
+        with self.assertWarns(UserWarning):
+            partition = fds.load_partition(3)
+
+        self.assertEqual(partition["features"], expected["features"])
+
+    @parameterized.expand(  # type: ignore
+        [
+            ("load_dataset_kwargs", {}, {"revision": "v2"}),
+            ("preprocessor", {}, {"preprocessor": {"train": ("train",)}}),
+            (
+                "preprocessor_config",
+                {"preprocessor": {"train": ("train",)}},
+                {"preprocessor": {"train": ("train", "train")}},
+            ),
+        ]
+    )
+    def test_materialized_partitions_with_other_loading_are_ignored(
+        self,
+        _: str,
+        materialized_kwargs: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Test if partitions materialized with another loading are not used."""
+        self._federated_dataset(**materialized_kwargs).materialize_partitions()
+        self.mock_load_dataset.reset_mock()
+        fds = self._federated_dataset(**kwargs)
+
+        with self.assertWarns(UserWarning):
+            fds.load_partition(3)
+
+        self.mock_load_dataset.assert_called_once()
+
+
+def _dirichlet_partitioner(alpha: float, seed: int) -> DirichletPartitioner:
+    return DirichletPartitioner(
+        num_partitions=5,
+        partition_by="label",
+        alpha=alpha,
+        min_partition_size=0,
+        seed=seed,
+    )
+
+
 class PartitionersSpecificationForFederatedDatasets(unittest.TestCase):
     """Test the specifications of partitioners for `FederatedDataset`."""
 
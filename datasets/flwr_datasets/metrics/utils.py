@@ -18,9 +18,11 @@
 import warnings
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 
-from flwr_datasets.partitioner import Partitioner
+from flwr_datasets.common.typing import NDArray, NDArrayInt
+from flwr_datasets.partitioner import IidPartitioner, Partitioner
 
 
 def compute_counts(
@@ -106,16 +108,26 @@ def compute_counts(
     except AttributeError:  # If the column_name is not formally a Label
         unique_labels = partitioner.dataset.unique(column_name)
 
-    partition_id_to_label_absolute_size = {}
-    for partition_id in range(max_num_partitions):
-        partition = partitioner.load_partition(partition_id)
-        partition_id_to_label_absolute_size[partition_id] = _compute_counts(
-            partition[column_name], unique_labels
-        )
-
-    dataframe = pd.DataFrame.from_dict(
-        partition_id_to_label_absolute_size, orient="index"
+    partition_id_to_indices = _get_partition_id_to_indices(
+        partitioner, max_num_partitions
     )
+    if partition_id_to_indices is not None:
+        # Count all partitions at once, without materializing them
+        dataframe = _compute_counts_from_indices(
+            partitioner.dataset.with_format("numpy")[column_name],
+            partition_id_to_indices,
+            unique_labels,
+        )
+    else:
+        partition_id_to_label_absolute_size = {}
+        for partition_id in range(max_num_partitions):
+            partition = partitioner.load_partition(partition_id)
+            partition_id_to_label_absolute_size[partition_id] = _compute_counts(
+                partition[column_name], unique_labels
+            )
+        dataframe = pd.DataFrame.from_dict(
+            partition_id_to_label_absolute_size, orient="index"
+        )
     dataframe.index.name = "Partition ID"
 
     if verbose_names:
@@ -236,6 +248,103 @@ def _compute_counts(
     return label_counts_with_zeros
 
 
+def _get_partition_id_to_indices(
+    partitioner: Partitioner, num_partitions: int
+) -> Optional[list[NDArrayInt]]:
+    """Get the indices of the rows of the first partitions, if known upfront.
+
+    The indices are derived from the state of the partitioner, without loading the
+    partitions. `None` is returned if the partitioner does not expose them (e.g.,
+    vertical partitioners).
+
+    Parameters
+    ----------
+    partitioner : Partitioner
+        Partitioner with an assigned dataset on which `load_partition` was called.
+    num_partitions : int
+        The number of partitions (starting from partition id 0) to consider.
+
+    Returns
+    -------
+    partition_id_to_indices : Optional[list[NDArrayInt]]
+        The indices of the rows of each partition in `partitioner.dataset`.
+    """
+    if isinstance(partitioner, IidPartitioner):
+        # Same boundaries as `Dataset.shard(..., contiguous=True)`
+        num_rows = partitioner.dataset.num_rows
+        div, mod = divmod(num_rows, partitioner.num_partitions)
+        return [
+            np.arange(
+                div * partition_id + min(partition_id, mod),
+                div * (partition_id + 1) + min(partition_id + 1, mod),
+            )
+            for partition_id in range(num_partitions)
+        ]
+    # Most partitioners assign the indices of all partitions in this mapping
+    mapping = getattr(partitioner, "_partition_id_to_indices", None)
+    if not isinstance(mapping, dict) or not all(
+        partition_id in mapping for partition_id in range(num_partitions)
+    ):
+        return None
+    return [
+        np.asarray(mapping[partition_id], dtype=np.int64)
+        for partition_id in range(num_partitions)
+    ]
+
+
+def _compute_counts_from_indices(
+    labels: NDArray,
+    partition_id_to_indices: list[NDArrayInt],
+    unique_labels: Union[list[int], list[str]],
+) -> pd.DataFrame:
+    """Compute the counts of labels of all partitions in a single pass.
+
+    Each row is assigned the key `partition_id * len(unique_labels) + label_index`,
+    so that a single `np.bincount` gives the partition x label count matrix.
+
+    Parameters
+    ----------
+    labels: NDArray
+        The labels of the whole dataset.
+    partition_id_to_indices: list[NDArrayInt]
+        The indices of the rows of each partition.
+    unique_labels: Union[List[int], List[str]]
+        The reference all unique label. Needed to avoid missing any label, instead
+        having the value equal to zero for them.
+
+    Returns
+    -------
+    dataframe: pd.DataFrame
+        DataFrame with the partition ids as the index and the labels as columns.
+    """
+    if len(unique_labels) != len(set(unique_labels)):
+        raise ValueError("unique_labels must contain unique elements only.")
+    num_partitions = len(partition_id_to_indices)
+    num_labels = len(unique_labels)
+    columns = pd.Index(unique_labels)
+    try:
+        # Same column order as the alignment of the counts in `_compute_counts`
+        columns = columns.sort_values()
+    except TypeError:
+        pass
+    label_indices = columns.get_indexer(labels)
+
+    indices = np.concatenate([np.empty(0, dtype=np.int64), *partition_id_to_indices])
+    partition_ids = np.repeat(
+        np.arange(num_partitions),
+        [len(partition_indices) for partition_indices in partition_id_to_indices],
+    )
+    row_label_indices = label_indices[indices]
+    known = row_label_indices >= 0
+    keys = partition_ids[known] * num_labels + row_label_indices[known]
+    counts = np.bincount(keys, minlength=num_partitions * num_labels)
+    return pd.DataFrame(
+        counts.reshape(num_partitions, num_labels),
+        index=np.arange(num_partitions),
+        columns=columns,
+    )
+
+
 def _compute_frequencies(
     labels: Union[list[int], list[str]], unique_labels: Union[list[int], list[str]]
 ) -> pd.Series:
@@ -28,7 +28,12 @@ from flwr_datasets.metrics.utils import (
     compute_counts,
     compute_frequencies,
 )
-from flwr_datasets.partitioner import IidPartitioner
+from flwr_datasets.partitioner import (
+    DirichletPartitioner,
+    IidPartitioner,
+    NaturalIdPartitioner,
+    Partitioner,
+)
 
 
 @parameterized_class(
@@ -135,6 +140,52 @@ class TestPublicMetricsUtils(unittest.TestCase):
         pd.testing.assert_frame_equal(count, self.result)
 
 
+class TestVectorizedComputeCounts(unittest.TestCase):
+    """Test that the counts computed from the indices match the partitions."""
+
+    @parameterized.expand(  # type: ignore
+        [
+            ("iid", IidPartitioner(num_partitions=7), "label"),
+            (
+                "dirichlet",
+                DirichletPartitioner(
+                    num_partitions=5,
+                    partition_by="label",
+                    alpha=0.5,
+                    min_partition_size=0,
+                    seed=42,
+                ),
+                "label",
+            ),
+            ("natural_id", NaturalIdPartitioner(partition_by="user"), "user"),
+        ]
+    )
+    def test_compute_counts_matches_partitions(
+        self, _: str, partitioner: Partitioner, column_name: str
+    ) -> None:
+        """Test if the counts match the labels of the loaded partitions."""
+        # Prepare
+        partitioner.dataset = datasets.Dataset.from_dict(
+            {
+                "label": [i % 4 for i in range(100)],
+                "user": [f"user_{i % 3}" for i in range(100)],
+            }
+        )
+
+        # Execute
+        count = compute_counts(partitioner, column_name=column_name)
+
+        # Assert
+        unique_labels = partitioner.dataset.unique(column_name)
+        for partition_id in range(partitioner.num_partitions):
+            expected = _compute_counts(
+                partitioner.load_partition(partition_id)[column_name], unique_labels
+            )
+            pd.testing.assert_series_equal(
+                count.loc[partition_id], expected, check_names=False
+            )
+
+
 class TestPrivateMetricsUtils(unittest.TestCase):
     """Test metrics utils."""
 
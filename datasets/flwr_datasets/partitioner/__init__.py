@@ -23,6 +23,9 @@ from .grouped_natural_id_partitioner import GroupedNaturalIdPartitioner
 from .id_to_size_fnc_partitioner import IdToSizeFncPartitioner
 from .iid_partitioner import IidPartitioner
 from .inner_dirichlet_partitioner import InnerDirichletPartitioner
+from .iterable_iid_partitioner import IterableIidPartitioner
+from .iterable_natural_id_partitioner import IterableNaturalIdPartitioner
+from .iterable_partitioner import IterablePartitioner
 from .linear_partitioner import LinearPartitioner
 from .natural_id_partitioner import NaturalIdPartitioner
 from .partitioner import Partitioner
@@ -42,6 +45,9 @@ __all__ = [
     "IdToSizeFncPartitioner",
     "IidPartitioner",
     "InnerDirichletPartitioner",
+    "IterableIidPartitioner",
+    "IterableNaturalIdPartitioner",
+    "IterablePartitioner",
     "LinearPartitioner",
     "NaturalIdPartitioner",
     "Partitioner",
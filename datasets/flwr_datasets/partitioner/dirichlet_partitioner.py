@@ -21,7 +21,7 @@ from typing import Optional, Union
 import numpy as np
 
 import datasets
-from flwr_datasets.common.typing import NDArrayFloat
+from flwr_datasets.common.typing import NDArrayFloat, NDArrayInt
 from flwr_datasets.partitioner.partitioner import Partitioner
 
 
@@ -111,7 +111,7 @@ class DirichletPartitioner(Partitioner):
         # The attributes below are determined during the first call to load_partition
         self._avg_num_of_samples_per_partition: Optional[float] = None
         self._unique_classes: Optional[Union[list[int], list[str]]] = None
-        self._partition_id_to_indices: dict[int, list[int]] = {}
+        self._partition_id_to_indices: dict[int, NDArrayInt] = {}
         self._partition_id_to_indices_determined = False
 
     def load_partition(self, partition_id: int) -> datasets.Dataset:
@@ -209,30 +209,33 @@ class DirichletPartitioner(Partitioner):
             self.dataset.num_rows / self._num_partitions
         )
 
-        # Change targets list data type to numpy
-        targets = np.array(self.dataset[self._partition_by])
+        # Group the indices of the samples by class, in the order of the classes
+        targets = np.asarray(self.dataset[self._partition_by])
+        class_ids = np.searchsorted(np.asarray(self._unique_classes), targets)
+        indices_by_class = np.argsort(class_ids, kind="stable")
+        class_bounds = np.cumsum(
+            np.bincount(class_ids, minlength=len(self._unique_classes))
+        )
 
         # Repeat the sampling procedure based on the Dirichlet distribution until the
         # min_partition_size is reached.
         sampling_try = 0
         while True:
-            # Prepare data structure to store indices assigned to partition ids
-            partition_id_to_indices: dict[int, list[int]] = {}
-            for nid in range(self._num_partitions):
-                partition_id_to_indices[nid] = []
-
-            # Iterated over all unique labels (they are not necessarily of type int)
-            for k in self._unique_classes:
-                # Access all the indices associated with class k
-                indices_representing_class_k = np.nonzero(targets == k)[0]
-                # Determine division (the fractions) of the data representing class k
-                # among the partitions
-                class_k_division_proportions = self._rng.dirichlet(self._alpha)
-                nid_to_proportion_of_k_samples = {}
-                for nid in range(self._num_partitions):
-                    nid_to_proportion_of_k_samples[nid] = class_k_division_proportions[
-                        nid
-                    ]
+            # Determine division (the fractions) of the data representing each class
+            # among the partitions
+            division_proportions = self._rng.dirichlet(
+                self._alpha, size=len(self._unique_classes)
+            )
+            # Partition id of each sample, in the order of `indices_by_class`
+            sample_partition_ids = np.empty(len(indices_by_class), dtype=np.int64)
+            partition_sizes = np.zeros(self._num_partitions, dtype=np.int64)
+
+            # The classes are processed sequentially, as the balancing depends on the
+            # samples assigned from the previous classes
+            for k, (class_start, class_end) in enumerate(
+                zip([0, *class_bounds[:-1]], class_bounds)
+            ):
+                class_k_division_proportions = division_proportions[k]
                 # Balancing (not mentioned in the paper but implemented)
                 # Do not assign additional samples to the partition if it already has
                 # more than the average numbers of samples per partition. Note that it
@@ -240,53 +243,41 @@ class DirichletPartitioner(Partitioner):
                 # the reason for more sparse division that the alpha might suggest.
                 if self._self_balancing:
                     assert self._avg_num_of_samples_per_partition is not None
-                    for nid in nid_to_proportion_of_k_samples.copy():
-                        if (
-                            len(partition_id_to_indices[nid])
-                            > self._avg_num_of_samples_per_partition
-                        ):
-                            nid_to_proportion_of_k_samples[nid] = 0
-
+                    class_k_division_proportions = np.where(
+                        partition_sizes > self._avg_num_of_samples_per_partition,
+                        0.0,
+                        class_k_division_proportions,
+                    )
                     # Normalize the proportions such that they sum up to 1
-                    sum_proportions = sum(nid_to_proportion_of_k_samples.values())
-                    for nid, prop in nid_to_proportion_of_k_samples.copy().items():
-                        nid_to_proportion_of_k_samples[nid] = prop / sum_proportions
+                    cumsum_proportions = np.cumsum(class_k_division_proportions)
+                    class_k_division_proportions = (
+                        class_k_division_proportions / cumsum_proportions[-1]
+                    )
 
                 # Determine the split indices
-                cumsum_division_fractions = np.cumsum(
-                    list(nid_to_proportion_of_k_samples.values())
-                )
-                cumsum_division_numbers = cumsum_division_fractions * len(
-                    indices_representing_class_k
+                num_class_k_samples = class_end - class_start
+                cumsum_division_numbers = (
+                    np.cumsum(class_k_division_proportions) * num_class_k_samples
                 )
-                # [:-1] is because the np.split requires the division indices but the
-                # last element represents the sum = total number of samples
+                # [:-1] is because the last element represents the sum = total number
+                # of samples
                 indices_on_which_split = cumsum_division_numbers.astype(int)[:-1]
-
-                split_indices = np.split(
-                    indices_representing_class_k, indices_on_which_split
+                class_k_partition_ids = np.searchsorted(
+                    indices_on_which_split, np.arange(num_class_k_samples), side="right"
+                )
+                sample_partition_ids[class_start:class_end] = class_k_partition_ids
+                partition_sizes += np.bincount(
+                    class_k_partition_ids, minlength=self._num_partitions
                 )
-
-                # Append new indices (coming from class k) to the existing indices
-                for nid, indices in partition_id_to_indices.items():
-                    indices.extend(split_indices[nid].tolist())
 
             # Determine if the indices assignment meets the min_partition_size
             # If it does not mean the requirement repeat the Dirichlet sampling process
             # Otherwise break the while loop
-            min_sample_size_on_client = min(
-                len(indices) for indices in partition_id_to_indices.values()
-            )
-            if min_sample_size_on_client >= self._min_partition_size:
+            if partition_sizes.min() >= self._min_partition_size:
                 break
-            sample_sizes = [
-                len(indices) for indices in partition_id_to_indices.values()
-            ]
-            alpha_not_met = [
-                self._alpha[i]
-                for i, ss in enumerate(sample_sizes)
-                if ss == min(sample_sizes)
-            ]
+            alpha_not_met = self._alpha[
+                partition_sizes == partition_sizes.min()
+            ].tolist()
             mssg_list_alphas = (
                 (
                     "Generating partitions by sampling from a list of very wide range "
@@ -314,6 +305,17 @@ class DirichletPartitioner(Partitioner):
                 )
             sampling_try += 1
 
+        # Collect the indices of each partition (ordered by class, then by index)
+        partition_order = np.argsort(sample_partition_ids, kind="stable")
+        partition_id_to_indices = dict(
+            enumerate(
+                np.split(
+                    indices_by_class[partition_order],
+                    np.cumsum(partition_sizes)[:-1],
+                )
+            )
+        )
+
         # Shuffle the indices not to have the datasets with targets in sequences like
         # [00000, 11111, ...]) if the shuffle is True
         if self._shuffle:
@@ -99,6 +99,15 @@ class TestDirichletPartitionerSuccess(unittest.TestCase):
             and len(partitioner._partition_id_to_indices) == num_partitions
         )
 
+    @parameterized.expand([(True,), (False,)])  # type: ignore
+    def test_partitions_cover_the_dataset(self, self_balancing: bool) -> None:
+        """Test that each sample is assigned to exactly one partition."""
+        _, partitioner = _dummy_setup(10, 0.5, 1000, "labels", self_balancing)
+        partitioner._min_partition_size = 0
+        partitioner._determine_partition_id_to_indices_if_needed()
+        indices = np.concatenate(list(partitioner._partition_id_to_indices.values()))
+        self.assertEqual(sorted(indices.tolist()), list(range(1000)))
+
     def test__determine_partition_id_to_indices_if_needed_consistency(
         self,
     ) -> None:
@@ -14,7 +14,7 @@
 # ==============================================================================
 """InnerDirichlet partitioner."""
 import warnings
-from typing import Optional, Union, cast
+from typing import Optional, Union
 
 import numpy as np
 
@@ -91,7 +91,7 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
         self._num_unique_classes: Optional[int] = None
         self._num_partitions = len(self._partition_sizes)
 
-        self._partition_id_to_indices: dict[int, list[int]] = {}
+        self._partition_id_to_indices: dict[int, NDArrayInt] = {}
         self._partition_id_to_indices_determined = False
 
     def load_partition(self, partition_id: int) -> datasets.Dataset:
@@ -189,9 +189,9 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
             )
         return alpha
 
-    def _determine_partition_id_to_indices_if_needed(
+    def _determine_partition_id_to_indices_if_needed(  # pylint: disable=R0914
         self,
-    ) -> None:  # pylint: disable=R0914
+    ) -> None:
         """Create an assignment of indices to the partition indices."""
         if self._partition_id_to_indices_determined:
             return
@@ -210,29 +210,31 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
             for cid in range(self._num_partitions)
         ]
 
-        # Node id to number of sample left for allocation for that partition id
-        partition_id_to_left_to_allocate = dict(
-            zip(range(self._num_partitions), self._partition_sizes)
-        )
+        # Partition id to number of samples left for allocation for that partition id
+        partition_id_to_left_to_allocate = self._partition_sizes.astype(np.int64)
+        num_left_to_allocate = int(partition_id_to_left_to_allocate.sum())
+        # Cumulative class priors to sample classes with a single uniform draw
+        # (equivalent to `self._rng.choice(num_unique_classes, p=class_priors[cid])`)
+        class_priors_cdf = _normalized_cdf(class_priors)
 
         not_full_partition_ids = list(range(self._num_partitions))
-        while np.sum(list(partition_id_to_left_to_allocate.values())) != 0:
-            # Choose a partition
-            current_partition_id = self._rng.choice(not_full_partition_ids)
+        while num_left_to_allocate != 0:
+            # Choose a partition (equivalent to `self._rng.choice`)
+            current_partition_id = not_full_partition_ids[
+                self._rng.integers(0, len(not_full_partition_ids))
+            ]
             # If current partition is full resample a client
             if partition_id_to_left_to_allocate[current_partition_id] == 0:
                 # When the partition is full, exclude it from the sampling list
-                not_full_partition_ids.pop(
-                    not_full_partition_ids.index(current_partition_id)
-                )
+                not_full_partition_ids.remove(current_partition_id)
                 continue
             partition_id_to_left_to_allocate[current_partition_id] -= 1
-            # Access the label distribution of the chosen client
-            current_probabilities = class_priors[current_partition_id]
+            num_left_to_allocate -= 1
             while True:
-                # curr_class = np.argmax(np.random.uniform() <= curr_prior)
-                curr_class = self._rng.choice(
-                    list(range(self._num_unique_classes)), p=current_probabilities
+                curr_class = int(
+                    class_priors_cdf[current_partition_id].searchsorted(
+                        self._rng.random(), side="right"
+                    )
                 )
                 # Redraw class label if there are no samples left to be allocated from
                 # that class
@@ -242,8 +244,7 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
                     # Renormalize such that the probability sums to 1
                     row_sums = class_priors.sum(axis=1, keepdims=True)
                     class_priors = class_priors / row_sums
-                    # Adjust the current_probabilities (it won't sum up to 1 otherwise)
-                    current_probabilities = class_priors[current_partition_id]
+                    class_priors_cdf = _normalized_cdf(class_priors)
                     continue
                 class_sizes[curr_class] -= 1
                 # Store sample index at the empty array cell
@@ -253,10 +254,7 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
                 ]
                 break
 
-        partition_id_to_indices = cast(
-            dict[int, list[int]],
-            {cid: client_indices[cid].tolist() for cid in range(self._num_partitions)},
-        )
+        partition_id_to_indices = dict(enumerate(client_indices))
         # Shuffle the indices if the shuffle is True.
         # Note that the samples from this partitioning do not necessarily require
         # shuffling, the order should exhibit consecutive samples.
@@ -304,6 +302,13 @@ class InnerDirichletPartitioner(Partitioner):  # pylint: disable=R0902
             )
 
 
+def _normalized_cdf(probabilities: NDArrayFloat) -> NDArrayFloat:
+    """Compute the cumulative distribution of each row, as `Generator.choice` does."""
+    cdf = np.cumsum(probabilities, axis=1)
+    cdf /= cdf[:, -1:]
+    return cdf
+
+
 def _instantiate_partition_sizes(
     partition_sizes: Union[list[int], NDArrayInt],
 ) -> NDArrayInt:
@@ -0,0 +1,160 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""IID partitioner class that works with streamed Hugging Face Datasets."""
+
+
+import hashlib
+from typing import Any, Optional
+
+import numpy as np
+
+from datasets import IterableDataset
+from flwr_datasets.partitioner.iterable_partitioner import (
+    IterablePartitioner,
+    _hash_to_partition_ids,
+)
+
+
+class IterableIidPartitioner(IterablePartitioner):
+    """Partitioner assigning each row of a stream to a partition by hashing.
+
+    A stable key of each row is hashed (with a seed) to one of the partitions, which
+    yields IID partitions of approximately equal sizes without knowing the size of
+    the dataset. Each partition is a lazily filtered stream. The key is the value of
+    `key_column` if given, and a digest of the row's content otherwise, so the
+    assignment does not depend on the order of the stream nor on how it is split
+    across nodes or data loader workers. Note that identical rows always land in the
+    same partition.
+
+    Parameters
+    ----------
+    num_partitions : int
+        The total number of partitions that the data will be divided into.
+    seed : int
+        Seed of the hash assigning the rows to partitions. Defaults to 42.
+    key_column : Optional[str]
+        The name of a column holding a unique id of each row (e.g., a sample id) to
+        hash instead of the content of the rows. Defaults to None.
+
+    Examples
+    --------
+    >>> from flwr_datasets import FederatedDataset
+    >>> from flwr_datasets.partitioner import IterableIidPartitioner
+    >>>
+    >>> partitioner = IterableIidPartitioner(num_partitions=1000)
+    >>> fds = FederatedDataset(
+    >>>     dataset="vicgalle/alpaca-gpt4",
+    >>>     partitioners={"train": partitioner},
+    >>>     streaming=True,
+    >>> )
+    >>> partition = fds.load_partition(0)
+    >>> print(next(iter(partition)))  # Print the first example
+    """
+
+    def __init__(
+        self, num_partitions: int, seed: int = 42, key_column: Optional[str] = None
+    ) -> None:
+        super().__init__()
+        if num_partitions <= 0:
+            raise ValueError("The number of partitions must be greater than zero.")
+        self._num_partitions = num_partitions
+        self._seed = seed
+        self._key_column = key_column
+
+    def load_partition(self, partition_id: int) -> IterableDataset:
+        """Load a single IID partition based on the partition index.
+
+        Parameters
+        ----------
+        partition_id : int
+            the index that corresponds to the requested partition
+
+        Returns
+        -------
+        dataset_partition : IterableDataset
+            single dataset partition, streamed lazily
+        """
+        self._check_partition_id(partition_id)
+        if (
+            self._key_column is not None
+            and self.dataset.column_names is not None
+            and self._key_column not in self.dataset.column_names
+        ):
+            raise ValueError(
+                f"The specified 'key_column': '{self._key_column}' is not "
+                f"present in the dataset. The dataset contains columns "
+                f"{self.dataset.column_names}."
+            )
+
+        def in_partition(batch: dict[str, list[Any]]) -> list[bool]:
+            # Positions restart in every shard (e.g., with `split_dataset_by_node` or
+            # several data loader workers), hash the content of the rows instead
+            columns = (
+                [batch[self._key_column]]
+                if self._key_column is not None
+                else [batch[name] for name in sorted(batch)]
+            )
+            num_rows = len(columns[0]) if columns else 0
+            keys = np.fromiter(
+                (_row_key([column[i] for column in columns]) for i in range(num_rows)),
+                dtype=np.uint64,
+                count=num_rows,
+            )
+            partition_ids = _hash_to_partition_ids(
+                keys, self._num_partitions, self._seed
+            )
+            return (partition_ids == partition_id).tolist()  # type: ignore
+
+        return self.dataset.filter(in_partition, batched=True)
+
+    @property
+    def num_partitions(self) -> int:
+        """Total number of partitions."""
+        return self._num_partitions
+
+
+def _row_key(values: list[Any]) -> int:
+    """Return a 64-bit key of the row values that is stable across processes."""
+    digest = hashlib.blake2b(digest_size=8)
+    for value in values:
+        _update_digest(digest, value)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def _update_digest(digest: Any, value: Any) -> None:
+    """Feed a canonical serialization of a (nested) row value to the digest."""
+    if isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b"]")
+    elif isinstance(value, bytes):
+        digest.update(len(value).to_bytes(8, "little") + value)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif hasattr(value, "tobytes") and hasattr(value, "mode"):
+        # Decoded images (PIL), whose `repr` contains the memory address
+        digest.update(f"{value.mode}{value.size}".encode())
+        digest.update(value.tobytes())
+    else:
+        encoded = repr(value).encode()
+        digest.update(len(encoded).to_bytes(8, "little") + encoded)
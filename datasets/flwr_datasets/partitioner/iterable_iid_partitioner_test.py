@@ -0,0 +1,115 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""IterableIidPartitioner tests."""
+
+
+import unittest
+
+from parameterized import parameterized
+
+from datasets import Dataset
+from datasets.distributed import split_dataset_by_node
+from flwr_datasets.partitioner.iterable_iid_partitioner import IterableIidPartitioner
+
+
+def _dummy_setup(num_partitions: int, num_rows: int) -> IterableIidPartitioner:
+    """Create a partitioner with a streamed dummy dataset assigned to it."""
+    dataset = Dataset.from_dict({"features": list(range(num_rows))})
+    partitioner = IterableIidPartitioner(num_partitions=num_partitions)
+    partitioner.dataset = dataset.to_iterable_dataset(num_shards=4)
+    return partitioner
+
+
+class TestIterableIidPartitioner(unittest.TestCase):
+    """Test IterableIidPartitioner."""
+
+    @parameterized.expand([(1, 100), (10, 1000), (100, 1000)])  # type: ignore
+    def test_partitions_cover_the_dataset(
+        self, num_partitions: int, num_rows: int
+    ) -> None:
+        """Test if each row is assigned to exactly one partition."""
+        partitioner = _dummy_setup(num_partitions, num_rows)
+        features = [
+            example["features"]
+            for partition_id in range(num_partitions)
+            for example in partitioner.load_partition(partition_id)
+        ]
+        self.assertEqual(sorted(features), list(range(num_rows)))
+
+    def test_partitions_are_balanced(self) -> None:
+        """Test if the partition sizes are close to the even split."""
+        partitioner = _dummy_setup(num_partitions=10, num_rows=10_000)
+        sizes = [
+            sum(1 for _ in partitioner.load_partition(partition_id))
+            for partition_id in range(10)
+        ]
+        self.assertTrue(all(800 < size < 1200 for size in sizes))
+
+    def test_load_partition_is_deterministic(self) -> None:
+        """Test if loading a partition twice yields the same rows."""
+        partitioner = _dummy_setup(num_partitions=5, num_rows=100)
+        first = list(partitioner.load_partition(2))
+        second = list(partitioner.load_partition(2))
+        self.assertEqual(first, second)
+
+    @parameterized.expand([(2,), (3,)])  # type: ignore
+    def test_partition_is_the_same_under_sharding(self, world_size: int) -> None:
+        """Test if reading a partition split across nodes yields the same rows."""
+        partitioner = _dummy_setup(num_partitions=5, num_rows=1000)
+        expected = [example["features"] for example in partitioner.load_partition(0)]
+        partition = [
+            example["features"]
+            for rank in range(world_size)
+            for example in split_dataset_by_node(
+                partitioner.load_partition(0), rank=rank, world_size=world_size
+            )
+        ]
+        self.assertEqual(sorted(partition), sorted(expected))
+
+    def test_partitions_with_key_column_cover_the_dataset(self) -> None:
+        """Test if hashing a key column assigns each row to exactly one partition."""
+        dataset = Dataset.from_dict({"id": list(range(100)), "features": [0] * 100})
+        partitioner = IterableIidPartitioner(num_partitions=5, key_column="id")
+        partitioner.dataset = dataset.to_iterable_dataset(num_shards=4)
+        ids = [
+            example["id"]
+            for partition_id in range(5)
+            for example in partitioner.load_partition(partition_id)
+        ]
+        self.assertEqual(sorted(ids), list(range(100)))
+
+    def test_load_partition_with_missing_key_column(self) -> None:
+        """Test if a key column absent from the dataset raises ValueError."""
+        dataset = Dataset.from_dict({"features": list(range(10))})
+        partitioner = IterableIidPartitioner(num_partitions=5, key_column="id")
+        partitioner.dataset = dataset.to_iterable_dataset()
+        with self.assertRaises(ValueError):
+            partitioner.load_partition(0)
+
+    def test_load_invalid_partition_index(self) -> None:
+        """Test if loading a partition out of range raises ValueError."""
+        partitioner = _dummy_setup(num_partitions=5, num_rows=100)
+        with self.assertRaises(ValueError):
+            partitioner.load_partition(5)
+
+    def test_assign_map_style_dataset(self) -> None:
+        """Test if assigning a (map-style) Dataset raises TypeError."""
+        partitioner = IterableIidPartitioner(num_partitions=5)
+        with self.assertRaises(TypeError):
+            partitioner.dataset = Dataset.from_dict({"features": [1, 2, 3]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Natural id partitioner class that works with streamed Hugging Face Datasets."""
+
+
+import hashlib
+from typing import Any
+
+import numpy as np
+
+from datasets import IterableDataset
+from flwr_datasets.partitioner.iterable_partitioner import (
+    IterablePartitioner,
+    _hash_to_partition_ids,
+)
+
+
+class IterableNaturalIdPartitioner(IterablePartitioner):
+    """Partitioner routing the rows of a stream by hashing a natural id column.
+
+    The unique natural ids (e.g., user ids) of a streamed dataset are not known
+    upfront, so each natural id is hashed (with a seed) to one of `num_partitions`
+    partitions. All rows of a natural id land in the same partition, and a partition
+    may hold several natural ids.
+
+    Parameters
+    ----------
+    partition_by : str
+        The name of the column that contains the natural ids.
+    num_partitions : int
+        The total number of partitions that the natural ids are routed to.
+    seed : int
+        Seed of the hash assigning the natural ids to partitions. Defaults to 42.
+
+    Examples
+    --------
+    >>> from flwr_datasets import FederatedDataset
+    >>> from flwr_datasets.partitioner import IterableNaturalIdPartitioner
+    >>>
+    >>> partitioner = IterableNaturalIdPartitioner(
+    >>>     partition_by="user", num_partitions=1000
+    >>> )
+    >>> fds = FederatedDataset(
+    >>>     dataset="sentiment140",
+    >>>     partitioners={"train": partitioner},
+    >>>     streaming=True,
+    >>> )
+    >>> partition = fds.load_partition(0)
+    >>> print(next(iter(partition)))  # Print the first example
+    """
+
+    def __init__(self, partition_by: str, num_partitions: int, seed: int = 42) -> None:
+        super().__init__()
+        if num_partitions <= 0:
+            raise ValueError("The number of partitions must be greater than zero.")
+        self._partition_by = partition_by
+        self._num_partitions = num_partitions
+        self._seed = seed
+
+    def load_partition(self, partition_id: int) -> IterableDataset:
+        """Load the partition of the natural ids routed to the partition index.
+
+        Parameters
+        ----------
+        partition_id : int
+            the index that corresponds to the requested partition
+
+        Returns
+        -------
+        dataset_partition : IterableDataset
+            single dataset partition, streamed lazily
+        """
+        self._check_partition_id(partition_id)
+        if (
+            self.dataset.column_names is not None
+            and self._partition_by not in self.dataset.column_names
+        ):
+            raise ValueError(
+                f"The specified 'partition_by': '{self._partition_by}' is not "
+                f"present in the dataset. The dataset contains columns "
+                f"{self.dataset.column_names}."
+            )
+
+        def in_partition(natural_ids: list[Any]) -> list[bool]:
+            # Python's `hash` of strings is salted per process, use a stable digest
+            keys = np.fromiter(
+                (_stable_key(natural_id) for natural_id in natural_ids),
+                dtype=np.uint64,
+                count=len(natural_ids),
+            )
+            partition_ids = _hash_to_partition_ids(
+                keys, self._num_partitions, self._seed
+            )
+            return (partition_ids == partition_id).tolist()  # type: ignore
+
+        return self.dataset.filter(
+            in_partition, input_columns=[self._partition_by], batched=True
+        )
+
+    @property
+    def num_partitions(self) -> int:
+        """Total number of partitions."""
+        return self._num_partitions
+
+
+def _stable_key(natural_id: Any) -> int:
+    """Return a 64-bit key of the natural id that is stable across processes."""
+    digest = hashlib.blake2b(str(natural_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -0,0 +1,80 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""IterableNaturalIdPartitioner tests."""
+
+
+import unittest
+
+from parameterized import parameterized
+
+from datasets import Dataset
+from flwr_datasets.partitioner.iterable_natural_id_partitioner import (
+    IterableNaturalIdPartitioner,
+)
+
+
+def _dummy_setup(
+    num_partitions: int, num_rows: int, num_unique_natural_ids: int
+) -> IterableNaturalIdPartitioner:
+    """Create a partitioner with a streamed dummy dataset assigned to it."""
+    data = {
+        "features": list(range(num_rows)),
+        "natural_id": [f"user_{i % num_unique_natural_ids}" for i in range(num_rows)],
+    }
+    partitioner = IterableNaturalIdPartitioner(
+        partition_by="natural_id", num_partitions=num_partitions
+    )
+    partitioner.dataset = Dataset.from_dict(data).to_iterable_dataset()
+    return partitioner
+
+
+class TestIterableNaturalIdPartitioner(unittest.TestCase):
+    """Test IterableNaturalIdPartitioner."""
+
+    @parameterized.expand([(1, 100, 10), (5, 100, 10), (10, 1000, 200)])  # type: ignore
+    def test_natural_ids_are_not_split(
+        self, num_partitions: int, num_rows: int, num_unique_natural_ids: int
+    ) -> None:
+        """Test if all rows of a natural id are in a single partition."""
+        partitioner = _dummy_setup(num_partitions, num_rows, num_unique_natural_ids)
+        natural_id_to_partition_ids: dict[str, set[int]] = {}
+        num_examples = 0
+        for partition_id in range(num_partitions):
+            for example in partitioner.load_partition(partition_id):
+                natural_id_to_partition_ids.setdefault(
+                    example["natural_id"], set()
+                ).add(partition_id)
+                num_examples += 1
+
+        self.assertEqual(num_examples, num_rows)
+        self.assertEqual(len(natural_id_to_partition_ids), num_unique_natural_ids)
+        self.assertTrue(
+            all(len(ids) == 1 for ids in natural_id_to_partition_ids.values())
+        )
+
+    def test_missing_column(self) -> None:
+        """Test if a missing `partition_by` column raises ValueError."""
+        partitioner = IterableNaturalIdPartitioner(
+            partition_by="missing", num_partitions=2
+        )
+        partitioner.dataset = Dataset.from_dict(
+            {"features": [1, 2]}
+        ).to_iterable_dataset()
+        with self.assertRaises(ValueError):
+            partitioner.load_partition(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
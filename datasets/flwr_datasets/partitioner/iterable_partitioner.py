@@ -0,0 +1,121 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Partitioner class that works with streamed Hugging Face Datasets."""
+
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+from datasets import IterableDataset
+from flwr_datasets.common.typing import NDArray, NDArrayInt
+
+
+class IterablePartitioner(ABC):
+    """The base partitioner class for streamed (iterable) datasets.
+
+    Unlike `Partitioner`, which selects the indices of each partition in a
+    materialized `datasets.Dataset`, an iterable partitioner assigns the rows of an
+    `IterableDataset` to partitions on the fly, e.g., by hashing. Loading a partition
+    returns a lazily filtered stream, so that only the rows of that partition are
+    kept while the dataset is read.
+    """
+
+    def __init__(self) -> None:
+        self._dataset: Optional[IterableDataset] = None
+
+    @property
+    def dataset(self) -> IterableDataset:
+        """Dataset property."""
+        if self._dataset is None:
+            raise AttributeError(
+                "The dataset field should be set before using it (directly, via "
+                "`load_partition` or some other method). "
+            )
+        return self._dataset
+
+    @dataset.setter
+    def dataset(self, value: IterableDataset) -> None:
+        """Set the dataset property."""
+        if self._dataset is not None:
+            raise ValueError(
+                "The dataset should be assigned only once to the partitioner."
+            )
+        if not isinstance(value, IterableDataset):
+            raise TypeError(
+                f"The dataset object you want to assign to the partitioner should be "
+                f"of type `datasets.IterableDataset` but given {type(value)}."
+            )
+        self._dataset = value
+
+    @abstractmethod
+    def load_partition(self, partition_id: int) -> IterableDataset:
+        """Load a single partition based on the partition index.
+
+        Parameters
+        ----------
+        partition_id : int
+            the index that corresponds to the requested partition
+
+        Returns
+        -------
+        dataset_partition : IterableDataset
+            single dataset partition, streamed lazily
+        """
+
+    def is_dataset_assigned(self) -> bool:
+        """Check if a dataset has been assigned to the partitioner.
+
+        This method returns True if a dataset is already set for the partitioner,
+        otherwise, it returns False.
+
+        Returns
+        -------
+        dataset_assigned : bool
+            True if a dataset is assigned, otherwise False.
+        """
+        return self._dataset is not None
+
+    @property
+    @abstractmethod
+    def num_partitions(self) -> int:
+        """Total number of partitions."""
+
+    def _check_partition_id(self, partition_id: int) -> None:
+        """Check that the partition id is in {0, ..., num_partitions - 1}."""
+        if not 0 <= partition_id < self.num_partitions:
+            raise ValueError(
+                f"partition_id: {partition_id} out of range "
+                f"<0, {self.num_partitions - 1}>."
+            )
+
+
+def _hash_to_partition_ids(keys: NDArray, num_partitions: int, seed: int) -> NDArrayInt:
+    """Map integer keys to partition ids with the seeded splitmix64 hash."""
+    seed_hash = _splitmix64(np.asarray([seed], dtype=np.uint64))
+    hashes = _splitmix64(keys.astype(np.uint64) ^ seed_hash)
+    return (hashes % np.uint64(num_partitions)).astype(np.int64)
+
+
+def _splitmix64(values: NDArray) -> NDArray:
+    """Apply the splitmix64 finalizer, a fast and well-mixing 64-bit hash."""
+    with np.errstate(over="ignore"):
+        hashes: NDArray = np.asarray(values, dtype=np.uint64)
+        hashes = hashes + np.uint64(0x9E3779B97F4A7C15)
+        hashes = (hashes ^ (hashes >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        hashes = (hashes ^ (hashes >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        hashes = hashes ^ (hashes >> np.uint64(31))
+    return hashes
@@ -15,11 +15,22 @@
 """Utils for FederatedDataset."""
 
 
+import hashlib
+import inspect
+import json
 import warnings
-from typing import Optional, Union, cast
+from collections.abc import Mapping
+from typing import Any, Optional, Union, cast
+
+import numpy as np
 
 from datasets import Dataset, DatasetDict, concatenate_datasets
-from flwr_datasets.partitioner import IidPartitioner, Partitioner
+from flwr_datasets.partitioner import (
+    IidPartitioner,
+    IterableIidPartitioner,
+    IterablePartitioner,
+    Partitioner,
+)
 from flwr_datasets.preprocessor import Preprocessor
 from flwr_datasets.preprocessor.merger import Merger
 
@@ -57,33 +68,43 @@ tested_datasets = [
 
 
 def _instantiate_partitioners(
-    partitioners: dict[str, Union[Partitioner, int]]
-) -> dict[str, Partitioner]:
+    partitioners: Mapping[str, Union[Partitioner, IterablePartitioner, int]],
+    streaming: bool = False,
+) -> dict[str, Union[Partitioner, IterablePartitioner]]:
     """Transform the partitioners from the initial format to instantiated objects.
 
     Parameters
     ----------
-    partitioners : Dict[str, Union[Partitioner, int]]
+    partitioners : Dict[str, Union[Partitioner, IterablePartitioner, int]]
         Dataset split to the Partitioner or a number of IID partitions.
+    streaming : bool
+        Whether the dataset is streamed. Then, IterablePartitioner objects are
+        expected and the number of IID partitions creates an IterableIidPartitioner.
 
     Returns
     -------
-    partitioners : Dict[str, Partitioner]
+    partitioners : Dict[str, Union[Partitioner, IterablePartitioner]]
         Partitioners specified as split to Partitioner object.
     """
-    instantiated_partitioners: dict[str, Partitioner] = {}
+    expected_type: Union[type[Partitioner], type[IterablePartitioner]] = (
+        IterablePartitioner if streaming else Partitioner
+    )
+    instantiated_partitioners: dict[str, Union[Partitioner, IterablePartitioner]] = {}
     if isinstance(partitioners, dict):
         for split, partitioner in partitioners.items():
-            if isinstance(partitioner, Partitioner):
+            if isinstance(partitioner, expected_type):
                 instantiated_partitioners[split] = partitioner
             elif isinstance(partitioner, int):
-                instantiated_partitioners[split] = IidPartitioner(
-                    num_partitions=partitioner
+                instantiated_partitioners[split] = (
+                    IterableIidPartitioner(num_partitions=partitioner)
+                    if streaming
+                    else IidPartitioner(num_partitions=partitioner)
                 )
             else:
                 raise ValueError(
                     f"Incorrect type of the 'partitioners' value encountered. "
-                    f"Expected Partitioner or int. Given {type(partitioner)}"
+                    f"Expected {expected_type.__name__} or int. "
+                    f"Given {type(partitioner)}"
                 )
     else:
         raise ValueError(
@@ -103,6 +124,80 @@ def _instantiate_merger_if_needed(
     return cast(Optional[Preprocessor], merger)
 
 
+# Attributes of partitioners holding the dataset or the state derived from it
+_PARTITIONER_STATE_ATTRIBUTES = ("_dataset", "_rng")
+_PARTITIONER_STATE_PREFIXES = ("_partition_id_to_", "_natural_id_to_")
+
+
+def _get_partitioner_settings(
+    partitioner: Union[Partitioner, IterablePartitioner],
+) -> dict[str, Any]:
+    """Return the JSON-serializable settings of a partitioner.
+
+    The settings are the attributes set by the constructor of the partitioner (e.g.,
+    `_num_partitions`, `_seed`, `_alpha`, `_partition_by`), without the dataset and
+    the state derived from it. Attributes that cannot be serialized (e.g.,
+    functions) are skipped.
+    """
+    settings = _get_serializable_attributes(partitioner)
+    for name in list(settings):
+        if name in _PARTITIONER_STATE_ATTRIBUTES or name.startswith(
+            _PARTITIONER_STATE_PREFIXES
+        ):
+            del settings[name]
+    return settings
+
+
+def _get_preprocessor_digest(preprocessor: Optional[Preprocessor]) -> Optional[str]:
+    """Return a digest of the class (or function) and settings of a preprocessor.
+
+    The settings are the JSON-serializable attributes of the preprocessor (e.g., the
+    `merge_config` of a `Merger`).
+    """
+    if preprocessor is None:
+        return None
+    kind = preprocessor if inspect.isroutine(preprocessor) else type(preprocessor)
+    return _get_digest(
+        {
+            "type": f"{kind.__module__}.{kind.__qualname__}",
+            "settings": _get_serializable_attributes(preprocessor),
+        }
+    )
+
+
+def _get_digest(value: Any) -> str:
+    """Return a SHA-256 digest of a value, using `repr` for non-JSON objects."""
+    encoded = json.dumps(value, sort_keys=True, default=_to_json_or_repr).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _get_serializable_attributes(obj: Any) -> dict[str, Any]:
+    """Return the JSON-serializable attributes of an object, skipping the others."""
+    attributes: dict[str, Any] = {}
+    for name, value in getattr(obj, "__dict__", {}).items():
+        try:
+            # Round-trip so that the attributes compare equal to the loaded ones
+            attributes[name] = json.loads(json.dumps(value, default=_to_json))
+        except (TypeError, ValueError):
+            continue
+    return attributes
+
+
+def _to_json(value: Any) -> Any:
+    """Convert NumPy values for `json.dumps`, raise TypeError for other objects."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value)} is not JSON serializable.")
+
+
+def _to_json_or_repr(value: Any) -> Any:
+    """Convert NumPy values for `json.dumps`, use `repr` for other objects."""
+    try:
+        return _to_json(value)
+    except TypeError:
+        return repr(value)
+
+
 def _check_if_dataset_tested(dataset: str) -> None:
     """Check if the dataset is in the narrowed down list of the tested datasets."""
     if dataset not in tested_datasets:
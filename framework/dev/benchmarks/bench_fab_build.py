@@ -0,0 +1,100 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark building a FAB with and without the build cache.
+
+Generates a Flower app with `--files` Python files and an ignored data directory
+holding `--ignored-files` files, then times an uncached build, the first cached
+build, a build after modifying one file, and a build of the unchanged app.
+
+Usage: python dev/benchmarks/bench_fab_build.py --files 2000 --ignored-files 50000
+"""
+
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from flwr.cli.build import RACY_WINDOW_NS, build_fab
+from flwr.common.constant import FLWR_HOME
+
+PYPROJECT = """
+[project]
+name = "bench-app"
+version = "1.0.0"
+
+[tool.flwr.app]
+publisher = "flwrlabs"
+"""
+
+
+def age(file_path: str) -> None:
+    """Make a file older than the racy window, as if it was edited earlier."""
+    mtime = (time.time_ns() - 2 * RACY_WINDOW_NS) / 1e9
+    os.utime(file_path, (mtime, mtime))
+
+
+def make_app(root: Path, num_files: int, num_ignored: int, file_size: int) -> Path:
+    """Generate a Flower app with Python files and an ignored data directory."""
+    app = root / "bench-app"
+    for i in range(num_files):
+        module_dir = app / "bench_app" / f"module_{i % 50}"
+        module_dir.mkdir(parents=True, exist_ok=True)
+        (module_dir / f"file_{i}.py").write_text(f"# {i}\n" + "x = 1\n" * file_size)
+    data_dir = app / "data"
+    for i in range(num_ignored):
+        shard_dir = data_dir / f"shard_{i % 100}"
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        (shard_dir / f"sample_{i}.py").write_text("")
+    (app / "pyproject.toml").write_text(PYPROJECT)
+    (app / ".gitignore").write_text("data/\n")
+    for dirpath, _, filenames in os.walk(app):
+        for filename in filenames:
+            age(os.path.join(dirpath, filename))
+    return app
+
+
+def timed(label: str, app: Path, use_cache: bool) -> str:
+    """Build the FAB of `app`, print the build time, and return the FAB hash."""
+    start = time.perf_counter()
+    _, fab_hash, _ = build_fab(app, use_cache=use_cache)
+    print(f"{label:<28} {(time.perf_counter() - start) * 1e3:9.1f} ms")
+    return fab_hash
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--ignored-files", type=int, default=50_000)
+    parser.add_argument("--file-size", type=int, default=100, help="Lines per file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ[FLWR_HOME] = os.path.join(tmp_dir, "flwr")
+        app = make_app(Path(tmp_dir), args.files, args.ignored_files, args.file_size)
+
+        fab_hash = timed("uncached build", app, use_cache=False)
+        assert timed("first cached build", app, use_cache=True) == fab_hash
+        modified_file = app / "bench_app" / "module_0" / "file_0.py"
+        modified_file.write_text("# modified\n")
+        age(str(modified_file))
+        timed("build with 1 modified file", app, use_cache=True)
+        timed("build of unchanged app", app, use_cache=True)
+
+
+if __name__ == "__main__":
+    main()
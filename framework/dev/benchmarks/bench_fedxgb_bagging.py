@@ -0,0 +1,109 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark `FedXgbBagging` aggregation over many clients and rounds.
+
+Usage: python dev/benchmarks/bench_fedxgb_bagging.py --clients 100 --rounds 500
+"""
+
+
+import argparse
+import json
+import time
+from unittest.mock import MagicMock
+
+from flwr.common import Code, FitRes, Parameters, Status
+from flwr.server.client_proxy import ClientProxy
+from flwr.server.strategy import FedXgbBagging
+
+
+def make_booster(num_nodes: int) -> bytes:
+    """Create a booster JSON holding a single tree with `num_nodes` nodes."""
+    tree = {
+        "id": 0,
+        "tree_param": {"num_nodes": str(num_nodes), "size_leaf_vector": "1"},
+        "left_children": list(range(num_nodes)),
+        "right_children": list(range(num_nodes)),
+        "parents": list(range(num_nodes)),
+        "split_indices": list(range(num_nodes)),
+        "split_conditions": [0.5] * num_nodes,
+        "base_weights": [0.1] * num_nodes,
+        "loss_changes": [0.2] * num_nodes,
+        "sum_hessian": [1.0] * num_nodes,
+        "default_left": [0] * num_nodes,
+        "split_type": [0] * num_nodes,
+        "categories": [],
+        "categories_nodes": [],
+        "categories_segments": [],
+        "categories_sizes": [],
+    }
+    model = {
+        "learner": {
+            "gradient_booster": {
+                "model": {
+                    "gbtree_model_param": {
+                        "num_trees": "1",
+                        "num_parallel_tree": "1",
+                    },
+                    "iteration_indptr": [0, 1],
+                    "tree_info": [0],
+                    "trees": [tree],
+                },
+                "name": "gbtree",
+            },
+        },
+        "version": [2, 0, 0],
+    }
+    return bytes(json.dumps(model), "utf-8")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--tree-nodes", type=int, default=63)
+    parser.add_argument("--broadcast-delta", action="store_true")
+    args = parser.parse_args()
+
+    strategy = FedXgbBagging(broadcast_delta=args.broadcast_delta)
+    proxies = []
+    for cid in range(args.clients):
+        proxy = MagicMock(spec=ClientProxy)
+        proxy.cid = str(cid)
+        proxies.append(proxy)
+    fit_res = FitRes(
+        status=Status(code=Code.OK, message=""),
+        parameters=Parameters(tensor_type="", tensors=[make_booster(args.tree_nodes)]),
+        num_examples=1,
+        metrics={},
+    )
+    results = [(proxy, fit_res) for proxy in proxies]
+
+    total = 0.0
+    for server_round in range(1, args.rounds + 1):
+        start = time.perf_counter()
+        parameters, _ = strategy.aggregate_fit(server_round, results, [])
+        total += time.perf_counter() - start
+        if server_round % max(1, args.rounds // 10) == 0:
+            print(
+                f"round {server_round:>5}: "
+                f"{len(parameters.tensors[0]) / 1e6:8.1f} MB global model, "
+                f"{total / server_round * 1e3:8.2f} ms/round (mean)"
+            )
+    print(f"Total aggregation time: {total:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
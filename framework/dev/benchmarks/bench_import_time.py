@@ -0,0 +1,101 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark the cold import time of `flwr` and of its entry points.
+
+Imports each target in a fresh interpreter with `python -X importtime` and reports
+the median import time and the modules taking the longest to import. Exits with a
+non-zero code if a target exceeds `--max-ms`, so that it can be used to catch
+import time regressions.
+
+Usage: python dev/benchmarks/bench_import_time.py --max-ms 200
+"""
+
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+# Entry points as `module:attribute`, see `[tool.poetry.scripts]` in pyproject.toml
+DEFAULT_TARGETS = [
+    "flwr",
+    "flwr.supernode.cli:flwr_clientapp",
+    "flwr.server.serverapp:flwr_serverapp",
+    "flwr.supernode.cli:flower_supernode",
+    "flwr.cli.app:app",
+]
+
+
+def import_statement(target: str) -> str:
+    """Return the statement importing `target`."""
+    module, _, attribute = target.partition(":")
+    return f"from {module} import {attribute}" if attribute else f"import {module}"
+
+
+def measure(target: str) -> tuple[float, Counter[str]]:
+    """Import `target` in a fresh interpreter and return its import time.
+
+    The import time is returned in seconds, together with the self time of each
+    imported module in microseconds.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{import_statement(target)}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    self_times: Counter[str] = Counter()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        self_times[name.strip()] += int(self_us)
+    return float(result.stdout.strip().splitlines()[-1]), self_times
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", nargs="+", default=DEFAULT_TARGETS)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="Fail if a target exceeds this"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for target in args.targets:
+        times = []
+        self_times: Counter[str] = Counter()
+        for _ in range(args.repeats):
+            elapsed, self_times = measure(target)
+            times.append(elapsed)
+        median_ms = statistics.median(times) * 1e3
+        print(f"{target:<40} {median_ms:8.1f} ms")
+        for name, self_us in self_times.most_common(args.top):
+            print(f"    {name:<60} {self_us / 1e3:8.1f} ms")
+        if args.max_ms is not None and median_ms > args.max_ms:
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark node heartbeats and `get_nodes` of the SQLite LinkState.
+
+Compares writing every heartbeat to the database (`--flush-interval 0`) with
+batched writes, and the `get_nodes` query on the node table with the in-memory
+expiry heap.
+
+Usage: python dev/benchmarks/bench_node_liveness.py --nodes 10000 100000
+"""
+
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from flwr.common import ConfigRecord
+from flwr.common.constant import HEARTBEAT_FLUSH_INTERVAL
+from flwr.server.superlink.linkstate.node_liveness import NodeLiveness
+from flwr.server.superlink.linkstate.sqlite_linkstate import SqliteLinkState
+from flwr.server.superlink.linkstate.utils import convert_uint64_to_sint64
+
+
+def make_state(
+    database: str, num_nodes: int, flush_interval: float
+) -> tuple[SqliteLinkState, list[int], int]:
+    """Create a LinkState holding a run and `num_nodes` nodes."""
+    state = SqliteLinkState(database, node_liveness=NodeLiveness(flush_interval))
+    state.initialize()
+    node_ids = random.sample(range(1, 2**63), num_nodes)
+    now = time.time()
+    # Spread the deadlines so that nodes go offline one after the other
+    state.query(
+        "INSERT INTO node (node_id, online_until, heartbeat_interval, public_key) "
+        "VALUES (?, ?, ?, ?)",
+        [
+            (convert_uint64_to_sint64(node_id), now + i * 1e-3, 30.0, b"")
+            for i, node_id in enumerate(node_ids)
+        ],
+    )
+    run_id = state.create_run(None, None, "hash", {}, ConfigRecord(), "")
+    # Reload the nodes into a fresh tracker
+    state = SqliteLinkState(database, node_liveness=NodeLiveness(flush_interval))
+    state.initialize()
+    return state, node_ids, run_id
+
+
+def bench(database: str, num_nodes: int, flush_interval: float, calls: int) -> None:
+    """Time heartbeats and `get_nodes` for one number of nodes."""
+    state, node_ids, run_id = make_state(database, num_nodes, flush_interval)
+
+    start = time.perf_counter()
+    for node_id in node_ids:
+        state.acknowledge_node_heartbeat(node_id, heartbeat_interval=30.0)
+    heartbeat_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        state.get_nodes(run_id)
+    get_nodes_time = (time.perf_counter() - start) / calls
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        state.query("SELECT node_id FROM node WHERE online_until > ?;", (time.time(),))
+    query_time = (time.perf_counter() - start) / calls
+
+    print(
+        f"{num_nodes:>7} nodes, flush every {flush_interval:>4.1f}s: "
+        f"{num_nodes / heartbeat_time:>9.0f} heartbeats/s, "
+        f"get_nodes {get_nodes_time * 1e3:7.2f} ms "
+        f"(SQL query {query_time * 1e3:7.2f} ms)"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        nargs="+",
+        default=[0.0, HEARTBEAT_FLUSH_INTERVAL],
+    )
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    for num_nodes in args.nodes:
+        for flush_interval in args.flush_interval:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                database = os.path.join(tmp_dir, "state.db")
+                bench(database, num_nodes, flush_interval, args.calls)
+
+
+if __name__ == "__main__":
+    main()
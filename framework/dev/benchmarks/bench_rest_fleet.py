@@ -0,0 +1,151 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark the REST Fleet API with many concurrent SuperNodes.
+
+Starts the REST Fleet API in-process (requires the `rest` extra) and simulates
+SuperNodes that register, then repeatedly send heartbeats and pull messages.
+Compares opening a new connection per request (`--client post`) with pooled
+keep-alive connections (`--client session`).
+
+Usage: python dev/benchmarks/bench_rest_fleet.py --nodes 1000 --requests 10
+"""
+
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import requests
+import uvicorn
+
+from flwr.common.constant import HEARTBEAT_DEFAULT_INTERVAL
+from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
+    CreateNodeRequest,
+    CreateNodeResponse,
+    PullMessagesRequest,
+)
+from flwr.proto.heartbeat_pb2 import SendNodeHeartbeatRequest  # pylint: disable=E0611
+from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
+from flwr.server.superlink.fleet.rest_rere.rest_api import app
+from flwr.server.superlink.linkstate import LinkStateFactory
+from flwr.supercore.ffs import FfsFactory
+from flwr.supercore.object_store import ObjectStoreFactory
+
+HEADERS = {
+    "Accept": "application/protobuf",
+    "Content-Type": "application/protobuf",
+}
+
+
+def start_server(database: str, ffs_dir: str, port: int) -> uvicorn.Server:
+    """Start the REST Fleet API in a background thread."""
+    app.state.STATE_FACTORY = LinkStateFactory(database)
+    app.state.FFS_FACTORY = FfsFactory(ffs_dir)
+    app.state.OBJECTSTORE_FACTORY = ObjectStoreFactory()
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="error", access_log=False
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def simulate_node(base_url: str, client: str, num_requests: int) -> list[float]:
+    """Register a node, then send heartbeats and pull messages."""
+    session = requests.Session() if client == "session" else None
+    post: Callable[..., requests.Response] = (
+        session.post if session is not None else requests.post
+    )
+    latencies: list[float] = []
+
+    def request(path: str, body: bytes) -> bytes:
+        start = time.perf_counter()
+        res = post(f"{base_url}/{path}", data=body, headers=HEADERS, timeout=60)
+        latencies.append(time.perf_counter() - start)
+        res.raise_for_status()
+        return res.content
+
+    res = CreateNodeResponse.FromString(
+        request(
+            "api/v0/fleet/create-node",
+            CreateNodeRequest(
+                heartbeat_interval=HEARTBEAT_DEFAULT_INTERVAL
+            ).SerializeToString(),
+        )
+    )
+    node = Node(node_id=res.node.node_id)
+    heartbeat = SendNodeHeartbeatRequest(
+        node=node, heartbeat_interval=HEARTBEAT_DEFAULT_INTERVAL
+    ).SerializeToString()
+    pull = PullMessagesRequest(node=node).SerializeToString()
+    for _ in range(num_requests):
+        request("api/v0/fleet/send-node-heartbeat", heartbeat)
+        request("api/v0/fleet/pull-messages", pull)
+    if session is not None:
+        session.close()
+    return latencies
+
+
+def bench(base_url: str, client: str, num_nodes: int, num_requests: int) -> None:
+    """Time the requests of `num_nodes` concurrent nodes."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_nodes) as executor:
+        results = list(
+            executor.map(
+                lambda _: simulate_node(base_url, client, num_requests),
+                range(num_nodes),
+            )
+        )
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result in results for latency in result)
+    p99 = latencies[int(0.99 * (len(latencies) - 1))]
+    print(
+        f"{num_nodes:>6} nodes, client {client:>7}: "
+        f"{len(latencies) / elapsed:>8.0f} requests/s, "
+        f"median {statistics.median(latencies) * 1e3:7.2f} ms, "
+        f"p99 {p99 * 1e3:8.2f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument(
+        "--client", nargs="+", choices=["post", "session"], default=["post", "session"]
+    )
+    parser.add_argument("--port", type=int, default=9095)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = os.path.join(tmp_dir, "state.db")
+        server = start_server(database, tmp_dir, args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+        for num_nodes in args.nodes:
+            for client in args.client:
+                bench(base_url, client, num_nodes, args.requests)
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
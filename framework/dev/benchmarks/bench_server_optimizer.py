@@ -0,0 +1,107 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark the update of the server-side Adam optimizer.
+
+Compares the per-layer list updates (as `FedAdam` used to do) with the in-place
+updates of the contiguous buffers of `ServerOptimizerState`, reporting the time
+per round and the peak memory allocated by the update (`tracemalloc`).
+
+Usage: python dev/benchmarks/bench_server_optimizer.py --params 100000000
+"""
+
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from flwr.common import NDArrays
+from flwr.server.strategy.server_optimizer import ServerOptimizerState
+
+BETA_1, BETA_2, ETA, TAU = 0.9, 0.99, 0.1, 1e-9
+
+
+def make_model(num_params: int, num_layers: int, seed: int) -> NDArrays:
+    """Return a model with `num_layers` float32 layers of equal size."""
+    rng = np.random.default_rng(seed)
+    size = num_params // num_layers
+    return [rng.random(size, dtype=np.float32) for _ in range(num_layers)]
+
+
+def per_layer_step(
+    weights: NDArrays, m_t: NDArrays, v_t: NDArrays, aggregated: NDArrays
+) -> tuple[NDArrays, NDArrays, NDArrays]:
+    """Run one round of Adam with per-layer list comprehensions."""
+    delta_t = [x - y for x, y in zip(aggregated, weights)]
+    m_t = [np.multiply(BETA_1, x) + (1 - BETA_1) * y for x, y in zip(m_t, delta_t)]
+    v_t = [BETA_2 * x + (1 - BETA_2) * np.multiply(y, y) for x, y in zip(v_t, delta_t)]
+    weights = [x + ETA * y / (np.sqrt(z) + TAU) for x, y, z in zip(weights, m_t, v_t)]
+    return weights, m_t, v_t
+
+
+def buffer_step(state: ServerOptimizerState, aggregated: NDArrays) -> None:
+    """Run one round of Adam with in-place updates of contiguous buffers."""
+    delta_t = state.flatten(aggregated, out=state.scratch(0))
+    delta_t -= state.weights
+    v_t = state.buffer("v_t")
+    v_t *= BETA_2
+    delta_sq = np.multiply(delta_t, delta_t, out=state.scratch(1))
+    delta_sq *= 1.0 - BETA_2
+    v_t += delta_sq
+    m_t = state.buffer("m_t")
+    m_t *= BETA_1
+    m_t += np.multiply(delta_t, 1.0 - BETA_1, out=state.scratch(1))
+    update = np.sqrt(v_t, out=state.scratch(1))
+    update += TAU
+    np.divide(m_t, update, out=update)
+    update *= ETA
+    state.weights += update
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--params", type=int, default=20_000_000)
+    parser.add_argument("--layers", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    weights = make_model(args.params, args.layers, seed=0)
+    aggregated = make_model(args.params, args.layers, seed=1)
+    m_t = [np.zeros_like(x) for x in weights]
+    v_t = [np.zeros_like(x) for x in weights]
+    state = ServerOptimizerState(weights)
+    buffer_step(state, aggregated)  # Allocate the buffers outside of the timing
+
+    for name in ("per-layer", "buffers"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            if name == "per-layer":
+                weights, m_t, v_t = per_layer_step(weights, m_t, v_t, aggregated)
+            else:
+                buffer_step(state, aggregated)
+        elapsed = (time.perf_counter() - start) / args.rounds
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<10} {elapsed * 1e3:9.1f} ms/round, "
+            f"peak allocation {peak / 2**20:9.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark the Simulation Engine backends on CIFAR-10 sized clients.
+
+Each client trains a two-layer MLP for one epoch on its partition of a synthetic
+dataset with the shape of CIFAR-10 (50,000 images of 32x32x3, 10 classes). The
+backends are driven the same way the Simulation Engine drives them: one thread per
+backend worker calls `process_message`.
+
+Usage: python dev/benchmarks/bench_simulation_backends.py --clients 1000 --rounds 3
+"""
+
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from flwr.client.client_app import ClientApp
+from flwr.common import ArrayRecord, ConfigRecord, Context, Message, RecordDict
+from flwr.common.constant import NUM_PARTITIONS_KEY, PARTITION_ID_KEY, MessageType
+from flwr.server.superlink.fleet.vce.backend import supported_backends
+
+NUM_EXAMPLES = 50_000
+IMAGE_SIZE = 32 * 32 * 3
+NUM_CLASSES = 10
+
+app = ClientApp()
+
+
+@app.train()
+def train(msg: Message, context: Context) -> Message:
+    """Train the MLP for one epoch on the partition of this client."""
+    w_1, w_2 = msg.content.array_records["arrays"].to_numpy_ndarrays()
+    partition_id = int(context.node_config[PARTITION_ID_KEY])
+    num_partitions = int(context.node_config[NUM_PARTITIONS_KEY])
+    rng = np.random.default_rng(partition_id)
+    num_examples = NUM_EXAMPLES // num_partitions
+    images = rng.random((num_examples, IMAGE_SIZE), dtype=np.float32)
+    labels = rng.integers(0, NUM_CLASSES, num_examples)
+
+    learning_rate = float(msg.content.config_records["config"]["lr"])
+    for start in range(0, num_examples, 32):
+        x, y = images[start : start + 32], labels[start : start + 32]
+        hidden = np.maximum(x @ w_1, 0)
+        logits = hidden @ w_2
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+        probs[np.arange(len(y)), y] -= 1
+        grad_2 = hidden.T @ probs / len(y)
+        grad_1 = x.T @ ((probs @ w_2.T) * (hidden > 0)) / len(y)
+        w_1 -= learning_rate * grad_1
+        w_2 -= learning_rate * grad_2
+
+    content = RecordDict({"arrays": ArrayRecord([w_1, w_2])})
+    return Message(content, reply_to=msg)
+
+
+def load_app() -> ClientApp:
+    """Return the ClientApp (a picklable function for the process backend)."""
+    return app
+
+
+def run_round(backend_name: str, backend, messages, contexts) -> float:
+    """Process one message per client and return the elapsed time."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=backend.num_workers) as executor:
+        results = list(executor.map(backend.process_message, messages, contexts))
+    elapsed = time.perf_counter() - start
+    for idx, (_, context) in enumerate(results):
+        contexts[idx] = context
+    print(f"{backend_name:>8} round: {elapsed:8.2f}s")
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--hidden", type=int, default=256)
+    parser.add_argument("--num-cpus", type=int, default=None)
+    parser.add_argument(
+        "--backends", nargs="+", default=["process", "ray"], choices=["process", "ray"]
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    arrays = ArrayRecord(
+        [
+            rng.normal(0, 0.01, (IMAGE_SIZE, args.hidden)).astype(np.float32),
+            rng.normal(0, 0.01, (args.hidden, NUM_CLASSES)).astype(np.float32),
+        ]
+    )
+    content = RecordDict({"arrays": arrays, "config": ConfigRecord({"lr": 0.01})})
+    print(
+        f"{args.clients} clients, model of "
+        f"{sum(len(a.data) for a in arrays.values()) / 1e6:.1f} MB"
+    )
+
+    backend_config = {"client_resources": {"num_cpus": 1, "num_gpus": 0.0}}
+    if args.num_cpus:
+        backend_config["init_args"] = {"num_cpus": args.num_cpus}
+
+    for backend_name in args.backends:
+        start = time.perf_counter()
+        backend = supported_backends[backend_name](backend_config)
+        backend.build(load_app)
+        startup = time.perf_counter() - start
+        num_workers = backend.num_workers
+
+        messages = [
+            Message(content, dst_node_id=node_id, message_type=MessageType.TRAIN)
+            for node_id in range(args.clients)
+        ]
+        contexts = [
+            Context(
+                run_id=1,
+                node_id=node_id,
+                node_config={
+                    PARTITION_ID_KEY: node_id,
+                    NUM_PARTITIONS_KEY: args.clients,
+                },
+                state=RecordDict(),
+                run_config={},
+            )
+            for node_id in range(args.clients)
+        ]
+        total = sum(
+            run_round(backend_name, backend, messages, contexts)
+            for _ in range(args.rounds)
+        )
+        backend.terminate()
+        print(
+            f"{backend_name:>8}: {num_workers} workers, "
+            f"startup {startup:.2f}s, {total / args.rounds:.2f}s/round (mean)"
+        )
+
+
+if __name__ == "__main__":
+    main()
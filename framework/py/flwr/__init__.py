@@ -15,9 +15,13 @@
 """Flower main package."""
 
 
+from typing import TYPE_CHECKING
+
+from flwr.common.lazy_import import lazy_attributes
 from flwr.common.version import package_version as _package_version
 
-from . import client, common, server, simulation
+if TYPE_CHECKING:
+    from . import client, common, server, simulation
 
 __all__ = [
     "client",
@@ -27,3 +31,15 @@ __all__ = [
 ]
 
 __version__ = _package_version
+
+# Import the subpackages on first access to keep `import flwr` fast
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "client": ".client",
+            "common": ".common",
+            "server": ".server",
+            "simulation": ".simulation",
+        },
+    )
@@ -15,6 +15,10 @@
 """Test for flwr __init__.py."""
 
 
+import subprocess
+import sys
+
+import pytest
 import semver
 
 
@@ -25,3 +29,35 @@ def test_version() -> None:
 
     # Assert
     semver.VersionInfo.parse(__version__)
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing flwr does not import its subpackages."""
+    # Execute
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, flwr; print(sorted(m for m in sys.modules "
+            "if m.startswith(('flwr.server', 'flwr.client', 'flwr.simulation'))))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # Assert
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes() -> None:
+    """Test that the subpackages and their attributes are imported on access."""
+    # Execute
+    import flwr  # pylint: disable=import-outside-toplevel
+
+    # Assert
+    assert "server" in dir(flwr)
+    assert flwr.server.strategy.FedAvg.__name__ == "FedAvg"
+    assert flwr.common.Message.__name__ == "Message"
+    with pytest.raises(AttributeError):
+        _ = flwr.common.Unknown  # type: ignore[attr-defined]
@@ -16,7 +16,11 @@
 
 
 import hashlib
+import json
+import os
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Annotated, Any, Optional, Union
@@ -25,8 +29,10 @@ import pathspec
 import tomli_w
 import typer
 
+from flwr.common.config import get_flwr_dir
 from flwr.common.constant import (
     FAB_ALLOWED_EXTENSIONS,
+    FAB_BUILD_CACHE_DIR,
     FAB_DATE,
     FAB_HASH_TRUNCATION,
     FAB_MAX_SIZE,
@@ -36,6 +42,11 @@ from .config_utils import load as load_toml
 from .config_utils import load_and_validate
 from .utils import is_valid_project_name
 
+# Files modified less than this before the last build are hashed again, as they may
+# have been modified again without changing their size or mtime (e.g., on file
+# systems with a coarse mtime resolution)
+RACY_WINDOW_NS = 2_000_000_000
+
 
 def write_to_zip(
     zipfile_obj: zipfile.ZipFile, filename: str, contents: Union[bytes, str]
@@ -43,6 +54,10 @@ def write_to_zip(
     """Set a fixed date and write contents to a zip file."""
     zip_info = zipfile.ZipInfo(filename)
     zip_info.date_time = FAB_DATE
+    # Use the same attributes on all platforms, so that the FAB hash only depends on
+    # the contents of the app
+    zip_info.create_system = 3
+    zip_info.external_attr = 0
     zipfile_obj.writestr(zip_info, contents)
     return zipfile_obj
 
@@ -125,16 +140,21 @@ def build(
     )
 
 
-def build_fab(app: Path) -> tuple[bytes, str, dict[str, Any]]:
+def build_fab(app: Path, use_cache: bool = True) -> tuple[bytes, str, dict[str, Any]]:
     """Build a FAB in memory and return the bytes, hash, and config.
 
     This function assumes that the provided path points to a valid Flower app and
-    bundles it into a FAB without performing additional validation.
+    bundles it into a FAB without performing additional validation. The FAB is
+    reproducible: building an unchanged app returns the same bytes and hash. If
+    `use_cache` is True, the FAB of an unchanged app and the hashes of unchanged
+    files are reused from the last build, detecting changes by file size and mtime.
 
     Parameters
     ----------
     app : Path
         Path to the Flower app to bundle into a FAB.
+    use_cache : bool (default: True)
+        Whether to use the build cache in the Flower directory.
 
     Returns
     -------
@@ -158,19 +178,41 @@ def build_fab(app: Path) -> tuple[bytes, str, dict[str, Any]]:
         and "federations" in config["tool"]["flwr"]
     ):
         del config["tool"]["flwr"]["federations"]
-
-    # Load .gitignore rules if present
-    ignore_spec = _load_gitignore(app)
+    pyproject = tomli_w.dumps(config)
 
     # Search for all files in the app directory
-    all_files = [
-        f
-        for f in app.rglob("*")
-        if not ignore_spec.match_file(f)
-        and f.suffix in FAB_ALLOWED_EXTENSIONS
-        and f.name != "pyproject.toml"  # Exclude the original pyproject.toml
-    ]
-    all_files.sort()
+    archive_paths = _list_files(app, _load_gitignore(app))
+    all_files = [os.path.join(app, archive_path) for archive_path in archive_paths]
+    stats = [(st.st_size, st.st_mtime_ns) for st in map(os.stat, all_files)]
+
+    # Reuse the last build if no file changed since
+    cache_path = _get_cache_path(app) if use_cache else None
+    cache = _load_cache(cache_path)
+    build_key = hashlib.sha256(
+        json.dumps([pyproject, archive_paths, stats]).encode()
+    ).hexdigest()
+    built_at_ns: int = cache.get("built_at_ns", 0)
+    is_racy = any(mtime >= built_at_ns - RACY_WINDOW_NS for _, mtime in stats)
+    if cache_path is not None and cache.get("build_key") == build_key and not is_racy:
+        fab_bytes = _read_cached_fab(cache_path, cache.get("fab_hash"))
+        if fab_bytes is not None:
+            return fab_bytes, cache["fab_hash"], config
+
+    # Read the files and hash the new or modified ones in parallel
+    cached_files: dict[str, list[Any]] = cache.get("files", {})
+
+    def read_and_hash(index: int) -> tuple[bytes, str]:
+        with open(all_files[index], "rb") as file:
+            file_contents = file.read()
+        entry = cached_files.get(archive_paths[index])
+        size, mtime = stats[index]
+        if entry is not None and entry[:2] == [size, mtime]:
+            if mtime < built_at_ns - RACY_WINDOW_NS:
+                return file_contents, str(entry[2])
+        return file_contents, hashlib.sha256(file_contents).hexdigest()
+
+    with ThreadPoolExecutor() as executor:
+        files = list(executor.map(read_and_hash, range(len(all_files))))
 
     # Create a zip file in memory
     list_file_content = ""
@@ -178,17 +220,12 @@ def build_fab(app: Path) -> tuple[bytes, str, dict[str, Any]]:
     fab_buffer = BytesIO()
     with zipfile.ZipFile(fab_buffer, "w", zipfile.ZIP_DEFLATED) as fab_file:
         # Add pyproject.toml
-        write_to_zip(fab_file, "pyproject.toml", tomli_w.dumps(config))
+        write_to_zip(fab_file, "pyproject.toml", pyproject)
 
-        for file_path in all_files:
-            # Read the file content manually
-            file_contents = file_path.read_bytes()
-
-            archive_path = str(file_path.relative_to(app))
+        for archive_path, (file_contents, sha256_hash) in zip(archive_paths, files):
             write_to_zip(fab_file, archive_path, file_contents)
 
             # Calculate file info
-            sha256_hash = hashlib.sha256(file_contents).hexdigest()
             file_size_bits = len(file_contents) * 8  # size in bits
             list_file_content += f"{archive_path},{sha256_hash},{file_size_bits}\n"
 
@@ -205,9 +242,92 @@ def build_fab(app: Path) -> tuple[bytes, str, dict[str, Any]]:
 
     fab_hash = hashlib.sha256(fab_bytes).hexdigest()
 
+    if cache_path is not None:
+        _save_cache(
+            cache_path,
+            {
+                "build_key": build_key,
+                "built_at_ns": time.time_ns(),
+                "fab_hash": fab_hash,
+                "files": {
+                    archive_path: [size, mtime, sha256_hash]
+                    for archive_path, (size, mtime), (_, sha256_hash) in zip(
+                        archive_paths, stats, files
+                    )
+                },
+            },
+            fab_bytes,
+        )
+
     return fab_bytes, fab_hash, config
 
 
+def _list_files(app: Path, ignore_spec: pathspec.PathSpec) -> list[str]:
+    """Return the sorted archive paths of the files of the app to bundle."""
+    archive_paths: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(app):
+        # Do not descend into ignored directories (e.g., datasets or environments)
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if not ignore_spec.match_file(os.path.join(dirpath, dirname) + "/")
+        ]
+        rel_dir = os.path.relpath(dirpath, app).replace(os.sep, "/")
+        for filename in filenames:
+            if (
+                os.path.splitext(filename)[1] in FAB_ALLOWED_EXTENSIONS
+                and filename != "pyproject.toml"  # Exclude the original pyproject.toml
+                and not ignore_spec.match_file(os.path.join(dirpath, filename))
+            ):
+                archive_paths.append(
+                    filename if rel_dir == "." else f"{rel_dir}/{filename}"
+                )
+    # Sort by path components, as for `Path` objects
+    archive_paths.sort(key=lambda archive_path: archive_path.split("/"))
+    return archive_paths
+
+
+def _get_cache_path(app: Path) -> Path:
+    """Return the path of the build cache of the app in the Flower directory."""
+    # Resolve the path, so that each project has its own cache, e.g., for `flwr run .`
+    app_key = hashlib.sha256(str(app.resolve()).encode()).hexdigest()
+    return get_flwr_dir() / FAB_BUILD_CACHE_DIR / f"{app_key}.json"
+
+
+def _load_cache(cache_path: Optional[Path]) -> dict[str, Any]:
+    """Load the build cache, or return an empty cache if missing or invalid."""
+    if cache_path is None:
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _read_cached_fab(cache_path: Path, fab_hash: Optional[str]) -> Optional[bytes]:
+    """Read the FAB of the last build, or return None if missing or corrupted."""
+    try:
+        fab_bytes = cache_path.with_suffix(".fab").read_bytes()
+    except OSError:
+        return None
+    if hashlib.sha256(fab_bytes).hexdigest() != fab_hash:
+        return None
+    return fab_bytes
+
+
+def _save_cache(cache_path: Path, cache: dict[str, Any], fab_bytes: bytes) -> None:
+    """Save the build cache and the FAB, ignoring errors as the cache is optional."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.with_suffix(".fab").write_bytes(fab_bytes)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
 def _load_gitignore(app: Path) -> pathspec.PathSpec:
     """Load and parse .gitignore file, returning a pathspec."""
     gitignore_path = app / ".gitignore"
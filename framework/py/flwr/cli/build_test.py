@@ -0,0 +1,137 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test for Flower command line interface `build` command."""
+
+
+import os
+import shutil
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from flwr.common.constant import FLWR_HOME
+
+from .build import RACY_WINDOW_NS, _get_cache_path, build_fab
+from .install import _verify_hashes
+
+PYPROJECT = """
+[project]
+name = "test-app"
+version = "1.0.0"
+
+[tool.flwr.app]
+publisher = "flwrlabs"
+"""
+
+
+@pytest.fixture(name="app")
+def fixture_app(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a Flower app and use a temporary Flower directory."""
+    monkeypatch.setenv(FLWR_HOME, str(tmp_path / "flwr"))
+    app = tmp_path / "test-app"
+    (app / "test_app").mkdir(parents=True)
+    (app / "pyproject.toml").write_text(PYPROJECT)
+    (app / "README.md").write_text("# Test app")
+    (app / "test_app" / "client_app.py").write_text("CLIENT = 1\n")
+    (app / "test_app" / "server_app.py").write_text("SERVER = 1\n")
+    (app / "data").mkdir()
+    (app / "data" / "generate.py").write_text("DATA = 1\n")
+    (app / ".gitignore").write_text("data/\n")
+    # Make the files older than the racy window, as if they were edited earlier
+    mtime = (os.stat(app).st_mtime_ns - 2 * RACY_WINDOW_NS) / 1e9
+    for file_path in app.rglob("*"):
+        os.utime(file_path, (mtime, mtime))
+    return app
+
+
+def _names(fab_bytes: bytes) -> list[str]:
+    with zipfile.ZipFile(BytesIO(fab_bytes)) as fab_file:
+        return fab_file.namelist()
+
+
+def test_build_fab_is_reproducible(app: Path) -> None:
+    """Test that the cached and uncached builds of an app are identical."""
+    # Execute
+    fab_bytes, fab_hash, _ = build_fab(app, use_cache=False)
+    first = build_fab(app)
+    second = build_fab(app)
+
+    # Assert
+    assert first[:2] == second[:2] == (fab_bytes, fab_hash)
+    assert _names(fab_bytes) == [
+        "pyproject.toml",
+        "README.md",
+        "test_app/client_app.py",
+        "test_app/server_app.py",
+        ".info/CONTENT",
+    ]
+
+
+def test_build_fab_detects_modified_files(app: Path) -> None:
+    """Test that a file modified after a cached build is bundled."""
+    # Prepare
+    _, fab_hash, _ = build_fab(app)
+
+    # Execute
+    (app / "test_app" / "client_app.py").write_text("CLIENT = 2\n")
+    fab_bytes, new_fab_hash, _ = build_fab(app)
+
+    # Assert
+    assert new_fab_hash != fab_hash
+    assert (fab_bytes, new_fab_hash) == build_fab(app, use_cache=False)[:2]
+
+
+def test_build_fab_caches_each_project_separately(
+    app: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that projects built from a relative path do not share their cache."""
+    # Prepare: a copy keeping the sizes and mtimes, with different file contents
+    other_app = tmp_path / "other-app"
+    shutil.copytree(app, other_app)
+    client_app = other_app / "test_app" / "client_app.py"
+    stat = os.stat(client_app)
+    client_app.write_text("CLIENT = 3\n")
+    os.utime(client_app, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    # Execute
+    monkeypatch.chdir(app)
+    fab_hash = build_fab(Path("."))[1]
+    cache_path = _get_cache_path(Path("."))
+    monkeypatch.chdir(other_app)
+    other_fab_hash = build_fab(Path("."))[1]
+
+    # Assert
+    assert cache_path == _get_cache_path(app)
+    assert cache_path != _get_cache_path(Path("."))
+    assert fab_hash == build_fab(app, use_cache=False)[1]
+    assert other_fab_hash == build_fab(other_app, use_cache=False)[1]
+    assert other_fab_hash != fab_hash
+
+
+def test_verify_hashes(app: Path, tmp_path: Path) -> None:
+    """Test that the hashes of a FAB are verified after extraction."""
+    # Prepare
+    fab_bytes, _, _ = build_fab(app)
+    extract_dir = tmp_path / "extracted"
+    with zipfile.ZipFile(BytesIO(fab_bytes)) as fab_file:
+        fab_file.extractall(extract_dir)
+    content = (extract_dir / ".info" / "CONTENT").read_text()
+
+    # Execute & Assert
+    assert _verify_hashes(content, extract_dir)
+    (extract_dir / "README.md").write_text("# Modified")
+    assert not _verify_hashes(content, extract_dir)
@@ -19,6 +19,7 @@ import hashlib
 import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import IO, Annotated, Optional, Union
@@ -199,12 +200,15 @@ def validate_and_install(
 
 def _verify_hashes(list_content: str, tmpdir: Path) -> bool:
     """Verify file hashes based on the LIST content."""
-    for line in list_content.strip().split("\n"):
+
+    def verify(line: str) -> bool:
         rel_path, hash_expected, _ = line.split(",")
         file_path = tmpdir / rel_path
-        if not file_path.exists() or get_sha256_hash(file_path) != hash_expected:
-            return False
-    return True
+        return file_path.exists() and get_sha256_hash(file_path) == hash_expected
+
+    # Hash the files in parallel, hashlib releases the GIL while hashing
+    with ThreadPoolExecutor() as executor:
+        return all(executor.map(verify, list_content.strip().split("\n")))
 
 
 def _validate_fab_and_config_metadata(
@@ -15,13 +15,20 @@
 """Flower client."""
 
 
-from ..compat.client.app import start_client as start_client  # Deprecated
-from ..compat.client.app import start_numpy_client as start_numpy_client  # Deprecated
-from .client import Client as Client
-from .client_app import ClientApp as ClientApp
-from .numpy_client import NumPyClient as NumPyClient
-from .typing import ClientFn as ClientFn
-from .typing import ClientFnExt as ClientFnExt
+from typing import TYPE_CHECKING
+
+from ..common.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from ..compat.client.app import start_client as start_client  # Deprecated
+    from ..compat.client.app import (
+        start_numpy_client as start_numpy_client,  # Deprecated
+    )
+    from .client import Client as Client
+    from .client_app import ClientApp as ClientApp
+    from .numpy_client import NumPyClient as NumPyClient
+    from .typing import ClientFn as ClientFn
+    from .typing import ClientFnExt as ClientFnExt
 
 __all__ = [
     "Client",
@@ -33,3 +40,19 @@ __all__ = [
     "start_client",
     "start_numpy_client",
 ]
+
+# Import the attributes on first access to keep `import flwr` fast
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "start_client": "..compat.client.app",
+            "start_numpy_client": "..compat.client.app",
+            "Client": ".client",
+            "ClientApp": ".client_app",
+            "NumPyClient": ".numpy_client",
+            "ClientFn": ".typing",
+            "ClientFnExt": ".typing",
+            "mod": ".mod",
+        },
+    )
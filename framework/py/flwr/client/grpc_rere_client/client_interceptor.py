@@ -15,14 +15,22 @@
 """Flower client interceptor."""
 
 
-from typing import Any, Callable
+import threading
+import time
+from typing import Any, Callable, Optional, cast
 
 import grpc
 from cryptography.hazmat.primitives.asymmetric import ec
 from google.protobuf.message import Message as GrpcMessage
 
 from flwr.common import now
-from flwr.common.constant import PUBLIC_KEY_HEADER, SIGNATURE_HEADER, TIMESTAMP_HEADER
+from flwr.common.constant import (
+    PUBLIC_KEY_HEADER,
+    SESSION_TOKEN_HEADER,
+    SESSION_TOKEN_TTL,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+)
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
     public_key_to_bytes,
     sign_message,
@@ -30,7 +38,13 @@ from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
 
 
 class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type: ignore
-    """Client interceptor for client authentication."""
+    """Client interceptor for client authentication.
+
+    Requests are signed with the private key of the node until the SuperLink issues a
+    session token, which then authenticates the requests in place of the signature. The
+    token is renewed by signing a request again once half of its lifetime has passed, or
+    when the SuperLink rejects it.
+    """
 
     def __init__(
         self,
@@ -39,6 +53,9 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
     ):
         self.private_key = private_key
         self.public_key_bytes = public_key_to_bytes(public_key)
+        self._session_token: Optional[str] = None
+        self._renew_at = 0.0
+        self._lock = threading.Lock()
 
     def intercept_unary_unary(
         self,
@@ -52,19 +69,49 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         RPC metadata.
         """
         metadata = list(client_call_details.metadata or [])
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode("ascii")
 
-        # Add the public key
-        metadata.append((PUBLIC_KEY_HEADER, self.public_key_bytes))
+        with self._lock:
+            token = self._session_token
+            if time.monotonic() >= self._renew_at or method.endswith("CreateNode"):
+                token = None
 
-        # Add timestamp
-        timestamp = now().isoformat()
-        metadata.append((TIMESTAMP_HEADER, timestamp))
+        if token is not None:
+            metadata.append((SESSION_TOKEN_HEADER, token))
+        else:
+            # Add the public key
+            metadata.append((PUBLIC_KEY_HEADER, self.public_key_bytes))
 
-        # Sign and add the signature
-        signature = sign_message(self.private_key, timestamp.encode("ascii"))
-        metadata.append((SIGNATURE_HEADER, signature))
+            # Add timestamp
+            timestamp = now().isoformat()
+            metadata.append((TIMESTAMP_HEADER, timestamp))
+
+            # Sign and add the signature
+            signature = sign_message(self.private_key, timestamp.encode("ascii"))
+            metadata.append((SIGNATURE_HEADER, signature))
 
         # Overwrite the metadata
         details = client_call_details._replace(metadata=metadata)
 
-        return continuation(details, request)
+        call = continuation(details, request)
+        if call.code() == grpc.StatusCode.UNAUTHENTICATED and token is not None:
+            # The token may have expired or been issued before a SuperLink restart
+            with self._lock:
+                self._session_token = None
+                self._renew_at = 0.0
+            return self.intercept_unary_unary(
+                continuation, client_call_details, request
+            )
+        if token is None and call.code() == grpc.StatusCode.OK:
+            self._store_session_token(call)
+        return call
+
+    def _store_session_token(self, call: grpc.Call) -> None:
+        """Store the session token sent by the SuperLink, if any."""
+        for key, value in call.trailing_metadata() or ():
+            if key == SESSION_TOKEN_HEADER:
+                with self._lock:
+                    self._session_token = cast(str, value)
+                    self._renew_at = time.monotonic() + SESSION_TOKEN_TTL / 2
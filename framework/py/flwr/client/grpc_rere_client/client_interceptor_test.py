@@ -28,7 +28,12 @@ from parameterized import parameterized
 
 from flwr.client.grpc_rere_client.connection import grpc_request_response
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH
-from flwr.common.constant import PUBLIC_KEY_HEADER, SIGNATURE_HEADER, TIMESTAMP_HEADER
+from flwr.common.constant import (
+    PUBLIC_KEY_HEADER,
+    SESSION_TOKEN_HEADER,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+)
 from flwr.common.logger import log
 from flwr.common.message import Message
 from flwr.common.record import RecordDict
@@ -66,6 +71,8 @@ class _MockServicer:
             Sequence[tuple[str, Union[str, bytes]]]
         ] = None
         self._received_message_bytes: bytes = b""
+        # If set, sent to the client in the trailing metadata of every response
+        self.session_token: Optional[str] = None
 
     def unary_unary(  # pylint: disable=too-many-return-statements
         self, request: GrpcMessage, context: grpc.ServicerContext
@@ -74,6 +81,10 @@ class _MockServicer:
         with self._lock:
             self._received_client_metadata = context.invocation_metadata()
             self._received_message_bytes = request.SerializeToString(deterministic=True)
+            if self.session_token is not None:
+                context.set_trailing_metadata(
+                    ((SESSION_TOKEN_HEADER, self.session_token),)
+                )
 
             if isinstance(request, CreateNodeRequest):
                 return CreateNodeResponse(node=Node(node_id=123))
@@ -262,6 +273,30 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
                 self._client_public_key, timestamp.encode("ascii"), signature
             )
 
+    def test_session_token_replaces_signature(self) -> None:
+        """Test that requests carry the session token issued by the server."""
+        # Prepare
+        self._servicer.session_token = "token"
+        retry_invoker = _init_retry_invoker()
+
+        # Execute
+        with self._connection(
+            self._address,
+            True,
+            retry_invoker,
+            GRPC_MAX_MESSAGE_LENGTH,
+            None,
+            (self._client_private_key, self._client_public_key),
+        ) as conn:
+            _get_run(conn)
+            received_metadata = self._servicer.received_client_metadata()
+
+        # Assert
+        assert received_metadata is not None
+        metadata_dict = dict(received_metadata)
+        assert metadata_dict[SESSION_TOKEN_HEADER] == "token"
+        assert SIGNATURE_HEADER not in metadata_dict
+
     def test_without_servicer(self) -> None:
         """Test client authentication without servicer."""
         # Prepare
@@ -15,11 +15,16 @@
 """Flower Built-in Mods."""
 
 
-from .centraldp_mods import adaptiveclipping_mod, fixedclipping_mod
-from .comms_mods import arrays_size_mod, message_size_mod
-from .localdp_mod import LocalDpMod
-from .secure_aggregation import secagg_mod, secaggplus_mod
-from .utils import make_ffn
+from typing import TYPE_CHECKING
+
+from flwr.common.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .centraldp_mods import adaptiveclipping_mod, fixedclipping_mod
+    from .comms_mods import arrays_size_mod, message_size_mod
+    from .localdp_mod import LocalDpMod
+    from .secure_aggregation import secagg_mod, secaggplus_mod
+    from .utils import make_ffn
 
 __all__ = [
     "LocalDpMod",
@@ -31,3 +36,19 @@ __all__ = [
     "secagg_mod",
     "secaggplus_mod",
 ]
+
+# Import the mods on first access, the secure aggregation mods are slow to import
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "adaptiveclipping_mod": ".centraldp_mods",
+            "fixedclipping_mod": ".centraldp_mods",
+            "arrays_size_mod": ".comms_mods",
+            "message_size_mod": ".comms_mods",
+            "LocalDpMod": ".localdp_mod",
+            "secagg_mod": ".secure_aggregation",
+            "secaggplus_mod": ".secure_aggregation",
+            "make_ffn": ".utils",
+        },
+    )
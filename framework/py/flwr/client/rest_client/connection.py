@@ -176,6 +176,17 @@ def http_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
     if authentication_keys is not None:
         log(ERROR, "Client authentication is not supported for this transport type.")
 
+    # Reuse TCP (and TLS) connections across requests instead of opening a new
+    # connection for every heartbeat, pull, and push
+    session = requests.Session()
+    session.verify = verify
+    session.headers.update(
+        {
+            "Accept": "application/protobuf",
+            "Content-Type": "application/protobuf",
+        }
+    )
+
     # Shared variables for inner functions
     node: Optional[Node] = None
 
@@ -191,14 +202,9 @@ def http_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
 
         # Send the request
         def post() -> requests.Response:
-            return requests.post(
+            return session.post(
                 f"{base_url}/{api_path}",
                 data=req_bytes,
-                headers={
-                    "Accept": "application/protobuf",
-                    "Content-Type": "application/protobuf",
-                },
-                verify=verify,
                 timeout=None,
             )
 
@@ -471,3 +477,4 @@ def http_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
                 delete_node()
         except RequestsConnectionError:
             pass
+        session.close()
@@ -15,57 +15,62 @@
 """Common components shared between server and client."""
 
 
-from ..app.error import Error as Error
-from ..app.metadata import Metadata as Metadata
-from .constant import MessageType as MessageType
-from .constant import MessageTypeLegacy as MessageTypeLegacy
-from .context import Context as Context
-from .date import now as now
-from .grpc import GRPC_MAX_MESSAGE_LENGTH
-from .logger import configure as configure
-from .logger import log as log
-from .message import DEFAULT_TTL
-from .message import Message as Message
-from .parameter import bytes_to_ndarray as bytes_to_ndarray
-from .parameter import ndarray_to_bytes as ndarray_to_bytes
-from .parameter import ndarrays_to_parameters as ndarrays_to_parameters
-from .parameter import parameters_to_ndarrays as parameters_to_ndarrays
-from .record import Array as Array
-from .record import ArrayRecord as ArrayRecord
-from .record import ConfigRecord as ConfigRecord
-from .record import ConfigsRecord as ConfigsRecord
-from .record import MetricRecord as MetricRecord
-from .record import MetricsRecord as MetricsRecord
-from .record import ParametersRecord as ParametersRecord
-from .record import RecordDict as RecordDict
-from .record import RecordSet as RecordSet
-from .record import array_from_numpy as array_from_numpy
-from .telemetry import EventType as EventType
-from .telemetry import event as event
-from .typing import ClientMessage as ClientMessage
-from .typing import Code as Code
-from .typing import Config as Config
-from .typing import ConfigRecordValues as ConfigRecordValues
-from .typing import DisconnectRes as DisconnectRes
-from .typing import EvaluateIns as EvaluateIns
-from .typing import EvaluateRes as EvaluateRes
-from .typing import FitIns as FitIns
-from .typing import FitRes as FitRes
-from .typing import GetParametersIns as GetParametersIns
-from .typing import GetParametersRes as GetParametersRes
-from .typing import GetPropertiesIns as GetPropertiesIns
-from .typing import GetPropertiesRes as GetPropertiesRes
-from .typing import MetricRecordValues as MetricRecordValues
-from .typing import Metrics as Metrics
-from .typing import MetricsAggregationFn as MetricsAggregationFn
-from .typing import NDArray as NDArray
-from .typing import NDArrays as NDArrays
-from .typing import Parameters as Parameters
-from .typing import Properties as Properties
-from .typing import ReconnectIns as ReconnectIns
-from .typing import Scalar as Scalar
-from .typing import ServerMessage as ServerMessage
-from .typing import Status as Status
+from typing import TYPE_CHECKING
+
+from .lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from ..app.error import Error as Error
+    from ..app.metadata import Metadata as Metadata
+    from .constant import MessageType as MessageType
+    from .constant import MessageTypeLegacy as MessageTypeLegacy
+    from .context import Context as Context
+    from .date import now as now
+    from .grpc import GRPC_MAX_MESSAGE_LENGTH as GRPC_MAX_MESSAGE_LENGTH
+    from .logger import configure as configure
+    from .logger import log as log
+    from .message import DEFAULT_TTL as DEFAULT_TTL
+    from .message import Message as Message
+    from .parameter import bytes_to_ndarray as bytes_to_ndarray
+    from .parameter import ndarray_to_bytes as ndarray_to_bytes
+    from .parameter import ndarrays_to_parameters as ndarrays_to_parameters
+    from .parameter import parameters_to_ndarrays as parameters_to_ndarrays
+    from .record import Array as Array
+    from .record import ArrayRecord as ArrayRecord
+    from .record import ConfigRecord as ConfigRecord
+    from .record import ConfigsRecord as ConfigsRecord
+    from .record import MetricRecord as MetricRecord
+    from .record import MetricsRecord as MetricsRecord
+    from .record import ParametersRecord as ParametersRecord
+    from .record import RecordDict as RecordDict
+    from .record import RecordSet as RecordSet
+    from .record import array_from_numpy as array_from_numpy
+    from .telemetry import EventType as EventType
+    from .telemetry import event as event
+    from .typing import ClientMessage as ClientMessage
+    from .typing import Code as Code
+    from .typing import Config as Config
+    from .typing import ConfigRecordValues as ConfigRecordValues
+    from .typing import DisconnectRes as DisconnectRes
+    from .typing import EvaluateIns as EvaluateIns
+    from .typing import EvaluateRes as EvaluateRes
+    from .typing import FitIns as FitIns
+    from .typing import FitRes as FitRes
+    from .typing import GetParametersIns as GetParametersIns
+    from .typing import GetParametersRes as GetParametersRes
+    from .typing import GetPropertiesIns as GetPropertiesIns
+    from .typing import GetPropertiesRes as GetPropertiesRes
+    from .typing import MetricRecordValues as MetricRecordValues
+    from .typing import Metrics as Metrics
+    from .typing import MetricsAggregationFn as MetricsAggregationFn
+    from .typing import NDArray as NDArray
+    from .typing import NDArrays as NDArrays
+    from .typing import Parameters as Parameters
+    from .typing import Properties as Properties
+    from .typing import ReconnectIns as ReconnectIns
+    from .typing import Scalar as Scalar
+    from .typing import ServerMessage as ServerMessage
+    from .typing import Status as Status
 
 __all__ = [
     "Array",
@@ -120,3 +125,62 @@ __all__ = [
     "now",
     "parameters_to_ndarrays",
 ]
+
+# Import the attributes on first access to keep `import flwr` fast
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "Error": "..app.error",
+            "Metadata": "..app.metadata",
+            "MessageType": ".constant",
+            "MessageTypeLegacy": ".constant",
+            "Context": ".context",
+            "now": ".date",
+            "GRPC_MAX_MESSAGE_LENGTH": ".grpc",
+            "configure": ".logger",
+            "log": ".logger",
+            "DEFAULT_TTL": ".message",
+            "Message": ".message",
+            "bytes_to_ndarray": ".parameter",
+            "ndarray_to_bytes": ".parameter",
+            "ndarrays_to_parameters": ".parameter",
+            "parameters_to_ndarrays": ".parameter",
+            "Array": ".record",
+            "ArrayRecord": ".record",
+            "ConfigRecord": ".record",
+            "ConfigsRecord": ".record",
+            "MetricRecord": ".record",
+            "MetricsRecord": ".record",
+            "ParametersRecord": ".record",
+            "RecordDict": ".record",
+            "RecordSet": ".record",
+            "array_from_numpy": ".record",
+            "EventType": ".telemetry",
+            "event": ".telemetry",
+            "ClientMessage": ".typing",
+            "Code": ".typing",
+            "Config": ".typing",
+            "ConfigRecordValues": ".typing",
+            "DisconnectRes": ".typing",
+            "EvaluateIns": ".typing",
+            "EvaluateRes": ".typing",
+            "FitIns": ".typing",
+            "FitRes": ".typing",
+            "GetParametersIns": ".typing",
+            "GetParametersRes": ".typing",
+            "GetPropertiesIns": ".typing",
+            "GetPropertiesRes": ".typing",
+            "MetricRecordValues": ".typing",
+            "Metrics": ".typing",
+            "MetricsAggregationFn": ".typing",
+            "NDArray": ".typing",
+            "NDArrays": ".typing",
+            "Parameters": ".typing",
+            "Properties": ".typing",
+            "ReconnectIns": ".typing",
+            "Scalar": ".typing",
+            "ServerMessage": ".typing",
+            "Status": ".typing",
+        },
+    )
@@ -23,7 +23,6 @@ from pathlib import Path
 from typing import IO, Any, Optional, TypeVar, Union, cast, get_args
 
 import tomli
-import typer
 
 from flwr.common.constant import (
     APP_DIR,
@@ -238,6 +237,9 @@ def parse_config_args(
                 overrides.update(tomli.loads(toml_str))
                 flat_overrides = flatten_dict(overrides) if flatten else overrides
             except tomli.TOMLDecodeError as err:
+                # Only import typer when needed, it is slow to import
+                import typer  # pylint: disable=import-outside-toplevel
+
                 typer.secho(
                     "❌ The provided configuration string is in an invalid format. "
                     "The correct format should be, e.g., 'key1=123 key2=false "
@@ -62,6 +62,7 @@ HEARTBEAT_BASE_MULTIPLIER = 0.8
 HEARTBEAT_RANDOM_RANGE = (-0.1, 0.1)
 HEARTBEAT_MAX_INTERVAL = 1e300
 HEARTBEAT_PATIENCE = 2
+HEARTBEAT_FLUSH_INTERVAL = 10.0  # Seconds between two writes of heartbeats
 RUN_FAILURE_DETAILS_NO_HEARTBEAT = "No heartbeat received from the run."
 
 # IDs
@@ -75,6 +76,7 @@ FAB_CONFIG_FILE = "pyproject.toml"
 FAB_DATE = (2024, 10, 1, 0, 0, 0)
 FAB_HASH_TRUNCATION = 8
 FAB_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
+FAB_BUILD_CACHE_DIR = "fab-cache"  # Cache of the last build of each app in FLWR_DIR
 FLWR_DIR = ".flwr"  # The default Flower directory: ~/.flwr/
 FLWR_HOME = "FLWR_HOME"  # If set, override the default Flower directory
 
@@ -99,12 +101,16 @@ MESSAGE_TTL_TOLERANCE = 1e-1
 # Isolation modes
 ISOLATION_MODE_SUBPROCESS = "subprocess"
 ISOLATION_MODE_PROCESS = "process"
+# Fallback interval at which the SuperLink checks for pending runs
+SCHEDULER_POLL_INTERVAL = 1.0
 
 # Log streaming configurations
 CONN_REFRESH_PERIOD = 60  # Stream connection refresh period
 CONN_RECONNECT_INTERVAL = 0.5  # Reconnect interval between two stream connections
-LOG_STREAM_INTERVAL = 0.5  # Log stream interval for `ExecServicer.StreamLogs`
+LOG_STREAM_INTERVAL = 0.5  # Max wait for new logs in `ExecServicer.StreamLogs`
 LOG_UPLOAD_INTERVAL = 0.2  # Minimum interval between two log uploads
+LOG_BUFFER_CAPACITY = 1000  # Log entries kept in memory per run by the SuperLink
+LOG_BUFFER_MAX_RUNS = 100  # Runs whose latest logs are kept in memory
 
 # Retry configurations
 MAX_RETRY_DELAY = 20  # Maximum delay duration between two consecutive retries.
@@ -125,6 +131,8 @@ SIGNATURE_HEADER = "flwr-signature-bin"  # Must end with "-bin" for binary data
 TIMESTAMP_HEADER = "flwr-timestamp"
 TIMESTAMP_TOLERANCE = 10  # General tolerance for timestamp verification
 SYSTEM_TIME_TOLERANCE = 5  # Allowance for system time drift
+SESSION_TOKEN_HEADER = "flwr-session-token"
+SESSION_TOKEN_TTL = 300  # Seconds a session token issued to a node is valid
 
 # Constants for grpc retry
 GRPC_RETRY_MAX_DELAY = 20  # Maximum delay duration between two consecutive retries.
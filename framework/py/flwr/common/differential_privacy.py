@@ -16,11 +16,13 @@
 
 
 from logging import WARNING
-from typing import Optional
+from typing import Optional, cast
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from flwr.common import (
+    NDArray,
     NDArrays,
     Parameters,
     ndarrays_to_parameters,
@@ -31,16 +33,41 @@ from flwr.common.logger import log
 
 def get_norm(input_arrays: NDArrays) -> float:
     """Compute the L2 norm of the flattened input."""
-    array_norms = [np.linalg.norm(array.flat) for array in input_arrays]
-    # pylint: disable=consider-using-generator
-    return float(np.sqrt(sum([norm**2 for norm in array_norms])))
-
+    squared_norm = 0.0
+    for arr in input_arrays:
+        # Accumulate in double precision, integer and float16 dot products overflow
+        flat = arr.ravel().astype(np.float64, copy=False)
+        squared_norm += float(np.dot(flat, flat))
+    return float(np.sqrt(squared_norm))
+
+
+def add_gaussian_noise_inplace(
+    input_arrays: NDArrays,
+    std_dev: float,
+    rng: Optional[np.random.Generator] = None,
+) -> None:
+    """Add Gaussian noise to each element of the input arrays.
 
-def add_gaussian_noise_inplace(input_arrays: NDArrays, std_dev: float) -> None:
-    """Add Gaussian noise to each element of the input arrays."""
+    The noise of all arrays is drawn at once from `rng`, in single precision if all
+    arrays are float32. By default, a counter-based Philox generator is used, seeded
+    from NumPy's global random state so that runs seeded with `np.random.seed` are
+    reproducible.
+    """
+    if rng is None:
+        seed = np.random.randint(np.iinfo(np.int64).max, dtype=np.int64)
+        rng = np.random.Generator(np.random.Philox(int(seed)))
+    size = sum(arr.size for arr in input_arrays)
+    noise: NDArray
+    if all(arr.dtype == np.float32 for arr in input_arrays):
+        noise = rng.standard_normal(size, dtype=np.float32)
+    else:
+        noise = rng.standard_normal(size)
+    noise *= std_dev
+    start = 0
     for array in input_arrays:
-        noise = np.random.normal(0, std_dev, array.shape).astype(array.dtype)
-        array += noise
+        end = start + array.size
+        array += noise[start:end].reshape(array.shape).astype(array.dtype, copy=False)
+        start = end
 
 
 def clip_inputs_inplace(input_arrays: NDArrays, clipping_norm: float) -> None:
@@ -70,11 +97,72 @@ def compute_clip_model_update(
     """Compute model update (param1 - param2) and clip it.
 
     Then add the clipped value to param1."""
-    model_update = [np.subtract(x, y) for (x, y) in zip(param1, param2)]
-    clip_inputs_inplace(model_update, clipping_norm)
+    compute_clip_model_updates([param1], param2, clipping_norm)
 
-    for i, _ in enumerate(param2):
-        param1[i] = param2[i] + model_update[i]
+
+def compute_clip_model_updates(
+    params: list[NDArrays],
+    reference: NDArrays,
+    clipping_norm: float,
+    dtype: Optional[DTypeLike] = None,
+) -> NDArray:
+    """Compute the model updates of several clients and clip them at once.
+
+    For each client, the model update (`params[i] - reference`) is clipped and added
+    to `reference`, replacing the arrays in `params[i]`. All updates are flattened
+    into one contiguous buffer, so that their norms, clipping factors and clipped
+    values are computed in single vectorized passes.
+
+    FlatClip method of the paper: https://arxiv.org/abs/1710.06963
+
+    Parameters
+    ----------
+    params : list[NDArrays]
+        The model parameters of each client, updated in-place.
+    reference : NDArrays
+        The model parameters the clients started from.
+    clipping_norm : float
+        The value to clip the L2 norm of each model update to.
+    dtype : Optional[DTypeLike] (default: None)
+        The data type in which the updates are computed, e.g. `np.float32` to halve
+        the size of the buffer. If `None`, the floating-point type of the parameters
+        is used.
+
+    Returns
+    -------
+    NDArray
+        A boolean array indicating, for each client, whether its update was clipped.
+    """
+    if dtype is None:
+        # The smallest floating-point type that can hold all parameters
+        dtype = np.result_type(*{arr.dtype for arr in reference}, np.float16)
+    offsets = np.cumsum([0] + [arr.size for arr in reference])
+    flat_reference = np.empty(offsets[-1], dtype=dtype)
+    for arr, start, end in zip(reference, offsets[:-1], offsets[1:]):
+        flat_reference[start:end] = arr.ravel()
+    updates = np.empty((len(params), offsets[-1]), dtype=dtype)
+    for row, client_params in zip(updates, params):
+        for arr, start, end in zip(client_params, offsets[:-1], offsets[1:]):
+            row[start:end] = arr.ravel()
+
+    # Compute the updates, then their norms and clipping factors
+    updates -= flat_reference
+    norms = np.sqrt(np.einsum("ij,ij->i", updates, updates, dtype=np.float64))
+    with np.errstate(divide="ignore"):
+        scaling_factors = np.minimum(1, clipping_norm / norms)
+    updates *= scaling_factors[:, np.newaxis].astype(dtype, copy=False)
+    updates += flat_reference
+
+    for row, client_params in zip(updates, params):
+        for i, (arr, start, end) in enumerate(
+            zip(reference, offsets[:-1], offsets[1:])
+        ):
+            client_params[i] = (
+                row[start:end]
+                .reshape(arr.shape)
+                .astype(np.result_type(client_params[i], arr), copy=False)
+            )
+    return cast(NDArray, scaling_factors < 1)
 
 
 def adaptive_clip_inputs_inplace(input_arrays: NDArrays, clipping_norm: float) -> bool:
@@ -112,12 +200,14 @@ def add_gaussian_noise_to_params(
     noise_multiplier: float,
     clipping_norm: float,
     num_sampled_clients: int,
+    rng: Optional[np.random.Generator] = None,
 ) -> Parameters:
     """Add gaussian noise to model parameters."""
     model_params_ndarrays = parameters_to_ndarrays(model_params)
     add_gaussian_noise_inplace(
         model_params_ndarrays,
         compute_stdv(noise_multiplier, clipping_norm, num_sampled_clients),
+        rng,
     )
     return ndarrays_to_parameters(model_params_ndarrays)
 
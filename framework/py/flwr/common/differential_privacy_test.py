@@ -22,9 +22,11 @@ from .differential_privacy import (
     clip_inputs_inplace,
     compute_adaptive_noise_params,
     compute_clip_model_update,
+    compute_clip_model_updates,
     compute_stdv,
     get_norm,
 )
+from .typing import NDArrays
 
 
 def test_add_gaussian_noise_inplace() -> None:
@@ -57,6 +59,24 @@ def test_add_gaussian_noise_inplace() -> None:
         assert np.any(np.abs(noise_added) > 0)
 
 
+def test_add_gaussian_noise_inplace_with_rng() -> None:
+    """Test that the noise drawn from seeded generators is reproducible."""
+    # Prepare
+    updates = [[np.zeros((2, 3), np.float32), np.zeros(4, np.float32)] for _ in "ab"]
+
+    # Execute
+    for update in updates:
+        add_gaussian_noise_inplace(
+            update, 0.1, np.random.Generator(np.random.Philox(0))
+        )
+
+    # Assert
+    for layer, other_layer in zip(*updates):
+        assert layer.dtype == np.float32
+        np.testing.assert_array_equal(layer, other_layer)
+    assert np.any(updates[0][0] != 0)
+
+
 def test_get_norm() -> None:
     """Test get_norm function."""
     # Prepare
@@ -73,6 +93,51 @@ def test_get_norm() -> None:
     assert expected == result
 
 
+def test_get_norm_does_not_overflow() -> None:
+    """Test get_norm with integer and float16 arrays whose squares overflow."""
+    # Prepare
+    update: NDArrays = [
+        np.full(4, 50_000, dtype=np.int32),
+        np.full(4, 300, dtype=np.float16),
+    ]
+
+    # Execute
+    result = get_norm(update)
+
+    # Assert
+    np.testing.assert_allclose(result, np.sqrt(4 * 50_000**2 + 4 * 300**2))
+
+
+def test_add_gaussian_noise_inplace_follows_global_seed() -> None:
+    """Test that the default noise is reproducible with `np.random.seed`."""
+    # Prepare
+    updates = [[np.zeros((2, 3)), np.zeros(4)] for _ in "ab"]
+
+    # Execute
+    for update in updates:
+        np.random.seed(42)
+        add_gaussian_noise_inplace(update, 0.1)
+
+    # Assert
+    for layer, other_layer in zip(*updates):
+        np.testing.assert_array_equal(layer, other_layer)
+    assert np.any(updates[0][0] != 0)
+
+
+def test_compute_clip_model_updates_float16() -> None:
+    """Test that the norms of float16 updates do not overflow."""
+    # Prepare
+    reference = [np.zeros(4, dtype=np.float16)]
+    params = [[np.full(4, 300, dtype=np.float16)]]
+
+    # Execute
+    norm_bits = compute_clip_model_updates(params, reference, 1.0)
+
+    # Assert
+    assert norm_bits.tolist() == [True]
+    np.testing.assert_allclose(params[0][0], np.full(4, 0.5), rtol=1e-3)
+
+
 def test_clip_inputs_inplace() -> None:
     """Test clip_inputs_inplace function."""
     # Prepare
@@ -207,3 +272,44 @@ def test_compute_adaptive_noise_params() -> None:
 
     # Assert
     assert np.isclose(result[1], temp_value, rtol=1e-6)
+
+
+def test_compute_clip_model_updates() -> None:
+    """Test that batched clipping matches clipping each update separately."""
+    # Prepare
+    rng = np.random.default_rng(0)
+    reference = [rng.normal(size=(3, 4)), rng.normal(size=5)]
+    params = [
+        [layer + scale * rng.normal(size=layer.shape) for layer in reference]
+        for scale in (0.01, 1.0, 10.0)
+    ]
+    expected = [[np.copy(layer) for layer in client] for client in params]
+    for client in expected:
+        compute_clip_model_update(client, reference, 1.0)
+
+    # Execute
+    norm_bits = compute_clip_model_updates(params, reference, 1.0)
+
+    # Assert
+    np.testing.assert_array_equal(norm_bits, [False, True, True])
+    for client, expected_client in zip(params, expected):
+        for layer, expected_layer in zip(client, expected_client):
+            np.testing.assert_allclose(layer, expected_layer)
+
+
+def test_compute_clip_model_updates_float32() -> None:
+    """Test batched clipping computed in single precision."""
+    # Prepare
+    reference = [np.zeros((2, 2)), np.zeros(2)]
+    params = [[np.full((2, 2), 2.0), np.full(2, 2.0)]]
+
+    # Execute
+    norm_bits = compute_clip_model_updates(params, reference, 1.0, dtype=np.float32)
+
+    # Assert
+    assert norm_bits.tolist() == [True]
+    np.testing.assert_allclose(
+        np.concatenate([layer.ravel() for layer in params[0]]),
+        np.full(6, 1 / np.sqrt(6)),
+        rtol=1e-6,
+    )
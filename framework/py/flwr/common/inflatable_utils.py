@@ -19,7 +19,11 @@ import os
 import random
 import threading
 import time
-from typing import Callable, Optional, TypeVar
+import weakref
+from collections import OrderedDict
+from collections.abc import ItemsView, Iterator, KeysView, ValuesView
+from logging import WARNING
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
 
@@ -42,6 +46,7 @@ from .inflatable import (
     is_valid_sha256_hash,
     iterate_object_tree,
 )
+from .logger import log
 from .message import Message
 from .record import Array, ArrayRecord, ConfigRecord, MetricRecord, RecordDict
 from .record.arraychunk import ArrayChunk
@@ -366,6 +371,7 @@ def pull_and_inflate_object_from_tree(  # pylint: disable=R0913
     max_tries_per_object: Optional[int] = PULL_MAX_TRIES_PER_OBJECT,
     initial_backoff: float = PULL_INITIAL_BACKOFF,
     backoff_cap: float = PULL_BACKOFF_CAP,
+    lazy: bool = False,
 ) -> T:
     """Pull and inflate the head object from the provided object tree.
 
@@ -392,30 +398,43 @@ def pull_and_inflate_object_from_tree(  # pylint: disable=R0913
         `ObjectUnavailableError`.
     backoff_cap : float (default: PULL_BACKOFF_CAP)
         The maximum backoff time in seconds. Backoff times will not exceed this value.
+    lazy : bool (default: False)
+        If `True`, the arrays of the non-empty `ArrayRecord`s in the object are only
+        pulled and inflated when the record is first accessed. The object is then
+        confirmed as received once all these records are loaded or garbage
+        collected, as the objects they need must remain available until then.
 
     Returns
     -------
     T
         An instance of the specified return type containing the inflated object.
     """
-    # Pull the main object and all its descendants
-    pulled_object_contents = pull_objects(
-        [tree.object_id for tree in iterate_object_tree(object_tree)],
-        pull_object_fn,
-        max_concurrent_pulls=max_concurrent_pulls,
-        max_time=max_time,
-        max_tries_per_object=max_tries_per_object,
-        initial_backoff=initial_backoff,
-        backoff_cap=backoff_cap,
-    )
+    pull_kwargs: dict[str, Any] = {
+        "max_concurrent_pulls": max_concurrent_pulls,
+        "max_time": max_time,
+        "max_tries_per_object": max_tries_per_object,
+        "initial_backoff": initial_backoff,
+        "backoff_cap": backoff_cap,
+    }
+    if lazy:
+        inflated_object = _pull_and_inflate_lazily(
+            object_tree, pull_object_fn, confirm_object_received_fn, pull_kwargs
+        )
+    else:
+        # Pull the main object and all its descendants
+        pulled_object_contents = pull_objects(
+            [tree.object_id for tree in iterate_object_tree(object_tree)],
+            pull_object_fn,
+            **pull_kwargs,
+        )
 
-    # Confirm that all objects were pulled
-    confirm_object_received_fn(object_tree.object_id)
+        # Confirm that all objects were pulled
+        confirm_object_received_fn(object_tree.object_id)
 
-    # Inflate the main object
-    inflated_object = inflate_object_from_contents(
-        object_tree.object_id, pulled_object_contents, keep_object_contents=False
-    )
+        # Inflate the main object
+        inflated_object = inflate_object_from_contents(
+            object_tree.object_id, pulled_object_contents, keep_object_contents=False
+        )
 
     # Check if the inflated object is of the expected type
     if not isinstance(inflated_object, return_type):
@@ -425,3 +444,213 @@ def pull_and_inflate_object_from_tree(  # pylint: disable=R0913
         )
 
     return inflated_object
+
+
+def _pull_and_inflate_lazily(
+    object_tree: ObjectTree,
+    pull_object_fn: Callable[[str], bytes],
+    confirm_object_received_fn: Callable[[str], None],
+    pull_kwargs: dict[str, Any],
+) -> InflatableObject:
+    """Pull and inflate an object, deferring the arrays of its ArrayRecords."""
+    # Pull the object level by level, without descending into ArrayRecords
+    object_contents: dict[str, bytes] = {}
+    lazy_trees: dict[str, ObjectTree] = {}
+    level = [object_tree]
+    while level:
+        object_contents.update(
+            pull_objects(
+                list({t.object_id for t in level} - object_contents.keys()),
+                pull_object_fn,
+                **pull_kwargs,
+            )
+        )
+        next_level: list[ObjectTree] = []
+        for tree in level:
+            obj_type, _, _ = get_object_head_values_from_object_content(
+                object_contents[tree.object_id]
+            )
+            if obj_type == ArrayRecord.__qualname__ and tree.children:
+                lazy_trees[tree.object_id] = tree
+            else:
+                next_level.extend(tree.children)
+        level = next_level
+
+    confirmation = _PendingConfirmation(
+        lambda: confirm_object_received_fn(object_tree.object_id), len(lazy_trees)
+    )
+    objects: dict[str, InflatableObject] = {}
+    for object_id, tree in lazy_trees.items():
+        content = object_contents.pop(object_id)
+
+        def _load(tree: ObjectTree = tree, content: bytes = content) -> ArrayRecord:
+            # Pull the descendants of the record, whose content is already known
+            contents = pull_objects(
+                [t.object_id for t in iterate_object_tree(tree)][:-1],
+                pull_object_fn,
+                **pull_kwargs,
+            )
+            contents[tree.object_id] = content
+            return cast(
+                ArrayRecord, inflate_object_from_contents(tree.object_id, contents)
+            )
+
+        objects[object_id] = _LazyArrayRecord(
+            object_id, content, _load, confirmation.done
+        )
+
+    return inflate_object_from_contents(
+        object_tree.object_id, object_contents, objects=objects
+    )
+
+
+class _PendingConfirmation:
+    """Run a confirmation once a number of lazy records are done with the store."""
+
+    def __init__(self, confirm_fn: Callable[[], None], num_pending: int) -> None:
+        self._confirm_fn = confirm_fn
+        self._num_pending = num_pending
+        self._lock = threading.Lock()
+        if num_pending == 0:
+            confirm_fn()
+
+    def done(self) -> None:
+        """Mark one record as done, confirming once no record is pending."""
+        with self._lock:
+            self._num_pending -= 1
+            if self._num_pending != 0:
+                return
+        self._confirm_fn()
+
+
+class _LazyArrayRecord(ArrayRecord):
+    """ArrayRecord whose Arrays are pulled and inflated on first access.
+
+    Until then, the record only holds its own object content, from which its object
+    ID and deflated content are known. `on_done` is called once, when the Arrays are
+    loaded or the record is garbage collected before that.
+    """
+
+    def __init__(
+        self,
+        object_id: str,
+        object_content: bytes,
+        load_fn: Callable[[], ArrayRecord],
+        on_done: Callable[[], None],
+    ) -> None:
+        super().__init__()
+        self.__dict__["_object_id"] = object_id
+        self.__dict__["_object_content"] = object_content
+        self.__dict__["_load_fn"] = load_fn
+        self.__dict__["_load_lock"] = threading.Lock()
+        self.__dict__["_finalizer"] = weakref.finalize(self, _call_safely, on_done)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the Arrays of the record have been loaded."""
+        return self.__dict__["_load_fn"] is None
+
+    def _load(self) -> None:
+        """Pull and inflate the Arrays of the record, once."""
+        if self.is_loaded:
+            return
+        with self.__dict__["_load_lock"]:
+            if self.is_loaded:
+                return
+            record = self.__dict__["_load_fn"]()
+            self.__dict__["_data"] = record.__dict__["_data"]
+            self.__dict__["_is_dirty"] = False
+            self.__dict__["_load_fn"] = None
+            self.__dict__["_object_content"] = None
+        self.__dict__["_finalizer"]()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the object is dirty after the last deflation."""
+        if not self.is_loaded:
+            return False
+        return cast(bool, ArrayRecord.is_dirty.fget(self))  # type: ignore
+
+    @is_dirty.setter
+    def is_dirty(self, value: bool) -> None:
+        """Set the dirty flag."""
+        self.__dict__["_is_dirty"] = value
+
+    def deflate(self) -> bytes:
+        """Deflate the record as an ArrayRecord."""
+        if not self.is_loaded:
+            return cast(bytes, self.__dict__["_object_content"])
+        return ArrayRecord(OrderedDict(self.items())).deflate()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the record as an ArrayRecord."""
+        return (ArrayRecord, (OrderedDict(self.items()),))
+
+    def __setitem__(self, key: str, value: Array) -> None:
+        """Load the record, then set item."""
+        self._load()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Load the record, then delete item."""
+        self._load()
+        super().__delitem__(key)
+
+    def __getitem__(self, item: str) -> Array:
+        """Load the record, then get item."""
+        self._load()
+        return super().__getitem__(item)
+
+    def __iter__(self) -> Iterator[str]:
+        """Load the record, then iterate over its keys."""
+        self._load()
+        return super().__iter__()
+
+    def __repr__(self) -> str:
+        """Load the record, then return its representation."""
+        self._load()
+        return super().__repr__()
+
+    def __len__(self) -> int:
+        """Load the record, then return its number of items."""
+        self._load()
+        return super().__len__()
+
+    def __contains__(self, key: object) -> bool:
+        """Load the record, then check whether it contains a key."""
+        self._load()
+        return super().__contains__(key)
+
+    def __eq__(self, other: object) -> bool:
+        """Load the records, then compare them."""
+        self._load()
+        if isinstance(other, _LazyArrayRecord):
+            other._load()  # pylint: disable=protected-access
+        return super().__eq__(other)
+
+    def keys(self) -> KeysView[str]:
+        """Load the record, then return its keys."""
+        self._load()
+        return super().keys()
+
+    def values(self) -> ValuesView[Array]:
+        """Load the record, then return its values."""
+        self._load()
+        return super().values()
+
+    def items(self) -> ItemsView[str, Array]:
+        """Load the record, then return its items."""
+        self._load()
+        return super().items()
+
+
+def _call_safely(fn: Callable[[], None]) -> None:
+    """Call a function, logging errors (e.g., when the connection is closed)."""
+    try:
+        fn()
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        log(
+            WARNING,
+            "Failed to confirm that a lazily pulled object was received: %s",
+            ex,
+        )
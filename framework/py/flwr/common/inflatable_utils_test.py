@@ -15,14 +15,20 @@
 """Unit tests for inflatable_utils.py."""
 
 
-from unittest.mock import Mock
+import gc
+import pickle
+from unittest.mock import Mock, patch
 
-from .inflatable import get_object_tree
+import numpy as np
+
+from .inflatable import get_all_nested_objects, get_object_tree
 from .inflatable_test import CustomDataClass
 from .inflatable_utils import (
     inflatable_class_registry,
     pull_and_inflate_object_from_tree,
 )
+from .message import Message
+from .record import ArrayRecord, ConfigRecord, RecordDict
 
 
 def test_pull_and_inflate_object_from_tree() -> None:
@@ -61,3 +67,103 @@ def test_pull_and_inflate_object_from_tree() -> None:
     assert result.object_id == root.object_id
     mock_pull_object.assert_called()
     mock_confirm_message_received.assert_called_once_with(root.object_id)
+
+
+def _prep_lazy_message() -> tuple[Message, dict[str, bytes]]:
+    """Create a message with an ArrayRecord and its object store."""
+    content = RecordDict(
+        {
+            "arrays": ArrayRecord([np.ones((2, 3)), np.zeros(4)]),
+            "config": ConfigRecord({"lr": 0.1}),
+        }
+    )
+    msg = Message(content, dst_node_id=123, message_type="train")
+    store = {k: v.deflate() for k, v in get_all_nested_objects(msg).items()}
+    return msg, store
+
+
+def test_pull_and_inflate_object_from_tree_lazily() -> None:
+    """Test that the Arrays of a message are only pulled once accessed."""
+    # Prepare
+    msg, store = _prep_lazy_message()
+    mock_pull_object = Mock(side_effect=lambda x: store[x])
+    mock_confirm = Mock()
+    # Each Array is stored as an Array object and a chunk
+    num_eager_objects = len(store) - len(msg.content.array_records["arrays"]) * 2
+
+    # Execute
+    result = pull_and_inflate_object_from_tree(
+        object_tree=get_object_tree(msg),
+        pull_object_fn=mock_pull_object,
+        confirm_object_received_fn=mock_confirm,
+        return_type=Message,
+        lazy=True,
+    )
+
+    # Assert: the message is inflated without its Arrays and is not confirmed yet
+    assert mock_pull_object.call_count == num_eager_objects
+    assert result.object_id == msg.object_id
+    assert (
+        result.content.config_records["config"] == msg.content.config_records["config"]
+    )
+    mock_confirm.assert_not_called()
+
+    # Assert: the Arrays are pulled once accessed, then the message is confirmed
+    arrays = result.content.array_records["arrays"].to_numpy_ndarrays()
+    assert mock_pull_object.call_count == len(store)
+    assert all(
+        np.array_equal(a, b)
+        for a, b in zip(arrays, msg.content.array_records["arrays"].to_numpy_ndarrays())
+    )
+    assert result.content.array_records["arrays"] == msg.content.array_records["arrays"]
+    assert result.object_id == msg.object_id
+    mock_confirm.assert_called_once_with(msg.object_id)
+
+    # Assert: the record is pickled as a plain ArrayRecord
+    record = pickle.loads(pickle.dumps(result.content["arrays"]))
+    assert type(record) is ArrayRecord  # pylint: disable=unidiomatic-typecheck
+
+
+def test_pull_and_inflate_object_from_tree_lazily_confirm_on_release() -> None:
+    """Test that a message whose Arrays are never accessed is confirmed once
+    released."""
+    # Prepare
+    msg, store = _prep_lazy_message()
+    mock_confirm = Mock()
+    result = pull_and_inflate_object_from_tree(
+        object_tree=get_object_tree(msg),
+        pull_object_fn=lambda x: store[x],
+        confirm_object_received_fn=mock_confirm,
+        return_type=Message,
+        lazy=True,
+    )
+
+    # Execute
+    del result
+    gc.collect()
+
+    # Assert
+    mock_confirm.assert_called_once_with(msg.object_id)
+
+
+def test_pull_and_inflate_object_from_tree_lazily_confirm_failure_is_logged() -> None:
+    """Test that a failed confirmation of a released message is logged."""
+    # Prepare
+    msg, store = _prep_lazy_message()
+    mock_confirm = Mock(side_effect=RuntimeError("Channel closed"))
+    result = pull_and_inflate_object_from_tree(
+        object_tree=get_object_tree(msg),
+        pull_object_fn=lambda x: store[x],
+        confirm_object_received_fn=mock_confirm,
+        return_type=Message,
+        lazy=True,
+    )
+
+    # Execute
+    with patch("flwr.common.inflatable_utils.log") as mock_log:
+        del result
+        gc.collect()
+
+    # Assert
+    mock_confirm.assert_called_once_with(msg.object_id)
+    mock_log.assert_called_once()
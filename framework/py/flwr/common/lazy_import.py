@@ -0,0 +1,56 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Lazy module attributes (PEP 562)."""
+
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    package: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return `__getattr__` and `__dir__` importing the attributes of a package lazily.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package, i.e., `__name__` of its `__init__` module.
+    attributes : dict[str, str]
+        Map the name of each attribute to the (relative) name of the module it is
+        imported from. An attribute named like the module it maps to, e.g.,
+        `{"strategy": ".strategy"}`, is the module itself.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The `__getattr__` and `__dir__` functions of the package.
+    """
+
+    def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name = attributes[name]
+        module = importlib.import_module(module_name, package)
+        value = module if module_name == f".{name}" else getattr(module, name)
+        # Cache the attribute, so that `__getattr__` is only called once per name
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # pylint: disable=invalid-name
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
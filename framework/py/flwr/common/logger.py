@@ -29,8 +29,6 @@ from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any, Optional, TextIO, Union
 
 import grpc
-import typer
-from rich.console import Console
 
 from flwr.proto.log_pb2 import PushLogsRequest  # pylint: disable=E0611
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
@@ -55,6 +53,8 @@ LOG_COLORS = {
 }
 
 if TYPE_CHECKING:
+    import typer
+
     StreamHandler = logging.StreamHandler[Any]
 else:
     StreamHandler = logging.StreamHandler
@@ -342,18 +342,25 @@ def _log_uploader(
     node = Node(node_id=node_id)
     msgs: list[str] = []
     while True:
+        # Block until new logs are available, or retry pending logs after a delay
+        try:
+            batch = [log_queue.get(timeout=LOG_UPLOAD_INTERVAL if msgs else None)]
+        except Empty:
+            batch = []
+
         # Fetch all messages from the queue
         try:
             while True:
-                msg = log_queue.get_nowait()
-                # Quit the loops if the returned message is `None`
-                # This is a signal that the run has finished
-                if msg is None:
-                    exit_flag = True
-                    break
-                msgs.append(msg)
+                batch.append(log_queue.get_nowait())
         except Empty:
             pass
+        for msg in batch:
+            # Quit the loops if the returned message is `None`
+            # This is a signal that the run has finished
+            if msg is None:
+                exit_flag = True
+                break
+            msgs.append(msg)
 
         # Upload if any logs
         if msgs:
@@ -374,6 +381,7 @@ def _log_uploader(
         if exit_flag:
             break
 
+        # Let logs accumulate briefly so that bursts are uploaded in one batch
         time.sleep(LOG_UPLOAD_INTERVAL)
 
 
@@ -415,8 +423,11 @@ def _remove_emojis(text: str) -> str:
     return emoji_pattern.sub(r"", text)
 
 
-def print_json_error(msg: str, e: Union[typer.Exit, Exception]) -> None:
+def print_json_error(msg: str, e: Union["typer.Exit", Exception]) -> None:
     """Print error message as JSON."""
+    # Only import rich when needed, it is slow to import and not used by the apps
+    from rich.console import Console  # pylint: disable=import-outside-toplevel
+
     Console().print_json(
         _json.dumps(
             {
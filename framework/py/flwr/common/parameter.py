@@ -15,6 +15,7 @@
 """Parameter conversion."""
 
 
+import math
 from io import BytesIO
 from typing import cast
 
@@ -29,13 +30,36 @@ def ndarrays_to_parameters(ndarrays: NDArrays) -> Parameters:
     return Parameters(tensors=tensors, tensor_type="numpy.ndarray")
 
 
-def parameters_to_ndarrays(parameters: Parameters) -> NDArrays:
-    """Convert parameters object to NumPy ndarrays."""
-    return [bytes_to_ndarray(tensor) for tensor in parameters.tensors]
+def parameters_to_ndarrays(parameters: Parameters, *, copy: bool = True) -> NDArrays:
+    """Convert parameters object to NumPy ndarrays.
+
+    If `copy` is False, the returned ndarrays are read-only views of the tensors of
+    `parameters`, see `bytes_to_ndarray`.
+    """
+    return [bytes_to_ndarray(tensor, copy=copy) for tensor in parameters.tensors]
 
 
 def ndarray_to_bytes(ndarray: NDArray) -> bytes:
-    """Serialize NumPy ndarray to bytes."""
+    """Serialize NumPy ndarray to bytes.
+
+    The result is the same as that of `np.save`, but the data of the ndarray is
+    copied only once.
+    """
+    if not ndarray.dtype.hasobject:
+        header = BytesIO()
+        try:
+            np.lib.format.write_array_header_1_0(
+                header, np.lib.format.header_data_from_array_1_0(ndarray)
+            )
+        except ValueError:
+            pass  # The header requires a newer format version
+        else:
+            # `np.save` writes Fortran-contiguous ndarrays in Fortran order
+            if not ndarray.flags.c_contiguous and ndarray.flags.f_contiguous:
+                ndarray = ndarray.T
+            data = np.ascontiguousarray(ndarray).reshape(-1).view(np.uint8).data
+            return b"".join((header.getvalue(), data))
+
     bytes_io = BytesIO()
     # WARNING: NEVER set allow_pickle to true.
     # Reason: loading pickled data can execute arbitrary code
@@ -44,9 +68,29 @@ def ndarray_to_bytes(ndarray: NDArray) -> bytes:
     return bytes_io.getvalue()
 
 
-def bytes_to_ndarray(tensor: bytes) -> NDArray:
-    """Deserialize NumPy ndarray from bytes."""
+def bytes_to_ndarray(tensor: bytes, *, copy: bool = True) -> NDArray:
+    """Deserialize NumPy ndarray from bytes.
+
+    The data is read directly from `tensor`. If `copy` is False, no data is copied:
+    the returned ndarray is a read-only view of `tensor`, which avoids holding the
+    data twice in memory when the ndarray is only read.
+    """
     bytes_io = BytesIO(tensor)
+    version = np.lib.format.read_magic(bytes_io)
+    if version in ((1, 0), (2, 0)):
+        read_header = (
+            np.lib.format.read_array_header_1_0
+            if version == (1, 0)
+            else np.lib.format.read_array_header_2_0
+        )
+        shape, fortran_order, dtype = read_header(bytes_io)
+        if not dtype.hasobject:
+            ndarray = np.frombuffer(
+                tensor, dtype=dtype, count=math.prod(shape), offset=bytes_io.tell()
+            ).reshape(shape, order="F" if fortran_order else "C")
+            return ndarray.copy(order="K") if copy else ndarray
+
+    bytes_io.seek(0)
     # WARNING: NEVER set allow_pickle to true.
     # Reason: loading pickled data can execute arbitrary code
     # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
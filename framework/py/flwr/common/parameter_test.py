@@ -18,10 +18,13 @@ tests.
 """
 
 
+from io import BytesIO
+
 import numpy as np
 import pytest
 
 from .parameter import bytes_to_ndarray, ndarray_to_bytes
+from .typing import NDArray
 
 
 def test_serialisation_deserialisation() -> None:
@@ -37,3 +40,46 @@ def test_serialisation_deserialisation() -> None:
     # Test false positive
     with pytest.raises(AssertionError, match="Arrays are not equal"):
         np.testing.assert_equal(arr_deserialized, np.ones((3, 2)))
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(12.0).reshape(3, 4),
+        np.asfortranarray(np.arange(12).reshape(3, 4)),
+        np.arange(24).reshape(4, 6)[:, ::2],
+        np.array(3.5, dtype=np.float32),
+        np.zeros((0, 3)),
+        np.array(["a", "bc"]),
+    ],
+)
+def test_serialization_matches_numpy(arr: NDArray) -> None:
+    """Test that arrays are serialized as `np.save` does and read back."""
+    # Prepare
+    bytes_io = BytesIO()
+    np.save(bytes_io, arr, allow_pickle=False)
+
+    # Execute
+    arr_serialized = ndarray_to_bytes(arr)
+    arr_deserialized = bytes_to_ndarray(arr_serialized)
+
+    # Assert
+    assert arr_serialized == bytes_io.getvalue()
+    assert arr_deserialized.dtype == arr.dtype
+    assert arr_deserialized.flags.writeable
+    np.testing.assert_equal(arr_deserialized, arr)
+
+
+def test_deserialization_without_copy() -> None:
+    """Test that arrays deserialized without copy are read-only views."""
+    # Prepare
+    arr = np.arange(6.0).reshape(2, 3)
+    arr_serialized = ndarray_to_bytes(arr)
+
+    # Execute
+    arr_deserialized = bytes_to_ndarray(arr_serialized, copy=False)
+
+    # Assert
+    np.testing.assert_equal(arr_deserialized, arr)
+    assert not arr_deserialized.flags.writeable
+    assert np.shares_memory(arr_deserialized, np.frombuffer(arr_serialized, np.uint8))
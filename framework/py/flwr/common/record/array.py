@@ -20,7 +20,6 @@ from __future__ import annotations
 import json
 import sys
 from dataclasses import dataclass
-from io import BytesIO
 from typing import TYPE_CHECKING, Any, cast, overload
 
 import numpy as np
@@ -32,6 +31,7 @@ from ..inflatable import (
     get_object_body,
     get_object_children_ids_from_object_content,
 )
+from ..parameter import bytes_to_ndarray, ndarray_to_bytes
 from ..typing import NDArray
 from .arraychunk import ArrayChunk
 
@@ -218,12 +218,7 @@ class Array(InflatableObject):
         assert isinstance(
             ndarray, np.ndarray
         ), f"Expected NumPy ndarray, got {type(ndarray)}"
-        buffer = BytesIO()
-        # WARNING: NEVER set allow_pickle to true.
-        # Reason: loading pickled data can execute arbitrary code
-        # Source: https://numpy.org/doc/stable/reference/generated/numpy.save.html
-        np.save(buffer, ndarray, allow_pickle=False)
-        data = buffer.getvalue()
+        data = ndarray_to_bytes(ndarray)
         return Array(
             dtype=str(ndarray.dtype),
             shape=tuple(ndarray.shape),
@@ -250,12 +245,7 @@ class Array(InflatableObject):
             raise TypeError(
                 f"Unsupported serialization type for numpy conversion: '{self.stype}'"
             )
-        bytes_io = BytesIO(self.data)
-        # WARNING: NEVER set allow_pickle to true.
-        # Reason: loading pickled data can execute arbitrary code
-        # Source: https://numpy.org/doc/stable/reference/generated/numpy.load.html
-        ndarray_deserialized = np.load(bytes_io, allow_pickle=False)
-        return cast(NDArray, ndarray_deserialized)
+        return bytes_to_ndarray(self.data)
 
     @property
     def children(self) -> dict[str, InflatableObject]:
@@ -354,12 +344,10 @@ class Array(InflatableObject):
             data=b"",
         )
 
-        # Now inject data from chunks
-        buff = bytearray()
-        for ch_id in chunk_ids:
-            buff += cast(ArrayChunk, children[ch_id]).data
-
-        array.data = bytes(buff)
+        # Now inject data from chunks, copying it only once
+        array.data = b"".join(
+            cast(ArrayChunk, children[ch_id]).data for ch_id in chunk_ids
+        )
         return array
 
     @property
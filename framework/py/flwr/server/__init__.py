@@ -15,19 +15,25 @@
 """Flower server."""
 
 
-from ..compat.server.app import start_server as start_server  # Deprecated
-from . import strategy
-from . import workflow as workflow
-from .client_manager import ClientManager as ClientManager
-from .client_manager import SimpleClientManager as SimpleClientManager
-from .compat import LegacyContext as LegacyContext
-from .grid import Driver as Driver
-from .grid import Grid as Grid
-from .history import History as History
-from .server import Server as Server
-from .server_app import ServerApp as ServerApp
-from .server_config import ServerConfig as ServerConfig
-from .serverapp_components import ServerAppComponents as ServerAppComponents
+from typing import TYPE_CHECKING
+
+from ..common.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from ..compat.server.app import start_server as start_server  # Deprecated
+    from . import strategy as strategy
+    from . import workflow as workflow
+    from .client_manager import ClientManager as ClientManager
+    from .client_manager import SimpleClientManager as SimpleClientManager
+    from .compat import LegacyContext as LegacyContext
+    from .grid import Driver as Driver
+    from .grid import Grid as Grid
+    from .history import History as History
+    from .node_registry import NodeRegistry as NodeRegistry
+    from .server import Server as Server
+    from .server_app import ServerApp as ServerApp
+    from .server_config import ServerConfig as ServerConfig
+    from .serverapp_components import ServerAppComponents as ServerAppComponents
 
 __all__ = [
     "ClientManager",
@@ -35,6 +41,7 @@ __all__ = [
     "Grid",
     "History",
     "LegacyContext",
+    "NodeRegistry",
     "Server",
     "ServerApp",
     "ServerAppComponents",
@@ -44,3 +51,25 @@ __all__ = [
     "strategy",
     "workflow",
 ]
+
+# Import the attributes on first access to keep `import flwr` fast
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "start_server": "..compat.server.app",
+            "strategy": ".strategy",
+            "workflow": ".workflow",
+            "ClientManager": ".client_manager",
+            "SimpleClientManager": ".client_manager",
+            "LegacyContext": ".compat",
+            "Driver": ".grid",
+            "Grid": ".grid",
+            "History": ".history",
+            "NodeRegistry": ".node_registry",
+            "Server": ".server",
+            "ServerApp": ".server_app",
+            "ServerConfig": ".server_config",
+            "ServerAppComponents": ".serverapp_components",
+        },
+    )
@@ -20,6 +20,7 @@ import csv
 import importlib.util
 import multiprocessing
 import multiprocessing.context
+import multiprocessing.synchronize
 import os
 import sys
 import threading
@@ -48,6 +49,7 @@ from flwr.common.constant import (
     FLEET_API_REST_DEFAULT_ADDRESS,
     ISOLATION_MODE_PROCESS,
     ISOLATION_MODE_SUBPROCESS,
+    SCHEDULER_POLL_INTERVAL,
     SERVER_OCTET,
     SERVERAPPIO_API_DEFAULT_SERVER_ADDRESS,
     SIMULATIONIO_API_DEFAULT_SERVER_ADDRESS,
@@ -79,7 +81,7 @@ from flwr.superexec.exec_grpc import run_exec_api_grpc
 from .superlink.fleet.grpc_adapter.grpc_adapter_servicer import GrpcAdapterServicer
 from .superlink.fleet.grpc_rere.fleet_servicer import FleetServicer
 from .superlink.fleet.grpc_rere.server_interceptor import AuthenticateServerInterceptor
-from .superlink.linkstate import LinkStateFactory
+from .superlink.linkstate import LinkState, LinkStateFactory
 from .superlink.serverappio.serverappio_grpc import run_serverappio_api_grpc
 from .superlink.simulation.simulationio_grpc import run_simulationio_api_grpc
 
@@ -171,6 +173,9 @@ def run_superlink() -> None:
     # Initialize ObjectStoreFactory
     objectstore_factory = ObjectStoreFactory()
 
+    # Event set whenever a run is created, waking up the run scheduler
+    run_created = threading.Event()
+
     # Start Exec API
     executor = load_executor(args)
     exec_server: grpc.Server = run_exec_api_grpc(
@@ -186,6 +191,7 @@ def run_superlink() -> None:
         auth_plugin=auth_plugin,
         authz_plugin=authz_plugin,
         event_log_plugin=event_log_plugin,
+        on_run_created=run_created.set,
     )
     grpc_servers = [exec_server]
 
@@ -319,16 +325,16 @@ def run_superlink() -> None:
         cmd = "flwr-simulation" if sim_exec else "flwr-serverapp"
 
         # Scheduler thread
-        scheduler_th = threading.Thread(
-            target=_flwr_scheduler,
-            args=(
-                state_factory,
-                address_arg,
-                address,
-                cmd,
-            ),
-            daemon=True,
+        scheduler = _RunScheduler(
+            state_factory=state_factory,
+            io_api_arg=address_arg,
+            io_api_address=address,
+            cmd=cmd,
+            wakeup=run_created,
+            max_concurrent_runs=args.max_concurrent_runs,
+            num_prewarmed=args.num_prewarmed_processes,
         )
+        scheduler_th = threading.Thread(target=scheduler.run, daemon=True)
         scheduler_th.start()
         bckg_threads.append(scheduler_th)
 
@@ -337,6 +343,7 @@ def run_superlink() -> None:
         event_type=EventType.RUN_SUPERLINK_LEAVE,
         exit_message="SuperLink terminated gracefully.",
         grpc_servers=grpc_servers,
+        exit_handlers=[state_factory.close],
     )
 
     # Block until a thread exits prematurely
@@ -348,7 +355,11 @@ def run_superlink() -> None:
     flwr_exit(ExitCode.SUPERLINK_THREAD_CRASH)
 
 
-def _run_flwr_command(args: list[str], main_pid: int) -> None:
+def _run_flwr_command(
+    args: list[str],
+    main_pid: int,
+    start_event: Optional[multiprocessing.synchronize.Event] = None,
+) -> None:
     # Monitor the main process in case of SIGKILL
     def main_process_monitor() -> None:
         while True:
@@ -358,6 +369,10 @@ def _run_flwr_command(args: list[str], main_pid: int) -> None:
 
     threading.Thread(target=main_process_monitor, daemon=True).start()
 
+    # Wait until the scheduler hands a run to this prewarmed process
+    if start_event is not None:
+        start_event.wait()
+
     # Run the command
     sys.argv = args
     if args[0] == "flwr-serverapp":
@@ -368,53 +383,109 @@ def _run_flwr_command(args: list[str], main_pid: int) -> None:
         raise ValueError(f"Unknown command: {args[0]}")
 
 
-def _flwr_scheduler(
-    state_factory: LinkStateFactory,
-    io_api_arg: str,
-    io_api_address: str,
-    cmd: str,
-) -> None:
-    log(DEBUG, "Started %s scheduler thread.", cmd)
-    state = state_factory.state()
-    run_id_to_proc: dict[int, multiprocessing.context.SpawnProcess] = {}
-
-    # Use the "spawn" start method for multiprocessing.
-    mp_spawn_context = multiprocessing.get_context("spawn")
-
-    # Periodically check for a pending run in the LinkState
-    while True:
-        sleep(0.1)
-        pending_run_id = state.get_pending_run_id()
-
-        if pending_run_id and pending_run_id not in run_id_to_proc:
-
-            log(
-                INFO,
-                "Launching %s subprocess. Connects to SuperLink on %s",
-                cmd,
-                io_api_address,
-            )
-            # Start subprocess
-            command = [
-                cmd,
-                "--run-once",
-                io_api_arg,
-                io_api_address,
-                "--insecure",
+class _RunScheduler:  # pylint: disable=R0902
+    """Launch a `flwr-serverapp` or `flwr-simulation` process for each pending run.
+
+    The scheduler wakes up as soon as a run is created (or, as a fallback, every
+    `SCHEDULER_POLL_INTERVAL` seconds) and starts pending runs in the order they were
+    created, while no more than `max_concurrent_runs` are being processed. It keeps a
+    pool of `num_prewarmed` processes that have already started the interpreter and
+    imported Flower, so that a run can be handed to one of them without the cost of
+    spawning a new process.
+    """
+
+    def __init__(  # pylint: disable=R0913, R0917
+        self,
+        state_factory: LinkStateFactory,
+        io_api_arg: str,
+        io_api_address: str,
+        cmd: str,
+        wakeup: threading.Event,
+        max_concurrent_runs: Optional[int] = None,
+        num_prewarmed: int = 0,
+    ) -> None:
+        self.state_factory = state_factory
+        self.cmd = cmd
+        self.command = [cmd, "--run-once", io_api_arg, io_api_address, "--insecure"]
+        self.io_api_address = io_api_address
+        self.wakeup = wakeup
+        self.max_concurrent_runs = max_concurrent_runs
+        self.num_prewarmed = num_prewarmed
+        # Use the "spawn" start method for multiprocessing.
+        self.mp_spawn_context = multiprocessing.get_context("spawn")
+        self.prewarmed: list[
+            tuple[
+                multiprocessing.context.SpawnProcess, multiprocessing.synchronize.Event
             ]
+        ] = []
+        self.run_id_to_proc: dict[int, multiprocessing.context.SpawnProcess] = {}
 
-            proc = mp_spawn_context.Process(
-                target=_run_flwr_command, args=(command, os.getpid()), daemon=True
-            )
-            proc.start()
+    def run(self) -> None:
+        """Launch processes for pending runs until the SuperLink stops."""
+        log(DEBUG, "Started %s scheduler thread.", self.cmd)
+        state = self.state_factory.state()
+        while True:
+            self._schedule_once(state)
 
-            # Store the process
-            run_id_to_proc[pending_run_id] = proc
+    def _schedule_once(self, state: LinkState) -> None:
+        """Launch a process for the oldest pending run if possible, then wait."""
+        # Clear before looking for pending runs, so that a run created from now on
+        # wakes up the next wait instead of being missed
+        self.wakeup.clear()
 
         # Clean up finished processes
-        for run_id, proc in list(run_id_to_proc.items()):
+        for run_id, proc in list(self.run_id_to_proc.items()):
             if not proc.is_alive():
-                del run_id_to_proc[run_id]
+                del self.run_id_to_proc[run_id]
+
+        # Top up the pool of prewarmed processes
+        self.prewarmed = [(p, e) for p, e in self.prewarmed if p.is_alive()]
+        while len(self.prewarmed) < self.num_prewarmed:
+            start_event = self.mp_spawn_context.Event()
+            self.prewarmed.append((self._spawn(start_event), start_event))
+
+        # Launch a process for the oldest pending run, if there is capacity
+        pending_run_id = state.get_pending_run_id()
+        poll_quickly = False
+        if pending_run_id and pending_run_id not in self.run_id_to_proc:
+            if self._has_capacity():
+                log(
+                    INFO,
+                    "Launching %s subprocess. Connects to SuperLink on %s",
+                    self.cmd,
+                    self.io_api_address,
+                )
+                self.run_id_to_proc[pending_run_id] = self._launch()
+            # Poll quickly while the launched process claims the run, or while the
+            # pending run waits for a running process to finish
+            poll_quickly = True
+
+        # Otherwise, wait until a run is created
+        self.wakeup.wait(0.1 if poll_quickly else SCHEDULER_POLL_INTERVAL)
+
+    def _has_capacity(self) -> bool:
+        if self.max_concurrent_runs is None:
+            return True
+        return len(self.run_id_to_proc) < self.max_concurrent_runs
+
+    def _launch(self) -> multiprocessing.context.SpawnProcess:
+        """Start a prewarmed process or, if there is none, spawn a new one."""
+        if self.prewarmed:
+            proc, start_event = self.prewarmed.pop(0)
+            start_event.set()
+            return proc
+        return self._spawn(None)
+
+    def _spawn(
+        self, start_event: Optional[multiprocessing.synchronize.Event]
+    ) -> multiprocessing.context.SpawnProcess:
+        proc = self.mp_spawn_context.Process(
+            target=_run_flwr_command,
+            args=(self.command, os.getpid(), start_event),
+            daemon=True,
+        )
+        proc.start()
+        return proc
 
 
 def _format_address(address: str) -> tuple[str, str, int]:
@@ -709,6 +780,23 @@ def _add_args_common(parser: argparse.ArgumentParser) -> None:
         "SuperLink to run a `ServerApp` in a subprocess. Use `process` to indicate "
         "that a separate independent process gets created outside of SuperLink.",
     )
+    parser.add_argument(
+        "--max-concurrent-runs",
+        type=int,
+        default=None,
+        help="The maximum number of runs processed at the same time when using the "
+        "`subprocess` isolation mode. Further runs stay pending until a running one "
+        "finishes. By default, there is no limit.",
+    )
+    parser.add_argument(
+        "--num-prewarmed-processes",
+        type=int,
+        default=1,
+        help="The number of idle `ServerApp` processes kept ready to start a run "
+        "when using the `subprocess` isolation mode. Prewarmed processes cut the "
+        "time it takes to start a run. Set it to 0 to spawn a process only when a "
+        "run is pending. Defaults to 1.",
+    )
     parser.add_argument(
         "--database",
         help="A string representing the path to the database "
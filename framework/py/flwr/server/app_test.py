@@ -0,0 +1,132 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the run scheduler of the SuperLink."""
+
+
+import threading
+import unittest
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+from .app import _RunScheduler
+
+
+class TestRunScheduler(unittest.TestCase):
+    """Tests for `_RunScheduler`."""
+
+    def setUp(self) -> None:
+        """Create a scheduler whose processes are mocks."""
+        self.state = MagicMock()
+        self.state.get_pending_run_id.return_value = None
+        self.wakeup = threading.Event()
+        self.procs: list[MagicMock] = []
+
+    def _scheduler(self, max_concurrent_runs: Optional[int] = None) -> _RunScheduler:
+        scheduler = _RunScheduler(
+            state_factory=MagicMock(),
+            io_api_arg="--serverappio-api-address",
+            io_api_address="127.0.0.1:9091",
+            cmd="flwr-serverapp",
+            wakeup=self.wakeup,
+            max_concurrent_runs=max_concurrent_runs,
+        )
+        scheduler._spawn = self._spawn  # type: ignore  # pylint: disable=W0212
+        return scheduler
+
+    def _spawn(self, _: Optional[threading.Event]) -> MagicMock:
+        proc = MagicMock()
+        proc.is_alive.return_value = True
+        self.procs.append(proc)
+        return proc
+
+    def test_max_concurrent_runs(self) -> None:
+        """Test that no more than `max_concurrent_runs` processes are launched."""
+        # Prepare
+        scheduler = self._scheduler(max_concurrent_runs=1)
+
+        # Execute
+        for run_id in (1, 2):
+            self.state.get_pending_run_id.return_value = run_id
+            scheduler._schedule_once(self.state)  # pylint: disable=W0212
+
+        # Assert
+        self.assertEqual(list(scheduler.run_id_to_proc), [1])
+        self.assertEqual(len(self.procs), 1)
+
+    def test_capacity_release(self) -> None:
+        """Test that a pending run is launched once a running process finishes."""
+        # Prepare
+        scheduler = self._scheduler(max_concurrent_runs=1)
+        self.state.get_pending_run_id.return_value = 1
+        scheduler._schedule_once(self.state)  # pylint: disable=W0212
+        self.state.get_pending_run_id.return_value = 2
+
+        # Execute & Assert: the pending run waits while the first one is running,
+        # polling quickly instead of waiting for the poll interval
+        with patch("flwr.server.app.SCHEDULER_POLL_INTERVAL", 60.0):
+            thread = threading.Thread(
+                target=scheduler._schedule_once,  # pylint: disable=W0212
+                args=(self.state,),
+            )
+            thread.start()
+            thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(list(scheduler.run_id_to_proc), [1])
+
+        # Execute & Assert: the pending run is launched once the first one finishes
+        self.procs[0].is_alive.return_value = False
+        scheduler._schedule_once(self.state)  # pylint: disable=W0212
+        self.assertEqual(list(scheduler.run_id_to_proc), [2])
+
+    def test_launch_on_run_created(self) -> None:
+        """Test that the scheduler wakes up as soon as a run is created."""
+        # Prepare
+        scheduler = self._scheduler()
+
+        # Execute: wait without any pending run, then create one
+        with patch("flwr.server.app.SCHEDULER_POLL_INTERVAL", 60.0):
+            thread = threading.Thread(
+                target=scheduler._schedule_once,  # pylint: disable=W0212
+                args=(self.state,),
+            )
+            thread.start()
+            self.state.get_pending_run_id.return_value = 1
+            self.wakeup.set()  # As done by `on_run_created`
+            thread.join(timeout=5.0)
+        scheduler._schedule_once(self.state)  # pylint: disable=W0212
+
+        # Assert
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(list(scheduler.run_id_to_proc), [1])
+
+    def test_run_created_while_scanning_is_not_missed(self) -> None:
+        """Test that a run created while looking for pending runs keeps the wakeup."""
+        # Prepare
+        scheduler = self._scheduler()
+
+        def _create_run() -> None:
+            self.wakeup.set()
+
+        self.state.get_pending_run_id.side_effect = _create_run
+
+        # Execute
+        scheduler._schedule_once(self.state)  # pylint: disable=W0212
+
+        # Assert
+        self.assertTrue(self.wakeup.is_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Centralized evaluation of the global model, optionally in the background."""
+
+
+import concurrent.futures
+import timeit
+from collections import deque
+from logging import INFO
+from typing import Optional
+
+from flwr.common import Parameters, Scalar
+from flwr.common.logger import log
+
+from .history import History
+from .strategy import Strategy
+
+EvaluateResult = Optional[tuple[float, dict[str, Scalar]]]
+
+
+class CentralizedEvaluator:
+    """Run `Strategy.evaluate` at a given cadence and record results in `History`.
+
+    With `background=True`, evaluations run in a single worker thread on a snapshot
+    of the global parameters, so that the next round can start while the previous
+    global model is still being evaluated. Results are attached to `History` in
+    round order as soon as they are ready, and all pending evaluations are awaited
+    by `shutdown`.
+
+    Parameters
+    ----------
+    strategy : Strategy
+        The strategy whose `evaluate` method is called.
+    history : History
+        The history to which losses and metrics are added.
+    evaluate_every : int (default: 1)
+        Evaluate the global model every `evaluate_every` rounds. The initial
+        parameters (round 0) and the final round are always evaluated.
+    background : bool (default: False)
+        Whether to run the evaluation in a background thread.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        history: History,
+        evaluate_every: int = 1,
+        background: bool = False,
+    ) -> None:
+        self.strategy = strategy
+        self.history = history
+        self.evaluate_every = evaluate_every
+        self.start_time = timeit.default_timer()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="centralized-evaluation"
+            )
+            if background
+            else None
+        )
+        self._pending: deque[tuple[int, concurrent.futures.Future[EvaluateResult]]]
+        self._pending = deque()
+
+    def should_evaluate(self, server_round: int, num_rounds: int) -> bool:
+        """Return whether the global model of `server_round` is evaluated."""
+        return server_round % self.evaluate_every == 0 or server_round == num_rounds
+
+    def submit(self, server_round: int, parameters: Parameters) -> None:
+        """Evaluate `parameters`, in the background if enabled."""
+        if server_round == 0:
+            log(INFO, "Starting evaluation of initial global parameters")
+        if self._executor is None:
+            res = self.strategy.evaluate(server_round, parameters=parameters)
+            self._record(server_round, res)
+            return
+
+        # Snapshot the parameters, as the caller may replace the tensors in place
+        snapshot = Parameters(
+            tensors=list(parameters.tensors), tensor_type=parameters.tensor_type
+        )
+        future = self._executor.submit(
+            self.strategy.evaluate, server_round, parameters=snapshot
+        )
+        self._pending.append((server_round, future))
+
+    def collect(self, wait: bool = False) -> None:
+        """Record the results of the finished evaluations, in round order."""
+        while self._pending and (wait or self._pending[0][1].done()):
+            server_round, future = self._pending.popleft()
+            self._record(server_round, future.result())
+
+    def shutdown(self) -> None:
+        """Wait for pending evaluations, record their results, and stop the worker."""
+        try:
+            self.collect(wait=True)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _record(self, server_round: int, res: EvaluateResult) -> None:
+        if res is None:
+            if server_round == 0:
+                log(INFO, "Evaluation returned no results (`None`)")
+            return
+        loss, metrics = res
+        if server_round == 0:
+            log(INFO, "initial parameters (loss, other metrics): %s, %s", loss, metrics)
+        else:
+            log(
+                INFO,
+                "fit progress: (%s, %s, %s, %s)",
+                server_round,
+                loss,
+                metrics,
+                timeit.default_timer() - self.start_time,
+            )
+        self.history.add_loss_centralized(server_round=server_round, loss=loss)
+        self.history.add_metrics_centralized(server_round=server_round, metrics=metrics)
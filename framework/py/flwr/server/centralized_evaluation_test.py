@@ -0,0 +1,85 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the centralized evaluation of the global model."""
+
+
+import threading
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from flwr.common import Parameters, Scalar
+
+from .centralized_evaluation import CentralizedEvaluator
+from .history import History
+
+
+def _make_strategy(
+    release: Optional[threading.Event] = None,
+) -> MagicMock:
+    """Return a strategy whose loss is the number of tensors of the parameters."""
+
+    def evaluate(
+        server_round: int, parameters: Parameters
+    ) -> tuple[float, dict[str, Scalar]]:
+        if release is not None:
+            release.wait(timeout=5)
+        return float(len(parameters.tensors)), {"round": server_round}
+
+    strategy = MagicMock()
+    strategy.evaluate.side_effect = evaluate
+    return strategy
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_cadence(background: bool) -> None:
+    """Test that only every n-th round and the final round are evaluated."""
+    # Prepare
+    history = History()
+    evaluator = CentralizedEvaluator(
+        _make_strategy(), history, evaluate_every=3, background=background
+    )
+
+    # Execute
+    for server_round in range(8):
+        if evaluator.should_evaluate(server_round, num_rounds=7):
+            evaluator.submit(server_round, Parameters(tensors=[], tensor_type=""))
+    evaluator.shutdown()
+
+    # Assert
+    assert [rnd for rnd, _ in history.losses_centralized] == [0, 3, 6, 7]
+    assert history.metrics_centralized["round"] == [(0, 0), (3, 3), (6, 6), (7, 7)]
+
+
+def test_background_evaluation_uses_snapshot() -> None:
+    """Test that evaluations run in the background on a snapshot of parameters."""
+    # Prepare
+    release = threading.Event()
+    history = History()
+    evaluator = CentralizedEvaluator(_make_strategy(release), history, background=True)
+    parameters = Parameters(tensors=[b"a"], tensor_type="")
+
+    # Execute
+    evaluator.submit(1, parameters)
+    parameters.tensors.append(b"b")
+    evaluator.collect()
+    pending_history = list(history.losses_centralized)
+    release.set()
+    evaluator.shutdown()
+
+    # Assert
+    assert not pending_history
+    assert history.losses_centralized == [(1, 1.0)]
@@ -25,6 +25,7 @@ from flwr.common.logger import log
 
 from .client_proxy import ClientProxy
 from .criterion import Criterion
+from .node_registry import NodeRegistry
 
 
 class ClientManager(ABC):
@@ -91,6 +92,8 @@ class SimpleClientManager(ClientManager):
 
     def __init__(self) -> None:
         self.clients: dict[str, ClientProxy] = {}
+        # Index of the clients, sampled from without listing all clients
+        self.registry: NodeRegistry[str] = NodeRegistry()
         self._cv = threading.Condition()
 
     def __len__(self) -> int:
@@ -152,6 +155,7 @@ class SimpleClientManager(ClientManager):
             return False
 
         self.clients[client.cid] = client
+        self.registry.add(client.cid)
         with self._cv:
             self._cv.notify_all()
 
@@ -168,6 +172,7 @@ class SimpleClientManager(ClientManager):
         """
         if client.cid in self.clients:
             del self.clients[client.cid]
+            self.registry.remove(client.cid)
 
             with self._cv:
                 self._cv.notify_all()
@@ -188,21 +193,26 @@ class SimpleClientManager(ClientManager):
             min_num_clients = num_clients
         self.wait_for(min_num_clients)
         # Sample clients which meet the criterion
-        available_cids = list(self.clients)
-        if criterion is not None:
+        if criterion is None:
+            num_available = len(self.registry)
+        else:
             available_cids = [
-                cid for cid in available_cids if criterion.select(self.clients[cid])
+                cid for cid, client in self.clients.items() if criterion.select(client)
             ]
+            num_available = len(available_cids)
 
-        if num_clients > len(available_cids):
+        if num_clients > num_available:
             log(
                 INFO,
                 "Sampling failed: number of available clients"
                 " (%s) is less than number of requested clients (%s).",
-                len(available_cids),
+                num_available,
                 num_clients,
             )
             return []
 
-        sampled_cids = random.sample(available_cids, num_clients)
+        if criterion is None:
+            sampled_cids = self.registry.sample(num_clients)
+        else:
+            sampled_cids = random.sample(available_cids, num_clients)
         return [self.clients[cid] for cid in sampled_cids]
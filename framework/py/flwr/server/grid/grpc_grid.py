@@ -18,7 +18,7 @@
 import time
 from collections.abc import Iterable
 from logging import DEBUG, ERROR, WARNING
-from typing import Optional, cast
+from typing import Callable, Optional, cast
 
 import grpc
 
@@ -31,18 +31,13 @@ from flwr.common.grpc import create_channel, on_channel_state_change
 from flwr.common.inflatable import (
     get_all_nested_objects,
     get_object_tree,
-    iterate_object_tree,
     no_object_id_recompute,
 )
 from flwr.common.inflatable_protobuf_utils import (
     make_pull_object_fn_protobuf,
     make_push_object_fn_protobuf,
 )
-from flwr.common.inflatable_utils import (
-    inflate_object_from_contents,
-    pull_objects,
-    push_objects,
-)
+from flwr.common.inflatable_utils import pull_and_inflate_object_from_tree, push_objects
 from flwr.common.logger import log, warn_deprecated_feature
 from flwr.common.message import remove_content_from_message
 from flwr.common.retry_invoker import _make_simple_grpc_retry_invoker, _wrap_stub
@@ -96,7 +91,7 @@ at once, or pull messages individually, for example:
 """
 
 
-class GrpcGrid(Grid):
+class GrpcGrid(Grid):  # pylint: disable=R0902
     """`GrpcGrid` provides an interface to the ServerAppIo API.
 
     Parameters
@@ -107,6 +102,10 @@ class GrpcGrid(Grid):
         The PEM-encoded root certificates as a byte string.
         If provided, a secure connection using the certificates will be
         established to an SSL-enabled Flower server.
+    lazy_pull : bool (default: False)
+        If True, the Arrays of pulled messages are only pulled from the SuperLink once
+        they are accessed, and a message is confirmed as received once all of them
+        have been pulled. Otherwise, messages are pulled entirely.
     """
 
     _deprecation_warning_logged = False
@@ -115,9 +114,11 @@ class GrpcGrid(Grid):
         self,
         serverappio_service_address: str = SERVERAPPIO_API_DEFAULT_CLIENT_ADDRESS,
         root_certificates: Optional[bytes] = None,
+        lazy_pull: bool = False,
     ) -> None:
         self._addr = serverappio_service_address
         self._cert = root_certificates
+        self._lazy_pull = lazy_pull
         self._run: Optional[Run] = None
         self._grpc_stub: Optional[ServerAppIoStub] = None
         self._channel: Optional[grpc.Channel] = None
@@ -288,6 +289,18 @@ class GrpcGrid(Grid):
 
         return message_ids
 
+    def _make_confirm_message_received_fn(self, run_id: int) -> Callable[[str], None]:
+        """Return a function confirming that a message has been received."""
+
+        def confirm(message_object_id: str) -> None:
+            self._stub.ConfirmMessageReceived(
+                ConfirmMessageReceivedRequest(
+                    node=self.node, run_id=run_id, message_object_id=message_object_id
+                )
+            )
+
+        return confirm
+
     def pull_messages(self, message_ids: Iterable[str]) -> Iterable[Message]:
         """Pull messages based on message IDs.
 
@@ -305,27 +318,22 @@ class GrpcGrid(Grid):
             )
             # Pull Messages from store
             inflated_msgs: list[Message] = []
+            confirm_fn = self._make_confirm_message_received_fn(run_id)
             for msg_proto, msg_tree in zip(res.messages_list, res.message_object_trees):
                 msg_id = msg_proto.metadata.message_id
-                all_object_contents = pull_objects(
-                    object_ids=[
-                        tree.object_id for tree in iterate_object_tree(msg_tree)
-                    ],
+
+                # With `lazy_pull`, the Arrays of the message are only pulled once
+                # accessed, and the message is confirmed once they have all been pulled
+                message = pull_and_inflate_object_from_tree(
+                    msg_tree,
                     pull_object_fn=make_pull_object_fn_protobuf(
                         pull_object_protobuf=self._stub.PullObject,
                         node=self.node,
                         run_id=run_id,
                     ),
-                )
-
-                # Confirm that the message has been received
-                self._stub.ConfirmMessageReceived(
-                    ConfirmMessageReceivedRequest(
-                        node=self.node, run_id=run_id, message_object_id=msg_id
-                    )
-                )
-                message = cast(
-                    Message, inflate_object_from_contents(msg_id, all_object_contents)
+                    confirm_object_received_fn=confirm_fn,
+                    return_type=Message,
+                    lazy=self._lazy_pull,
                 )
                 message.metadata.__dict__["_message_id"] = msg_id
                 inflated_msgs.append(message)
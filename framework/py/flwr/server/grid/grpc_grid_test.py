@@ -20,9 +20,10 @@ import unittest
 from unittest.mock import Mock, patch
 
 import grpc
+import numpy as np
 
 from flwr.app.error import Error
-from flwr.common import RecordDict
+from flwr.common import ArrayRecord, RecordDict
 from flwr.common.constant import SUPERLINK_NODE_ID
 from flwr.common.inflatable import get_all_nested_objects, get_object_tree
 from flwr.common.message import Message
@@ -199,6 +200,39 @@ class TestGrpcGrid(unittest.TestCase):
         self.assertEqual(msgs[1].error, err_msg.error)
         self.assertEqual(self.mock_stub.PullObject.call_count, len(obj_store))
 
+    def test_pull_messages_lazily(self) -> None:
+        """Test that the Arrays of pulled messages are only pulled if `lazy_pull`."""
+        # Prepare: Create a reply carrying Arrays
+        ins = self._prep_message(Message(RecordDict(), 123, "train"))
+        content = RecordDict({"arrays": ArrayRecord([np.ones(3), np.zeros(2)])})
+        reply = Message(content, reply_to=ins)
+        reply.metadata.__dict__["_message_id"] = reply.object_id
+        obj_store = {k: v.deflate() for k, v in get_all_nested_objects(reply).items()}
+        self.mock_stub.PullMessages.return_value = Mock(
+            messages_list=[message_to_proto(reply)],
+            message_object_trees=[get_object_tree(reply)],
+        )
+        self.mock_stub.PullObject.side_effect = lambda req: Mock(
+            object_found=True,
+            object_available=True,
+            object_content=obj_store[req.object_id],
+        )
+        lazy_grid = GrpcGrid(lazy_pull=True)
+        lazy_grid._grpc_stub = self.mock_stub  # pylint: disable=protected-access
+        lazy_grid._channel = self.mock_channel  # pylint: disable=protected-access
+        lazy_grid.set_run(run_id=61016)
+
+        # Execute & Assert: by default, all objects are pulled right away
+        msgs = list(self.grid.pull_messages([ins.object_id]))
+        self.assertEqual(self.mock_stub.PullObject.call_count, len(obj_store))
+        self.mock_stub.PullObject.reset_mock()
+
+        # Execute & Assert: with `lazy_pull`, Arrays are pulled once accessed
+        lazy_msgs = list(lazy_grid.pull_messages([ins.object_id]))
+        self.assertLess(self.mock_stub.PullObject.call_count, len(obj_store))
+        self.assertEqual(lazy_msgs[0].content, msgs[0].content)
+        self.assertEqual(self.mock_stub.PullObject.call_count, len(obj_store))
+
     def test_send_and_receive_messages_complete(self) -> None:
         """Test send and receive all messages successfully."""
         # Prepare: Create an instruction message and mock responses
@@ -0,0 +1,394 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Registry of nodes with indexed attributes for sampling."""
+
+
+import heapq
+import random
+import threading
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class NodeRegistry(Generic[K]):
+    """A registry of nodes from which nodes are sampled without scanning all nodes.
+
+    Each node has a weight and a set of attributes (e.g., hardware, availability
+    window or latency bucket). All attributes are indexed, so that the nodes matching
+    some attribute values are found without scanning the registry. Nodes are sampled
+    without replacement:
+
+    - uniformly, in O(k) for k nodes,
+    - proportionally to their weight (importance sampling), in O(k log n),
+    - per stratum of an attribute, proportionally to the size of each stratum.
+
+    The registry can back a `ClientManager`, which registers the `cid` of its
+    clients, or be kept in sync with the node IDs of a `Grid`.
+
+    Parameters
+    ----------
+    rng : Optional[random.Random] (default: None)
+        The random number generator to sample with. If `None`, the global generator
+        of the `random` module is used, so that `random.seed()` applies.
+
+    Examples
+    --------
+    Sample 10 of the nodes connected to the SuperLink that have a GPU:
+
+    >>> registry = NodeRegistry()
+    >>> registry.sync(grid.get_node_ids())
+    >>> for node_id in registry.node_ids:
+    >>>     registry.update(node_id, {"hardware": get_hardware(node_id)})
+    >>> node_ids = registry.sample(10, where={"hardware": "gpu"})
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng = rng
+        # Node IDs are kept in a list, which is sampled without copying it. Removed
+        # nodes are swapped with the last node, so `_positions` holds their index.
+        self._node_ids: list[K] = []
+        self._positions: dict[K, int] = {}
+        self._attributes: dict[K, dict[str, Hashable]] = {}
+        # attribute name -> attribute value -> IDs of the nodes with that value
+        self._index: dict[str, dict[Hashable, set[K]]] = {}
+        self._weights = _FenwickTree()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of registered nodes."""
+        return len(self._node_ids)
+
+    def __contains__(self, node_id: object) -> bool:
+        """Return whether a node is registered."""
+        return node_id in self._positions
+
+    @property
+    def node_ids(self) -> list[K]:
+        """Return the IDs of all registered nodes."""
+        with self._lock:
+            return list(self._node_ids)
+
+    def add(
+        self,
+        node_id: K,
+        attributes: Optional[Mapping[str, Hashable]] = None,
+        weight: float = 1.0,
+    ) -> bool:
+        """Register a node, returning False if it is already registered."""
+        _check_weight(weight)
+        with self._lock:
+            if node_id in self._positions:
+                return False
+            self._positions[node_id] = len(self._node_ids)
+            self._node_ids.append(node_id)
+            self._attributes[node_id] = {}
+            self._weights.append(weight)
+            self._set_attributes(node_id, attributes or {})
+            return True
+
+    def remove(self, node_id: K) -> None:
+        """Unregister a node.
+
+        This method is idempotent.
+        """
+        with self._lock:
+            position = self._positions.pop(node_id, None)
+            if position is None:
+                return
+            self._set_attributes(node_id, dict.fromkeys(self._attributes[node_id]))
+            del self._attributes[node_id]
+            # Move the last node to the position of the removed one
+            last_node_id = self._node_ids.pop()
+            self._weights.swap_remove(position)
+            if last_node_id != node_id:
+                self._node_ids[position] = last_node_id
+                self._positions[last_node_id] = position
+
+    def update(
+        self,
+        node_id: K,
+        attributes: Optional[Mapping[str, Optional[Hashable]]] = None,
+        weight: Optional[float] = None,
+    ) -> None:
+        """Update the weight and attributes of a node.
+
+        Attributes set to `None` are removed from the node, the others are kept.
+        """
+        with self._lock:
+            if node_id not in self._positions:
+                raise KeyError(f"Node {node_id} is not registered.")
+            if weight is not None:
+                _check_weight(weight)
+                self._weights[self._positions[node_id]] = weight
+            if attributes:
+                self._set_attributes(node_id, attributes)
+
+    def sync(self, node_ids: Iterable[K]) -> None:
+        """Register the given nodes and unregister all other nodes."""
+        current = set(node_ids)
+        with self._lock:
+            for node_id in set(self._positions) - current:
+                self.remove(node_id)
+            for node_id in current:
+                self.add(node_id)
+
+    def attributes(self, node_id: K) -> dict[str, Hashable]:
+        """Return the attributes of a node."""
+        with self._lock:
+            return dict(self._attributes[node_id])
+
+    def weight(self, node_id: K) -> float:
+        """Return the weight of a node."""
+        with self._lock:
+            return self._weights[self._positions[node_id]]
+
+    def select(self, where: Mapping[str, Hashable]) -> set[K]:
+        """Return the IDs of the nodes whose attributes match all given values."""
+        with self._lock:
+            return self._select(where)
+
+    def sample(
+        self,
+        num_nodes: int,
+        *,
+        where: Optional[Mapping[str, Hashable]] = None,
+        weighted: bool = False,
+    ) -> list[K]:
+        """Sample nodes without replacement.
+
+        Parameters
+        ----------
+        num_nodes : int
+            The number of nodes to sample.
+        where : Optional[Mapping[str, Hashable]] (default: None)
+            If set, only nodes whose attributes match all given values are sampled.
+        weighted : bool (default: False)
+            If True, nodes are successively drawn with a probability proportional to
+            their weight. Nodes with a weight of 0 are never sampled.
+
+        Returns
+        -------
+        list[K]
+            The IDs of the sampled nodes.
+        """
+        with self._lock:
+            if where is None:
+                if not weighted:
+                    return self._draw(self._node_ids, num_nodes)
+                return self._sample_weighted(num_nodes)
+            candidates = list(self._select(where))
+            if not weighted:
+                return self._draw(candidates, num_nodes)
+            return self._sample_weighted_from(candidates, num_nodes)
+
+    def sample_stratified(  # pylint: disable=R0914
+        self,
+        num_nodes: int,
+        by: str,
+        *,
+        where: Optional[Mapping[str, Hashable]] = None,
+        weighted: bool = False,
+    ) -> list[K]:
+        """Sample nodes from each stratum of an attribute.
+
+        Nodes are grouped by their value of the attribute `by`, and each group is
+        allocated a number of nodes proportional to its size. Nodes without this
+        attribute are not sampled. Within each group, nodes are sampled as by
+        `sample()`.
+        """
+        with self._lock:
+            strata: list[list[K]] = []
+            matching = None if where is None else self._select(where)
+            for node_ids in self._index.get(by, {}).values():
+                stratum = list(
+                    node_ids if matching is None else node_ids.intersection(matching)
+                )
+                if stratum:
+                    strata.append(stratum)
+            size = sum(len(stratum) for stratum in strata)
+            if num_nodes > size:
+                raise ValueError("Sample larger than population")
+
+            # Allocate proportionally, giving the remaining nodes to the strata with
+            # the largest remainders
+            quotas = [num_nodes * len(stratum) / size for stratum in strata]
+            counts = [int(quota) for quota in quotas]
+            by_remainder = sorted(
+                range(len(strata)), key=lambda i: counts[i] - quotas[i]
+            )
+            for i in by_remainder[: num_nodes - sum(counts)]:
+                counts[i] += 1
+
+            sampled: list[K] = []
+            for stratum, count in zip(strata, counts):
+                if weighted:
+                    sampled.extend(self._sample_weighted_from(stratum, count))
+                else:
+                    sampled.extend(self._draw(stratum, count))
+            return sampled
+
+    def _draw(self, population: Sequence[K], num_nodes: int) -> list[K]:
+        """Sample uniformly without replacement."""
+        if self._rng is None:
+            return random.sample(population, num_nodes)
+        return self._rng.sample(population, num_nodes)
+
+    def _draw_random(self) -> float:
+        """Return a random float in [0, 1)."""
+        if self._rng is None:
+            return random.random()
+        return self._rng.random()
+
+    def _set_attributes(
+        self, node_id: K, attributes: Mapping[str, Optional[Hashable]]
+    ) -> None:
+        """Set the attributes of a node and update the indexes."""
+        node_attributes = self._attributes[node_id]
+        for name, value in attributes.items():
+            if name in node_attributes:
+                values = self._index[name]
+                old_value = node_attributes.pop(name)
+                values[old_value].discard(node_id)
+                if not values[old_value]:
+                    del values[old_value]
+            if value is not None:
+                node_attributes[name] = value
+                self._index.setdefault(name, {}).setdefault(value, set()).add(node_id)
+
+    def _select(self, where: Mapping[str, Hashable]) -> set[K]:
+        """Intersect the indexes, starting from the smallest set of nodes."""
+        matches = [
+            self._index.get(name, {}).get(value, set()) for name, value in where.items()
+        ]
+        if not matches:
+            return set(self._positions)
+        matches.sort(key=len)
+        return matches[0].intersection(*matches[1:])
+
+    def _sample_weighted(self, num_nodes: int) -> list[K]:
+        """Draw nodes proportionally to their weight, in O(k log n)."""
+        if num_nodes > self._weights.num_positive:
+            raise ValueError("Sample larger than population")
+        drawn: list[tuple[int, float]] = []
+        try:
+            for _ in range(num_nodes):
+                position = self._weights.find(self._draw_random() * self._weights.total)
+                drawn.append((position, self._weights[position]))
+                # Exclude the drawn node from the next draws
+                self._weights[position] = 0.0
+        finally:
+            for position, weight in drawn:
+                self._weights[position] = weight
+        return [self._node_ids[position] for position, _ in drawn]
+
+    def _sample_weighted_from(self, candidates: list[K], num_nodes: int) -> list[K]:
+        """Draw candidates proportionally to their weight.
+
+        Algorithm A-ES by Efraimidis and Spirakis, which draws the same distribution as
+        successive weighted draws.
+        """
+        keys: list[tuple[float, K]] = []
+        for node_id in candidates:
+            weight = self._weights[self._positions[node_id]]
+            if weight > 0:
+                keys.append((self._draw_random() ** (1.0 / weight), node_id))
+        if num_nodes > len(keys):
+            raise ValueError("Sample larger than population")
+        return [node_id for _, node_id in heapq.nlargest(num_nodes, keys)]
+
+
+class _FenwickTree:
+    """Binary indexed tree of non-negative weights supporting weighted draws."""
+
+    def __init__(self) -> None:
+        self._values: list[float] = []
+        self._tree: list[float] = [0.0]
+        self.num_positive = 0
+
+    @property
+    def total(self) -> float:
+        """Return the sum of all weights."""
+        return self._prefix_sum(len(self._values))
+
+    def __getitem__(self, position: int) -> float:
+        """Return the weight at a position."""
+        return self._values[position]
+
+    def __setitem__(self, position: int, value: float) -> None:
+        """Set the weight at a position."""
+        old_value = self._values[position]
+        self._values[position] = value
+        self.num_positive += (value > 0) - (old_value > 0)
+        self._add(position, value - old_value)
+
+    def append(self, value: float) -> None:
+        """Append a weight."""
+        self._values.append(0.0)
+        if len(self._values) >= len(self._tree):
+            # Double the capacity, rebuilding the tree in O(n)
+            capacity = 2 * len(self._tree)
+            self._tree = [0.0] * capacity
+            for i, weight in enumerate(self._values, start=1):
+                self._tree[i] += weight
+                parent = i + (i & -i)
+                if parent < capacity:
+                    self._tree[parent] += self._tree[i]
+        self[len(self._values) - 1] = value
+
+    def swap_remove(self, position: int) -> None:
+        """Move the last weight to `position` and remove it from the end."""
+        last = len(self._values) - 1
+        last_value = self._values[last]
+        self[last] = 0.0
+        self._values.pop()
+        if position != last:
+            self[position] = last_value
+
+    def find(self, value: float) -> int:
+        """Return the first position whose prefix sum of weights exceeds `value`."""
+        position = 0
+        step = 1 << (len(self._tree).bit_length() - 1)
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] <= value:
+                position = nxt
+                value -= self._tree[nxt]
+            step >>= 1
+        # Guard against rounding errors landing on a position without weight
+        if position >= len(self._values) or self._values[position] <= 0:
+            positive = [i for i, weight in enumerate(self._values) if weight > 0]
+            later = [i for i in positive if i > position]
+            position = later[0] if later else positive[-1]
+        return position
+
+    def _add(self, position: int, delta: float) -> None:
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix_sum(self, end: int) -> float:
+        total = 0.0
+        while end > 0:
+            total += self._tree[end]
+            end -= end & -end
+        return total
+
+
+def _check_weight(weight: float) -> None:
+    if weight < 0:
+        raise ValueError("The weight of a node must be non-negative.")
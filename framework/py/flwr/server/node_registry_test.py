@@ -0,0 +1,132 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for NodeRegistry."""
+
+
+import random
+from collections import Counter
+
+import pytest
+
+from .node_registry import NodeRegistry
+
+
+def _registry(num_nodes: int = 10) -> NodeRegistry[int]:
+    """Create a registry whose even nodes have a GPU."""
+    registry: NodeRegistry[int] = NodeRegistry(random.Random(42))
+    for node_id in range(num_nodes):
+        hardware = "gpu" if node_id % 2 == 0 else "cpu"
+        registry.add(node_id, {"hardware": hardware, "region": node_id % 3})
+    return registry
+
+
+def test_add_remove_and_select() -> None:
+    """Test that the indexes follow the registered nodes and their attributes."""
+    # Prepare
+    registry = _registry()
+
+    # Execute
+    added_twice = registry.add(0)
+    registry.remove(4)
+    registry.remove(4)
+    registry.update(2, {"hardware": "cpu"})
+    registry.update(6, {"region": None})
+
+    # Assert
+    assert not added_twice
+    assert len(registry) == 9
+    assert 4 not in registry
+    assert sorted(registry.node_ids) == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+    assert registry.select({"hardware": "gpu"}) == {0, 6, 8}
+    assert registry.select({"hardware": "gpu", "region": 0}) == {0}
+    assert registry.attributes(6) == {"hardware": "gpu"}
+    with pytest.raises(KeyError):
+        registry.update(4, weight=2.0)
+
+
+def test_sample_uniform() -> None:
+    """Test uniform sampling, with and without attribute filters."""
+    # Prepare
+    registry = _registry()
+
+    # Execute
+    sampled = registry.sample(5)
+    sampled_gpu = registry.sample(3, where={"hardware": "gpu"})
+
+    # Assert
+    assert len(set(sampled)) == 5
+    assert len(set(sampled_gpu)) == 3
+    assert all(node_id % 2 == 0 for node_id in sampled_gpu)
+    with pytest.raises(ValueError):
+        registry.sample(6, where={"hardware": "gpu"})
+
+
+def test_sample_weighted() -> None:
+    """Test that nodes are drawn proportionally to their weight."""
+    # Prepare
+    registry = _registry()
+    for node_id in range(10):
+        registry.update(node_id, weight=0.0 if node_id < 5 else float(node_id))
+    counts: Counter[int] = Counter()
+
+    # Execute
+    for _ in range(2000):
+        counts.update(registry.sample(1, weighted=True))
+    sampled = registry.sample(5, weighted=True)
+    sampled_gpu = registry.sample(2, where={"hardware": "gpu"}, weighted=True)
+
+    # Assert
+    assert set(counts) == {5, 6, 7, 8, 9}
+    assert counts[9] > counts[5]
+    assert sorted(sampled) == [5, 6, 7, 8, 9]
+    assert sorted(sampled_gpu) == [6, 8]
+    with pytest.raises(ValueError):
+        registry.sample(6, weighted=True)
+    # Weights are restored after sampling
+    assert registry.weight(9) == 9.0
+
+
+def test_weights_follow_removed_nodes() -> None:
+    """Test that weights stay attached to their node when others are removed."""
+    # Prepare
+    registry: NodeRegistry[str] = NodeRegistry(random.Random(0))
+    for i in range(100):
+        registry.add(str(i), weight=1.0 if i == 0 else 0.0)
+
+    # Execute
+    for i in range(1, 100, 2):
+        registry.remove(str(i))
+    registry.sync(["0", "2", "200"])
+    registry.update("0", weight=0.0)
+    registry.update("200", weight=3.0)
+
+    # Assert
+    assert sorted(registry.node_ids) == ["0", "2", "200"]
+    assert registry.sample(1, weighted=True) == ["200"]
+
+
+def test_sample_stratified() -> None:
+    """Test that strata are allocated proportionally to their size."""
+    # Prepare
+    registry = _registry(num_nodes=12)
+
+    # Execute
+    sampled = registry.sample_stratified(6, by="region")
+    sampled_gpu = registry.sample_stratified(3, by="region", where={"hardware": "gpu"})
+
+    # Assert
+    assert sorted(Counter(node_id % 3 for node_id in sampled).values()) == [2, 2, 2]
+    assert sorted(node_id % 3 for node_id in sampled_gpu) == [0, 1, 2]
+    assert all(node_id % 2 == 0 for node_id in sampled_gpu)
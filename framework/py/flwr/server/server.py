@@ -39,6 +39,7 @@ from flwr.server.client_proxy import ClientProxy
 from flwr.server.history import History
 from flwr.server.strategy import FedAvg, Strategy
 
+from .centralized_evaluation import CentralizedEvaluator
 from .server_config import ServerConfig
 
 FitResultsAndFailures = tuple[
@@ -70,11 +71,20 @@ class Server:
         )
         self.strategy: Strategy = strategy if strategy is not None else FedAvg()
         self.max_workers: Optional[int] = None
+        self.evaluate_every: int = 1
+        self.background_evaluation: bool = False
 
     def set_max_workers(self, max_workers: Optional[int]) -> None:
         """Set the max_workers used by ThreadPoolExecutor."""
         self.max_workers = max_workers
 
+    def set_centralized_evaluation(
+        self, evaluate_every: int = 1, background: bool = False
+    ) -> None:
+        """Set the cadence and background execution of the centralized evaluation."""
+        self.evaluate_every = evaluate_every
+        self.background_evaluation = background
+
     def set_strategy(self, strategy: Strategy) -> None:
         """Replace server strategy."""
         self.strategy = strategy
@@ -87,26 +97,37 @@ class Server:
     def fit(self, num_rounds: int, timeout: Optional[float]) -> tuple[History, float]:
         """Run federated averaging for a number of rounds."""
         history = History()
+        evaluator = CentralizedEvaluator(
+            self.strategy,
+            history,
+            evaluate_every=self.evaluate_every,
+            background=self.background_evaluation,
+        )
 
         # Initialize parameters
         log(INFO, "[INIT]")
         self.parameters = self._get_initial_parameters(server_round=0, timeout=timeout)
-        log(INFO, "Starting evaluation of initial global parameters")
-        res = self.strategy.evaluate(0, parameters=self.parameters)
-        if res is not None:
-            log(
-                INFO,
-                "initial parameters (loss, other metrics): %s, %s",
-                res[0],
-                res[1],
-            )
-            history.add_loss_centralized(server_round=0, loss=res[0])
-            history.add_metrics_centralized(server_round=0, metrics=res[1])
-        else:
-            log(INFO, "Evaluation returned no results (`None`)")
+        try:
+            evaluator.submit(0, self.parameters)
+            start_time = self._fit_rounds(num_rounds, timeout, history, evaluator)
+        finally:
+            evaluator.shutdown()
+
+        # Bookkeeping
+        end_time = timeit.default_timer()
+        elapsed = end_time - start_time
+        return history, elapsed
 
-        # Run federated learning for num_rounds
+    def _fit_rounds(
+        self,
+        num_rounds: int,
+        timeout: Optional[float],
+        history: History,
+        evaluator: CentralizedEvaluator,
+    ) -> float:
+        """Run the rounds of federated learning and return their start time."""
         start_time = timeit.default_timer()
+        evaluator.start_time = start_time
 
         for current_round in range(1, num_rounds + 1):
             log(INFO, "")
@@ -125,21 +146,9 @@ class Server:
                 )
 
             # Evaluate model using strategy implementation
-            res_cen = self.strategy.evaluate(current_round, parameters=self.parameters)
-            if res_cen is not None:
-                loss_cen, metrics_cen = res_cen
-                log(
-                    INFO,
-                    "fit progress: (%s, %s, %s, %s)",
-                    current_round,
-                    loss_cen,
-                    metrics_cen,
-                    timeit.default_timer() - start_time,
-                )
-                history.add_loss_centralized(server_round=current_round, loss=loss_cen)
-                history.add_metrics_centralized(
-                    server_round=current_round, metrics=metrics_cen
-                )
+            evaluator.collect()
+            if evaluator.should_evaluate(current_round, num_rounds):
+                evaluator.submit(current_round, self.parameters)
 
             # Evaluate model on a sample of available clients
             res_fed = self.evaluate_round(server_round=current_round, timeout=timeout)
@@ -153,10 +162,7 @@ class Server:
                         server_round=current_round, metrics=evaluate_metrics_fed
                     )
 
-        # Bookkeeping
-        end_time = timeit.default_timer()
-        elapsed = end_time - start_time
-        return history, elapsed
+        return start_time
 
     def evaluate_round(
         self,
@@ -489,6 +495,10 @@ def run_fl(
     config: ServerConfig,
 ) -> History:
     """Train a model on the given server and return the History object."""
+    server.set_centralized_evaluation(
+        evaluate_every=config.evaluate_every,
+        background=config.background_evaluation,
+    )
     hist, elapsed_time = server.fit(
         num_rounds=config.num_rounds, timeout=config.round_timeout
     )
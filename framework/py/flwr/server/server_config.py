@@ -25,10 +25,60 @@ class ServerConfig:
 
     All attributes have default values which allows users to configure just the ones
     they care about.
+
+    Parameters
+    ----------
+    num_rounds : int (default: 1)
+        The number of rounds to run.
+    round_timeout : Optional[float] (default: None)
+        The deadline, in seconds, for collecting replies in a round. Once it passes,
+        the round proceeds with the replies received so far. If `None`, wait for all
+        replies.
+    over_selection_factor : float (default: 1.0)
+        The factor by which the default workflows over-select clients in a fit
+        round. For example, a factor of 1.3 sends instructions to 30% more clients
+        than the strategy sampled. The additional clients are chosen by lowest
+        historical response latency.
+    quorum_fraction : float (default: 1.0)
+        The fraction of the clients sampled by the strategy whose successful replies
+        complete a round in the default workflows. Together with
+        `over_selection_factor`, this lets a round finish without waiting for the
+        slowest clients.
+    evaluate_every : int (default: 1)
+        The cadence, in rounds, of the centralized evaluation (`Strategy.evaluate`).
+        The initial parameters and the final round are always evaluated.
+    background_evaluation : bool (default: False)
+        Whether to run the centralized evaluation in a background thread on a
+        snapshot of the global parameters, while the next round proceeds. Results
+        are added to the `History` once they are ready. The `evaluate_fn` of the
+        strategy must then be safe to call concurrently with the other methods of
+        the strategy.
     """
 
     num_rounds: int = 1
     round_timeout: Optional[float] = None
+    over_selection_factor: float = 1.0
+    quorum_fraction: float = 1.0
+    evaluate_every: int = 1
+    background_evaluation: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the ServerConfig."""
+        if self.over_selection_factor < 1.0:
+            raise ValueError(
+                "`over_selection_factor` must be greater than or equal to 1.0, "
+                f"but got {self.over_selection_factor}."
+            )
+        if not 0.0 < self.quorum_fraction <= 1.0:
+            raise ValueError(
+                "`quorum_fraction` must be in the range (0.0, 1.0], "
+                f"but got {self.quorum_fraction}."
+            )
+        if self.evaluate_every < 1:
+            raise ValueError(
+                "`evaluate_every` must be greater than or equal to 1, "
+                f"but got {self.evaluate_every}."
+            )
 
     def __repr__(self) -> str:
         """Return the string representation of the ServerConfig."""
@@ -37,4 +87,13 @@ class ServerConfig:
             if self.round_timeout is None
             else f"round_timeout={self.round_timeout}s"
         )
-        return f"num_rounds={self.num_rounds}, {timeout_string}"
+        ret = f"num_rounds={self.num_rounds}, {timeout_string}"
+        if self.over_selection_factor != 1.0:
+            ret += f", over_selection_factor={self.over_selection_factor}"
+        if self.quorum_fraction != 1.0:
+            ret += f", quorum_fraction={self.quorum_fraction}"
+        if self.evaluate_every != 1:
+            ret += f", evaluate_every={self.evaluate_every}"
+        if self.background_evaluation:
+            ret += ", background_evaluation=True"
+        return ret
@@ -23,7 +23,6 @@ from time import sleep
 from typing import Optional
 
 from flwr.cli.config_utils import get_fab_metadata
-from flwr.cli.install import install_from_fab
 from flwr.cli.utils import get_sha256_hash
 from flwr.common.args import add_args_flwr_app_common
 from flwr.common.config import (
@@ -150,6 +149,11 @@ def run_serverapp(  # pylint: disable=R0914, disable=W0212, disable=R0915
             )
 
             log(DEBUG, "[flwr-serverapp] Start FAB installation.")
+            # Only import the CLI (typer) when a FAB is installed
+            from flwr.cli.install import (  # pylint: disable=import-outside-toplevel
+                install_from_fab,
+            )
+
             install_from_fab(fab.content, flwr_dir=flwr_dir_, skip_prompt=True)
 
             fab_id, fab_version = get_fab_metadata(fab.content)
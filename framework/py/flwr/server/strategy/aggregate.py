@@ -69,9 +69,10 @@ def aggregate_inplace(results: list[tuple[ClientProxy, FitRes]]) -> NDArrays:
     ]
 
     for i, (_, fit_res) in enumerate(results[1:], start=1):
+        # Only copy one layer at a time out of the read-only views of the results
         res = (
-            _try_inplace(x, scaling_factors[i], np_binary_op=np.multiply)
-            for x in parameters_to_ndarrays(fit_res.parameters)
+            _try_inplace(x.copy(), scaling_factors[i], np_binary_op=np.multiply)
+            for x in parameters_to_ndarrays(fit_res.parameters, copy=False)
         )
         params = [
             reduce(partial(_try_inplace, np_binary_op=np.add), layer_updates)
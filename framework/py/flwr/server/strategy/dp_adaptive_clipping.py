@@ -36,9 +36,9 @@ from flwr.common import (
     parameters_to_ndarrays,
 )
 from flwr.common.differential_privacy import (
-    adaptive_clip_inputs_inplace,
     add_gaussian_noise_to_params,
     compute_adaptive_noise_params,
+    compute_clip_model_updates,
     compute_stdv,
 )
 from flwr.common.differential_privacy_constants import (
@@ -187,25 +187,20 @@ class DifferentialPrivacyServerSideAdaptiveClipping(Strategy):
                 self.num_sampled_clients,
             )
 
-        norm_bit_set_count = 0
-        for _, res in results:
-            param = parameters_to_ndarrays(res.parameters)
-            # Compute and clip update
-            model_update = [
-                np.subtract(x, y) for (x, y) in zip(param, self.current_round_params)
-            ]
-
-            norm_bit = adaptive_clip_inputs_inplace(model_update, self.clipping_norm)
-            norm_bit_set_count += norm_bit
-
-            log(
-                INFO,
-                "aggregate_fit: parameters are clipped by value: %.4f.",
-                self.clipping_norm,
-            )
-
-            for i, _ in enumerate(self.current_round_params):
-                param[i] = self.current_round_params[i] + model_update[i]
+        params = [
+            parameters_to_ndarrays(res.parameters, copy=False) for _, res in results
+        ]
+        # Compute and clip the updates of all clients at once
+        norm_bits = compute_clip_model_updates(
+            params, self.current_round_params, self.clipping_norm
+        )
+        norm_bit_set_count = int(norm_bits.sum())
+        log(
+            INFO,
+            "aggregate_fit: parameters are clipped by value: %.4f.",
+            self.clipping_norm,
+        )
+        for (_, res), param in zip(results, params):
             # Convert back to parameters
             res.parameters = ndarrays_to_parameters(param)
 
@@ -34,7 +34,7 @@ from flwr.common import (
 )
 from flwr.common.differential_privacy import (
     add_gaussian_noise_to_params,
-    compute_clip_model_update,
+    compute_clip_model_updates,
     compute_stdv,
 )
 from flwr.common.differential_privacy_constants import (
@@ -150,17 +150,19 @@ class DifferentialPrivacyServerSideFixedClipping(Strategy):
                 len(results),
                 self.num_sampled_clients,
             )
-        for _, res in results:
-            param = parameters_to_ndarrays(res.parameters)
-            # Compute and clip update
-            compute_clip_model_update(
-                param, self.current_round_params, self.clipping_norm
-            )
-            log(
-                INFO,
-                "aggregate_fit: parameters are clipped by value: %.4f.",
-                self.clipping_norm,
-            )
+        params = [
+            parameters_to_ndarrays(res.parameters, copy=False) for _, res in results
+        ]
+        # Compute and clip the updates of all clients at once
+        compute_clip_model_updates(
+            params, self.current_round_params, self.clipping_norm
+        )
+        log(
+            INFO,
+            "aggregate_fit: parameters are clipped by value: %.4f.",
+            self.clipping_norm,
+        )
+        for (_, res), param in zip(results, params):
             # Convert back to parameters
             res.parameters = ndarrays_to_parameters(param)
 
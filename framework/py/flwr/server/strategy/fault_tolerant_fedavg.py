@@ -99,7 +99,10 @@ class FaultTolerantFedAvg(FedAvg):
 
         # Convert results
         weights_results = [
-            (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
+            (
+                parameters_to_ndarrays(fit_res.parameters, copy=False),
+                fit_res.num_examples,
+            )
             for client, fit_res in results
         ]
         parameters_aggregated = ndarrays_to_parameters(aggregate(weights_results))
@@ -24,15 +24,7 @@ from typing import Callable, Optional, Union
 
 import numpy as np
 
-from flwr.common import (
-    FitRes,
-    MetricsAggregationFn,
-    NDArrays,
-    Parameters,
-    Scalar,
-    ndarrays_to_parameters,
-    parameters_to_ndarrays,
-)
+from flwr.common import FitRes, MetricsAggregationFn, NDArrays, Parameters, Scalar
 from flwr.server.client_proxy import ClientProxy
 
 from .fedopt import FedOpt
@@ -147,28 +139,19 @@ class FedAdam(FedOpt):
         if fedavg_parameters_aggregated is None:
             return None, {}
 
-        fedavg_weights_aggregate = parameters_to_ndarrays(fedavg_parameters_aggregated)
+        # Adam, updating the contiguous buffers of the optimizer state in place
+        state = self.optimizer_state
+        delta_t = self._compute_delta(fedavg_parameters_aggregated)
 
-        # Adam
-        delta_t: NDArrays = [
-            x - y for x, y in zip(fedavg_weights_aggregate, self.current_weights)
-        ]
+        # v_t
+        v_t = state.buffer("v_t")
+        v_t *= self.beta_2
+        delta_sq = np.multiply(delta_t, delta_t, out=state.scratch(1))
+        delta_sq *= 1.0 - self.beta_2
+        v_t += delta_sq
 
         # m_t
-        if not self.m_t:
-            self.m_t = [np.zeros_like(x) for x in delta_t]
-        self.m_t = [
-            np.multiply(self.beta_1, x) + (1 - self.beta_1) * y
-            for x, y in zip(self.m_t, delta_t)
-        ]
-
-        # v_t
-        if not self.v_t:
-            self.v_t = [np.zeros_like(x) for x in delta_t]
-        self.v_t = [
-            self.beta_2 * x + (1 - self.beta_2) * np.multiply(y, y)
-            for x, y in zip(self.v_t, delta_t)
-        ]
+        self._update_m_t(delta_t)
 
         # Compute the bias-corrected learning rate, `eta_norm` for improving convergence
         # in the early rounds of FL training. This `eta_norm` is `\alpha_t` in Kingma &
@@ -180,11 +163,4 @@ class FedAdam(FedOpt):
             / (1 - np.power(self.beta_1, server_round + 1.0))
         )
 
-        new_weights = [
-            x + eta_norm * y / (np.sqrt(z) + self.tau)
-            for x, y, z in zip(self.current_weights, self.m_t, self.v_t)
-        ]
-
-        self.current_weights = new_weights
-
-        return ndarrays_to_parameters(self.current_weights), metrics_aggregated
+        return self._apply_update(float(eta_norm)), metrics_aggregated
@@ -236,7 +236,10 @@ class FedAvg(Strategy):
         else:
             # Convert results
             weights_results = [
-                (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
+                (
+                    parameters_to_ndarrays(fit_res.parameters, copy=False),
+                    fit_res.num_examples,
+                )
                 for _, fit_res in results
             ]
             aggregated_ndarrays = aggregate(weights_results)
@@ -21,6 +21,8 @@ Paper: arxiv.org/pdf/1909.06335.pdf
 from logging import WARNING
 from typing import Callable, Optional, Union
 
+import numpy as np
+
 from flwr.common import (
     FitRes,
     MetricsAggregationFn,
@@ -36,6 +38,7 @@ from flwr.server.client_proxy import ClientProxy
 
 from .aggregate import aggregate
 from .fedavg import FedAvg
+from .server_optimizer import ServerOptimizerState
 
 
 # pylint: disable=line-too-long
@@ -116,7 +119,9 @@ class FedAvgM(FedAvg):
         self.server_opt: bool = (self.server_momentum != 0.0) or (
             self.server_learning_rate != 1.0
         )
-        self.momentum_vector: Optional[NDArrays] = None
+        # The weights and momentum are kept in contiguous buffers, created in the
+        # first round, which can be saved with `optimizer_state.to_array_record()`
+        self.optimizer_state: Optional[ServerOptimizerState] = None
 
     def __repr__(self) -> str:
         """Compute a string representation of the strategy."""
@@ -143,7 +148,10 @@ class FedAvgM(FedAvg):
             return None, {}
         # Convert results
         weights_results = [
-            (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
+            (
+                parameters_to_ndarrays(fit_res.parameters, copy=False),
+                fit_res.num_examples,
+            )
             for _, fit_res in results
         ]
 
@@ -155,39 +163,35 @@ class FedAvgM(FedAvg):
             assert (
                 self.initial_parameters is not None
             ), "When using server-side optimization, model needs to be initialized."
-            initial_weights = parameters_to_ndarrays(self.initial_parameters)
+            state = self._get_optimizer_state()
 
             # remember that updates are the opposite of gradients
-            pseudo_gradient: NDArrays = [
-                x - y
-                for x, y in zip(
-                    parameters_to_ndarrays(self.initial_parameters), fedavg_result
-                )
-            ]
+            pseudo_gradient = state.flatten(fedavg_result, out=state.scratch(0))
+            np.subtract(state.weights, pseudo_gradient, out=pseudo_gradient)
             if self.server_momentum > 0.0:
                 if server_round > 1:
                     assert (
-                        self.momentum_vector
+                        "momentum_vector" in state.buffers
                     ), "Momentum should have been created on round 1."
-                    self.momentum_vector = [
-                        self.server_momentum * x + y
-                        for x, y in zip(self.momentum_vector, pseudo_gradient)
-                    ]
+                    momentum_vector = state.buffers["momentum_vector"]
+                    momentum_vector *= self.server_momentum
+                    momentum_vector += pseudo_gradient
                 else:
-                    self.momentum_vector = pseudo_gradient
+                    state.buffer("momentum_vector")[:] = pseudo_gradient
 
                 # No nesterov for now
-                pseudo_gradient = self.momentum_vector
+                pseudo_gradient = state.buffers["momentum_vector"]
 
-            # SGD
-            fedavg_result = [
-                x - self.server_learning_rate * y
-                for x, y in zip(initial_weights, pseudo_gradient)
-            ]
+            # SGD, in place
+            state.weights -= np.multiply(
+                pseudo_gradient, self.server_learning_rate, out=state.scratch(1)
+            )
+            fedavg_result = state.unflatten(state.weights)
             # Update current weights
             self.initial_parameters = ndarrays_to_parameters(fedavg_result)
-
-        parameters_aggregated = ndarrays_to_parameters(fedavg_result)
+            parameters_aggregated = self.initial_parameters
+        else:
+            parameters_aggregated = ndarrays_to_parameters(fedavg_result)
 
         # Aggregate custom metrics if aggregation fn was provided
         metrics_aggregated = {}
@@ -198,3 +202,32 @@ class FedAvgM(FedAvg):
             log(WARNING, "No fit_metrics_aggregation_fn provided")
 
         return parameters_aggregated, metrics_aggregated
+
+    @property
+    def momentum_vector(self) -> Optional[NDArrays]:
+        """The momentum of the server optimizer, or None before the first round."""
+        state = self.optimizer_state
+        if state is None or "momentum_vector" not in state.buffers:
+            return None
+        return state.unflatten(state.buffers["momentum_vector"])
+
+    @momentum_vector.setter
+    def momentum_vector(self, ndarrays: Optional[NDArrays]) -> None:
+        """Set the momentum of the server optimizer."""
+        if ndarrays is None:
+            if self.optimizer_state is not None:
+                self.optimizer_state.buffers.pop("momentum_vector", None)
+            return
+        state = self._get_optimizer_state()
+        state.flatten(ndarrays, out=state.buffer("momentum_vector"))
+
+    def _get_optimizer_state(self) -> ServerOptimizerState:
+        """Return the optimizer state, created from the initial parameters if needed."""
+        if self.optimizer_state is None:
+            assert (
+                self.initial_parameters is not None
+            ), "When using server-side optimization, model needs to be initialized."
+            self.optimizer_state = ServerOptimizerState(
+                parameters_to_ndarrays(self.initial_parameters)
+            )
+        return self.optimizer_state
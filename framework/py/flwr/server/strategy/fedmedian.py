@@ -58,7 +58,10 @@ class FedMedian(FedAvg):
 
         # Convert results
         weights_results = [
-            (parameters_to_ndarrays(fit_res.parameters), fit_res.num_examples)
+            (
+                parameters_to_ndarrays(fit_res.parameters, copy=False),
+                fit_res.num_examples,
+            )
             for _, fit_res in results
         ]
         parameters_aggregated = ndarrays_to_parameters(
@@ -20,15 +20,20 @@ Paper: arxiv.org/abs/2003.00295
 
 from typing import Callable, Optional
 
+import numpy as np
+
 from flwr.common import (
     MetricsAggregationFn,
     NDArrays,
     Parameters,
     Scalar,
+    ndarrays_to_parameters,
     parameters_to_ndarrays,
 )
+from flwr.common.typing import NDArray
 
 from .fedavg import FedAvg
+from .server_optimizer import ServerOptimizerState
 
 
 # pylint: disable=line-too-long
@@ -116,16 +121,88 @@ class FedOpt(FedAvg):
             fit_metrics_aggregation_fn=fit_metrics_aggregation_fn,
             evaluate_metrics_aggregation_fn=evaluate_metrics_aggregation_fn,
         )
-        self.current_weights = parameters_to_ndarrays(initial_parameters)
+        # The weights and moments are kept in contiguous buffers, which can be saved
+        # with `optimizer_state.to_array_record()`, e.g., in `Context.state`
+        self.optimizer_state = ServerOptimizerState(
+            parameters_to_ndarrays(initial_parameters)
+        )
         self.eta = eta
         self.eta_l = eta_l
         self.tau = tau
         self.beta_1 = beta_1
         self.beta_2 = beta_2
-        self.m_t: Optional[NDArrays] = None
-        self.v_t: Optional[NDArrays] = None
 
     def __repr__(self) -> str:
         """Compute a string representation of the strategy."""
         rep = f"FedOpt(accept_failures={self.accept_failures})"
         return rep
+
+    @property
+    def current_weights(self) -> NDArrays:
+        """The current weights of the global model."""
+        return self.optimizer_state.unflatten(self.optimizer_state.weights)
+
+    @current_weights.setter
+    def current_weights(self, ndarrays: NDArrays) -> None:
+        """Set the current weights of the global model."""
+        self.optimizer_state.flatten(ndarrays, out=self.optimizer_state.weights)
+
+    @property
+    def m_t(self) -> Optional[NDArrays]:
+        """The first moment, or None before the first round."""
+        return self._get_buffer("m_t")
+
+    @m_t.setter
+    def m_t(self, ndarrays: Optional[NDArrays]) -> None:
+        """Set the first moment."""
+        self._set_buffer("m_t", ndarrays)
+
+    @property
+    def v_t(self) -> Optional[NDArrays]:
+        """The second moment, or None before the first round."""
+        return self._get_buffer("v_t")
+
+    @v_t.setter
+    def v_t(self, ndarrays: Optional[NDArrays]) -> None:
+        """Set the second moment."""
+        self._set_buffer("v_t", ndarrays)
+
+    def _get_buffer(self, name: str) -> Optional[NDArrays]:
+        if name not in self.optimizer_state.buffers:
+            return None
+        return self.optimizer_state.unflatten(self.optimizer_state.buffers[name])
+
+    def _set_buffer(self, name: str, ndarrays: Optional[NDArrays]) -> None:
+        if ndarrays is None:
+            self.optimizer_state.buffers.pop(name, None)
+        else:
+            self.optimizer_state.flatten(
+                ndarrays, out=self.optimizer_state.buffer(name)
+            )
+
+    def _compute_delta(self, parameters_aggregated: Parameters) -> NDArray:
+        """Return the aggregated weights minus the current weights (in scratch 0)."""
+        state = self.optimizer_state
+        delta_t = state.flatten(
+            parameters_to_ndarrays(parameters_aggregated), out=state.scratch(0)
+        )
+        delta_t -= state.weights
+        return delta_t
+
+    def _update_m_t(self, delta_t: NDArray) -> None:
+        """Update the first moment in place, m_t = beta_1 * m_t + (1 - beta_1) * d_t."""
+        m_t = self.optimizer_state.buffer("m_t")
+        m_t *= self.beta_1
+        m_t += np.multiply(
+            delta_t, 1.0 - self.beta_1, out=self.optimizer_state.scratch(1)
+        )
+
+    def _apply_update(self, eta: float) -> Parameters:
+        """Update the weights in place: x += eta * m_t / (sqrt(v_t) + tau)."""
+        state = self.optimizer_state
+        update = np.sqrt(state.buffer("v_t"), out=state.scratch(1))
+        update += self.tau
+        np.divide(state.buffer("m_t"), update, out=update)
+        update *= eta
+        state.weights += update
+        return ndarrays_to_parameters(self.current_weights)
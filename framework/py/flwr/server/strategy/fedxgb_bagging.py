@@ -17,17 +17,42 @@
 
 import json
 from logging import WARNING
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, Callable, Optional, TypeVar, Union, cast
 
-from flwr.common import EvaluateRes, FitRes, Parameters, Scalar
+from flwr.common import EvaluateIns, EvaluateRes, FitIns, FitRes, Parameters, Scalar
 from flwr.common.logger import log
+from flwr.server.client_manager import ClientManager
 from flwr.server.client_proxy import ClientProxy
 
 from .fedavg import FedAvg
 
+# Config key holding the number of global trees a delta broadcast builds upon
+DELTA_BASE_NUM_TREES_KEY = "xgb-delta-base-num-trees"
+# Placeholder for the serialized trees when encoding the model JSON
+_TREES_PLACEHOLDER = "__flwr_xgb_trees__"
+
+InsT = TypeVar("InsT", FitIns, EvaluateIns)
+
 
 class FedXgbBagging(FedAvg):
-    """Configurable FedXgbBagging strategy implementation."""
+    """Configurable FedXgbBagging strategy implementation.
+
+    The global model is kept as an append-only tree ensemble. In each round, only the
+    trees grown by the clients are parsed and appended to it, and the trees that are
+    already part of the ensemble are not serialized again.
+
+    Parameters
+    ----------
+    evaluate_function : Optional[Callable[[int, Parameters, Dict[str, Scalar]],
+        Optional[Tuple[float, Dict[str, Scalar]]]]] (default: None)
+        Optional function used for validation.
+    broadcast_delta : bool (default: False)
+        If True, clients that replied in an earlier round only receive the trees
+        added to the global model since then. The number of global trees the delta
+        builds upon is sent in the config under the key
+        `"xgb-delta-base-num-trees"`. Clients are expected to keep the last global
+        model they received and to merge the delta into it using `merge_tree_delta`.
+    """
 
     # pylint: disable=too-many-arguments,too-many-instance-attributes, line-too-long
     def __init__(
@@ -38,10 +63,17 @@ class FedXgbBagging(FedAvg):
                 Optional[tuple[float, dict[str, Scalar]]],
             ]
         ] = None,
+        broadcast_delta: bool = False,
         **kwargs: Any,
     ):
         self.evaluate_function = evaluate_function
+        self.broadcast_delta = broadcast_delta
         self.global_model: Optional[bytes] = None
+        self._ensemble: Optional[_TreeEnsemble] = None
+        # Number of global trees sent to each client in the latest round
+        self._num_trees_sent: dict[str, int] = {}
+        # Number of global trees each client holds after its latest reply
+        self._num_trees_synced: dict[str, int] = {}
         super().__init__(**kwargs)
 
     def __repr__(self) -> str:
@@ -49,6 +81,24 @@ class FedXgbBagging(FedAvg):
         rep = f"FedXgbBagging(accept_failures={self.accept_failures})"
         return rep
 
+    def configure_fit(
+        self, server_round: int, parameters: Parameters, client_manager: ClientManager
+    ) -> list[tuple[ClientProxy, FitIns]]:
+        """Configure the next round of training."""
+        client_instructions = super().configure_fit(
+            server_round, parameters, client_manager
+        )
+        return self._to_delta_instructions(client_instructions)
+
+    def configure_evaluate(
+        self, server_round: int, parameters: Parameters, client_manager: ClientManager
+    ) -> list[tuple[ClientProxy, EvaluateIns]]:
+        """Configure the next round of evaluation."""
+        client_instructions = super().configure_evaluate(
+            server_round, parameters, client_manager
+        )
+        return self._to_delta_instructions(client_instructions)
+
     def aggregate_fit(
         self,
         server_round: int,
@@ -62,17 +112,23 @@ class FedXgbBagging(FedAvg):
         if not self.accept_failures and failures:
             return None, {}
 
-        # Aggregate all the client trees
-        global_model = self.global_model
+        # Record which global model the clients that replied hold
+        self._confirm_sync([proxy for proxy, _ in results])
+
+        # Append the client trees to the global ensemble
         for _, fit_res in results:
             update = fit_res.parameters.tensors
             for bst in update:
-                global_model = aggregate(global_model, bst)
+                bst_json = json.loads(bytearray(bst))
+                if self._ensemble is None:
+                    self._ensemble = _TreeEnsemble(bst_json)
+                else:
+                    self._ensemble.append_trees(bst_json)
 
-        self.global_model = global_model
+        self.global_model = cast(_TreeEnsemble, self._ensemble).to_bytes()
 
         return (
-            Parameters(tensor_type="", tensors=[cast(bytes, global_model)]),
+            Parameters(tensor_type="", tensors=[self.global_model]),
             {},
         )
 
@@ -89,6 +145,9 @@ class FedXgbBagging(FedAvg):
         if not self.accept_failures and failures:
             return None, {}
 
+        # Record which global model the clients that replied hold
+        self._confirm_sync([proxy for proxy, _ in results])
+
         # Aggregate custom metrics if aggregation fn was provided
         metrics_aggregated = {}
         if self.evaluate_metrics_aggregation_fn:
@@ -112,6 +171,110 @@ class FedXgbBagging(FedAvg):
         loss, metrics = eval_res
         return loss, metrics
 
+    def _to_delta_instructions(
+        self, client_instructions: list[tuple[ClientProxy, InsT]]
+    ) -> list[tuple[ClientProxy, InsT]]:
+        """Replace the global model by the trees each client does not hold yet."""
+        if not self.broadcast_delta or self._ensemble is None:
+            return client_instructions
+
+        num_trees = self._ensemble.num_trees
+        deltas: dict[int, bytes] = {}
+        ret: list[tuple[ClientProxy, InsT]] = []
+        for proxy, ins in client_instructions:
+            self._num_trees_sent[proxy.cid] = num_trees
+            base = self._num_trees_synced.get(proxy.cid)
+            if base is None:
+                ret.append((proxy, ins))
+                continue
+            if base not in deltas:
+                deltas[base] = self._ensemble.to_bytes(start=base)
+            parameters = Parameters(tensor_type="", tensors=[deltas[base]])
+            config = {**ins.config, DELTA_BASE_NUM_TREES_KEY: base}
+            ret.append((proxy, type(ins)(parameters, config)))
+        return ret
+
+    def _confirm_sync(self, proxies: list[ClientProxy]) -> None:
+        """Record that the given clients hold the global model sent to them."""
+        for proxy in proxies:
+            if proxy.cid in self._num_trees_sent:
+                self._num_trees_synced[proxy.cid] = self._num_trees_sent[proxy.cid]
+
+
+class _TreeEnsemble:
+    """Append-only XGBoost tree ensemble.
+
+    The model JSON is kept parsed, while each tree is serialized once, when it is
+    appended. Encoding the ensemble therefore only joins the serialized trees.
+    """
+
+    def __init__(self, model: dict[str, Any]) -> None:
+        self._model = model
+        gbtree = self._gbtree
+        self._trees: list[str] = [json.dumps(tree) for tree in gbtree["trees"]]
+        gbtree["trees"] = _TREES_PLACEHOLDER
+
+    @property
+    def _gbtree(self) -> dict[str, Any]:
+        return cast(dict[str, Any], self._model["learner"]["gradient_booster"]["model"])
+
+    @property
+    def num_trees(self) -> int:
+        """Return the number of trees in the ensemble."""
+        return len(self._trees)
+
+    def append_trees(self, model: dict[str, Any]) -> None:
+        """Append the parallel trees of the first boosting iteration of a model."""
+        gbtree = self._gbtree
+        model_gbtree = model["learner"]["gradient_booster"]["model"]
+        paral_tree_num = int(model_gbtree["gbtree_model_param"]["num_parallel_tree"])
+        for tree in model_gbtree["trees"][:paral_tree_num]:
+            tree["id"] = len(self._trees)
+            self._trees.append(json.dumps(tree))
+            gbtree["tree_info"].append(0)
+        gbtree["gbtree_model_param"]["num_trees"] = str(len(self._trees))
+        gbtree["iteration_indptr"].append(
+            gbtree["iteration_indptr"][-1] + paral_tree_num
+        )
+
+    def to_bytes(self, start: int = 0) -> bytes:
+        """Encode the ensemble, keeping only the trees from index `start` onwards."""
+        if start == 0:
+            return _encode(self._model, self._trees)
+
+        # Temporarily restrict the model metadata to the trees being encoded
+        gbtree = self._gbtree
+        indptr = gbtree["iteration_indptr"]
+        tree_info = gbtree["tree_info"]
+        num_trees = gbtree["gbtree_model_param"]["num_trees"]
+        gbtree["iteration_indptr"] = [x - start for x in indptr if x >= start]
+        gbtree["tree_info"] = tree_info[start:]
+        gbtree["gbtree_model_param"]["num_trees"] = str(len(self._trees) - start)
+        try:
+            return _encode(self._model, _shift_tree_ids(self._trees[start:], start))
+        finally:
+            gbtree["iteration_indptr"] = indptr
+            gbtree["tree_info"] = tree_info
+            gbtree["gbtree_model_param"]["num_trees"] = num_trees
+
+
+def _encode(model: dict[str, Any], trees: list[str]) -> bytes:
+    """Encode the model JSON with the placeholder substituted by the trees."""
+    model_str = json.dumps(model).replace(
+        f'"{_TREES_PLACEHOLDER}"', "[" + ", ".join(trees) + "]", 1
+    )
+    return bytes(model_str, "utf-8")
+
+
+def _shift_tree_ids(trees: list[str], offset: int) -> list[str]:
+    """Shift the IDs of serialized trees down by `offset`."""
+    ret: list[str] = []
+    for tree_str in trees:
+        tree = json.loads(tree_str)
+        tree["id"] -= offset
+        ret.append(json.dumps(tree))
+    return ret
+
 
 def aggregate(
     bst_prev_org: Optional[bytes],
@@ -121,49 +284,35 @@ def aggregate(
     if not bst_prev_org:
         return bst_curr_org
 
-    # Get the tree numbers
-    tree_num_prev, _ = _get_tree_nums(bst_prev_org)
-    _, paral_tree_num_curr = _get_tree_nums(bst_curr_org)
-
-    bst_prev = json.loads(bytearray(bst_prev_org))
-    bst_curr = json.loads(bytearray(bst_curr_org))
-
-    bst_prev["learner"]["gradient_booster"]["model"]["gbtree_model_param"][
-        "num_trees"
-    ] = str(tree_num_prev + paral_tree_num_curr)
-    iteration_indptr = bst_prev["learner"]["gradient_booster"]["model"][
-        "iteration_indptr"
-    ]
-    bst_prev["learner"]["gradient_booster"]["model"]["iteration_indptr"].append(
-        iteration_indptr[-1] + paral_tree_num_curr
-    )
-
-    # Aggregate new trees
-    trees_curr = bst_curr["learner"]["gradient_booster"]["model"]["trees"]
-    for tree_count in range(paral_tree_num_curr):
-        trees_curr[tree_count]["id"] = tree_num_prev + tree_count
-        bst_prev["learner"]["gradient_booster"]["model"]["trees"].append(
-            trees_curr[tree_count]
-        )
-        bst_prev["learner"]["gradient_booster"]["model"]["tree_info"].append(0)
+    ensemble = _TreeEnsemble(json.loads(bytearray(bst_prev_org)))
+    ensemble.append_trees(json.loads(bytearray(bst_curr_org)))
+    return ensemble.to_bytes()
 
-    bst_prev_bytes = bytes(json.dumps(bst_prev), "utf-8")
 
-    return bst_prev_bytes
+def merge_tree_delta(bst_prev_org: bytes, delta_org: bytes) -> bytes:
+    """Merge the trees of a delta broadcast into the last received global model.
 
+    Parameters
+    ----------
+    bst_prev_org : bytes
+        The last global model received by the client.
+    delta_org : bytes
+        The model holding only the trees added to the global model since then, as
+        sent by `FedXgbBagging` when `broadcast_delta` is enabled.
 
-def _get_tree_nums(xgb_model_org: bytes) -> tuple[int, int]:
-    xgb_model = json.loads(bytearray(xgb_model_org))
-    # Get the number of trees
-    tree_num = int(
-        xgb_model["learner"]["gradient_booster"]["model"]["gbtree_model_param"][
-            "num_trees"
-        ]
-    )
-    # Get the number of parallel trees
-    paral_tree_num = int(
-        xgb_model["learner"]["gradient_booster"]["model"]["gbtree_model_param"][
-            "num_parallel_tree"
-        ]
-    )
-    return tree_num, paral_tree_num
+    Returns
+    -------
+    bytes
+        The up-to-date global model.
+    """
+    ensemble = _TreeEnsemble(json.loads(bytearray(bst_prev_org)))
+    delta = json.loads(bytearray(delta_org))
+    delta_gbtree = delta["learner"]["gradient_booster"]["model"]
+    indptr = delta_gbtree["iteration_indptr"]
+    trees = delta_gbtree["trees"]
+    # Append the trees one boosting iteration at a time
+    for begin, end in zip(indptr[:-1], indptr[1:]):
+        delta_gbtree["trees"] = trees[begin:end]
+        delta_gbtree["gbtree_model_param"]["num_parallel_tree"] = str(end - begin)
+        ensemble.append_trees(delta)
+    return ensemble.to_bytes()
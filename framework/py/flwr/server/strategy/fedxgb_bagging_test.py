@@ -0,0 +1,154 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""FedXgbBagging tests."""
+
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+from flwr.common import Code, FitRes, Parameters, Status
+from flwr.server.client_manager import SimpleClientManager
+from flwr.server.client_proxy import ClientProxy
+
+from .fedxgb_bagging import (
+    DELTA_BASE_NUM_TREES_KEY,
+    FedXgbBagging,
+    aggregate,
+    merge_tree_delta,
+)
+
+
+def _make_booster(tree_tags: list[str], num_parallel_tree: int = 1) -> bytes:
+    """Create a minimal XGBoost booster JSON with one tree per tag."""
+    model: dict[str, Any] = {
+        "learner": {
+            "gradient_booster": {
+                "model": {
+                    "gbtree_model_param": {
+                        "num_trees": str(len(tree_tags)),
+                        "num_parallel_tree": str(num_parallel_tree),
+                    },
+                    "iteration_indptr": list(
+                        range(0, len(tree_tags) + 1, num_parallel_tree)
+                    ),
+                    "tree_info": [0] * len(tree_tags),
+                    "trees": [
+                        {"id": idx, "tag": tag} for idx, tag in enumerate(tree_tags)
+                    ],
+                },
+            },
+        },
+        "version": [2, 0, 0],
+    }
+    return bytes(json.dumps(model), "utf-8")
+
+
+def _gbtree(bst: bytes) -> dict[str, Any]:
+    return json.loads(bst)["learner"]["gradient_booster"]["model"]  # type: ignore
+
+
+def _make_proxy(cid: str) -> ClientProxy:
+    proxy = MagicMock(spec=ClientProxy)
+    proxy.cid = cid
+    proxy.node_id = int(cid)
+    return proxy
+
+
+def _make_fit_res(bst: bytes) -> FitRes:
+    return FitRes(
+        status=Status(code=Code.OK, message=""),
+        parameters=Parameters(tensor_type="", tensors=[bst]),
+        num_examples=1,
+        metrics={},
+    )
+
+
+def test_aggregate() -> None:
+    """Test that the trees of the client model are appended to the global model."""
+    # Prepare
+    bst_prev = _make_booster(["a", "b"])
+    bst_curr = _make_booster(["c"])
+
+    # Execute
+    gbtree = _gbtree(aggregate(bst_prev, bst_curr))
+
+    # Assert
+    assert gbtree["gbtree_model_param"]["num_trees"] == "3"
+    assert gbtree["iteration_indptr"] == [0, 1, 2, 3]
+    assert gbtree["tree_info"] == [0, 0, 0]
+    assert [tree["id"] for tree in gbtree["trees"]] == [0, 1, 2]
+    assert [tree["tag"] for tree in gbtree["trees"]] == ["a", "b", "c"]
+
+
+def test_aggregate_fit_multiple_rounds() -> None:
+    """Test that the global ensemble grows with the trees of every client."""
+    # Prepare
+    strategy = FedXgbBagging()
+    proxies = [_make_proxy(str(cid)) for cid in range(1, 4)]
+
+    # Execute
+    for server_round in range(1, 4):
+        results = [
+            (proxy, _make_fit_res(_make_booster([f"{server_round}-{proxy.cid}"])))
+            for proxy in proxies
+        ]
+        parameters, _ = strategy.aggregate_fit(server_round, results, [])
+
+    # Assert
+    assert parameters is not None
+    gbtree = _gbtree(parameters.tensors[0])
+    assert gbtree["gbtree_model_param"]["num_trees"] == "9"
+    assert [tree["id"] for tree in gbtree["trees"]] == list(range(9))
+    assert gbtree["trees"][-1]["tag"] == "3-3"
+    assert parameters.tensors[0] == strategy.global_model
+
+
+def test_broadcast_delta() -> None:
+    """Test that synced clients receive only the new trees and can merge them."""
+    # Prepare
+    strategy = FedXgbBagging(
+        broadcast_delta=True, min_fit_clients=1, min_available_clients=1
+    )
+    client_manager = SimpleClientManager()
+    proxy = _make_proxy("1")
+    client_manager.register(proxy)
+    empty = Parameters(tensor_type="", tensors=[])
+
+    # Round 1: no global model yet
+    (_, fit_ins), *_ = strategy.configure_fit(1, empty, client_manager)
+    assert DELTA_BASE_NUM_TREES_KEY not in fit_ins.config
+    parameters, _ = strategy.aggregate_fit(
+        1, [(proxy, _make_fit_res(_make_booster(["a", "b"])))], []
+    )
+    assert parameters is not None
+    client_model = parameters.tensors[0]
+
+    # Round 2: the full global model is sent, as the client has not synced yet
+    (_, fit_ins), *_ = strategy.configure_fit(2, parameters, client_manager)
+    assert DELTA_BASE_NUM_TREES_KEY not in fit_ins.config
+    parameters, _ = strategy.aggregate_fit(
+        2, [(proxy, _make_fit_res(_make_booster(["c"])))], []
+    )
+    assert parameters is not None
+
+    # Round 3: only the tree added in round 2 is sent
+    (_, fit_ins), *_ = strategy.configure_fit(3, parameters, client_manager)
+
+    # Assert
+    assert fit_ins.config[DELTA_BASE_NUM_TREES_KEY] == 2
+    delta = fit_ins.parameters.tensors[0]
+    assert [tree["tag"] for tree in _gbtree(delta)["trees"]] == ["c"]
+    assert merge_tree_delta(client_model, delta) == parameters.tensors[0]
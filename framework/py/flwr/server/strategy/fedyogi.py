@@ -22,15 +22,7 @@ from typing import Callable, Optional, Union
 
 import numpy as np
 
-from flwr.common import (
-    FitRes,
-    MetricsAggregationFn,
-    NDArrays,
-    Parameters,
-    Scalar,
-    ndarrays_to_parameters,
-    parameters_to_ndarrays,
-)
+from flwr.common import FitRes, MetricsAggregationFn, NDArrays, Parameters, Scalar
 from flwr.server.client_proxy import ClientProxy
 
 from .fedopt import FedOpt
@@ -147,34 +139,19 @@ class FedYogi(FedOpt):
         if fedavg_parameters_aggregated is None:
             return None, {}
 
-        fedavg_weights_aggregate = parameters_to_ndarrays(fedavg_parameters_aggregated)
-
-        # Yogi
-        delta_t: NDArrays = [
-            x - y for x, y in zip(fedavg_weights_aggregate, self.current_weights)
-        ]
+        # Yogi, updating the contiguous buffers of the optimizer state in place
+        state = self.optimizer_state
+        delta_t = self._compute_delta(fedavg_parameters_aggregated)
 
         # m_t
-        if not self.m_t:
-            self.m_t = [np.zeros_like(x) for x in delta_t]
-        self.m_t = [
-            np.multiply(self.beta_1, x) + (1 - self.beta_1) * y
-            for x, y in zip(self.m_t, delta_t)
-        ]
-
-        # v_t
-        if not self.v_t:
-            self.v_t = [np.zeros_like(x) for x in delta_t]
-        self.v_t = [
-            x - (1.0 - self.beta_2) * np.multiply(y, y) * np.sign(x - np.multiply(y, y))
-            for x, y in zip(self.v_t, delta_t)
-        ]
-
-        new_weights = [
-            x + self.eta * y / (np.sqrt(z) + self.tau)
-            for x, y, z in zip(self.current_weights, self.m_t, self.v_t)
-        ]
-
-        self.current_weights = new_weights
-
-        return ndarrays_to_parameters(self.current_weights), metrics_aggregated
+        self._update_m_t(delta_t)
+
+        # v_t = v_t - (1 - beta_2) * delta_t^2 * sign(v_t - delta_t^2)
+        v_t = state.buffer("v_t")
+        delta_sq = np.multiply(delta_t, delta_t, out=state.scratch(1))
+        sign = np.sign(np.subtract(v_t, delta_sq, out=delta_t), out=delta_t)
+        sign *= delta_sq
+        sign *= 1.0 - self.beta_2
+        v_t -= sign
+
+        return self._apply_update(self.eta), metrics_aggregated
@@ -0,0 +1,114 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""State of server-side optimizers kept in contiguous buffers."""
+
+
+from typing import Any, Optional
+
+import numpy as np
+
+from flwr.common import Array, ArrayRecord, NDArrays
+from flwr.common.typing import NDArray
+
+WEIGHTS_KEY = "weights"
+
+
+class ServerOptimizerState:
+    """Model weights and optimizer buffers, each flattened into one contiguous array.
+
+    Server-side optimizers such as `FedAdam` or `FedAvgM` update the weights of the
+    global model together with buffers of the same size (e.g., the first and second
+    moments). Keeping each of them in a single contiguous array lets optimizers
+    update all layers at once, in place, using the two scratch buffers of the state
+    instead of allocating temporary arrays for every layer in every round.
+
+    Parameters
+    ----------
+    ndarrays : NDArrays
+        The initial weights of the global model.
+
+    Notes
+    -----
+    The buffers use the widest floating point dtype of the weights (`float64` if
+    no weight is a floating point array). The weights returned by `unflatten` are
+    views of the buffers in this dtype.
+    """
+
+    def __init__(self, ndarrays: NDArrays) -> None:
+        self.shapes = [arr.shape for arr in ndarrays]
+        sizes = [int(arr.size) for arr in ndarrays]
+        self.offsets: list[int] = np.cumsum([0, *sizes]).tolist()
+        float_dtypes = [arr.dtype for arr in ndarrays if arr.dtype.kind == "f"]
+        self.dtype: np.dtype[Any] = (
+            np.result_type(*float_dtypes) if float_dtypes else np.dtype(np.float64)
+        )
+        self.weights: NDArray = self.flatten(ndarrays)
+        self.buffers: dict[str, NDArray] = {}
+        self._scratch: list[NDArray] = []
+
+    @property
+    def size(self) -> int:
+        """Return the number of parameters of the model."""
+        return self.offsets[-1]
+
+    def flatten(self, ndarrays: NDArrays, out: Optional[NDArray] = None) -> NDArray:
+        """Copy `ndarrays` into one contiguous array, or into `out` if provided."""
+        if [arr.shape for arr in ndarrays] != self.shapes:
+            raise ValueError("The shapes of the arrays do not match the model.")
+        if out is None:
+            out = np.empty(self.size, dtype=self.dtype)
+        for arr, start, end in zip(ndarrays, self.offsets[:-1], self.offsets[1:]):
+            out[start:end] = arr.reshape(-1)
+        return out
+
+    def unflatten(self, flat: NDArray) -> NDArrays:
+        """Return views of `flat` with the shapes of the model's arrays."""
+        return [
+            flat[start:end].reshape(shape)
+            for shape, start, end in zip(
+                self.shapes, self.offsets[:-1], self.offsets[1:]
+            )
+        ]
+
+    def buffer(self, name: str) -> NDArray:
+        """Return the optimizer buffer `name`, initialized with zeros if missing."""
+        if name not in self.buffers:
+            self.buffers[name] = np.zeros(self.size, dtype=self.dtype)
+        return self.buffers[name]
+
+    def scratch(self, index: int) -> NDArray:
+        """Return the scratch buffer `index` (0 or 1), reused across rounds."""
+        while len(self._scratch) <= index:
+            self._scratch.append(np.empty(self.size, dtype=self.dtype))
+        return self._scratch[index]
+
+    def to_array_record(self) -> ArrayRecord:
+        """Return the weights and optimizer buffers, e.g., to store in `Context`."""
+        record = ArrayRecord()
+        record[WEIGHTS_KEY] = Array(self.weights)
+        for name, buffer in self.buffers.items():
+            record[name] = Array(buffer)
+        return record
+
+    def load_array_record(self, record: ArrayRecord) -> None:
+        """Restore the weights and optimizer buffers from `to_array_record`."""
+        for name, array in record.items():
+            flat = array.numpy()
+            if flat.shape != (self.size,):
+                raise ValueError(f"The size of `{name}` does not match the model.")
+            if name == WEIGHTS_KEY:
+                self.weights[:] = flat
+            else:
+                self.buffer(name)[:] = flat
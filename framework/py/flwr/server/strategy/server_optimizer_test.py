@@ -0,0 +1,131 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the state of server-side optimizers."""
+
+
+from typing import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from flwr.common import (
+    Code,
+    FitRes,
+    NDArrays,
+    Status,
+    ndarrays_to_parameters,
+    parameters_to_ndarrays,
+)
+from flwr.server.client_proxy import ClientProxy
+
+from .fedadagrad import FedAdagrad
+from .fedadam import FedAdam
+from .fedopt import FedOpt
+from .fedyogi import FedYogi
+from .server_optimizer import ServerOptimizerState
+
+# Per-layer reference implementations of the updates of the second moment
+V_T_UPDATES: dict[type[FedOpt], Callable[[FedOpt, NDArrays, NDArrays], NDArrays]] = {
+    FedAdam: lambda s, v_t, d: [
+        s.beta_2 * x + (1 - s.beta_2) * np.multiply(y, y) for x, y in zip(v_t, d)
+    ],
+    FedYogi: lambda s, v_t, d: [
+        x - (1.0 - s.beta_2) * np.multiply(y, y) * np.sign(x - np.multiply(y, y))
+        for x, y in zip(v_t, d)
+    ],
+    FedAdagrad: lambda s, v_t, d: [x + np.multiply(y, y) for x, y in zip(v_t, d)],
+}
+
+
+def _model(seed: int) -> NDArrays:
+    rng = np.random.default_rng(seed)
+    return [
+        rng.normal(size=(4, 3)).astype(np.float32),
+        rng.normal(size=3).astype(np.float32),
+    ]
+
+
+def _fit_results(ndarrays: NDArrays) -> list[tuple[ClientProxy, FitRes]]:
+    fit_res = FitRes(
+        status=Status(code=Code.OK, message="Success"),
+        parameters=ndarrays_to_parameters(ndarrays),
+        num_examples=5,
+        metrics={},
+    )
+    return [(MagicMock(), fit_res)]
+
+
+@pytest.mark.parametrize("strategy_cls", [FedAdam, FedYogi, FedAdagrad])
+def test_fedopt_matches_per_layer_updates(strategy_cls: type[FedOpt]) -> None:
+    """Test that the in-place updates match the per-layer formulas."""
+    # Prepare
+    weights = _model(0)
+    strategy = strategy_cls(initial_parameters=ndarrays_to_parameters(weights))
+    beta_1, beta_2, tau = strategy.beta_1, strategy.beta_2, strategy.tau
+    m_t = [np.zeros_like(x) for x in weights]
+    v_t = [np.zeros_like(x) for x in weights]
+
+    for server_round in range(1, 4):
+        # Execute
+        aggregated = _model(server_round)
+        parameters, _ = strategy.aggregate_fit(
+            server_round, _fit_results(aggregated), []
+        )
+        assert parameters is not None
+
+        # Assert
+        delta_t = [x - y for x, y in zip(aggregated, weights)]
+        m_t = [beta_1 * x + (1 - beta_1) * y for x, y in zip(m_t, delta_t)]
+        v_t = V_T_UPDATES[strategy_cls](strategy, v_t, delta_t)
+        eta = strategy.eta
+        if strategy_cls is FedAdam:
+            eta *= np.sqrt(1 - beta_2 ** (server_round + 1.0)) / (
+                1 - beta_1 ** (server_round + 1.0)
+            )
+        weights = [
+            x + eta * y / (np.sqrt(z) + tau) for x, y, z in zip(weights, m_t, v_t)
+        ]
+        for actual, expected in zip(parameters_to_ndarrays(parameters), weights):
+            assert actual.dtype == np.float32
+            np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_checkpoint_to_array_record() -> None:
+    """Test that the state is restored from a single ArrayRecord."""
+    # Prepare
+    strategy = FedAdam(initial_parameters=ndarrays_to_parameters(_model(0)))
+    strategy.aggregate_fit(1, _fit_results(_model(1)), [])
+    record = strategy.optimizer_state.to_array_record()
+
+    # Execute
+    restored = FedAdam(initial_parameters=ndarrays_to_parameters(_model(0)))
+    restored.optimizer_state.load_array_record(record)
+
+    # Assert
+    assert set(record.keys()) == {"weights", "m_t", "v_t"}
+    for name in ("current_weights", "m_t", "v_t"):
+        for actual, expected in zip(getattr(restored, name), getattr(strategy, name)):
+            np.testing.assert_array_equal(actual, expected)
+
+
+def test_flatten_rejects_other_shapes() -> None:
+    """Test that arrays of another model cannot be flattened into the buffers."""
+    # Prepare
+    state = ServerOptimizerState(_model(0))
+
+    # Execute & Assert
+    with pytest.raises(ValueError):
+        state.flatten([np.zeros(15, dtype=np.float32)])
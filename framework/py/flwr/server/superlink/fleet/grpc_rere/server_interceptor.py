@@ -16,14 +16,23 @@
 
 
 import datetime
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from functools import lru_cache
 from typing import Any, Callable, Optional, cast
 
 import grpc
+from cryptography.hazmat.primitives.asymmetric import ec
 from google.protobuf.message import Message as GrpcMessage
 
 from flwr.common import now
 from flwr.common.constant import (
     PUBLIC_KEY_HEADER,
+    SESSION_TOKEN_HEADER,
+    SESSION_TOKEN_TTL,
     SIGNATURE_HEADER,
     SYSTEM_TIME_TOLERANCE,
     TIMESTAMP_HEADER,
@@ -36,11 +45,20 @@ from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
 from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     CreateNodeRequest,
     CreateNodeResponse,
+    DeleteNodeResponse,
 )
 from flwr.server.superlink.linkstate import LinkStateFactory
 
 MIN_TIMESTAMP_DIFF = -SYSTEM_TIME_TOLERANCE
 MAX_TIMESTAMP_DIFF = TIMESTAMP_TOLERANCE + SYSTEM_TIME_TOLERANCE
+# Number of parsed node public keys kept in memory
+PUBLIC_KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PUBLIC_KEY_CACHE_SIZE)
+def _load_public_key(public_key_bytes: bytes) -> ec.EllipticCurvePublicKey:
+    """Parse a node public key, caching the most recently used ones."""
+    return bytes_to_public_key(public_key_bytes)
 
 
 def _unary_unary_rpc_terminator(
@@ -64,13 +82,28 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         If True, nodes are authenticated without requiring their public keys to be
         pre-stored in the LinkState. If False, only nodes with pre-stored public keys
         can be authenticated.
+
+    Notes
+    -----
+    Verifying the signature of a node requires parsing its public key and checking
+    it against the public keys stored in the LinkState. Once a node has been
+    authenticated by its signature, the response carries a session token in its
+    trailing metadata. The token binds the node ID to an expiry time with an HMAC
+    keyed by a secret of this interceptor, and authenticates the requests of the node
+    until it expires after `SESSION_TOKEN_TTL` seconds, without accessing the
+    LinkState. Tokens are invalidated when the node is deleted or the SuperLink
+    restarts, in which case nodes authenticate by their signature again.
     """
 
     def __init__(self, state_factory: LinkStateFactory, auto_auth: bool = False):
         self.state_factory = state_factory
         self.auto_auth = auto_auth
+        self._secret = secrets.token_bytes(32)
+        # Map the IDs of deleted nodes to the expiry of their last possible token
+        self._revoked: dict[int, float] = {}
+        self._lock = threading.Lock()
 
-    def intercept_service(  # pylint: disable=too-many-return-statements
+    def intercept_service(  # pylint: disable=too-many-return-statements, too-many-locals
         self,
         continuation: Callable[[Any], Any],
         handler_call_details: grpc.HandlerCallDetails,
@@ -85,9 +118,20 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         if not handler_call_details.method.startswith("/flwr.proto.Fleet/"):
             return continuation(handler_call_details)
 
-        state = self.state_factory.state()
         metadata_dict = dict(handler_call_details.invocation_metadata)
 
+        # Authenticate by session token, unless the node is being created
+        is_create_node = handler_call_details.method.endswith("CreateNode")
+        if SESSION_TOKEN_HEADER in metadata_dict and not is_create_node:
+            token = cast(str, metadata_dict[SESSION_TOKEN_HEADER])
+            if (node_id := self._verify_session_token(token)) is None:
+                return _unary_unary_rpc_terminator("Invalid session token")
+            return self._wrap_method_handler(
+                continuation(handler_call_details), node_id, None
+            )
+
+        state = self.state_factory.state()
+
         # Retrieve info from the metadata
         try:
             node_pk_bytes = cast(bytes, metadata_dict[PUBLIC_KEY_HEADER])
@@ -102,7 +146,7 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
                 return _unary_unary_rpc_terminator("Public key not recognized")
 
         # Verify the signature
-        node_pk = bytes_to_public_key(node_pk_bytes)
+        node_pk = _load_public_key(node_pk_bytes)
         if not verify_signature(node_pk, timestamp_iso.encode("ascii"), signature):
             return _unary_unary_rpc_terminator("Invalid signature")
 
@@ -115,7 +159,7 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
 
         # Continue the RPC call
         expected_node_id = state.get_node_id(node_pk_bytes)
-        if not handler_call_details.method.endswith("CreateNode"):
+        if not is_create_node:
             # All calls, except for `CreateNode`, must provide a public key that is
             # already mapped to a `node_id` (in `LinkState`)
             if expected_node_id is None:
@@ -131,8 +175,14 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         self,
         method_handler: grpc.RpcMethodHandler,
         expected_node_id: Optional[int],
-        node_public_key: bytes,
+        node_public_key: Optional[bytes],
     ) -> grpc.RpcMethodHandler:
+        """Wrap the handler of a request authenticated by signature or token.
+
+        `node_public_key` is None if the request was authenticated by a session token,
+        otherwise a new session token is issued along with the response.
+        """
+
         def _generic_method_handler(
             request: GrpcMessage,
             context: grpc.ServicerContext,
@@ -148,15 +198,24 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
             response: GrpcMessage = method_handler.unary_unary(request, context)
 
             # Set the public key after a successful CreateNode request
+            node_id = expected_node_id
             if isinstance(response, CreateNodeResponse):
+                node_id = response.node.node_id
                 state = self.state_factory.state()
                 try:
-                    state.set_node_public_key(response.node.node_id, node_public_key)
+                    state.set_node_public_key(node_id, cast(bytes, node_public_key))
                 except ValueError as e:
                     # Remove newly created node if setting the public key fails
-                    state.delete_node(response.node.node_id)
+                    state.delete_node(node_id)
                     context.abort(grpc.StatusCode.UNAUTHENTICATED, str(e))
 
+            if isinstance(response, DeleteNodeResponse):
+                self._revoke_session_tokens(cast(int, expected_node_id))
+            elif node_public_key is not None and node_id is not None:
+                context.set_trailing_metadata(
+                    ((SESSION_TOKEN_HEADER, self._issue_session_token(node_id)),)
+                )
+
             return response
 
         return grpc.unary_unary_rpc_method_handler(
@@ -164,3 +223,36 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
             request_deserializer=method_handler.request_deserializer,
             response_serializer=method_handler.response_serializer,
         )
+
+    def _sign(self, payload: str) -> str:
+        return hmac.new(
+            self._secret, payload.encode("ascii"), hashlib.sha256
+        ).hexdigest()
+
+    def _issue_session_token(self, node_id: int) -> str:
+        """Return a token authenticating `node_id` for `SESSION_TOKEN_TTL` seconds."""
+        payload = f"{node_id}:{int(time.time()) + SESSION_TOKEN_TTL}"
+        return f"{payload}:{self._sign(payload)}"
+
+    def _verify_session_token(self, token: str) -> Optional[int]:
+        """Return the node ID authenticated by `token`, or None if it is invalid."""
+        payload, _, mac = token.rpartition(":")
+        if not hmac.compare_digest(mac, self._sign(payload)):
+            return None
+        node_id_str, _, expires_at_str = payload.partition(":")
+        node_id, expires_at = int(node_id_str), int(expires_at_str)
+        if expires_at < time.time() or node_id in self._revoked:
+            return None
+        return node_id
+
+    def _revoke_session_tokens(self, node_id: int) -> None:
+        """Reject the session tokens issued to a deleted node."""
+        current = time.time()
+        with self._lock:
+            # Forget the nodes whose tokens have all expired
+            self._revoked = {
+                revoked_id: until
+                for revoked_id, until in self._revoked.items()
+                if until > current
+            }
+            self._revoked[node_id] = current + SESSION_TOKEN_TTL
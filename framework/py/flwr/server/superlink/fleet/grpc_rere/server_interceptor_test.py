@@ -26,6 +26,7 @@ from flwr.common import ConfigRecord, now
 from flwr.common.constant import (
     FLEET_API_GRPC_RERE_DEFAULT_ADDRESS,
     PUBLIC_KEY_HEADER,
+    SESSION_TOKEN_HEADER,
     SIGNATURE_HEADER,
     SUPERLINK_NODE_ID,
     TIMESTAMP_HEADER,
@@ -371,3 +372,37 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         with self.assertRaises(grpc.RpcError) as cm:
             rpc(self, self._make_metadata_with_invalid_timestamp())
         assert cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+
+    def test_session_token(self) -> None:
+        """Test that a session token is issued and authenticates later requests."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+        _, call = self._send_node_heartbeat.with_call(
+            request=req, metadata=self._make_metadata()
+        )
+        token = dict(call.trailing_metadata())[SESSION_TOKEN_HEADER]
+        tampered = token.replace(str(node_id), str(node_id + 1), 1)
+
+        # Execute
+        _, token_call = self._send_node_heartbeat.with_call(
+            request=req, metadata=[(SESSION_TOKEN_HEADER, token)]
+        )
+        with self.assertRaises(grpc.RpcError) as tampered_cm:
+            self._send_node_heartbeat.with_call(
+                request=req, metadata=[(SESSION_TOKEN_HEADER, tampered)]
+            )
+        self._delete_node.with_call(
+            request=DeleteNodeRequest(node=Node(node_id=node_id)),
+            metadata=[(SESSION_TOKEN_HEADER, token)],
+        )
+        with self.assertRaises(grpc.RpcError) as deleted_cm:
+            self._send_node_heartbeat.with_call(
+                request=req, metadata=[(SESSION_TOKEN_HEADER, token)]
+            )
+
+        # Assert
+        assert token_call.code() == grpc.StatusCode.OK
+        assert SESSION_TOKEN_HEADER not in dict(token_call.trailing_metadata())
+        assert tampered_cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+        assert deleted_cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
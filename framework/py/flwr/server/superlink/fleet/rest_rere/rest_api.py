@@ -54,6 +54,7 @@ from flwr.supercore.object_store import ObjectStore, ObjectStoreFactory
 
 try:
     from starlette.applications import Starlette
+    from starlette.concurrency import run_in_threadpool
     from starlette.datastructures import Headers
     from starlette.exceptions import HTTPException
     from starlette.requests import Request
@@ -66,28 +67,37 @@ except ModuleNotFoundError:
 GrpcRequest = TypeVar("GrpcRequest", bound=GrpcMessage)
 GrpcResponse = TypeVar("GrpcResponse", bound=GrpcMessage)
 
-GrpcAsyncFunction = Callable[[GrpcRequest], Awaitable[GrpcResponse]]
+GrpcFunction = Callable[[GrpcRequest], GrpcResponse]
 RestEndPoint = Callable[[Request], Awaitable[Response]]
 
 
 def rest_request_response(
     grpc_request_type: type[GrpcRequest],
-) -> Callable[[GrpcAsyncFunction[GrpcRequest, GrpcResponse]], RestEndPoint]:
-    """Convert an async gRPC-based function into a RESTful HTTP endpoint."""
+) -> Callable[[GrpcFunction[GrpcRequest, GrpcResponse]], RestEndPoint]:
+    """Convert a gRPC-based function into a RESTful HTTP endpoint.
+
+    The function is run in a worker thread, together with the (de)serialization of the
+    ProtoBuf messages, so that blocking calls to the LinkState and ObjectStore do not
+    stall the event loop serving the requests of all other nodes.
+    """
+
+    def decorator(func: GrpcFunction[GrpcRequest, GrpcResponse]) -> RestEndPoint:
+        def handle(grpc_req_bytes: bytes) -> bytes:
+            # Deserialize ProtoBuf
+            grpc_req = grpc_request_type.FromString(grpc_req_bytes)
+            grpc_res = func(grpc_req)
+            return grpc_res.SerializeToString()
 
-    def decorator(func: GrpcAsyncFunction[GrpcRequest, GrpcResponse]) -> RestEndPoint:
         async def wrapper(request: Request) -> Response:
             _check_headers(request.headers)
 
             # Get the request body as raw bytes
             grpc_req_bytes: bytes = await request.body()
 
-            # Deserialize ProtoBuf
-            grpc_req = grpc_request_type.FromString(grpc_req_bytes)
-            grpc_res = await func(grpc_req)
+            grpc_res_bytes = await run_in_threadpool(handle, grpc_req_bytes)
             return Response(
                 status_code=200,
-                content=grpc_res.SerializeToString(),
+                content=grpc_res_bytes,
                 headers={"Content-Type": "application/protobuf"},
             )
 
@@ -97,7 +107,7 @@ def rest_request_response(
 
 
 @rest_request_response(CreateNodeRequest)
-async def create_node(request: CreateNodeRequest) -> CreateNodeResponse:
+def create_node(request: CreateNodeRequest) -> CreateNodeResponse:
     """Create Node."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -107,7 +117,7 @@ async def create_node(request: CreateNodeRequest) -> CreateNodeResponse:
 
 
 @rest_request_response(DeleteNodeRequest)
-async def delete_node(request: DeleteNodeRequest) -> DeleteNodeResponse:
+def delete_node(request: DeleteNodeRequest) -> DeleteNodeResponse:
     """Delete Node Id."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -117,7 +127,7 @@ async def delete_node(request: DeleteNodeRequest) -> DeleteNodeResponse:
 
 
 @rest_request_response(PullMessagesRequest)
-async def pull_message(request: PullMessagesRequest) -> PullMessagesResponse:
+def pull_message(request: PullMessagesRequest) -> PullMessagesResponse:
     """Pull PullMessages."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -128,7 +138,7 @@ async def pull_message(request: PullMessagesRequest) -> PullMessagesResponse:
 
 
 @rest_request_response(PushMessagesRequest)
-async def push_message(request: PushMessagesRequest) -> PushMessagesResponse:
+def push_message(request: PushMessagesRequest) -> PushMessagesResponse:
     """Pull PushMessages."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -139,7 +149,7 @@ async def push_message(request: PushMessagesRequest) -> PushMessagesResponse:
 
 
 @rest_request_response(PullObjectRequest)
-async def pull_object(request: PullObjectRequest) -> PullObjectResponse:
+def pull_object(request: PullObjectRequest) -> PullObjectResponse:
     """Pull PullObject."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -150,7 +160,7 @@ async def pull_object(request: PullObjectRequest) -> PullObjectResponse:
 
 
 @rest_request_response(PushObjectRequest)
-async def push_object(request: PushObjectRequest) -> PushObjectResponse:
+def push_object(request: PushObjectRequest) -> PushObjectResponse:
     """Pull PushObject."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -161,7 +171,7 @@ async def push_object(request: PushObjectRequest) -> PushObjectResponse:
 
 
 @rest_request_response(SendNodeHeartbeatRequest)
-async def send_node_heartbeat(
+def send_node_heartbeat(
     request: SendNodeHeartbeatRequest,
 ) -> SendNodeHeartbeatResponse:
     """Send node heartbeat."""
@@ -173,7 +183,7 @@ async def send_node_heartbeat(
 
 
 @rest_request_response(GetRunRequest)
-async def get_run(request: GetRunRequest) -> GetRunResponse:
+def get_run(request: GetRunRequest) -> GetRunResponse:
     """GetRun."""
     # Get state from app
     state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
@@ -184,7 +194,7 @@ async def get_run(request: GetRunRequest) -> GetRunResponse:
 
 
 @rest_request_response(GetFabRequest)
-async def get_fab(request: GetFabRequest) -> GetFabResponse:
+def get_fab(request: GetFabRequest) -> GetFabResponse:
     """GetRun."""
     # Get ffs from app
     ffs: Ffs = cast(FfsFactory, app.state.FFS_FACTORY).ffs()
@@ -198,7 +208,7 @@ async def get_fab(request: GetFabRequest) -> GetFabResponse:
 
 
 @rest_request_response(ConfirmMessageReceivedRequest)
-async def confirm_message_received(
+def confirm_message_received(
     request: ConfirmMessageReceivedRequest,
 ) -> ConfirmMessageReceivedResponse:
     """Confirm message received."""
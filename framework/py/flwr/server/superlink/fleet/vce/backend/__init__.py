@@ -18,11 +18,12 @@
 import importlib
 
 from .backend import Backend, BackendConfig
+from .processbackend import ProcessBackend
 
 is_ray_installed = importlib.util.find_spec("ray") is not None
 
 # Mapping of supported backends
-supported_backends: dict[str, type[Backend]] = {}
+supported_backends: dict[str, type[Backend]] = {"process": ProcessBackend}
 
 # To log backend-specific error message when chosen backend isn't available
 error_messages_backends: dict[str, str] = {}
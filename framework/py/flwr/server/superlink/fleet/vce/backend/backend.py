@@ -16,7 +16,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Union
 
 from flwr.client.client_app import ClientApp
 from flwr.common.context import Context
@@ -49,6 +49,15 @@ class Backend(ABC):
         """
         return 0
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the maximum number of Messages a worker processes in one job.
+
+        All Messages of a batch are submitted to the same worker at once, which saves
+        the per-job overhead of the backend when ClientApps are quick to run.
+        """
+        return 1
+
     @abstractmethod
     def is_worker_idle(self) -> bool:
         """Report whether a backend worker is idle and can therefore run a ClientApp."""
@@ -64,3 +73,21 @@ class Backend(ABC):
         context: Context,
     ) -> tuple[Message, Context]:
         """Submit a job to the backend."""
+
+    def process_messages(
+        self,
+        jobs: list[tuple[Message, Context]],
+    ) -> list[Union[tuple[Message, Context], Exception]]:
+        """Submit a batch of jobs to the backend.
+
+        The jobs are processed as with `process_message`. For each job, either the
+        output message and updated context, or the exception raised while
+        processing it, is returned.
+        """
+        results: list[Union[tuple[Message, Context], Exception]] = []
+        for message, context in jobs:
+            try:
+                results.append(self.process_message(message, context))
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                results.append(ex)
+        return results
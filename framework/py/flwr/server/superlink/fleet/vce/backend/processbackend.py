@@ -0,0 +1,278 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Process pool backend for the Fleet API using the Simulation Engine."""
+
+
+import io
+import multiprocessing as mp
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from logging import DEBUG, ERROR, WARNING
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, Union, cast
+
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
+from flwr.common.context import Context
+from flwr.common.logger import log
+from flwr.common.message import Message
+from flwr.common.record import Array
+
+from .backend import Backend, BackendConfig
+
+# Arrays at least this large (in bytes) are passed through shared memory
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+# Status of a job returned by a worker process
+_STATUS_OK = 0
+_STATUS_LOAD_ERROR = 1
+_STATUS_APP_ERROR = 2
+
+# Start workers from a clean process rather than forking the multithreaded parent
+_START_METHOD = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+
+# Set in each worker process by `_init_worker`
+# pylint: disable-next=invalid-name
+_app_loader: Optional[Union[bytes, Callable[[], ClientApp]]] = None
+_app: Optional[ClientApp] = None  # pylint: disable=invalid-name
+
+
+class ProcessBackend(Backend):
+    """A backend that runs ClientApps in a pool of persistent worker processes.
+
+    Each worker process loads the `ClientApp` once and reuses it for all messages it
+    processes. Workers are started with the `forkserver` (or `spawn`) start method,
+    so the function loading the `ClientApp` is pickled and must be importable by the
+    workers (e.g., a function or `ClientApp` defined at module level). Otherwise, the
+    workers are forked where possible, which is unsafe in multithreaded processes.
+    Messages and contexts are pickled to and from the workers, except for the data
+    of large arrays, which is copied once into shared memory by the sender and once
+    out of it by the receiver instead of being sent through a pipe.
+
+    The number of workers is the number of CPUs available (or `num_cpus` in the
+    `init_args` of the backend config) divided by the `num_cpus` in
+    `client_resources`. GPU resources are not managed by this backend.
+    """
+
+    def __init__(
+        self,
+        backend_config: BackendConfig,
+    ) -> None:
+        """Prepare ProcessBackend by computing the number of worker processes."""
+        log(DEBUG, "Initialising: %s", self.__class__.__name__)
+        log(DEBUG, "Backend config: %s", backend_config)
+
+        init_args = backend_config.get("init_args", {})
+        client_resources = backend_config.get("client_resources", {})
+        total_cpus = init_args.get("num_cpus", os.cpu_count() or 1)
+        client_cpus = client_resources.get("num_cpus", 2)
+        if not isinstance(total_cpus, (int, float)) or not isinstance(
+            client_cpus, (int, float)
+        ):
+            raise ValueError("`num_cpus` is expected to be of type int or float")
+        if client_resources.get("num_gpus", 0.0):
+            log(
+                WARNING,
+                "%s does not manage GPUs: `num_gpus` in `client_resources` is ignored.",
+                self.__class__.__name__,
+            )
+
+        self._num_workers = max(1, int(total_cpus / client_cpus))
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._num_busy = 0
+        self._lock = threading.Lock()
+
+    @property
+    def num_workers(self) -> int:
+        """Return number of worker processes."""
+        return self._num_workers if self.executor else 0
+
+    def is_worker_idle(self) -> bool:
+        """Report whether a worker process is idle."""
+        with self._lock:
+            return self.executor is not None and self._num_busy < self._num_workers
+
+    def build(self, app_fn: Callable[[], ClientApp]) -> None:
+        """Start the pool of worker processes this backend will submit jobs to."""
+        # Workers inherit the resource tracker, which then sees the shared memory
+        # segments of all processes and cleans up those that are leaked
+        resource_tracker.ensure_running()
+        # Pickle `app_fn` upfront, workers unpickle it when they first run a job
+        start_method = _START_METHOD
+        try:
+            app_loader: Union[bytes, Callable[[], ClientApp]] = pickle.dumps(app_fn)
+        except (pickle.PicklingError, AttributeError, TypeError) as ex:
+            if "fork" not in mp.get_all_start_methods():
+                raise ValueError(
+                    f"{self.__class__.__name__} requires a picklable function to "
+                    "load the `ClientApp` (e.g., defined at module level) on this "
+                    f"platform, got: {app_fn!r}"
+                ) from ex
+            # Forked workers inherit `app_fn`, which may deadlock if another thread
+            # holds a lock at the time of the fork
+            log(
+                WARNING,
+                "The function loading the `ClientApp` cannot be pickled (%s), "
+                "falling back to forking the worker processes. Pass the `ClientApp` "
+                "by reference (e.g., `flwr run`) to avoid this.",
+                ex,
+            )
+            start_method = "fork"
+            app_loader = app_fn
+        self.executor = ProcessPoolExecutor(
+            max_workers=self._num_workers,
+            mp_context=mp.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(app_loader,),
+        )
+        log(DEBUG, "Constructed process pool with: %i workers", self._num_workers)
+
+    def process_message(
+        self,
+        message: Message,
+        context: Context,
+    ) -> tuple[Message, Context]:
+        """Run ClientApp that process a given message.
+
+        Return output message and updated context.
+        """
+        if self.executor is None:
+            raise ValueError(
+                "The process pool is not running. "
+                "Call the backend's `build()` method before processing messages."
+            )
+
+        payload, segments = _dumps((message, context), unlink_on_load=False)
+        with self._lock:
+            self._num_busy += 1
+        try:
+            status, result = self.executor.submit(_run_client_app, payload).result()
+        except Exception as ex:
+            log(
+                ERROR,
+                "An exception was raised when processing a message by %s",
+                self.__class__.__name__,
+            )
+            raise ex
+        finally:
+            with self._lock:
+                self._num_busy -= 1
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+        if status == _STATUS_LOAD_ERROR:
+            raise LoadClientAppError(str(result))
+        if status == _STATUS_APP_ERROR:
+            raise ClientAppException(str(result))
+        out_message, updated_context = pickle.loads(cast(bytes, result))
+        return out_message, updated_context
+
+    def terminate(self) -> None:
+        """Terminate all worker processes."""
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        log(DEBUG, "Terminated %s", self.__class__.__name__)
+
+
+def _init_worker(app_loader: Union[bytes, Callable[[], ClientApp]]) -> None:
+    """Store the (pickled) function loading the ClientApp in the worker process."""
+    global _app_loader  # pylint: disable=global-statement
+    _app_loader = app_loader
+
+
+def _run_client_app(payload: bytes) -> tuple[int, Union[bytes, str]]:
+    """Run the cached ClientApp in a worker process."""
+    global _app  # pylint: disable=global-statement
+    message, context = pickle.loads(payload)
+    try:
+        if _app is None and _app_loader is not None:
+            app_fn = (
+                pickle.loads(_app_loader)
+                if isinstance(_app_loader, bytes)
+                else _app_loader
+            )
+            _app = cast(Callable[[], ClientApp], app_fn)()
+        if _app is None:
+            raise LoadClientAppError("No function to load the `ClientApp` was set")
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        return _STATUS_LOAD_ERROR, str(ex)
+
+    try:
+        out_message = _app(message=message, context=context)  # pylint: disable=E1102
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        return _STATUS_APP_ERROR, str(ex)
+
+    # The segments are unlinked by the backend once it has read them
+    result, segments = _dumps((out_message, context), unlink_on_load=True)
+    for shm in segments:
+        shm.close()
+    return _STATUS_OK, result
+
+
+class _SharedMemoryPickler(pickle.Pickler):
+    """Pickler moving the data of large arrays into shared memory."""
+
+    def __init__(self, file: io.BytesIO, unlink_on_load: bool) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.unlink_on_load = unlink_on_load
+        self.segments: list[SharedMemory] = []
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduce large arrays to a reference to a shared memory segment."""
+        if not isinstance(obj, Array) or len(obj.data) < SHARED_MEMORY_THRESHOLD:
+            return NotImplemented
+        size = len(obj.data)
+        shm = SharedMemory(create=True, size=size)
+        self.segments.append(shm)
+        shm.buf[:size] = obj.data
+        return _array_from_shared_memory, (
+            obj.dtype,
+            obj.shape,
+            obj.stype,
+            shm.name,
+            size,
+            self.unlink_on_load,
+        )
+
+
+def _dumps(obj: Any, unlink_on_load: bool) -> tuple[bytes, list[SharedMemory]]:
+    """Pickle an object, moving the data of large arrays into shared memory.
+
+    If `unlink_on_load` is False, the caller must unlink the returned segments once
+    the object has been unpickled.
+    """
+    buffer = io.BytesIO()
+    pickler = _SharedMemoryPickler(buffer, unlink_on_load)
+    pickler.dump(obj)
+    return buffer.getvalue(), pickler.segments
+
+
+def _array_from_shared_memory(  # pylint: disable=R0913, R0917
+    dtype: str, shape: tuple[int, ...], stype: str, name: str, size: int, unlink: bool
+) -> Array:
+    """Create an Array from the data held by a shared memory segment."""
+    shm = SharedMemory(name=name)
+    try:
+        # `Array` owns its `bytes`, so the segment is copied once before it is freed
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return Array(dtype=dtype, shape=shape, stype=stype, data=data)
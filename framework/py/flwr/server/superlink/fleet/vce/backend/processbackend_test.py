@@ -0,0 +1,136 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test for process pool backend for the Fleet API using the Simulation Engine."""
+
+
+from typing import cast
+from unittest import TestCase
+
+import numpy as np
+
+from flwr.client.client_app import ClientApp, ClientAppException
+from flwr.common import ArrayRecord, ConfigRecord, Context, Message, RecordDict
+from flwr.common.constant import MessageType
+
+from .processbackend import SHARED_MEMORY_THRESHOLD, ProcessBackend
+from .raybackend_test import _create_message_and_context, _load_app
+
+_echo_app = ClientApp()
+
+
+@_echo_app.train()
+def _echo(msg: Message, context: Context) -> Message:
+    """Reply with the doubled arrays and count the calls in the context."""
+    arrays = msg.content.array_records["arrays"].to_numpy_ndarrays()
+    calls = context.state.config_records.get("calls", ConfigRecord({"n": 0}))
+    context.state.config_records["calls"] = ConfigRecord(
+        {"n": cast(int, calls["n"]) + 1}
+    )
+    content = RecordDict({"arrays": ArrayRecord([arr * 2 for arr in arrays])})
+    return Message(content, reply_to=msg)
+
+
+@_echo_app.evaluate()
+def _fail(msg: Message, context: Context) -> Message:
+    """Raise an exception."""
+    raise ValueError("Evaluation failed")
+
+
+def _load_echo_app() -> ClientApp:
+    """Return the echo ClientApp."""
+    return _echo_app
+
+
+class TestProcessBackend(TestCase):
+    """Tests for ProcessBackend."""
+
+    def setUp(self) -> None:
+        """Start a backend with two workers."""
+        self.backend = ProcessBackend(
+            backend_config={
+                "init_args": {"num_cpus": 2},
+                "client_resources": {"num_cpus": 1},
+            }
+        )
+
+    def tearDown(self) -> None:
+        """Terminate the backend."""
+        self.backend.terminate()
+
+    def test_num_workers(self) -> None:
+        """Test that the number of workers follows the backend config."""
+        self.assertEqual(self.backend.num_workers, 0)
+        self.backend.build(_load_app)
+        self.assertEqual(self.backend.num_workers, 2)
+        self.assertTrue(self.backend.is_worker_idle())
+
+    def test_process_message(self) -> None:
+        """Test processing a message and updating the context."""
+        # Prepare
+        self.backend.build(_load_app)
+        message, context, expected_output = _create_message_and_context()
+
+        # Execute
+        out_msg, updated_context = self.backend.process_message(message, context)
+
+        # Assert
+        content = out_msg.content
+        props = content.config_records["getpropertiesres.properties"]
+        self.assertEqual(props["result"], expected_output)
+        result = updated_context.state.config_records["result"]["result"]
+        self.assertEqual(result, expected_output)
+
+    def test_process_message_with_large_arrays(self) -> None:
+        """Test that large arrays are passed to and from the workers intact."""
+        # Prepare
+        self.backend.build(_load_echo_app)
+        large = np.arange(2 * SHARED_MEMORY_THRESHOLD // 8, dtype=np.float64)
+        small = np.ones(3)
+        content = RecordDict({"arrays": ArrayRecord([large, small])})
+        message = Message(content, dst_node_id=1, message_type=MessageType.TRAIN)
+        _, context, _ = _create_message_and_context()
+
+        # Execute
+        for _ in range(2):
+            out_msg, context = self.backend.process_message(message, context)
+
+        # Assert
+        arrays = out_msg.content.array_records["arrays"].to_numpy_ndarrays()
+        np.testing.assert_array_equal(arrays[0], large * 2)
+        np.testing.assert_array_equal(arrays[1], small * 2)
+        self.assertEqual(context.state.config_records["calls"]["n"], 2)
+
+    def test_client_app_exception(self) -> None:
+        """Test that exceptions raised by the ClientApp are reported."""
+        # Prepare
+        self.backend.build(_load_echo_app)
+        message = Message(RecordDict(), dst_node_id=1, message_type="evaluate")
+        _, context, _ = _create_message_and_context()
+
+        # Execute & Assert
+        with self.assertRaises(ClientAppException):
+            self.backend.process_message(message, context)
+
+    def test_build_with_unpicklable_app_fn(self) -> None:
+        """Test that workers are forked if `app_fn` cannot be pickled."""
+        # Prepare
+        with self.assertLogs("flwr", level="WARNING"):
+            self.backend.build(lambda: _echo_app)
+        message = Message(RecordDict(), dst_node_id=1, message_type="evaluate")
+        _, context, _ = _create_message_and_context()
+
+        # Execute & Assert
+        with self.assertRaises(ClientAppException):
+            self.backend.process_message(message, context)
@@ -16,18 +16,34 @@
 
 
 import sys
+import threading
+from collections import OrderedDict
 from logging import DEBUG, ERROR
-from typing import Callable, Optional, Union
+from typing import Any, Callable, Optional, Union, cast
 
 import ray
+from ray import ObjectRef
 
 from flwr.client.client_app import ClientApp
 from flwr.common.constant import PARTITION_ID_KEY
 from flwr.common.context import Context
 from flwr.common.logger import log
-from flwr.common.message import Message
+from flwr.common.message import Message, make_message
+from flwr.common.record import Array, ArrayRecord, RecordDict
 from flwr.common.typing import ConfigRecordValues
-from flwr.simulation.ray_transport.ray_actor import BasicActorPool, ClientAppActor
+from flwr.simulation.ray_transport.autoscaler import (
+    AUTOSCALE_INTERVAL,
+    NUM_CPUS_STEP,
+    ActorPoolAutoscaler,
+)
+from flwr.simulation.ray_transport.ray_actor import (
+    BasicActorPool,
+    BatchJob,
+    ClientAppActor,
+    ClientAppFn,
+    SharedArrayRefs,
+    pool_size_from_resources,
+)
 from flwr.simulation.ray_transport.utils import enable_tf_gpu_growth
 
 from .backend import Backend, BackendConfig
@@ -35,8 +51,14 @@ from .backend import Backend, BackendConfig
 ClientResourcesDict = dict[str, Union[int, float]]
 ActorArgsDict = dict[str, Union[int, float, Callable[[], None]]]
 
+# Arrays at least this large (in bytes) are put in the object store once and passed
+# to the actors by reference
+SHARED_ARRAY_MIN_SIZE = 64 * 1024
+# Maximum total size (in bytes) of the arrays kept in the object store for reuse
+SHARED_ARRAY_CACHE_SIZE = 2 * 1024**3
 
-class RayBackend(Backend):
+
+class RayBackend(Backend):  # pylint: disable=R0902
     """A backend that submits jobs to a `BasicActorPool`."""
 
     def __init__(
@@ -57,9 +79,14 @@ class RayBackend(Backend):
 
         # Valide actor resources
         self.actor_kwargs = self._validate_actor_arguments(config=backend_config)
+        self._max_batch_size = self._validate_batch_size(config=backend_config)
+        self.autoscale_args = self._validate_autoscale_arguments(config=backend_config)
         self.pool: Optional[BasicActorPool] = None
+        self.autoscaler: Optional[ActorPoolAutoscaler] = None
 
         self.app_fn: Optional[Callable[[], ClientApp]] = None
+        self.app_fn_ref: Optional[ObjectRef[Any]] = None
+        self.array_refs = _ArrayRefCache(SHARED_ARRAY_CACHE_SIZE)
 
     def _validate_client_resources(self, config: BackendConfig) -> ClientResourcesDict:
         client_resources_config = config.get(self.client_resources_key)
@@ -99,6 +126,42 @@ class RayBackend(Backend):
                 actor_args["on_actor_init_fn"] = enable_tf_gpu_growth
         return actor_args
 
+    def _validate_batch_size(self, config: BackendConfig) -> int:
+        actor_config = config.get("actor") or {}
+        batch_size = actor_config.get("batch_size", 1)
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(
+                "`batch_size` in the `actor` backend config is expected to be a "
+                f"positive integer but found `{batch_size!r}`"
+            )
+        return batch_size
+
+    def _validate_autoscale_arguments(
+        self, config: BackendConfig
+    ) -> Optional[dict[str, Union[int, float]]]:
+        actor_config = config.get("actor") or {}
+        if not actor_config.get("autoscale", False):
+            return None
+        autoscale_args: dict[str, Union[int, float]] = {
+            "min_actors": 1,
+            "interval": AUTOSCALE_INTERVAL,
+        }
+        for key, arg in (
+            ("min_actors", "min_actors"),
+            ("max_actors", "max_actors"),
+            ("autoscale_interval", "interval"),
+        ):
+            value = actor_config.get(key, autoscale_args.get(arg))
+            if value is None:
+                continue
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(
+                    f"`{key}` in the `actor` backend config is expected to be a "
+                    f"positive number but found `{value!r}`"
+                )
+            autoscale_args[arg] = value
+        return autoscale_args
+
     def init_ray(self, backend_config: BackendConfig) -> None:
         """Intialises Ray if not already initialised."""
         if not ray.is_initialized():
@@ -117,9 +180,19 @@ class RayBackend(Backend):
 
     @property
     def num_workers(self) -> int:
-        """Return number of actors in pool."""
+        """Return number of actors in pool.
+
+        With autoscaling, return the maximum number of actors in the pool instead.
+        """
+        if self.autoscaler:
+            return self.autoscaler.max_actors
         return self.pool.num_actors if self.pool else 0
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the number of Messages an actor processes in one remote call."""
+        return self._max_batch_size
+
     def is_worker_idle(self) -> bool:
         """Report whether the pool has idle actors."""
         return self.pool.is_actor_available() if self.pool else False
@@ -137,8 +210,24 @@ class RayBackend(Backend):
             raise ex
 
         self.pool.add_actors_to_pool(self.pool.actors_capacity)
-        # Set ClientApp callable that ray actors will use
+        if self.autoscale_args is not None:
+            max_actors = self.autoscale_args.get("max_actors")
+            if max_actors is None:
+                # As many actors as fit when packed as tightly as possible
+                max_actors = pool_size_from_resources(
+                    {**self.client_resources, "num_cpus": NUM_CPUS_STEP}
+                )
+            self.autoscaler = ActorPoolAutoscaler(
+                self.pool,
+                min_actors=int(self.autoscale_args["min_actors"]),
+                max_actors=max(int(max_actors), self.pool.num_actors),
+                interval=self.autoscale_args["interval"],
+            )
+            self.autoscaler.start()
+        # Set ClientApp callable that ray actors will use, and put it in the object
+        # store so that it is not serialized for every message
         self.app_fn = app_fn
+        self.app_fn_ref = ray.put(app_fn)
         log(DEBUG, "Constructed ActorPool with: %i actors", self.pool.num_actors)
 
     def process_message(
@@ -161,11 +250,23 @@ class RayBackend(Backend):
                 "Call the backend's `build()` method before processing messages."
             )
 
+        # Pass large arrays by reference, so that arrays shared by the messages of a
+        # round (e.g., the global model) are serialized only once
+        message, shared_arrays = _detach_large_arrays(message, self.array_refs)
+
         try:
             # Submit a task to the pool
             future = self.pool.submit(
-                lambda a, a_fn, mssg, cid, state: a.run.remote(a_fn, mssg, cid, state),
-                (self.app_fn, message, str(partition_id), context),
+                lambda a, a_fn, mssg, cid, state: a.run.remote(
+                    a_fn, mssg, cid, state, shared_arrays
+                ),
+                # Ray resolves the reference to `app_fn` when running the job
+                (
+                    cast(ClientAppFn, self.app_fn_ref),
+                    message,
+                    str(partition_id),
+                    context,
+                ),
             )
 
             # Fetch result
@@ -186,9 +287,137 @@ class RayBackend(Backend):
             self.pool.add_actor_back_to_pool(future)
             raise ex
 
+    def process_messages(
+        self,
+        jobs: list[tuple[Message, Context]],
+    ) -> list[Union[tuple[Message, Context], Exception]]:
+        """Run the ClientApp on a batch of messages in a single actor call.
+
+        Return, for each message, the output message and updated context, or the
+        exception raised while processing it.
+        """
+        if len(jobs) == 1:
+            return super().process_messages(jobs)
+
+        if self.pool is None:
+            raise ValueError("The actor pool is empty, unfit to process messages.")
+
+        if self.app_fn is None:
+            raise ValueError(
+                "Unspecified function to load a `ClientApp`. "
+                "Call the backend's `build()` method before processing messages."
+            )
+
+        batch: list[BatchJob] = []
+        for message, context in jobs:
+            message, shared_arrays = _detach_large_arrays(message, self.array_refs)
+            partition_id = str(context.node_config[PARTITION_ID_KEY])
+            batch.append((message, partition_id, context, shared_arrays))
+
+        # Submit the batch to a single actor
+        future = self.pool.submit_batch(cast(ClientAppFn, self.app_fn_ref), batch)
+        try:
+            outputs = self.pool.fetch_batch_result_and_return_actor_to_pool(future)
+        except Exception as ex:
+            log(
+                ERROR,
+                "An exception was raised when processing a batch of messages by %s",
+                self.__class__.__name__,
+            )
+            # add actor back into pool
+            self.pool.add_actor_back_to_pool(future)
+            raise ex
+
+        results: list[Union[tuple[Message, Context], Exception]] = []
+        for out_mssg, updated_context, error in outputs:
+            if error is not None:
+                results.append(error.to_exception())
+            else:
+                results.append((cast(Message, out_mssg), updated_context))
+        return results
+
     def terminate(self) -> None:
         """Terminate all actors in actor pool."""
+        if self.autoscaler:
+            self.autoscaler.stop()
+            if self.autoscaler.metrics:
+                log(DEBUG, "Last actor pool metrics: %s", self.autoscaler.metrics)
         if self.pool:
             self.pool.terminate_all_actors()
+        self.array_refs.clear()
         ray.shutdown()
         log(DEBUG, "Terminated %s", self.__class__.__name__)
+
+
+class _ArrayRefCache:
+    """LRU cache of the object store references of large array data.
+
+    Array data is identified by its buffer, so that an array shared by many messages is
+    put in the object store only once. The cache holds a reference to each buffer it
+    keys, which keeps the buffer IDs unique.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._refs: OrderedDict[int, tuple[bytes, ObjectRef[Any]]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_ref(self, data: bytes) -> "ObjectRef[Any]":
+        """Return the reference of the data, putting it in the object store if new."""
+        with self._lock:
+            entry = self._refs.get(id(data))
+            if entry is not None:
+                self._refs.move_to_end(id(data))
+                return entry[1]
+
+            ref: ObjectRef[Any] = ray.put(data)
+            self._refs[id(data)] = (data, ref)
+            self._size += len(data)
+            # Evict the least recently used data, the object store frees it once
+            # no pending job holds the reference anymore
+            while self._size > self.max_size and len(self._refs) > 1:
+                _, (old_data, _) = self._refs.popitem(last=False)
+                self._size -= len(old_data)
+            return ref
+
+    def clear(self) -> None:
+        """Release all references."""
+        with self._lock:
+            self._refs.clear()
+            self._size = 0
+
+
+def _detach_large_arrays(
+    message: Message, array_refs: _ArrayRefCache
+) -> tuple[Message, SharedArrayRefs]:
+    """Replace the data of large arrays by object store references.
+
+    The message itself is left untouched. A copy of it holding empty arrays is returned
+    together with the references, keyed by record and array name.
+    """
+    shared_arrays: SharedArrayRefs = {}
+    if not message.has_content():
+        return message, shared_arrays
+
+    content = RecordDict()
+    for record_key, record in message.content.items():
+        if isinstance(record, ArrayRecord) and any(
+            len(arr.data) >= SHARED_ARRAY_MIN_SIZE for arr in record.values()
+        ):
+            array_dict: OrderedDict[str, Array] = OrderedDict()
+            for array_key, arr in record.items():
+                if len(arr.data) >= SHARED_ARRAY_MIN_SIZE:
+                    shared_arrays[(record_key, array_key)] = array_refs.get_ref(
+                        arr.data
+                    )
+                    arr = Array(
+                        dtype=arr.dtype, shape=arr.shape, stype=arr.stype, data=b""
+                    )
+                array_dict[array_key] = arr
+            record = ArrayRecord(array_dict, keep_input=True)
+        content[record_key] = record
+
+    if not shared_arrays:
+        return message, shared_arrays
+    return make_message(metadata=message.metadata, content=content), shared_arrays
@@ -19,13 +19,15 @@ from math import pi
 from typing import Callable, Optional, Union
 from unittest import TestCase
 
+import numpy as np
 import ray
 
 from flwr.client import Client, NumPyClient
-from flwr.client.client_app import ClientApp
+from flwr.client.client_app import ClientApp, ClientAppException
 from flwr.client.run_info_store import DeprecatedRunInfoStore
 from flwr.common import (
     DEFAULT_TTL,
+    ArrayRecord,
     Config,
     ConfigRecord,
     Context,
@@ -41,7 +43,10 @@ from flwr.common.constant import PARTITION_ID_KEY
 from flwr.common.message import make_message
 from flwr.common.recorddict_compat import getpropertiesins_to_recorddict
 from flwr.server.superlink.fleet.vce.backend.backend import BackendConfig
-from flwr.server.superlink.fleet.vce.backend.raybackend import RayBackend
+from flwr.server.superlink.fleet.vce.backend.raybackend import (
+    SHARED_ARRAY_MIN_SIZE,
+    RayBackend,
+)
 from flwr.simulation.ray_transport.ray_actor import pool_size_from_resources
 
 
@@ -70,6 +75,15 @@ def _load_app() -> ClientApp:
     return ClientApp(client_fn=get_dummy_client)
 
 
+_echo_app = ClientApp()
+
+
+@_echo_app.train()
+def _echo(msg: Message, context: Context) -> Message:  # pylint: disable=W0613
+    """Reply with the received arrays."""
+    return Message(msg.content, reply_to=msg)
+
+
 def backend_build_process_and_termination(
     backend: RayBackend,
     app_fn: Callable[[], ClientApp],
@@ -234,3 +248,78 @@ class TestRayBackend(TestCase):
 
         finally:
             ray.shutdown()
+
+    def test_shared_arrays_put_once(self) -> None:
+        """Test that arrays shared by messages are put in the object store once."""
+        # Prepare
+        backend = RayBackend(backend_config={"client_resources": {"num_cpus": 1}})
+        backend.build(lambda: _echo_app)
+        large = np.arange(SHARED_ARRAY_MIN_SIZE // 8 + 1, dtype=np.float64)
+        arrays = ArrayRecord([large, np.ones(3)])
+        _, context, _ = _create_message_and_context()
+
+        # Execute
+        replies = []
+        for node_id in (1, 2):
+            message = Message(
+                RecordDict({"arrays": arrays}),
+                dst_node_id=node_id,
+                message_type="train",
+            )
+            reply, _ = backend.process_message(message, context)
+            replies.append(reply)
+        num_refs = len(backend.array_refs._refs)  # pylint: disable=W0212
+        backend.terminate()
+
+        # Assert
+        assert num_refs == 1
+        assert len(arrays["0"].data) > SHARED_ARRAY_MIN_SIZE  # Input is untouched
+        for reply in replies:
+            received = reply.content.array_records["arrays"].to_numpy_ndarrays()
+            np.testing.assert_array_equal(received[0], large)
+            np.testing.assert_array_equal(received[1], np.ones(3))
+
+    def test_process_messages_in_batch(self) -> None:
+        """Test that a batch of messages is processed by a single actor call."""
+        # Prepare
+        backend = RayBackend(
+            backend_config={
+                "client_resources": {"num_cpus": 1},
+                "actor": {"batch_size": 4},
+            }
+        )
+        backend.build(lambda: _echo_app)
+        _, context, _ = _create_message_and_context()
+        jobs = [
+            (
+                Message(
+                    RecordDict({"arrays": ArrayRecord([np.full(3, node_id)])}),
+                    dst_node_id=node_id,
+                    message_type="train",
+                ),
+                context,
+            )
+            for node_id in range(3)
+        ]
+        # No handler is registered for this message type
+        jobs.append(
+            (Message(RecordDict(), dst_node_id=3, message_type="evaluate"), context)
+        )
+
+        # Execute
+        results = backend.process_messages(jobs)
+        backend.terminate()
+
+        # Assert
+        assert backend.max_batch_size == 4
+        assert len(results) == 4
+        for node_id, result in enumerate(results[:3]):
+            assert isinstance(result, tuple)
+            received = result[0].content.array_records["arrays"].to_numpy_ndarrays()
+            np.testing.assert_array_equal(received[0], np.full(3, node_id))
+        assert isinstance(results[3], ClientAppException)
+
+    def test_invalid_batch_size(self) -> None:
+        """Test that a non-positive batch size is rejected."""
+        with self.assertRaises(ValueError):
+            RayBackend(backend_config={"actor": {"batch_size": 0}})
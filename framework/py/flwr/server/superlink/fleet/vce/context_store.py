@@ -0,0 +1,249 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Store of the Contexts of the nodes simulated by the Simulation Engine."""
+
+
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from logging import DEBUG
+from pathlib import Path
+from typing import Optional
+
+from flwr.common import Context, RecordDict
+from flwr.common.constant import NUM_PARTITIONS_KEY, PARTITION_ID_KEY
+from flwr.common.logger import log
+from flwr.common.serde import recorddict_from_proto, recorddict_to_proto
+from flwr.common.typing import UserConfig
+
+# pylint: disable=E0611
+from flwr.proto.recorddict_pb2 import RecordDict as ProtoRecordDict
+
+# pylint: enable=E0611
+
+# Seconds between two checkpoints of the node states to disk
+CONTEXT_CHECKPOINT_INTERVAL = 60.0
+
+SQL_CREATE_TABLE_NODE_STATE = """
+CREATE TABLE IF NOT EXISTS node_state(
+    partition_id    INTEGER PRIMARY KEY,
+    state           BLOB NOT NULL
+);
+"""
+
+
+class NodeContextStore:  # pylint: disable=R0902
+    """The Contexts of all simulated nodes of a run.
+
+    The `Context` of a node is only created when a message for that node is
+    processed. By default, all Contexts are then kept in memory. If `cache_size` is
+    set, only the Contexts of the most recently used nodes are kept in memory, while
+    the `state` of the other nodes is stored in a SQLite database and loaded back
+    when needed.
+
+    The Contexts of the nodes are acquired in batches and released once updated. A
+    node whose Context is acquired cannot be acquired again before it is released,
+    so that concurrent workers never process a stale Context.
+
+    Parameters
+    ----------
+    nodes_mapping : dict[int, int]
+        Mapping of the node IDs to the partition IDs of the simulated nodes.
+    run_id : int
+        The ID of the run.
+    run_config : UserConfig
+        The run config every Context is created with. It cannot be modified.
+    cache_size : Optional[int] (default: None)
+        The maximum number of Contexts kept in memory. If `None`, all Contexts are
+        kept in memory unless `path` is set, in which case they are still
+        checkpointed to it.
+    path : Optional[str] (default: None)
+        The path of the SQLite database storing the `state` of the nodes, keyed by
+        their partition ID. States found in an existing database are restored, which
+        allows resuming a simulation. If `None` and `cache_size` is set, a temporary
+        database is used and removed on `close()`.
+    checkpoint_interval : float (default: CONTEXT_CHECKPOINT_INTERVAL)
+        The minimum number of seconds between two checkpoints of the `state` of all
+        nodes to the database.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        nodes_mapping: dict[int, int],
+        run_id: int,
+        run_config: UserConfig,
+        cache_size: Optional[int] = None,
+        path: Optional[str] = None,
+        checkpoint_interval: float = CONTEXT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        if cache_size is not None and cache_size < 1:
+            raise ValueError("`cache_size` must be a positive integer.")
+        self.nodes_mapping = nodes_mapping
+        self.num_partitions = len(set(nodes_mapping.values()))
+        self.run_id = run_id
+        self.run_config = run_config
+        self.cache_size = cache_size
+        self.checkpoint_interval = checkpoint_interval
+
+        self._cache: OrderedDict[int, Context] = OrderedDict()
+        self._dirty: set[int] = set()
+        self._in_use: set[int] = set()
+        self._cond = threading.Condition()
+        self._last_checkpoint = time.monotonic()
+
+        self._tmp_dir: Optional[str] = None
+        if path is None and cache_size is not None:
+            self._tmp_dir = tempfile.mkdtemp(prefix="flwr-node-contexts-")
+            path = str(Path(self._tmp_dir) / "node_contexts.db")
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            # Access is serialized by the condition of the store
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(SQL_CREATE_TABLE_NODE_STATE)
+            self._conn.commit()
+            log(DEBUG, "Storing the state of simulated nodes in %s", path)
+
+    def acquire_contexts(self, run_id: int, node_ids: list[int]) -> list[Context]:
+        """Get the Contexts of the given nodes, waiting for them to be released."""
+        if run_id != self.run_id:
+            raise RuntimeError(
+                f"Context for run_id={run_id} doesn't exist."
+                " A run context must be registered before it can be retrieved or "
+                "updated by a client."
+            )
+        with self._cond:
+            # Acquiring all nodes at once prevents workers from deadlocking
+            self._cond.wait_for(lambda: self._in_use.isdisjoint(node_ids))
+            self._in_use.update(node_ids)
+            try:
+                return [self._get(node_id) for node_id in node_ids]
+            except Exception:
+                self._in_use.difference_update(node_ids)
+                self._cond.notify_all()
+                raise
+
+    def release_context(self, node_id: int, context: Optional[Context]) -> None:
+        """Release the Context of a node, updating it unless `context` is `None`."""
+        with self._cond:
+            try:
+                if context is not None:
+                    if context.run_config != self.run_config:
+                        raise ValueError(
+                            "The `run_config` field of the `Context` object cannot be "
+                            f"modified (run_id: {self.run_id})."
+                        )
+                    self._cache[node_id] = context
+                    self._cache.move_to_end(node_id)
+                    self._dirty.add(node_id)
+            finally:
+                self._in_use.discard(node_id)
+                self._evict()
+                if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+                    self._checkpoint()
+                self._cond.notify_all()
+
+    def checkpoint(self) -> None:
+        """Write the `state` of all updated nodes held in memory to the database."""
+        with self._cond:
+            self._checkpoint()
+
+    def close(self) -> None:
+        """Checkpoint the `state` of the nodes and close the database."""
+        with self._cond:
+            self._checkpoint()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if self._tmp_dir is not None:
+                shutil.rmtree(self._tmp_dir, ignore_errors=True)
+                self._tmp_dir = None
+
+    def _get(self, node_id: int) -> Context:
+        """Get the Context of a node from the cache, or create it."""
+        context = self._cache.get(node_id)
+        if context is not None:
+            self._cache.move_to_end(node_id)
+            return context
+
+        partition_id = self.nodes_mapping[node_id]
+        context = Context(
+            run_id=self.run_id,
+            node_id=node_id,
+            node_config={
+                PARTITION_ID_KEY: partition_id,
+                NUM_PARTITIONS_KEY: self.num_partitions,
+            },
+            state=self._load_state(partition_id),
+            run_config=self.run_config.copy(),
+        )
+        self._cache[node_id] = context
+        self._evict()
+        return context
+
+    def _load_state(self, partition_id: int) -> RecordDict:
+        """Load the `state` of a node from the database."""
+        if self._conn is None:
+            return RecordDict()
+        row = self._conn.execute(
+            "SELECT state FROM node_state WHERE partition_id = ?;", (partition_id,)
+        ).fetchone()
+        if row is None:
+            return RecordDict()
+        return recorddict_from_proto(ProtoRecordDict.FromString(row[0]))
+
+    def _evict(self) -> None:
+        """Remove the least recently used Contexts that are not in use."""
+        if self.cache_size is None:
+            return
+        num_to_evict = len(self._cache) - self.cache_size
+        evicted: list[int] = []
+        for node_id in self._cache:
+            if len(evicted) >= num_to_evict:
+                break
+            if node_id not in self._in_use:
+                evicted.append(node_id)
+        self._write(node_id for node_id in evicted if node_id in self._dirty)
+        for node_id in evicted:
+            del self._cache[node_id]
+            self._dirty.discard(node_id)
+
+    def _checkpoint(self) -> None:
+        """Write all updated states to the database and commit."""
+        self._last_checkpoint = time.monotonic()
+        if self._conn is None:
+            return
+        self._write(self._dirty)
+        self._dirty.clear()
+        self._conn.commit()
+
+    def _write(self, node_ids: Iterable[int]) -> None:
+        """Write the `state` of the given cached nodes to the database."""
+        if self._conn is None:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO node_state (partition_id, state) VALUES (?, ?);",
+            (
+                (
+                    self.nodes_mapping[node_id],
+                    recorddict_to_proto(self._cache[node_id].state).SerializeToString(),
+                )
+                for node_id in node_ids
+            ),
+        )
@@ -0,0 +1,169 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for NodeContextStore."""
+
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Optional, cast
+
+from flwr.common import ConfigRecord, Context
+from flwr.common.constant import NUM_PARTITIONS_KEY, PARTITION_ID_KEY
+
+from .context_store import NodeContextStore
+
+NODES_MAPPING = {node_id: node_id - 100 for node_id in range(100, 110)}
+
+
+def _increment(store: NodeContextStore, node_id: int) -> Context:
+    """Acquire the Context of a node, increment its counter and release it."""
+    (context,) = store.acquire_contexts(run_id=1, node_ids=[node_id])
+    count = 0
+    if "counter" in context.state.config_records:
+        count = cast(int, context.state.config_records["counter"]["count"])
+    context.state.config_records["counter"] = ConfigRecord({"count": count + 1})
+    store.release_context(node_id, context)
+    return context
+
+
+class TestNodeContextStore(unittest.TestCase):
+    """Tests for NodeContextStore."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the databases."""
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = str(Path(self.tmp_dir.name) / "contexts.db")
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def _count(self, context: Context) -> Optional[int]:
+        if "counter" not in context.state.config_records:
+            return None
+        return cast(int, context.state.config_records["counter"]["count"])
+
+    def test_create_context(self) -> None:
+        """Test that Contexts are created with the config of the node and run."""
+        # Prepare
+        store = NodeContextStore(NODES_MAPPING, run_id=1, run_config={"lr": 0.1})
+
+        # Execute
+        (context,) = store.acquire_contexts(run_id=1, node_ids=[103])
+
+        # Assert
+        self.assertEqual(context.node_id, 103)
+        self.assertEqual(
+            context.node_config, {PARTITION_ID_KEY: 3, NUM_PARTITIONS_KEY: 10}
+        )
+        self.assertEqual(context.run_config, {"lr": 0.1})
+        with self.assertRaises(RuntimeError):
+            store.acquire_contexts(run_id=2, node_ids=[104])
+
+    def test_evicted_state_is_reloaded(self) -> None:
+        """Test that the state of evicted nodes is loaded back from disk."""
+        # Prepare
+        store = NodeContextStore(NODES_MAPPING, run_id=1, run_config={}, cache_size=2)
+
+        # Execute
+        for _ in range(3):
+            for node_id in NODES_MAPPING:
+                _increment(store, node_id)
+
+        # Assert
+        contexts = store.acquire_contexts(run_id=1, node_ids=list(NODES_MAPPING))
+        self.assertEqual([self._count(context) for context in contexts], [3] * 10)
+        store.close()
+
+    def test_resume_from_checkpoint(self) -> None:
+        """Test that a new store restores the states checkpointed to its path."""
+        # Prepare
+        store = NodeContextStore(NODES_MAPPING, run_id=1, run_config={}, path=self.path)
+        _increment(store, 100)
+        store.close()
+
+        # Execute
+        resumed = NodeContextStore(
+            {200 + pid: pid for pid in NODES_MAPPING.values()},
+            run_id=1,
+            run_config={},
+            path=self.path,
+        )
+        contexts = resumed.acquire_contexts(run_id=1, node_ids=[200, 201])
+
+        # Assert
+        self.assertEqual([self._count(context) for context in contexts], [1, None])
+        resumed.close()
+
+    def test_periodic_checkpoint(self) -> None:
+        """Test that updated states are checkpointed once the interval elapsed."""
+        # Prepare
+        store = NodeContextStore(
+            NODES_MAPPING,
+            run_id=1,
+            run_config={},
+            path=self.path,
+            checkpoint_interval=0.0,
+        )
+
+        # Execute
+        _increment(store, 100)
+        resumed = NodeContextStore(
+            NODES_MAPPING, run_id=1, run_config={}, path=self.path
+        )
+
+        # Assert
+        (context,) = resumed.acquire_contexts(run_id=1, node_ids=[100])
+        self.assertEqual(self._count(context), 1)
+        store.close()
+        resumed.close()
+
+    def test_run_config_cannot_be_modified(self) -> None:
+        """Test that a Context with a modified run config is rejected."""
+        # Prepare
+        store = NodeContextStore(NODES_MAPPING, run_id=1, run_config={"lr": 0.1})
+        (context,) = store.acquire_contexts(run_id=1, node_ids=[100])
+        context.run_config["lr"] = 1.0
+
+        # Execute & Assert
+        with self.assertRaises(ValueError):
+            store.release_context(100, context)
+        # The node is released nonetheless
+        store.acquire_contexts(run_id=1, node_ids=[100])
+
+    def test_concurrent_updates(self) -> None:
+        """Test that concurrent workers do not lose updates of a node."""
+        # Prepare
+        store = NodeContextStore(NODES_MAPPING, run_id=1, run_config={}, cache_size=3)
+
+        def _work() -> None:
+            for _ in range(50):
+                for node_id in (100, 101, 102, 103):
+                    _increment(store, node_id)
+
+        workers = [threading.Thread(target=_work) for _ in range(4)]
+
+        # Execute
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Assert
+        contexts = store.acquire_contexts(run_id=1, node_ids=[100, 101, 102, 103])
+        self.assertEqual([self._count(context) for context in contexts], [200] * 4)
+        store.close()
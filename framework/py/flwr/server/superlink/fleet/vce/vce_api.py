@@ -20,29 +20,26 @@ import threading
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
 from logging import DEBUG, ERROR, INFO, WARN
 from pathlib import Path
 from queue import Empty, Queue
 from time import sleep
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Union
 from uuid import uuid4
 
 from flwr.app.error import Error
 from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
 from flwr.client.clientapp.utils import get_load_client_app_fn
-from flwr.client.run_info_store import DeprecatedRunInfoStore
-from flwr.common import Message
-from flwr.common.constant import (
-    HEARTBEAT_MAX_INTERVAL,
-    NUM_PARTITIONS_KEY,
-    PARTITION_ID_KEY,
-    ErrorCode,
-)
+from flwr.common import Context, Message
+from flwr.common.config import get_fused_config, get_fused_config_from_dir
+from flwr.common.constant import HEARTBEAT_MAX_INTERVAL, ErrorCode
 from flwr.common.logger import log
-from flwr.common.typing import Run
+from flwr.common.typing import Run, UserConfig
 from flwr.server.superlink.linkstate import LinkState, LinkStateFactory
 
 from .backend import Backend, error_messages_backends, supported_backends
+from .context_store import CONTEXT_CHECKPOINT_INTERVAL, NodeContextStore
 
 NodeToPartitionMapping = dict[int, int]
 
@@ -60,85 +57,142 @@ def _register_nodes(
     return nodes_mapping
 
 
-def _register_node_info_stores(
+def _get_run_config(run: Run, app_dir: Optional[str] = None) -> UserConfig:
+    """Get the run config shared by the Contexts of all nodes."""
+    if app_dir:
+        # Load from app directory
+        app_path = Path(app_dir)
+        if not app_path.is_dir():
+            raise ValueError("The specified `app_dir` must be a directory.")
+        return get_fused_config_from_dir(app_path, run.override_config)
+    # Load pyproject.toml from installed FAB and fuse
+    return get_fused_config(run, None)
+
+
+def _create_context_store(
     nodes_mapping: NodeToPartitionMapping,
     run: Run,
     app_dir: Optional[str] = None,
-) -> dict[int, DeprecatedRunInfoStore]:
-    """Create DeprecatedRunInfoStore objects and register the context for the run."""
-    node_info_store: dict[int, DeprecatedRunInfoStore] = {}
-    num_partitions = len(set(nodes_mapping.values()))
-    for node_id, partition_id in nodes_mapping.items():
-        node_info_store[node_id] = DeprecatedRunInfoStore(
-            node_id=node_id,
-            node_config={
-                PARTITION_ID_KEY: partition_id,
-                NUM_PARTITIONS_KEY: num_partitions,
-            },
-        )
-
-        # Pre-register Context objects
-        node_info_store[node_id].register_context(
-            run_id=run.run_id, run=run, app_dir=app_dir
-        )
-
-    return node_info_store
+    store_config: Optional[dict[str, Any]] = None,
+) -> NodeContextStore:
+    """Create the store of the Contexts of all nodes for the run."""
+    store_config = store_config or {}
+    return NodeContextStore(
+        nodes_mapping=nodes_mapping,
+        run_id=run.run_id,
+        run_config=_get_run_config(run, app_dir),
+        cache_size=store_config.get("cache_size"),
+        path=store_config.get("path"),
+        checkpoint_interval=store_config.get(
+            "checkpoint_interval", CONTEXT_CHECKPOINT_INTERVAL
+        ),
+    )
 
 
 # pylint: disable=too-many-arguments,too-many-locals
 def worker(
     messageins_queue: Queue[Message],
     messageres_queue: Queue[Message],
-    node_info_store: dict[int, DeprecatedRunInfoStore],
+    context_store: NodeContextStore,
     backend: Backend,
     f_stop: threading.Event,
 ) -> None:
     """Process messages from the queue, execute them, update context, and enqueue
     replies."""
+    carry_over: list[Message] = []
     while not f_stop.is_set():
-        out_mssg = None
         try:
             # Fetch from queue with timeout. We use a timeout so
             # the stopping event can be evaluated even when the queue is empty.
-            message: Message = messageins_queue.get(timeout=1.0)
-            node_id = message.metadata.dst_node_id
+            messages = carry_over or [messageins_queue.get(timeout=1.0)]
+        except Empty:
+            # An exception raised if queue.get times out
+            continue
+        carry_over = _fill_batch(messages, messageins_queue, backend.max_batch_size)
+        _process_batch(messages, messageres_queue, context_store, backend)
+
+
+def _fill_batch(
+    messages: list[Message], messageins_queue: Queue[Message], max_batch_size: int
+) -> list[Message]:
+    """Add queued messages to a batch, without waiting for new ones.
+
+    A batch holds at most one message per node, so that each message of a node is
+    processed with the context updated by the previous one. The message that would break
+    this rule is returned in a list (empty otherwise), to start the next batch.
+    """
+    node_ids = {msg.metadata.dst_node_id for msg in messages}
+    while len(messages) < max_batch_size:
+        try:
+            message = messageins_queue.get_nowait()
+        except Empty:
+            break
+        if message.metadata.dst_node_id in node_ids:
+            return [message]
+        node_ids.add(message.metadata.dst_node_id)
+        messages.append(message)
+    return []
 
-            # Retrieve context
-            context = node_info_store[node_id].retrieve_context(
-                run_id=message.metadata.run_id
-            )
 
-            # Let backend process message
-            out_mssg, updated_context = backend.process_message(message, context)
+def _process_batch(
+    messages: list[Message],
+    messageres_queue: Queue[Message],
+    context_store: NodeContextStore,
+    backend: Backend,
+) -> None:
+    """Let the backend process a batch of messages and enqueue the replies."""
+    results: list[Union[tuple[Message, Context], Exception]]
+    acquired = False
+    try:
+        # Retrieve contexts
+        contexts = context_store.acquire_contexts(
+            run_id=messages[0].metadata.run_id,
+            node_ids=[msg.metadata.dst_node_id for msg in messages],
+        )
+        acquired = True
 
+        # Let backend process messages
+        results = backend.process_messages(list(zip(messages, contexts)))
+    # Exceptions aren't raised but reported as an error message
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        results = [ex] * len(messages)
+
+    for message, result in zip(messages, results):
+        if acquired:
             # Update Context
-            node_info_store[node_id].update_context(
-                message.metadata.run_id, context=updated_context
-            )
-        except Empty:
-            # An exception raised if queue.get times out
-            pass
-        # Exceptions aren't raised but reported as an error message
-        except Exception as ex:  # pylint: disable=broad-exception-caught
-            log(ERROR, ex)
-            log(ERROR, traceback.format_exc())
+            try:
+                context_store.release_context(
+                    message.metadata.dst_node_id,
+                    context=None if isinstance(result, Exception) else result[1],
+                )
+            except ValueError as ex:
+                result = ex
+
+        if isinstance(result, Exception):
+            out_mssg = _error_reply(message, result)
+        else:
+            out_mssg = result[0]
+
+        # Assign a message_id
+        out_mssg.metadata.__dict__["_message_id"] = str(uuid4())
+        # Store reply Messages in state
+        messageres_queue.put(out_mssg)
 
-            if isinstance(ex, ClientAppException):
-                e_code = ErrorCode.CLIENT_APP_RAISED_EXCEPTION
-            elif isinstance(ex, LoadClientAppError):
-                e_code = ErrorCode.LOAD_CLIENT_APP_EXCEPTION
-            else:
-                e_code = ErrorCode.UNKNOWN
 
-            reason = str(type(ex)) + ":<'" + str(ex) + "'>"
-            out_mssg = Message(Error(code=e_code, reason=reason), reply_to=message)
+def _error_reply(message: Message, ex: Exception) -> Message:
+    """Log an exception raised when processing a message and create the reply."""
+    log(ERROR, ex)
+    log(ERROR, "".join(traceback.format_exception(type(ex), ex, ex.__traceback__)))
 
-        finally:
-            if out_mssg:
-                # Assign a message_id
-                out_mssg.metadata.__dict__["_message_id"] = str(uuid4())
-                # Store reply Messages in state
-                messageres_queue.put(out_mssg)
+    if isinstance(ex, ClientAppException):
+        e_code = ErrorCode.CLIENT_APP_RAISED_EXCEPTION
+    elif isinstance(ex, LoadClientAppError):
+        e_code = ErrorCode.LOAD_CLIENT_APP_EXCEPTION
+    else:
+        e_code = ErrorCode.UNKNOWN
+
+    reason = str(type(ex)) + ":<'" + str(ex) + "'>"
+    return Message(Error(code=e_code, reason=reason), reply_to=message)
 
 
 def add_messages_to_queue(
@@ -175,7 +229,7 @@ def run_api(
     backend_fn: Callable[[], Backend],
     nodes_mapping: NodeToPartitionMapping,
     state_factory: LinkStateFactory,
-    node_info_stores: dict[int, DeprecatedRunInfoStore],
+    context_store: NodeContextStore,
     f_stop: threading.Event,
 ) -> None:
     """Run the VCE."""
@@ -220,7 +274,7 @@ def run_api(
                     worker,
                     messageins_queue,
                     messageres_queue,
-                    node_info_stores,
+                    context_store,
                     backend,
                     f_stop,
                 )
@@ -248,6 +302,29 @@ def run_api(
         backend.terminate()
 
 
+def _get_client_app(client_app: ClientApp) -> ClientApp:
+    """Return the given ClientApp."""
+    return client_app
+
+
+@cache
+def _load_client_app(
+    client_app_attr: str,
+    app_dir: str,
+    flwr_dir: Optional[str],
+    fab_id: str,
+    fab_version: str,
+    fab_hash: str,
+) -> ClientApp:
+    """Load the ClientApp from its reference, once per process."""
+    return get_load_client_app_fn(
+        default_app_ref=client_app_attr,
+        app_path=app_dir,
+        flwr_dir=flwr_dir,
+        multi_app=False,
+    )(fab_id, fab_version, fab_hash)
+
+
 # pylint: disable=too-many-arguments,unused-argument,too-many-locals,too-many-branches
 # pylint: disable=too-many-statements,too-many-positional-arguments
 def start_vce(
@@ -309,15 +386,18 @@ def start_vce(
             num_nodes=num_supernodes, state_factory=state_factory
         )
 
-    # Construct mapping of DeprecatedRunInfoStore
-    node_info_stores = _register_node_info_stores(
-        nodes_mapping=nodes_mapping, run=run, app_dir=app_dir if is_app else None
-    )
-
     # Load backend config
     log(DEBUG, "Supported backends: %s", list(supported_backends.keys()))
     backend_config = json.loads(backend_config_json_stream)
 
+    # Construct the store of the Contexts of all nodes
+    context_store = _create_context_store(
+        nodes_mapping=nodes_mapping,
+        run=run,
+        app_dir=app_dir if is_app else None,
+        store_config=backend_config.get("context_store"),
+    )
+
     try:
         backend_type = supported_backends[backend_name]
     except KeyError as ex:
@@ -337,35 +417,30 @@ def start_vce(
         """Instantiate a Backend."""
         return backend_type(backend_config)
 
-    # Load ClientApp if needed
-    def _load() -> ClientApp:
-
-        if client_app:
-            return client_app
-        if client_app_attr:
-            return get_load_client_app_fn(
-                default_app_ref=client_app_attr,
-                app_path=app_dir,
-                flwr_dir=flwr_dir,
-                multi_app=False,
-            )(run.fab_id, run.fab_version, run.fab_hash)
-
-        raise ValueError("Either `client_app_attr` or `client_app` must be provided")
-
-    app_fn = _load
+    # Picklable function loading the ClientApp, so that backends running it in other
+    # processes can send it to them (each process loads the ClientApp only once)
+    app_fn: Callable[[], ClientApp]
+    if client_app:
+        app_fn = partial(_get_client_app, client_app)
+    else:
+        app_fn = partial(
+            _load_client_app,
+            client_app_attr,
+            app_dir,
+            flwr_dir,
+            run.fab_id,
+            run.fab_version,
+            run.fab_hash,
+        )
 
     try:
-        # Test if ClientApp can be loaded
-        client_app = app_fn()
-
-        # Cache `ClientApp`
-        if client_app_attr:
-            # Now wrap the loaded ClientApp in a dummy function
-            # this prevent unnecesary low-level loading of ClientApp
-            def _load_client_app() -> ClientApp:
-                return client_app
+        if not client_app_attr and not client_app:
+            raise ValueError(
+                "Either `client_app_attr` or `client_app` must be provided"
+            )
 
-            app_fn = _load_client_app
+        # Test if ClientApp can be loaded (and cache it in this process)
+        app_fn()
 
         # Run main simulation loop
         run_api(
@@ -373,7 +448,7 @@ def start_vce(
             backend_fn,
             nodes_mapping,
             state_factory,
-            node_info_stores,
+            context_store,
             f_stop,
         )
     except LoadClientAppError as loadapp_ex:
@@ -388,3 +463,5 @@ def start_vce(
         raise loadapp_ex
     except Exception as ex:
         raise ex
+    finally:
+        context_store.close()
@@ -20,6 +20,7 @@ from itertools import cycle
 from json import JSONDecodeError
 from math import pi
 from pathlib import Path
+from queue import Queue
 from time import sleep
 from typing import Optional
 from unittest import TestCase
@@ -32,6 +33,7 @@ from flwr.common import (
     ConfigRecord,
     Context,
     GetPropertiesIns,
+    Message,
     MessageTypeLegacy,
     Metadata,
     RecordDict,
@@ -44,6 +46,7 @@ from flwr.common.recorddict_compat import getpropertiesins_to_recorddict
 from flwr.common.typing import Run, RunStatus
 from flwr.server.superlink.fleet.vce.vce_api import (
     NodeToPartitionMapping,
+    _fill_batch,
     _register_nodes,
     start_vce,
 )
@@ -287,7 +290,6 @@ class TestFleetSimulationEngineRayBackend(TestCase):
         """Start Simulation Engine Fleet and terminate it."""
         start_and_shutdown(num_supernodes=50, duration=10)
 
-    # pylint: disable=too-many-locals
     def test_start_and_shutdown_with_message_in_state(self) -> None:
         """Run Simulation Engine with some Message in State.
 
@@ -296,6 +298,30 @@ class TestFleetSimulationEngineRayBackend(TestCase):
         producer/consumer logic must function. This also severs to evaluate a valid
         ClientApp.
         """
+        self._run_with_message_in_state()
+
+    def test_start_and_shutdown_with_message_in_state_batched(self) -> None:
+        """Run Simulation Engine with actors processing batches of Messages."""
+        self._run_with_message_in_state(
+            backend_config='{"client_resources": {"num_cpus": 1}, '
+            '"actor": {"batch_size": 8}}'
+        )
+
+    def test_start_and_shutdown_with_message_in_state_autoscaled(self) -> None:
+        """Run Simulation Engine with an autoscaled actor pool."""
+        self._run_with_message_in_state(
+            backend_config='{"client_resources": {"num_cpus": 1}, '
+            '"actor": {"autoscale": true, "autoscale_interval": 0.5}}'
+        )
+
+    def test_start_and_shutdown_with_message_in_state_process(self) -> None:
+        """Run Simulation Engine with the process pool backend."""
+        self._run_with_message_in_state(backend="process")
+
+    # pylint: disable=too-many-locals
+    def _run_with_message_in_state(
+        self, backend: str = "ray", backend_config: str = "{}"
+    ) -> None:
         num_messages = 229
         num_nodes = 59
 
@@ -308,7 +334,11 @@ class TestFleetSimulationEngineRayBackend(TestCase):
 
         # Run
         start_and_shutdown(
-            state_factory=state_factory, nodes_mapping=nodes_mapping, duration=10
+            backend=backend,
+            state_factory=state_factory,
+            nodes_mapping=nodes_mapping,
+            duration=10,
+            backend_config=backend_config,
         )
 
         # Get all Message replies
@@ -325,3 +355,43 @@ class TestFleetSimulationEngineRayBackend(TestCase):
                 content.config_records["getpropertiesres.properties"]["result"]
                 == expected_results[message_res.metadata.reply_to_message_id]
             )
+
+
+class TestFillBatch(TestCase):
+    """Tests for batching queued messages."""
+
+    def test_fill_batch_one_message_per_node(self) -> None:
+        """Test that a batch stops before a second message for the same node."""
+        # Prepare
+        queue: Queue[Message] = Queue()
+        messages = [
+            Message(RecordDict(), dst_node_id=node_id, message_type="query")
+            for node_id in (1, 2, 3, 2, 4)
+        ]
+        for message in messages[1:]:
+            queue.put(message)
+        batch = [messages[0]]
+
+        # Execute
+        carry_over = _fill_batch(batch, queue, max_batch_size=10)
+
+        # Assert
+        self.assertEqual(batch, messages[:3])
+        self.assertEqual(carry_over, [messages[3]])
+        self.assertEqual(queue.get_nowait(), messages[4])
+
+    def test_fill_batch_max_size(self) -> None:
+        """Test that a batch does not exceed the maximum batch size."""
+        # Prepare
+        queue: Queue[Message] = Queue()
+        for node_id in range(2, 6):
+            queue.put(Message(RecordDict(), dst_node_id=node_id, message_type="query"))
+        batch = [Message(RecordDict(), dst_node_id=1, message_type="query")]
+
+        # Execute
+        carry_over = _fill_batch(batch, queue, max_batch_size=3)
+
+        # Assert
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(carry_over, [])
+        self.assertEqual(queue.qsize(), 2)
@@ -40,6 +40,7 @@ from flwr.common.typing import Run, RunStatus, UserConfig
 from flwr.server.superlink.linkstate.linkstate import LinkState
 from flwr.server.utils import validate_message
 
+from .node_liveness import NodeLiveness
 from .utils import (
     check_node_availability_for_in_message,
     generate_rand_int_from_bytes,
@@ -58,7 +59,7 @@ class RunRecord:  # pylint: disable=R0902
     active_until: float = 0.0
     heartbeat_interval: float = 0.0
     logs: list[tuple[float, str]] = field(default_factory=list)
-    log_lock: threading.Lock = field(default_factory=threading.Lock)
+    log_lock: threading.Condition = field(default_factory=threading.Condition)
     lock: threading.RLock = field(default_factory=threading.RLock)
 
 
@@ -69,6 +70,8 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
 
         # Map node_id to (online_until, heartbeat_interval)
         self.node_ids: dict[int, tuple[float, float]] = {}
+        # Detect offline nodes without scanning `node_ids`
+        self.node_liveness = NodeLiveness()
         self.public_key_to_node_id: dict[bytes, int] = {}
         self.node_id_to_public_key: dict[int, bytes] = {}
 
@@ -336,10 +339,9 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
                 return 0
 
             # Mark the node online until time.time() + heartbeat_interval
-            self.node_ids[node_id] = (
-                time.time() + heartbeat_interval,
-                heartbeat_interval,
-            )
+            online_until = time.time() + heartbeat_interval
+            self.node_ids[node_id] = (online_until, heartbeat_interval)
+            self.node_liveness.add(node_id, online_until, heartbeat_interval)
             return node_id
 
     def delete_node(self, node_id: int) -> None:
@@ -353,6 +355,7 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
                 del self.public_key_to_node_id[pk]
 
             del self.node_ids[node_id]
+            self.node_liveness.remove(node_id)
 
     def get_nodes(self, run_id: int) -> set[int]:
         """Return all available nodes.
@@ -365,12 +368,7 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
         with self.lock:
             if run_id not in self.run_ids:
                 return set()
-            current_time = time.time()
-            return {
-                node_id
-                for node_id, (online_until, _) in self.node_ids.items()
-                if online_until > current_time
-            }
+            return self.node_liveness.online_nodes(time.time())
 
     def set_node_public_key(self, node_id: int, public_key: bytes) -> None:
         """Set `public_key` for the specified `node_id`."""
@@ -602,10 +600,10 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
         """
         with self.lock:
             if node_id in self.node_ids:
-                self.node_ids[node_id] = (
-                    time.time() + HEARTBEAT_PATIENCE * heartbeat_interval,
-                    heartbeat_interval,
-                )
+                online_until = time.time() + HEARTBEAT_PATIENCE * heartbeat_interval
+                self.node_ids[node_id] = (online_until, heartbeat_interval)
+                # Nothing to persist, so the deadline is not marked as pending
+                self.node_liveness.add(node_id, online_until, heartbeat_interval)
                 return True
         return False
 
@@ -663,6 +661,7 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
         run = self.run_ids[run_id]
         with run.log_lock:
             run.logs.append((now().timestamp(), log_message))
+            run.log_lock.notify_all()
 
     def get_serverapp_log(
         self, run_id: int, after_timestamp: Optional[float]
@@ -678,3 +677,16 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
             index = bisect_right(run.logs, (after_timestamp, ""))
             latest_timestamp = run.logs[-1][0] if index < len(run.logs) else 0.0
             return "".join(log for _, log in run.logs[index:]), latest_timestamp
+
+    def wait_for_serverapp_log(
+        self, run_id: int, after_timestamp: Optional[float], timeout: float
+    ) -> bool:
+        """Wait for new serverapp logs for the specified `run_id`."""
+        if run_id not in self.run_ids:
+            raise ValueError(f"Run {run_id} not found")
+        run = self.run_ids[run_id]
+        after = after_timestamp if after_timestamp is not None else 0.0
+        with run.log_lock:
+            return run.log_lock.wait_for(
+                lambda: bool(run.logs) and run.logs[-1][0] > after, timeout=timeout
+            )
@@ -380,3 +380,25 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
             - The timestamp of the latest log entry in the returned logs.
               Returns `0` if no logs are returned.
         """
+
+    @abc.abstractmethod
+    def wait_for_serverapp_log(
+        self, run_id: int, after_timestamp: Optional[float], timeout: float
+    ) -> bool:
+        """Wait until ServerApp logs newer than `after_timestamp` are available.
+
+        Parameters
+        ----------
+        run_id : int
+            The identifier of the run for which to wait for ServerApp logs.
+        after_timestamp : Optional[float]
+            Wait for logs after this timestamp. If set to `None`, wait for any log.
+        timeout : float
+            The maximum time to wait, in seconds.
+
+        Returns
+        -------
+        bool
+            `True` if logs newer than `after_timestamp` are available, `False` if
+            the timeout expired before.
+        """
@@ -15,13 +15,16 @@
 """Factory class that creates State instances."""
 
 
-from logging import DEBUG
+import threading
+from logging import DEBUG, ERROR
 from typing import Optional
 
 from flwr.common.logger import log
 
 from .in_memory_linkstate import InMemoryLinkState
 from .linkstate import LinkState
+from .log_buffer import LogBuffer
+from .node_liveness import NodeLiveness
 from .sqlite_linkstate import SqliteLinkState
 
 
@@ -40,6 +43,13 @@ class LinkStateFactory:
     def __init__(self, database: str) -> None:
         self.database = database
         self.state_instance: Optional[LinkState] = None
+        # Shared by all SqliteLinkState instances to serve log streams from memory
+        self.log_buffer = LogBuffer()
+        # Shared by all SqliteLinkState instances to batch heartbeats in memory
+        self.node_liveness = NodeLiveness()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
 
     def state(self) -> LinkState:
         """Return a State instance and create it, if necessary."""
@@ -51,7 +61,61 @@ class LinkStateFactory:
             return self.state_instance
 
         # SqliteState
-        state = SqliteLinkState(self.database)
-        state.initialize()
+        state = self._sqlite_state()
         log(DEBUG, "Using SqliteState")
+        self._start_flusher()
+        return state
+
+    def close(self) -> None:
+        """Stop flushing heartbeats periodically and write the pending ones."""
+        self._stop_flusher.set()
+        with self._flusher_lock:
+            if self._flusher is not None:
+                self._flusher.join()
+        self._flush_node_heartbeats()
+
+    def _start_flusher(self) -> None:
+        """Start flushing heartbeats in the background, unless already started.
+
+        Heartbeats are otherwise only written when another heartbeat is received. Each
+        connection to ':memory:' opens a separate database, so there is nothing to flush
+        to in that case.
+        """
+        if self._flusher is not None or self.database == ":memory:":
+            return
+        with self._flusher_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """Flush the heartbeats every `flush_interval` seconds until closed."""
+        # SQLite connections can only be used by the thread that created them
+        state: Optional[SqliteLinkState] = None
+        while not self._stop_flusher.wait(self.node_liveness.flush_interval):
+            try:
+                if state is None:
+                    state = self._sqlite_state()
+                state.flush_node_heartbeats()
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                log(ERROR, "Failed to write the heartbeats of nodes: %s", ex)
+
+    def _flush_node_heartbeats(self) -> None:
+        """Write the heartbeats recorded in memory, logging any error."""
+        if self.database in (":flwr-in-memory-state:", ":memory:"):
+            return
+        try:
+            self._sqlite_state().flush_node_heartbeats()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            log(ERROR, "Failed to write the heartbeats of nodes: %s", ex)
+
+    def _sqlite_state(self) -> SqliteLinkState:
+        state = SqliteLinkState(
+            self.database,
+            log_buffer=self.log_buffer,
+            node_liveness=self.node_liveness,
+        )
+        state.initialize()
         return state
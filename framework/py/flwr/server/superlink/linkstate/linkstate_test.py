@@ -1368,6 +1368,23 @@ class StateTest(unittest.TestCase):
         assert latest == 0
         assert retrieved_logs == ""
 
+    def test_wait_for_serverapp_log(self) -> None:
+        """Test waiting for serverapp logs after a specific timestamp."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        timestamp = now().timestamp()
+
+        # Execute
+        available_before = state.wait_for_serverapp_log(run_id, timestamp, 0.01)
+        state.add_serverapp_log(run_id, "Log entry")
+        available_after = state.wait_for_serverapp_log(run_id, timestamp, 5.0)
+
+        # Assert
+        assert not available_before
+        assert available_after
+        assert state.get_serverapp_log(run_id, timestamp)[0] == "Log entry"
+
     def test_create_run_with_and_without_federation_options(self) -> None:
         """Test that the recording and fetching of federation options works."""
         # Prepare
@@ -0,0 +1,119 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""In-memory buffer of the latest ServerApp logs."""
+
+
+import threading
+from collections import OrderedDict, deque
+from typing import Optional
+
+from flwr.common.constant import LOG_BUFFER_CAPACITY, LOG_BUFFER_MAX_RUNS
+
+
+class _RunLogs:
+    """The buffered logs of a single run."""
+
+    def __init__(self, capacity: int, timestamp: float) -> None:
+        self.entries: deque[tuple[float, str]] = deque(maxlen=capacity)
+        # All logs added after this timestamp are held by the buffer. Older logs may
+        # have been evicted or added before the buffer was created.
+        self.complete_after = timestamp
+
+
+class LogBuffer:
+    """Ring buffers holding the latest ServerApp logs of the most recent runs.
+
+    Any number of readers can wait on the buffer for new logs of a run, which lets
+    log streams follow a run without querying the persistent storage.
+
+    Parameters
+    ----------
+    capacity : int (default: LOG_BUFFER_CAPACITY)
+        The maximum number of log entries kept per run.
+    max_runs : int (default: LOG_BUFFER_MAX_RUNS)
+        The maximum number of runs whose logs are kept. The logs of the run that was
+        least recently written to are dropped first.
+    """
+
+    def __init__(
+        self, capacity: int = LOG_BUFFER_CAPACITY, max_runs: int = LOG_BUFFER_MAX_RUNS
+    ) -> None:
+        self.capacity = capacity
+        self.max_runs = max_runs
+        self._runs: OrderedDict[int, _RunLogs] = OrderedDict()
+        self._cond = threading.Condition()
+
+    def append(self, run_id: int, timestamp: float, log_message: str) -> None:
+        """Append a log entry and wake up all readers waiting for the run."""
+        with self._cond:
+            run_logs = self._runs.get(run_id)
+            if run_logs is None:
+                run_logs = self._runs[run_id] = _RunLogs(self.capacity, timestamp)
+                if len(self._runs) > self.max_runs:
+                    self._runs.popitem(last=False)
+            else:
+                self._runs.move_to_end(run_id)
+
+            entries = run_logs.entries
+            if entries and timestamp < entries[-1][0]:
+                # Entries must stay sorted; treat older logs as not buffered
+                run_logs.complete_after = max(run_logs.complete_after, timestamp)
+            elif len(entries) == entries.maxlen:
+                run_logs.complete_after = max(run_logs.complete_after, entries[0][0])
+                entries.append((timestamp, log_message))
+            else:
+                entries.append((timestamp, log_message))
+            self._cond.notify_all()
+
+    def get(
+        self, run_id: int, after_timestamp: Optional[float]
+    ) -> Optional[tuple[str, float]]:
+        """Get the buffered logs of a run added after `after_timestamp`.
+
+        Returns `None` if the buffer cannot guarantee to hold all of those logs, in
+        which case they must be retrieved from the persistent storage.
+        """
+        with self._cond:
+            run_logs = self._runs.get(run_id)
+            if run_logs is None or after_timestamp is None:
+                return None
+            if after_timestamp < run_logs.complete_after:
+                return None
+
+            # Collect the newest entries, which are the ones log streams ask for
+            logs: list[str] = []
+            latest_timestamp = 0.0
+            for timestamp, log_message in reversed(run_logs.entries):
+                if timestamp <= after_timestamp:
+                    break
+                latest_timestamp = max(latest_timestamp, timestamp)
+                logs.append(log_message)
+            return "".join(reversed(logs)), latest_timestamp
+
+    def wait(
+        self, run_id: int, after_timestamp: Optional[float], timeout: float
+    ) -> bool:
+        """Wait until a log entry newer than `after_timestamp` is added to a run.
+
+        Returns `True` if such an entry is available, `False` on timeout.
+        """
+        after = after_timestamp if after_timestamp is not None else 0.0
+
+        def _has_new_logs() -> bool:
+            run_logs = self._runs.get(run_id)
+            return bool(run_logs and run_logs.entries[-1][0] > after)
+
+        with self._cond:
+            return self._cond.wait_for(_has_new_logs, timeout=timeout)
@@ -0,0 +1,87 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for LogBuffer."""
+
+
+import threading
+import unittest
+
+from .log_buffer import LogBuffer
+
+
+class TestLogBuffer(unittest.TestCase):
+    """Tests for LogBuffer."""
+
+    def test_get_after_timestamp(self) -> None:
+        """Test that only the logs after the timestamp are returned."""
+        # Prepare
+        buffer = LogBuffer()
+        for timestamp in (1.0, 2.0, 3.0):
+            buffer.append(1, timestamp, f"log-{timestamp} ")
+
+        # Execute & Assert
+        self.assertEqual(buffer.get(1, 1.5), ("log-2.0 log-3.0 ", 3.0))
+        self.assertEqual(buffer.get(1, 3.0), ("", 0.0))
+
+    def test_get_unbuffered_logs(self) -> None:
+        """Test that logs the buffer may not hold are not served from memory."""
+        # Prepare
+        buffer = LogBuffer(capacity=2)
+        for timestamp in (2.0, 3.0, 4.0):
+            buffer.append(1, timestamp, f"log-{timestamp} ")
+
+        # Execute & Assert
+        self.assertIsNone(buffer.get(1, None))
+        self.assertIsNone(buffer.get(1, 1.0))  # Logs before the buffer existed
+        self.assertIsNone(buffer.get(1, 1.5))  # Evicted log
+        self.assertEqual(buffer.get(1, 3.0), ("log-4.0 ", 4.0))
+        self.assertIsNone(buffer.get(2, 0.0))  # Unknown run
+
+    def test_max_runs(self) -> None:
+        """Test that the logs of the least recently written run are dropped."""
+        # Prepare
+        buffer = LogBuffer(max_runs=2)
+        buffer.append(1, 1.0, "log")
+        buffer.append(2, 1.0, "log")
+        buffer.append(1, 2.0, "log")
+
+        # Execute
+        buffer.append(3, 1.0, "log")
+
+        # Assert
+        self.assertIsNotNone(buffer.get(1, 1.0))
+        self.assertIsNone(buffer.get(2, 1.0))
+        self.assertIsNotNone(buffer.get(3, 1.0))
+
+    def test_wait_wakes_up_all_readers(self) -> None:
+        """Test that all readers waiting for a run are woken up by a new log."""
+        # Prepare
+        buffer = LogBuffer()
+        results: list[bool] = []
+        readers = [
+            threading.Thread(target=lambda: results.append(buffer.wait(1, 0.0, 5.0)))
+            for _ in range(3)
+        ]
+        for reader in readers:
+            reader.start()
+
+        # Execute
+        buffer.append(1, 1.0, "log")
+        for reader in readers:
+            reader.join()
+
+        # Assert
+        self.assertEqual(results, [True] * 3)
+        self.assertFalse(buffer.wait(1, 1.0, 0.01))
@@ -0,0 +1,136 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""In-memory tracker of the liveness of nodes."""
+
+
+import heapq
+import threading
+import time
+from collections.abc import Iterable
+from typing import Optional
+
+from flwr.common.constant import HEARTBEAT_FLUSH_INTERVAL
+
+
+class NodeLiveness:  # pylint: disable=R0902
+    """Track until when nodes are online, detecting offline nodes as they expire.
+
+    Every heartbeat pushes the new deadline of its node onto an expiry heap. Nodes
+    whose deadline has passed are popped from the heap and marked offline when the
+    set of online nodes is read, which costs O(log n) per expired deadline instead of
+    a scan of all nodes. Deadlines replaced by a later heartbeat are skipped when
+    popped.
+
+    Heartbeats are only recorded in memory. The deadlines that changed since the last
+    flush are returned by `pop_pending()`, so that a persistent LinkState can write
+    them in a single batch every `flush_interval` seconds.
+
+    Parameters
+    ----------
+    flush_interval : float (default: HEARTBEAT_FLUSH_INTERVAL)
+        The number of seconds between two flushes of the pending deadlines.
+    """
+
+    def __init__(self, flush_interval: float = HEARTBEAT_FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        # Map node_id to (online_until, heartbeat_interval)
+        self._nodes: dict[int, tuple[float, float]] = {}
+        self._online: set[int] = set()
+        self._expiry_heap: list[tuple[float, int]] = []
+        self._pending: dict[int, tuple[float, float]] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self, nodes: Iterable[tuple[int, float, float]]) -> None:
+        """Track the given `(node_id, online_until, heartbeat_interval)` tuples."""
+        with self._lock:
+            for node_id, online_until, heartbeat_interval in nodes:
+                self._set(node_id, online_until, heartbeat_interval)
+            self.loaded = True
+
+    def __contains__(self, node_id: object) -> bool:
+        """Return whether the node is tracked, whether it is online or not."""
+        return node_id in self._nodes
+
+    def add(self, node_id: int, online_until: float, heartbeat_interval: float) -> None:
+        """Start tracking a node."""
+        with self._lock:
+            self._set(node_id, online_until, heartbeat_interval)
+
+    def remove(self, node_id: int) -> None:
+        """Stop tracking a node."""
+        with self._lock:
+            self._nodes.pop(node_id, None)
+            self._online.discard(node_id)
+            self._pending.pop(node_id, None)
+
+    def heartbeat(
+        self, node_id: int, online_until: float, heartbeat_interval: float
+    ) -> bool:
+        """Extend the deadline of a tracked node, returning False if it is unknown."""
+        with self._lock:
+            if node_id not in self._nodes:
+                return False
+            self._set(node_id, online_until, heartbeat_interval)
+            self._pending[node_id] = (online_until, heartbeat_interval)
+            return True
+
+    def online_until(self, node_id: int) -> Optional[float]:
+        """Return until when a node is online, or None if it is unknown."""
+        with self._lock:
+            node = self._nodes.get(node_id)
+            return None if node is None else node[0]
+
+    def online_nodes(self, current_time: float) -> set[int]:
+        """Return the IDs of the nodes online at `current_time`."""
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= current_time:
+                online_until, node_id = heapq.heappop(heap)
+                node = self._nodes.get(node_id)
+                # Skip deadlines that have been extended since
+                if node is not None and node[0] == online_until:
+                    self._online.discard(node_id)
+            return set(self._online)
+
+    def should_flush(self) -> bool:
+        """Return whether pending deadlines are due to be flushed."""
+        return (
+            bool(self._pending)
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        )
+
+    def pop_pending(self) -> dict[int, tuple[float, float]]:
+        """Return and clear the deadlines changed since the last flush."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+            return pending
+
+    def _set(
+        self, node_id: int, online_until: float, heartbeat_interval: float
+    ) -> None:
+        self._nodes[node_id] = (online_until, heartbeat_interval)
+        self._online.add(node_id)
+        heapq.heappush(self._expiry_heap, (online_until, node_id))
+        if len(self._expiry_heap) > 4 * len(self._nodes) + 64:
+            # Drop the deadlines that have been replaced by later heartbeats
+            self._expiry_heap = [
+                (until, nid)
+                for nid, (until, _) in self._nodes.items()
+                if nid in self._online
+            ]
+            heapq.heapify(self._expiry_heap)
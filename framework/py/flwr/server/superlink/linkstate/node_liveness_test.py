@@ -0,0 +1,142 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for NodeLiveness."""
+
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from .linkstate_factory import LinkStateFactory
+from .node_liveness import NodeLiveness
+from .sqlite_linkstate import SqliteLinkState
+
+
+def test_online_nodes_expire() -> None:
+    """Test that nodes are offline once their latest deadline has passed."""
+    # Prepare
+    liveness = NodeLiveness()
+    liveness.load([(1, 10.0, 5.0), (2, 20.0, 5.0)])
+    liveness.add(3, 30.0, 5.0)
+
+    # Execute
+    liveness.heartbeat(1, 25.0, 5.0)
+    unknown = liveness.heartbeat(4, 25.0, 5.0)
+    online_at_15 = liveness.online_nodes(15.0)
+    online_at_22 = liveness.online_nodes(22.0)
+    liveness.remove(3)
+    online_at_26 = liveness.online_nodes(26.0)
+
+    # Assert
+    assert not unknown
+    assert online_at_15 == {1, 2, 3}
+    assert online_at_22 == {1, 3}
+    assert not online_at_26
+    assert liveness.online_until(1) == 25.0
+    assert liveness.online_until(3) is None
+    # A later heartbeat brings an expired node back online
+    liveness.heartbeat(2, 40.0, 5.0)
+    assert liveness.online_nodes(26.0) == {2}
+
+
+def test_pending_heartbeats_are_coalesced() -> None:
+    """Test that only the latest deadline of each node is flushed."""
+    # Prepare
+    liveness = NodeLiveness(flush_interval=0.0)
+    liveness.load([(1, 10.0, 5.0), (2, 10.0, 5.0)])
+
+    # Execute
+    for until in (11.0, 12.0, 13.0):
+        liveness.heartbeat(1, until, 5.0)
+    liveness.heartbeat(2, 14.0, 5.0)
+    liveness.remove(2)
+    should_flush = liveness.should_flush()
+    pending = liveness.pop_pending()
+
+    # Assert
+    assert should_flush
+    assert pending == {1: (13.0, 5.0)}
+    assert not liveness.should_flush()
+
+
+def test_sqlite_linkstate_batches_heartbeats() -> None:
+    """Test that heartbeats reach the database in batches."""
+    # Prepare
+    liveness = NodeLiveness(flush_interval=3600.0)
+    state = SqliteLinkState(":memory:", node_liveness=liveness)
+    state.initialize()
+    node_id = state.create_node(heartbeat_interval=10)
+    query = "SELECT online_until FROM node;"
+    created_until = state.query(query)[0]["online_until"]
+
+    # Execute
+    state.acknowledge_node_heartbeat(node_id, heartbeat_interval=30)
+    until_before_flush = state.query(query)[0]["online_until"]
+    liveness.flush_interval = 0.0
+    state.acknowledge_node_heartbeat(node_id, heartbeat_interval=30)
+    until_after_flush = state.query(query)[0]["online_until"]
+
+    # Assert
+    assert until_before_flush == created_until
+    assert until_after_flush > time.time() + 50
+    assert until_after_flush == liveness.online_until(node_id)
+
+
+def _read_online_until(database: Path) -> float:
+    """Read the deadline of the only node with a new connection."""
+    state = SqliteLinkState(str(database))
+    state.initialize()
+    return float(state.query("SELECT online_until FROM node;")[0]["online_until"])
+
+
+def test_linkstate_factory_flushes_heartbeats_on_close(tmp_path: Path) -> None:
+    """Test that pending heartbeats are written when the factory is closed."""
+    # Prepare
+    database = tmp_path / "state.db"
+    factory = LinkStateFactory(str(database))
+    factory.node_liveness.flush_interval = 3600.0
+    state = factory.state()
+    node_id = state.create_node(heartbeat_interval=10)
+    state.acknowledge_node_heartbeat(node_id, heartbeat_interval=30)
+    until_before_close = _read_online_until(database)
+
+    # Execute
+    factory.close()
+
+    # Assert
+    assert until_before_close < time.time() + 50
+    assert _read_online_until(database) == factory.node_liveness.online_until(node_id)
+
+
+def test_linkstate_factory_flushes_heartbeats_periodically(tmp_path: Path) -> None:
+    """Test that pending heartbeats are written without further heartbeats."""
+    # Prepare
+    database = tmp_path / "state.db"
+    factory = LinkStateFactory(str(database))
+    factory.node_liveness.flush_interval = 0.1
+    state = factory.state()
+    node_id = state.create_node(heartbeat_interval=10)
+
+    # Execute: heartbeats are never flushed when they are received
+    with patch.object(factory.node_liveness, "should_flush", return_value=False):
+        state.acknowledge_node_heartbeat(node_id, heartbeat_interval=30)
+        deadline = time.time() + 5.0
+        while _read_online_until(database) < time.time() + 50:
+            assert time.time() < deadline
+            time.sleep(0.05)
+    factory.close()
+
+    # Assert
+    assert _read_online_until(database) == factory.node_liveness.online_until(node_id)
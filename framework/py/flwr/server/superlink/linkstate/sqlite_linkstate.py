@@ -21,6 +21,7 @@ import json
 import re
 import sqlite3
 import time
+import zlib
 from collections.abc import Sequence
 from logging import DEBUG, ERROR, WARNING
 from typing import Any, Optional, Union, cast
@@ -51,6 +52,8 @@ from flwr.proto.recorddict_pb2 import RecordDict as ProtoRecordDict
 from flwr.server.utils.validator import validate_message
 
 from .linkstate import LinkState
+from .log_buffer import LogBuffer
+from .node_liveness import NodeLiveness
 from .utils import (
     check_node_availability_for_in_message,
     configrecord_from_bytes,
@@ -172,6 +175,8 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
     def __init__(
         self,
         database_path: str,
+        log_buffer: Optional[LogBuffer] = None,
+        node_liveness: Optional[NodeLiveness] = None,
     ) -> None:
         """Initialize an SqliteLinkState.
 
@@ -180,8 +185,21 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         database : (path-like object)
             The path to the database file to be opened. Pass ":memory:" to open
             a connection to a database that is in RAM, instead of on disk.
+        log_buffer : Optional[LogBuffer] (default: None)
+            The buffer holding the latest ServerApp logs. Pass the same buffer to
+            all instances using the same database, so that log streams are served
+            from memory and woken up as soon as new logs are added.
+        node_liveness : Optional[NodeLiveness] (default: None)
+            The tracker of the deadlines until which nodes are online. Pass the
+            same tracker to all instances using the same database, so that
+            heartbeats are written to the database in batches and offline nodes
+            are detected from memory.
         """
         self.database_path = database_path
+        self.log_buffer = log_buffer if log_buffer is not None else LogBuffer()
+        self.node_liveness = (
+            node_liveness if node_liveness is not None else NodeLiveness()
+        )
         self.conn: Optional[sqlite3.Connection] = None
 
     def initialize(self, log_queries: bool = False) -> list[tuple[str]]:
@@ -214,7 +232,21 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         cur.execute(SQL_CREATE_TABLE_PUBLIC_KEY)
         cur.execute(SQL_CREATE_INDEX_ONLINE_UNTIL)
         res = cur.execute("SELECT name FROM sqlite_schema;")
-        return res.fetchall()
+        tables: list[tuple[str]] = res.fetchall()
+
+        if not self.node_liveness.loaded:
+            rows = cur.execute(
+                "SELECT node_id, online_until, heartbeat_interval FROM node;"
+            )
+            self.node_liveness.load(
+                (
+                    convert_sint64_to_uint64(row["node_id"]),
+                    row["online_until"],
+                    row["heartbeat_interval"],
+                )
+                for row in rows
+            )
+        return tables
 
     def query(
         self,
@@ -462,24 +494,16 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         )
 
         # Check node availability
-        dst_node_ids: set[int] = set()
+        node_id_to_online_until: dict[int, float] = {}
         for message_id in message_ids:
-            in_message = found_message_ins_dict[message_id]
-            sint_node_id = convert_uint64_to_sint64(in_message.metadata.dst_node_id)
-            dst_node_ids.add(sint_node_id)
-        query = f"""
-                    SELECT node_id, online_until
-                    FROM node
-                    WHERE node_id IN ({",".join(["?"] * len(dst_node_ids))});
-                """
-        rows = self.query(query, tuple(dst_node_ids))
+            node_id = found_message_ins_dict[message_id].metadata.dst_node_id
+            online_until = self.node_liveness.online_until(node_id)
+            if online_until is not None:
+                node_id_to_online_until[node_id] = online_until
         tmp_ret_dict = check_node_availability_for_in_message(
             inquired_in_message_ids=message_ids,
             found_in_message_dict=found_message_ins_dict,
-            node_id_to_online_until={
-                convert_sint64_to_uint64(row["node_id"]): row["online_until"]
-                for row in rows
-            },
+            node_id_to_online_until=node_id_to_online_until,
             current_time=current,
         )
         ret.update(tmp_ret_dict)
@@ -604,12 +628,13 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         )
 
         # Mark the node online util time.time() + heartbeat_interval
+        online_until = time.time() + heartbeat_interval
         try:
             self.query(
                 query,
                 (
                     sint64_node_id,
-                    time.time() + heartbeat_interval,
+                    online_until,
                     heartbeat_interval,
                     b"",  # Initialize with an empty public key
                 ),
@@ -617,6 +642,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         except sqlite3.IntegrityError:
             log(ERROR, "Unexpected node registration failure.")
             return 0
+        self.node_liveness.add(uint64_node_id, online_until, heartbeat_interval)
 
         # Note: we need to return the uint64 value of the node_id
         return uint64_node_id
@@ -639,6 +665,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
                     raise ValueError(f"Node {node_id} not found")
         except KeyError as exc:
             log(ERROR, {"query": query, "data": params, "exception": exc})
+        self.node_liveness.remove(node_id)
 
     def get_nodes(self, run_id: int) -> set[int]:
         """Retrieve all currently stored node IDs as a set.
@@ -656,13 +683,9 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         if self.query(query, (sint64_run_id,))[0]["COUNT(*)"] == 0:
             return set()
 
-        # Get nodes
-        query = "SELECT node_id FROM node WHERE online_until > ?;"
-        rows = self.query(query, (time.time(),))
-
-        # Convert sint64 node_ids to uint64
-        result: set[int] = {convert_sint64_to_uint64(row["node_id"]) for row in rows}
-        return result
+        # Get nodes, popping only the deadlines that expired since the last call
+        self._flush_node_heartbeats()
+        return self.node_liveness.online_nodes(time.time())
 
     def set_node_public_key(self, node_id: int, public_key: bytes) -> None:
         """Set `public_key` for the specified `node_id`."""
@@ -954,7 +977,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         pending_run_id = None
 
         # Fetch all runs with unset `starting_at` (i.e. they are in PENDING status)
-        query = "SELECT * FROM run WHERE starting_at = '' LIMIT 1;"
+        query = "SELECT * FROM run WHERE starting_at = '' ORDER BY pending_at LIMIT 1;"
         rows = self.query(query)
         if rows:
             pending_run_id = convert_sint64_to_uint64(rows[0]["run_id"])
@@ -986,9 +1009,15 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         HEARTBEAT_PATIENCE = N allows for N-1 missed heartbeat before
         the node is marked as offline.
         """
-        sint64_node_id = convert_uint64_to_sint64(node_id)
+        online_until = time.time() + HEARTBEAT_PATIENCE * heartbeat_interval
 
-        # Check if the node exists in the `node` table
+        # Record the heartbeat in memory, it is written with the next batch
+        if self.node_liveness.heartbeat(node_id, online_until, heartbeat_interval):
+            self._flush_node_heartbeats()
+            return True
+
+        # The node may have been created by another SuperLink on the same database
+        sint64_node_id = convert_uint64_to_sint64(node_id)
         query = "SELECT 1 FROM node WHERE node_id = ?"
         if not self.query(query, (sint64_node_id,)):
             return False
@@ -997,15 +1026,31 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         query = (
             "UPDATE node SET online_until = ?, heartbeat_interval = ? WHERE node_id = ?"
         )
+        self.query(query, (online_until, heartbeat_interval, sint64_node_id))
+        self.node_liveness.add(node_id, online_until, heartbeat_interval)
+        return True
+
+    def flush_node_heartbeats(self) -> None:
+        """Write all heartbeats recorded in memory to the database."""
+        self._flush_node_heartbeats(force=True)
+
+    def _flush_node_heartbeats(self, force: bool = False) -> None:
+        """Write the pending heartbeats in one transaction, if they are due."""
+        if not force and not self.node_liveness.should_flush():
+            return
+        pending = self.node_liveness.pop_pending()
+        if not pending:
+            return
+        query = (
+            "UPDATE node SET online_until = ?, heartbeat_interval = ? WHERE node_id = ?"
+        )
         self.query(
             query,
-            (
-                time.time() + HEARTBEAT_PATIENCE * heartbeat_interval,
-                heartbeat_interval,
-                sint64_node_id,
-            ),
+            [
+                (online_until, heartbeat_interval, convert_uint64_to_sint64(node_id))
+                for node_id, (online_until, heartbeat_interval) in pending.items()
+            ],
         )
-        return True
 
     def acknowledge_app_heartbeat(self, run_id: int, heartbeat_interval: float) -> bool:
         """Acknowledge a heartbeat received from a ServerApp for a given run.
@@ -1078,14 +1123,21 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         # Convert the uint64 value to sint64 for SQLite
         sint64_run_id = convert_uint64_to_sint64(run_id)
 
-        # Store log
+        # Store log, compressed if that makes it smaller
+        timestamp = now().timestamp()
+        log_bytes = log_message.encode("utf-8")
+        compressed = zlib.compress(log_bytes)
+        stored: Union[str, bytes] = (
+            compressed if len(compressed) < len(log_bytes) else log_message
+        )
         try:
             query = """
                 INSERT INTO logs (timestamp, run_id, node_id, log) VALUES (?, ?, ?, ?);
             """
-            self.query(query, (now().timestamp(), sint64_run_id, 0, log_message))
+            self.query(query, (timestamp, sint64_run_id, 0, stored))
         except sqlite3.IntegrityError:
             raise ValueError(f"Run {run_id} not found") from None
+        self.log_buffer.append(run_id, timestamp, log_message)
 
     def get_serverapp_log(
         self, run_id: int, after_timestamp: Optional[float]
@@ -1099,17 +1151,44 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         if not self.query(query, (sint64_run_id,)):
             raise ValueError(f"Run {run_id} not found")
 
+        # Serve the logs from memory if possible
+        buffered = self.log_buffer.get(run_id, after_timestamp)
+        if buffered is not None:
+            return buffered
+
         # Retrieve logs
         if after_timestamp is None:
             after_timestamp = 0.0
         query = """
             SELECT log, timestamp FROM logs
-            WHERE run_id = ? AND node_id = ? AND timestamp > ?;
+            WHERE run_id = ? AND node_id = ? AND timestamp > ?
+            ORDER BY timestamp;
         """
         rows = self.query(query, (sint64_run_id, 0, after_timestamp))
-        rows.sort(key=lambda x: x["timestamp"])
         latest_timestamp = rows[-1]["timestamp"] if rows else 0.0
-        return "".join(row["log"] for row in rows), latest_timestamp
+        logs = (
+            (
+                zlib.decompress(row["log"]).decode("utf-8")
+                if isinstance(row["log"], bytes)
+                else row["log"]
+            )
+            for row in rows
+        )
+        return "".join(logs), latest_timestamp
+
+    def wait_for_serverapp_log(
+        self, run_id: int, after_timestamp: Optional[float], timeout: float
+    ) -> bool:
+        """Wait for new ServerApp logs for the specified `run_id`."""
+        # Convert the uint64 value to sint64 for SQLite
+        sint64_run_id = convert_uint64_to_sint64(run_id)
+
+        # Check if the run_id exists
+        query = "SELECT run_id FROM run WHERE run_id = ?;"
+        if not self.query(query, (sint64_run_id,)):
+            raise ValueError(f"Run {run_id} not found")
+
+        return self.log_buffer.wait(run_id, after_timestamp, timeout)
 
     def get_valid_message_ins(self, message_id: str) -> Optional[dict[str, Any]]:
         """Check if the Message exists and is valid (not expired).
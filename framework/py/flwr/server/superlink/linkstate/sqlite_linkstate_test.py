@@ -21,10 +21,12 @@ from copy import deepcopy
 from parameterized import parameterized
 
 from flwr.app.error import Error
+from flwr.common import ConfigRecord
 from flwr.common.constant import SUPERLINK_NODE_ID
 from flwr.common.serde import message_from_proto
 from flwr.server.superlink.linkstate.linkstate_test import create_ins_message
 from flwr.server.superlink.linkstate.sqlite_linkstate import (
+    SqliteLinkState,
     dict_to_message,
     message_to_dict,
 )
@@ -78,6 +80,24 @@ class SqliteStateTest(unittest.TestCase):
             assert res_msg.content == msg.content
         assert res_msg.metadata == msg.metadata
 
+    def test_serverapp_log_compressed(self) -> None:
+        """Test that long logs are stored compressed and read back from storage."""
+        # Prepare
+        state = SqliteLinkState(":memory:")
+        state.initialize()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        log_message = "INFO :      Round 1 completed\n" * 100
+
+        # Execute
+        state.add_serverapp_log(run_id, log_message)
+        stored = state.query("SELECT log FROM logs;")[0]["log"]
+        retrieved_logs, _ = state.get_serverapp_log(run_id, after_timestamp=None)
+
+        # Assert
+        assert isinstance(stored, bytes)
+        assert len(stored) < len(log_message)
+        assert retrieved_logs == log_message
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
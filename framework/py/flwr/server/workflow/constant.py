@@ -19,6 +19,7 @@ from __future__ import annotations
 
 MAIN_CONFIGS_RECORD = "config"
 MAIN_PARAMS_RECORD = "parameters"
+MAIN_LATENCY_RECORD = "latency"
 
 
 class Key:
@@ -16,9 +16,11 @@
 
 
 import io
+import math
+import time
 import timeit
 from logging import INFO, WARN
-from typing import Optional, Union, cast
+from typing import Optional, TypeVar, Union, cast
 
 import flwr.common.recorddict_compat as compat
 from flwr.common import (
@@ -34,12 +36,20 @@ from flwr.common import (
 )
 from flwr.common.constant import MessageType, MessageTypeLegacy
 
+from ..centralized_evaluation import CentralizedEvaluator
 from ..client_proxy import ClientProxy
 from ..compat.app_utils import start_update_client_manager_thread
 from ..compat.legacy_context import LegacyContext
-from ..grid import Grid
+from ..grid import Grid, InMemoryGrid
 from ..typing import Workflow
-from .constant import MAIN_CONFIGS_RECORD, MAIN_PARAMS_RECORD, Key
+from .constant import MAIN_CONFIGS_RECORD, MAIN_LATENCY_RECORD, MAIN_PARAMS_RECORD, Key
+
+# Weight of the most recent observation in the per-node latency moving average
+LATENCY_EMA_WEIGHT = 0.5
+# Sleep duration between pulls while waiting for a quorum (in seconds)
+QUORUM_PULL_INTERVAL = 3.0
+
+InsT = TypeVar("InsT")
 
 
 class DefaultWorkflow:
@@ -57,7 +67,7 @@ class DefaultWorkflow:
         self.fit_workflow: Workflow = fit_workflow
         self.evaluate_workflow: Workflow = evaluate_workflow
 
-    def __call__(self, grid: Grid, context: Context) -> None:
+    def __call__(self, grid: Grid, context: Context) -> None:  # pylint: disable=R0914
         """Execute the workflow."""
         if not isinstance(context, LegacyContext):
             raise TypeError(
@@ -81,20 +91,36 @@ class DefaultWorkflow:
         cfg = ConfigRecord()
         cfg[Key.START_TIME] = start_time
         context.state.config_records[MAIN_CONFIGS_RECORD] = cfg
-
-        for current_round in range(1, context.config.num_rounds + 1):
-            log(INFO, "")
-            log(INFO, "[ROUND %s]", current_round)
-            cfg[Key.CURRENT_ROUND] = current_round
-
-            # Fit round
-            self.fit_workflow(grid, context)
-
-            # Centralized evaluation
-            default_centralized_evaluation_workflow(grid, context)
-
-            # Evaluate round
-            self.evaluate_workflow(grid, context)
+        evaluator = CentralizedEvaluator(
+            context.strategy,
+            context.history,
+            evaluate_every=context.config.evaluate_every,
+            background=context.config.background_evaluation,
+        )
+        evaluator.start_time = start_time
+
+        try:
+            for current_round in range(1, context.config.num_rounds + 1):
+                log(INFO, "")
+                log(INFO, "[ROUND %s]", current_round)
+                cfg[Key.CURRENT_ROUND] = current_round
+
+                # Fit round
+                self.fit_workflow(grid, context)
+
+                # Centralized evaluation
+                evaluator.collect()
+                if evaluator.should_evaluate(current_round, context.config.num_rounds):
+                    parameters = compat.arrayrecord_to_parameters(
+                        record=context.state.array_records[MAIN_PARAMS_RECORD],
+                        keep_input=True,
+                    )
+                    evaluator.submit(current_round, parameters)
+
+                # Evaluate round
+                self.evaluate_workflow(grid, context)
+        finally:
+            evaluator.shutdown()
 
         # Bookkeeping and log results
         end_time = timeit.default_timer()
@@ -169,20 +195,8 @@ def default_init_params_workflow(grid: Grid, context: Context) -> None:
     context.state.array_records[MAIN_PARAMS_RECORD] = arr_record
 
     # Evaluate initial parameters
-    log(INFO, "Starting evaluation of initial global parameters")
     parameters = compat.arrayrecord_to_parameters(arr_record, keep_input=True)
-    res = context.strategy.evaluate(0, parameters=parameters)
-    if res is not None:
-        log(
-            INFO,
-            "initial parameters (loss, other metrics): %s, %s",
-            res[0],
-            res[1],
-        )
-        context.history.add_loss_centralized(server_round=0, loss=res[0])
-        context.history.add_metrics_centralized(server_round=0, metrics=res[1])
-    else:
-        log(INFO, "Evaluation returned no results (`None`)")
+    CentralizedEvaluator(context.strategy, context.history).submit(0, parameters)
 
 
 def default_centralized_evaluation_workflow(_: Grid, context: Context) -> None:
@@ -200,21 +214,9 @@ def default_centralized_evaluation_workflow(_: Grid, context: Context) -> None:
         record=context.state.array_records[MAIN_PARAMS_RECORD],
         keep_input=True,
     )
-    res_cen = context.strategy.evaluate(current_round, parameters=parameters)
-    if res_cen is not None:
-        loss_cen, metrics_cen = res_cen
-        log(
-            INFO,
-            "fit progress: (%s, %s, %s, %s)",
-            current_round,
-            loss_cen,
-            metrics_cen,
-            timeit.default_timer() - start_time,
-        )
-        context.history.add_loss_centralized(server_round=current_round, loss=loss_cen)
-        context.history.add_metrics_centralized(
-            server_round=current_round, metrics=metrics_cen
-        )
+    evaluator = CentralizedEvaluator(context.strategy, context.history)
+    evaluator.start_time = start_time
+    evaluator.submit(current_round, parameters)
 
 
 def default_fit_workflow(grid: Grid, context: Context) -> None:  # pylint: disable=R0914
@@ -245,6 +247,11 @@ def default_fit_workflow(grid: Grid, context: Context) -> None:  # pylint: disab
         context.client_manager.num_available(),
     )
 
+    # Over-select clients to compensate for stragglers
+    num_sampled = len(client_instructions)
+    quorum = math.ceil(context.config.quorum_fraction * num_sampled)
+    client_instructions = _over_select(context, client_instructions)
+
     # Build dictionary mapping node_id to ClientProxy
     node_id_to_proxy = {proxy.node_id: proxy for proxy, _ in client_instructions}
 
@@ -254,14 +261,15 @@ def default_fit_workflow(grid: Grid, context: Context) -> None:  # pylint: disab
             content=compat.fitins_to_recorddict(fitins, True),
             dst_node_id=proxy.node_id,
             message_type=MessageType.TRAIN,
+            ttl=context.config.round_timeout,
             group_id=str(current_round),
         )
         for proxy, fitins in client_instructions
     ]
 
     # Send instructions to clients and
-    # collect `fit` results from all clients participating in this round
-    messages = list(grid.send_and_receive(out_messages))
+    # collect `fit` results until a quorum is reached or the deadline passes
+    messages = _send_and_receive_until_quorum(grid, context, out_messages, quorum)
     del out_messages
     num_failures = len([msg for msg in messages if msg.has_error()])
 
@@ -287,6 +295,15 @@ def default_fit_workflow(grid: Grid, context: Context) -> None:  # pylint: disab
         else:
             failures.append(Exception(msg.error))
 
+    # Only aggregate as many results as clients were sampled, the fastest first
+    if len(results) > num_sampled:
+        log(
+            INFO,
+            "aggregate_fit: discarding %s results from over-selected clients",
+            len(results) - num_sampled,
+        )
+        results = results[:num_sampled]
+
     aggregated_result = context.strategy.aggregate_fit(current_round, results, failures)
     parameters_aggregated, metrics_aggregated = aggregated_result
 
@@ -336,14 +353,16 @@ def default_evaluate_workflow(grid: Grid, context: Context) -> None:
             content=compat.evaluateins_to_recorddict(evalins, True),
             dst_node_id=proxy.node_id,
             message_type=MessageType.EVALUATE,
+            ttl=context.config.round_timeout,
             group_id=str(current_round),
         )
         for proxy, evalins in client_instructions
     ]
 
     # Send instructions to clients and
-    # collect `evaluate` results from all clients participating in this round
-    messages = list(grid.send_and_receive(out_messages))
+    # collect `evaluate` results until a quorum is reached or the deadline passes
+    quorum = math.ceil(context.config.quorum_fraction * len(out_messages))
+    messages = _send_and_receive_until_quorum(grid, context, out_messages, quorum)
     del out_messages
     num_failures = len([msg for msg in messages if msg.has_error()])
 
@@ -383,3 +402,110 @@ def default_evaluate_workflow(grid: Grid, context: Context) -> None:
         context.history.add_metrics_distributed(
             server_round=current_round, metrics=metrics_aggregated
         )
+
+
+def _over_select(
+    context: LegacyContext, client_instructions: list[tuple[ClientProxy, InsT]]
+) -> list[tuple[ClientProxy, InsT]]:
+    """Add the fastest unselected clients on top of those sampled by the strategy.
+
+    Strategies only configure the clients they sample themselves, so the additional
+    clients receive the same instructions as the first sampled client. A warning is
+    logged if the strategy gave different instructions to the sampled clients. Clients
+    without any recorded latency are preferred so that they get explored.
+    """
+    num_extra = math.ceil(
+        len(client_instructions) * context.config.over_selection_factor
+    ) - len(client_instructions)
+    if num_extra <= 0:
+        return client_instructions
+
+    latencies = context.state.config_records.get(MAIN_LATENCY_RECORD, ConfigRecord())
+    selected = {proxy.node_id for proxy, _ in client_instructions}
+    candidates = [
+        proxy
+        for proxy in context.client_manager.all().values()
+        if proxy.node_id not in selected
+    ]
+    candidates.sort(key=lambda proxy: cast(float, latencies.get(str(proxy.node_id), 0)))
+    ins = client_instructions[0][1]
+    extra = [(proxy, ins) for proxy in candidates[:num_extra]]
+    if extra:
+        log(INFO, "Over-selected %s additional clients", len(extra))
+        if any(other is not ins and other != ins for _, other in client_instructions):
+            log(
+                WARN,
+                "The strategy configured the sampled clients differently, the "
+                "over-selected clients receive the instructions of the first one",
+            )
+    return client_instructions + extra
+
+
+def _send_and_receive_until_quorum(  # pylint: disable=R0914
+    grid: Grid, context: LegacyContext, messages: list[Message], quorum: int
+) -> list[Message]:
+    """Push messages and pull replies until a quorum or the round deadline is reached.
+
+    A quorum is reached once `quorum` replies with content have been received. The
+    replies are returned in the order they were received, and the response latency
+    of each destination node is recorded in the context state.
+    Unanswered instructions are deleted from the LinkState when running with an
+    `InMemoryGrid`; otherwise they expire once their TTL (the round deadline) elapses.
+    """
+    timeout = context.config.round_timeout
+    start_time = time.time()
+    msg_ids = set(grid.push_messages(messages))
+    msg_id_to_node_id = {
+        msg.metadata.message_id: msg.metadata.dst_node_id
+        for msg in messages
+        if msg.metadata.message_id in msg_ids
+    }
+    pull_interval = (
+        grid.pull_interval if isinstance(grid, InMemoryGrid) else QUORUM_PULL_INTERVAL
+    )
+
+    # Pull replies
+    latencies = context.state.config_records.setdefault(
+        MAIN_LATENCY_RECORD, ConfigRecord()
+    )
+    ret: list[Message] = []
+    num_ok = 0
+    while msg_ids:
+        res_msgs = list(grid.pull_messages(msg_ids))
+        elapsed = time.time() - start_time
+        for msg in res_msgs:
+            msg_id = msg.metadata.reply_to_message_id
+            msg_ids.discard(msg_id)
+            _record_latency(latencies, msg_id_to_node_id[msg_id], elapsed)
+            num_ok += int(msg.has_content())
+        ret.extend(res_msgs)
+        if not msg_ids or num_ok >= quorum:
+            break
+        if timeout is not None and elapsed >= timeout:
+            log(INFO, "Round deadline of %ss reached", timeout)
+            break
+        # Do not sleep past the round deadline
+        sleep_duration = pull_interval
+        if timeout is not None:
+            remaining = timeout - (time.time() - start_time)
+            sleep_duration = max(0.0, min(pull_interval, remaining))
+        time.sleep(sleep_duration)
+
+    # Penalize and cancel the stragglers
+    if msg_ids:
+        elapsed = time.time() - start_time
+        for msg_id in msg_ids:
+            _record_latency(latencies, msg_id_to_node_id[msg_id], elapsed)
+        log(INFO, "Cancelling %s outstanding messages", len(msg_ids))
+        if isinstance(grid, InMemoryGrid):
+            grid.state.delete_messages(message_ins_ids=msg_ids)
+    return ret
+
+
+def _record_latency(latencies: ConfigRecord, node_id: int, latency: float) -> None:
+    """Update the moving average of the response latency of a node."""
+    key = str(node_id)
+    if key in latencies:
+        prev = cast(float, latencies[key])
+        latency = LATENCY_EMA_WEIGHT * latency + (1 - LATENCY_EMA_WEIGHT) * prev
+    latencies[key] = latency
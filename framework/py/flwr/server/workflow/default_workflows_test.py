@@ -0,0 +1,242 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the default workflows."""
+
+
+import time
+import unittest
+from collections.abc import Iterable
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+from flwr.common import (
+    ArrayRecord,
+    Code,
+    ConfigRecord,
+    Context,
+    FitIns,
+    FitRes,
+    Message,
+    Parameters,
+    RecordDict,
+    Status,
+)
+from flwr.common import recorddict_compat as compat
+from flwr.common.constant import MessageType
+
+from ..client_manager import SimpleClientManager
+from ..client_proxy import ClientProxy
+from ..compat.legacy_context import LegacyContext
+from ..grid import Grid
+from ..server_config import ServerConfig
+from .constant import MAIN_CONFIGS_RECORD, MAIN_LATENCY_RECORD, MAIN_PARAMS_RECORD, Key
+from .default_workflows import (
+    _over_select,
+    _send_and_receive_until_quorum,
+    default_centralized_evaluation_workflow,
+    default_fit_workflow,
+)
+
+
+def _make_proxy(node_id: int) -> ClientProxy:
+    proxy = MagicMock(spec=ClientProxy)
+    proxy.node_id = node_id
+    proxy.cid = str(node_id)
+    return proxy
+
+
+def _make_context(config: ServerConfig, num_nodes: int) -> LegacyContext:
+    client_manager = SimpleClientManager()
+    for node_id in range(1, num_nodes + 1):
+        client_manager.register(_make_proxy(node_id))
+    context = Context(
+        run_id=1, node_id=0, node_config={}, state=RecordDict(), run_config={}
+    )
+    return LegacyContext(context, config=config, client_manager=client_manager)
+
+
+class _ReplyingGrid(MagicMock):
+    """A mock Grid replying only to the messages sent to `responsive` nodes."""
+
+    def __init__(
+        self, responsive: set[int], content: Optional[RecordDict] = None
+    ) -> None:
+        super().__init__(spec=Grid)
+        self.responsive = responsive
+        self.content = content or RecordDict()
+        self.pushed: dict[str, Message] = {}
+
+    def push_messages(self, messages: Iterable[Message]) -> Iterable[str]:
+        """Assign message IDs and record the messages."""
+        for idx, msg in enumerate(messages):
+            msg.metadata.__dict__["_message_id"] = str(idx)
+            self.pushed[str(idx)] = msg
+        return list(self.pushed)
+
+    def pull_messages(self, message_ids: Iterable[str]) -> Iterable[Message]:
+        """Reply to the messages sent to responsive nodes."""
+        return [
+            Message(self.content, reply_to=self.pushed[msg_id])
+            for msg_id in message_ids
+            if self.pushed[msg_id].metadata.dst_node_id in self.responsive
+        ]
+
+
+class TestDefaultWorkflowsQuorum(unittest.TestCase):
+    """Tests for over-selection and quorum-based reply collection."""
+
+    def test_over_select_prefers_fast_clients(self) -> None:
+        """Test that over-selection picks the clients with the lowest latency."""
+        # Prepare
+        context = _make_context(ServerConfig(over_selection_factor=1.5), 5)
+        context.state.config_records[MAIN_LATENCY_RECORD] = ConfigRecord(
+            {"3": 10.0, "4": 1.0, "5": 5.0}
+        )
+        proxies = list(context.client_manager.all().values())
+        instructions = [(proxies[0], "ins-1"), (proxies[1], "ins-2")]
+
+        # Execute
+        selected = _over_select(context, instructions)
+
+        # Assert
+        self.assertEqual([proxy.node_id for proxy, _ in selected], [1, 2, 4])
+        self.assertEqual(selected[-1][1], "ins-1")
+
+    def test_over_select_warns_about_different_instructions(self) -> None:
+        """Test that reusing the instructions of the first client is reported."""
+        context = _make_context(ServerConfig(over_selection_factor=2.0), 4)
+        proxies = list(context.client_manager.all().values())
+        instructions = [(proxies[0], "ins-1"), (proxies[1], "ins-2")]
+
+        with self.assertLogs("flwr", level="WARNING"):
+            _over_select(context, instructions)
+
+    def test_no_over_selection_by_default(self) -> None:
+        """Test that the instructions are untouched with the default config."""
+        context = _make_context(ServerConfig(), 5)
+        proxies = list(context.client_manager.all().values())
+        instructions = [(proxies[0], "ins")]
+
+        self.assertEqual(_over_select(context, instructions), instructions)
+
+    def test_quorum_ends_round_early(self) -> None:
+        """Test that replies stop being collected once the quorum is reached."""
+        # Prepare
+        context = _make_context(ServerConfig(), 3)
+        grid = _ReplyingGrid(responsive={1, 2})
+        messages = [Message(RecordDict(), i, MessageType.TRAIN) for i in (1, 2, 3)]
+
+        # Execute
+        replies = _send_and_receive_until_quorum(grid, context, messages, quorum=2)
+
+        # Assert
+        self.assertEqual(len(replies), 2)
+        latencies = context.state.config_records[MAIN_LATENCY_RECORD]
+        self.assertEqual(set(latencies.keys()), {"1", "2", "3"})
+
+    @patch("flwr.server.workflow.default_workflows.time.sleep")
+    def test_deadline_ends_round(self, mock_sleep: MagicMock) -> None:
+        """Test that replies stop being collected once the deadline passes."""
+        # Prepare
+        context = _make_context(ServerConfig(round_timeout=0.0), 3)
+        grid = _ReplyingGrid(responsive={1})
+        messages = [Message(RecordDict(), i, MessageType.TRAIN) for i in (1, 2, 3)]
+
+        # Execute
+        replies = _send_and_receive_until_quorum(grid, context, messages, quorum=3)
+
+        # Assert
+        self.assertEqual(len(replies), 1)
+        mock_sleep.assert_not_called()
+
+    def test_sleep_is_capped_at_deadline(self) -> None:
+        """Test that no pull interval extends past the round deadline."""
+        # Prepare: a fake clock advanced by the sleeps
+        clock = [0.0]
+        context = _make_context(ServerConfig(round_timeout=1.0), 2)
+        grid = _ReplyingGrid(responsive={1})
+        messages = [Message(RecordDict(), i, MessageType.TRAIN) for i in (1, 2)]
+
+        # Execute
+        with patch(
+            "flwr.server.workflow.default_workflows.time", wraps=time
+        ) as mock_time:
+            mock_time.time.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = lambda t: clock.__setitem__(0, clock[0] + t)
+            replies = _send_and_receive_until_quorum(grid, context, messages, 2)
+
+        # Assert
+        self.assertEqual(len(replies), 1)
+        mock_time.sleep.assert_called_once_with(1.0)
+
+    def test_fit_aggregates_sampled_number_of_results(self) -> None:
+        """Test that results of over-selected clients beyond the sample are dropped."""
+        # Prepare
+        context = _make_context(ServerConfig(over_selection_factor=2.0), 4)
+        proxies = list(context.client_manager.all().values())
+        parameters = Parameters(tensors=[], tensor_type="")
+        context.strategy = MagicMock()
+        context.strategy.configure_fit.return_value = [
+            (proxy, FitIns(parameters, {})) for proxy in proxies[:2]
+        ]
+        context.strategy.aggregate_fit.return_value = (None, {})
+        context.state.config_records[MAIN_CONFIGS_RECORD] = ConfigRecord(
+            {Key.CURRENT_ROUND: 1}
+        )
+        context.state.array_records[MAIN_PARAMS_RECORD] = ArrayRecord()
+        fitres = FitRes(Status(Code.OK, ""), parameters, 1, {})
+        grid = _ReplyingGrid(
+            responsive={1, 2, 3, 4},
+            content=compat.fitres_to_recorddict(fitres, False),
+        )
+
+        # Execute
+        default_fit_workflow(grid, context)
+
+        # Assert: four clients were asked, but only two results are aggregated
+        self.assertEqual(len(grid.pushed), 4)
+        _, results, failures = context.strategy.aggregate_fit.call_args.args
+        self.assertEqual(len(results), 2)
+        self.assertEqual(failures, [])
+
+    def test_invalid_config(self) -> None:
+        """Test that invalid over-selection and quorum settings are rejected."""
+        with self.assertRaises(ValueError):
+            ServerConfig(over_selection_factor=0.5)
+        with self.assertRaises(ValueError):
+            ServerConfig(quorum_fraction=0.0)
+
+
+class TestCentralizedEvaluationWorkflow(unittest.TestCase):
+    """Tests for the default centralized evaluation workflow."""
+
+    def test_results_are_added_to_history(self) -> None:
+        """Test that the centralized evaluation of the current round is recorded."""
+        # Prepare
+        context = _make_context(ServerConfig(), 0)
+        context.strategy = MagicMock()
+        context.strategy.evaluate.return_value = (0.5, {"acc": 0.9})
+        context.state.config_records[MAIN_CONFIGS_RECORD] = ConfigRecord(
+            {Key.CURRENT_ROUND: 2, Key.START_TIME: 0.0}
+        )
+        context.state.array_records[MAIN_PARAMS_RECORD] = ArrayRecord()
+
+        # Execute
+        default_centralized_evaluation_workflow(MagicMock(spec=Grid), context)
+
+        # Assert
+        self.assertEqual(context.strategy.evaluate.call_args.args[0], 2)
+        self.assertEqual(context.history.losses_centralized, [(2, 0.5)])
+        self.assertEqual(context.history.metrics_centralized, {"acc": [(2, 0.9)]})
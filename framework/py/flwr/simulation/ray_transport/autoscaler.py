@@ -0,0 +1,185 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Autoscaler of the actor pool of the Simulation Engine."""
+
+
+import math
+import threading
+from logging import DEBUG, WARNING
+from typing import Optional
+
+import ray
+
+from flwr.common.logger import log
+
+from .ray_actor import ActorPoolMetrics, BasicActorPool
+
+# Seconds between two resizes of the actor pool
+AUTOSCALE_INTERVAL = 5.0
+# Granularity of the CPUs reserved by each actor
+NUM_CPUS_STEP = 0.25
+# Utilization above which actors are added, and below which actors are removed
+SCALE_UP_UTILIZATION = 0.9
+SCALE_DOWN_UTILIZATION = 0.5
+# Seconds to wait for idle actors to report their resource usage
+USAGE_TIMEOUT = 1.0
+
+
+class ActorPoolAutoscaler:
+    """Periodically resize a `BasicActorPool` to match the observed load.
+
+    At every step, the autoscaler first packs the actors: new actors reserve the
+    number of CPU cores that jobs were observed to use, rounded up to
+    `NUM_CPUS_STEP` and capped by the `num_cpus` in `client_resources`. GPUs are
+    reserved as requested. On CPU-only clusters, idle actors reserving more CPUs are
+    replaced by smaller ones while jobs wait, which schedules clients on fractions of
+    CPUs when they do not use all the CPUs they request.
+
+    It then sizes the pool: actors are added while jobs wait for an idle actor or the
+    pool is highly utilized, as long as the cluster has the resources to host them.
+    Actors are gradually removed while the pool is underutilized. The pool never
+    holds more actors than fit in the memory of the cluster, given the peak memory
+    observed per actor.
+
+    Parameters
+    ----------
+    pool : BasicActorPool
+        The actor pool to resize.
+    min_actors : int
+        The minimum number of actors in the pool.
+    max_actors : int
+        The maximum number of actors in the pool.
+    interval : float (default: AUTOSCALE_INTERVAL)
+        The number of seconds between two steps.
+    """
+
+    def __init__(
+        self,
+        pool: BasicActorPool,
+        min_actors: int,
+        max_actors: int,
+        interval: float = AUTOSCALE_INTERVAL,
+    ) -> None:
+        self.pool = pool
+        self.min_actors = min_actors
+        self.max_actors = max_actors
+        self.interval = interval
+        # The metrics of the pool collected at the last step
+        self.metrics: Optional[ActorPoolMetrics] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start resizing the pool in a background thread."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop resizing the pool."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.step()
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                log(WARNING, "Failed to resize the actor pool: %s", ex)
+
+    def step(self) -> ActorPoolMetrics:
+        """Pack the actors and resize the pool once."""
+        memory_per_actor = self._pack()
+        metrics = self.pool.metrics()
+        if metrics.num_waiting > 0 and not self.pool.actor_resources.get("num_gpus"):
+            # Free the CPUs held by idle actors that reserve more than needed
+            num_repacked = self.pool.repack(self.max_actors)
+            if num_repacked:
+                log(DEBUG, "Repacked idle actors into %i actors", num_repacked)
+        num_actors = self._target_num_actors(metrics, memory_per_actor)
+        log(
+            DEBUG,
+            "Actor pool: %i actors (%i idle, %i jobs waiting), %.0f%% utilization, "
+            "%.2fs per job, %s CPUs per new actor",
+            metrics.num_actors,
+            metrics.num_idle,
+            metrics.num_waiting,
+            100 * metrics.utilization,
+            metrics.mean_job_time,
+            self.pool.actor_resources.get("num_cpus"),
+        )
+        if num_actors != self.pool.num_actors:
+            log(
+                DEBUG,
+                "Resizing actor pool from %i to %i actors",
+                self.pool.num_actors,
+                num_actors,
+            )
+            self.pool.resize(num_actors)
+        self.metrics = metrics
+        return metrics
+
+    def _pack(self) -> int:
+        """Set the CPUs of new actors to the observed usage.
+
+        Return the peak memory used by an actor, or 0 if unknown.
+        """
+        usages = self.pool.collect_usage(timeout=USAGE_TIMEOUT)
+        wall_time = sum(usage.wall_time for usage in usages)
+        if wall_time > 0:
+            cores = sum(usage.cpu_time for usage in usages) / wall_time
+            num_cpus = max(
+                NUM_CPUS_STEP, math.ceil(cores / NUM_CPUS_STEP) * NUM_CPUS_STEP
+            )
+            self.pool.actor_resources["num_cpus"] = min(
+                num_cpus, self.pool.client_resources["num_cpus"]
+            )
+        return max((usage.peak_memory for usage in usages), default=0)
+
+    def _target_num_actors(
+        self, metrics: ActorPoolMetrics, memory_per_actor: int
+    ) -> int:
+        """Return the number of actors the pool should hold."""
+        num_actors = self.pool.num_actors
+        if metrics.num_waiting > 0 or metrics.utilization > SCALE_UP_UTILIZATION:
+            num_new = min(max(1, metrics.num_waiting), self._num_actors_available())
+            num_actors += num_new
+        elif metrics.utilization < SCALE_DOWN_UTILIZATION:
+            # Shrink by at most a quarter per step, as recreating actors is costly
+            num_actors = max(
+                math.ceil(num_actors * metrics.utilization / SCALE_UP_UTILIZATION),
+                num_actors - max(1, num_actors // 4),
+            )
+
+        if memory_per_actor > 0:
+            total_memory = ray.cluster_resources().get("memory", 0)
+            if total_memory > 0:
+                num_actors = min(num_actors, int(total_memory / memory_per_actor))
+        return max(self.min_actors, min(self.max_actors, num_actors))
+
+    def _num_actors_available(self) -> int:
+        """Return how many new actors fit in the resources available in the cluster.
+
+        Resources are summed over the nodes of the cluster, which overestimates the
+        number of actors when resources are fragmented across nodes.
+        """
+        available = ray.available_resources()
+        resources = self.pool.actor_resources
+        num_actors = int(available.get("CPU", 0) / resources["num_cpus"])
+        num_gpus = resources.get("num_gpus", 0.0)
+        if num_gpus > 0:
+            num_actors = min(num_actors, int(available.get("GPU", 0) / num_gpus))
+        return num_actors
@@ -0,0 +1,141 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for ActorPoolAutoscaler."""
+
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import ray
+
+from flwr.client.client_app import ClientApp
+
+from .autoscaler import ActorPoolAutoscaler
+from .ray_actor import ActorPoolMetrics, ActorUsage, BasicActorPool, ClientAppActor
+
+
+def _metrics(
+    num_actors: int, num_waiting: int = 0, utilization: float = 0.0
+) -> ActorPoolMetrics:
+    return ActorPoolMetrics(
+        num_actors=num_actors,
+        num_idle=0,
+        num_waiting=num_waiting,
+        num_jobs=10,
+        utilization=utilization,
+        mean_job_time=1.0,
+    )
+
+
+def _pool(
+    num_actors: int, usages: list[ActorUsage], metrics: ActorPoolMetrics
+) -> MagicMock:
+    pool = MagicMock(spec=BasicActorPool)
+    pool.num_actors = num_actors
+    pool.client_resources = {"num_cpus": 2, "num_gpus": 0.0}
+    pool.actor_resources = {"num_cpus": 2, "num_gpus": 0.0}
+    pool.collect_usage.return_value = usages
+    pool.metrics.return_value = metrics
+    pool.repack.return_value = 0
+    return pool
+
+
+@patch("ray.cluster_resources", return_value={"CPU": 4.0, "memory": 8e9})
+@patch("ray.available_resources", return_value={"CPU": 1.0})
+class TestActorPoolAutoscaler(unittest.TestCase):
+    """Tests for ActorPoolAutoscaler."""
+
+    def test_pack_to_observed_cpu_usage(self, *_: MagicMock) -> None:
+        """Test that new actors reserve the CPUs jobs were observed to use."""
+        # Prepare
+        usages = [ActorUsage(0.5, 2.0, 0), ActorUsage(0.1, 0.5, 0)]
+        pool = _pool(2, usages, _metrics(2))
+
+        # Execute
+        ActorPoolAutoscaler(pool, min_actors=1, max_actors=8).step()
+
+        # Assert
+        self.assertEqual(pool.actor_resources["num_cpus"], 0.25)
+
+    def test_scale_up_while_jobs_wait(self, *_: MagicMock) -> None:
+        """Test that actors are added for waiting jobs, within available CPUs."""
+        # Prepare
+        usages = [ActorUsage(0.9, 1.0, 0)]
+        pool = _pool(4, usages, _metrics(4, num_waiting=3, utilization=1.0))
+
+        # Execute
+        ActorPoolAutoscaler(pool, min_actors=1, max_actors=16).step()
+
+        # Assert
+        pool.repack.assert_called_once_with(16)
+        pool.resize.assert_called_once_with(5)  # One 1-CPU actor fits
+
+    def test_scale_down_when_underutilized(self, *_: MagicMock) -> None:
+        """Test that actors are gradually removed from an underutilized pool."""
+        # Prepare
+        pool = _pool(8, [], _metrics(8, utilization=0.1))
+
+        # Execute
+        ActorPoolAutoscaler(pool, min_actors=1, max_actors=16).step()
+
+        # Assert
+        pool.resize.assert_called_once_with(6)
+
+    def test_memory_limits_pool_size(self, *_: MagicMock) -> None:
+        """Test that the pool holds no more actors than fit in memory."""
+        # Prepare
+        usages = [ActorUsage(1.0, 1.0, int(2e9))]
+        pool = _pool(6, usages, _metrics(6, utilization=0.7))
+
+        # Execute
+        ActorPoolAutoscaler(pool, min_actors=1, max_actors=16).step()
+
+        # Assert
+        pool.resize.assert_called_once_with(4)
+
+
+class TestBasicActorPool(unittest.TestCase):
+    """Tests for resizing a BasicActorPool."""
+
+    def setUp(self) -> None:
+        """Start Ray."""
+        ray.init(num_cpus=1)
+
+    def tearDown(self) -> None:
+        """Shut Ray down."""
+        ray.shutdown()
+
+    def test_resize_and_metrics(self) -> None:
+        """Test that the pool can be resized and reports its utilization."""
+        # Prepare
+        pool = BasicActorPool(ClientAppActor, {"num_cpus": 0.5}, actor_kwargs={})
+        pool.add_actors_to_pool(pool.actors_capacity)
+
+        # Execute
+        future = pool.submit_batch(ClientApp, [])
+        # The idle actor is removed now, the busy one once its job is completed
+        pool.resize(0)
+        num_actors_before = pool.num_actors
+        ray.get(future)
+        pool.add_actor_back_to_pool(future)
+        metrics = pool.metrics()
+
+        # Assert
+        self.assertEqual(pool.actors_capacity, 2)
+        self.assertEqual(num_actors_before, 1)
+        self.assertEqual(pool.num_actors, 0)
+        self.assertEqual(metrics.num_jobs, 1)
+        self.assertEqual(metrics.num_idle, 0)
+        self.assertGreater(metrics.mean_job_time, 0.0)
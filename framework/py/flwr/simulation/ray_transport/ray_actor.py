@@ -15,8 +15,11 @@
 """Ray-based Flower Actor and ActorPool implementation."""
 
 
+import sys
 import threading
+import time
 from abc import ABC
+from dataclasses import dataclass
 from logging import DEBUG, ERROR, WARNING
 from typing import Any, Callable, Optional, Union
 
@@ -28,28 +31,88 @@ from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppE
 from flwr.common import Context, Message
 from flwr.common.logger import log
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
 ClientAppFn = Callable[[], ClientApp]
+# References to the data of arrays in the object store, keyed by record and array name
+SharedArrayRefs = dict[tuple[str, str], "ObjectRef[Any]"]
+# A job of a batch: the message, the cid, the context and the shared arrays
+BatchJob = tuple[Message, str, Context, Optional[SharedArrayRefs]]
+
+
+@dataclass
+class JobError:
+    """An error raised while running a job of a batch."""
+
+    load_error: bool
+    reason: str
+
+    def to_exception(self) -> Exception:
+        """Return the exception the job would have raised if run on its own."""
+        if self.load_error:
+            return LoadClientAppError(self.reason)
+        return ClientAppException(self.reason)
+
+
+@dataclass
+class ActorUsage:
+    """The resources used by an actor to run client jobs."""
+
+    cpu_time: float
+    wall_time: float
+    peak_memory: int
+
+
+@dataclass
+class ActorPoolMetrics:
+    """Utilization of an actor pool since the previous report."""
+
+    num_actors: int
+    num_idle: int
+    num_waiting: int
+    num_jobs: int
+    utilization: float
+    mean_job_time: float
 
 
 class VirtualClientEngineActor(ABC):
     """Abstract base class for VirtualClientEngine Actors."""
 
+    def __init__(self) -> None:
+        self._cpu_time = 0.0
+        self._wall_time = 0.0
+
     def terminate(self) -> None:
         """Manually terminate Actor object."""
         log(WARNING, "Manually terminating %s", self.__class__.__name__)
         ray.actor.exit_actor()
 
-    def run(
+    def run(  # pylint: disable=R0913, R0914, R0917
         self,
         client_app_fn: ClientAppFn,
         message: Message,
         cid: str,
         context: Context,
+        shared_arrays: Optional[SharedArrayRefs] = None,
     ) -> tuple[str, Message, Context]:
-        """Run a client run."""
+        """Run a client run.
+
+        If `shared_arrays` is set, the data of the arrays it maps (by record and
+        array name) is fetched from the object store into the message first.
+        """
+        if shared_arrays:
+            records = message.content.array_records
+            datas = ray.get(list(shared_arrays.values()))
+            for (record_key, array_key), data in zip(shared_arrays, datas):
+                records[record_key][array_key].data = data
+
         # Pass message through ClientApp and return a message
         # return also cid which is needed to ensure results
         # from the pool are correctly assigned to each ClientProxy
+        start_cpu, start_wall = time.process_time(), time.perf_counter()
         try:
             # Load app
             app: ClientApp = client_app_fn()
@@ -63,8 +126,43 @@ class VirtualClientEngineActor(ABC):
         except Exception as ex:
             raise ClientAppException(str(ex)) from ex
 
+        finally:
+            self._cpu_time += time.process_time() - start_cpu
+            self._wall_time += time.perf_counter() - start_wall
+
         return cid, out_message, context
 
+    def usage(self) -> ActorUsage:
+        """Return the CPU and wall time spent running jobs and the peak memory."""
+        peak_memory = 0
+        if resource is not None:
+            peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # Reported in kilobytes on Linux and in bytes on macOS
+            if sys.platform != "darwin":
+                peak_memory *= 1024
+        return ActorUsage(self._cpu_time, self._wall_time, peak_memory)
+
+    def run_batch(
+        self, client_app_fn: ClientAppFn, jobs: list[BatchJob]
+    ) -> list[tuple[Optional[Message], Context, Optional[JobError]]]:
+        """Run a batch of client runs back to back.
+
+        For each job, return the output message (or `None` if the job failed), the
+        updated context and the error raised by the job, if any.
+        """
+        results: list[tuple[Optional[Message], Context, Optional[JobError]]] = []
+        for message, cid, context, shared_arrays in jobs:
+            try:
+                _, out_message, context = self.run(
+                    client_app_fn, message, cid, context, shared_arrays
+                )
+                results.append((out_message, context, None))
+            except LoadClientAppError as load_ex:
+                results.append((None, context, JobError(True, str(load_ex))))
+            except ClientAppException as ex:
+                results.append((None, context, JobError(False, str(ex.__cause__))))
+        return results
+
 
 @ray.remote
 class ClientAppActor(VirtualClientEngineActor):
@@ -401,8 +499,13 @@ class VirtualClientEngineActorPool(ActorPool):
         return self._fetch_future_result(cid)
 
 
-class BasicActorPool:
-    """A basic actor pool."""
+class BasicActorPool:  # pylint: disable=R0902
+    """A basic actor pool.
+
+    The pool can be resized while jobs are running. Submitting a job waits for an actor
+    to be idle, and the actors removed from the pool while busy are terminated once
+    their job is completed.
+    """
 
     def __init__(
         self,
@@ -411,17 +514,24 @@ class BasicActorPool:
         actor_kwargs: dict[str, Any],
     ):
         self.client_resources = client_resources
+        # The resources of the actors added to the pool from now on
+        self.actor_resources = dict(client_resources)
 
         # Queue of idle actors
         self.pool: list[VirtualClientEngineActor] = []
         self.num_actors = 0
+        # All actors in the pool and the resources each of them holds
+        self._actors: dict[Any, dict[str, Union[int, float]]] = {}
+        self._num_to_remove = 0
+        self._num_waiting = 0
+        self._cond = threading.Condition()
 
         # Resolve arguments to pass during actor init
         actor_args = {} if actor_kwargs is None else actor_kwargs
 
         # A function that creates an actor
         self.create_actor_fn = lambda: actor_type.options(  # type: ignore
-            **client_resources
+            **self.actor_resources
         ).remote(**actor_args)
 
         # Figure out how many actors can be created given the cluster resources
@@ -429,6 +539,12 @@ class BasicActorPool:
         self.actors_capacity = pool_size_from_resources(client_resources)
         self._future_to_actor: dict[Any, VirtualClientEngineActor] = {}
 
+        # Utilization since the last call to `metrics()`
+        self._future_to_start: dict[Any, float] = {}
+        self._window_start = time.monotonic()
+        self._busy_time = 0.0
+        self._num_jobs = 0
+
     def is_actor_available(self) -> bool:
         """Return true if there is an idle actor."""
         return len(self.pool) > 0
@@ -439,9 +555,60 @@ class BasicActorPool:
         This method may be executed also if new resources are added to your Ray cluster
         (e.g. you add a new node).
         """
-        for _ in range(num_actors):
-            self.pool.append(self.create_actor_fn())  # type: ignore
-        self.num_actors += num_actors
+        with self._cond:
+            for _ in range(num_actors):
+                actor = self.create_actor_fn()  # type: ignore
+                self._actors[actor] = dict(self.actor_resources)
+                self.pool.append(actor)
+            self.num_actors += num_actors
+            self._cond.notify_all()
+
+    def resize(self, num_actors: int) -> None:
+        """Add or remove actors so that the pool holds `num_actors` actors.
+
+        Idle actors holding the most resources are removed first. If not enough actors
+        are idle, the remaining ones are removed once their job is completed.
+        """
+        with self._cond:
+            diff = num_actors - (self.num_actors - self._num_to_remove)
+            if diff > 0:
+                # Cancel pending removals first
+                kept = min(diff, self._num_to_remove)
+                self._num_to_remove -= kept
+                self.add_actors_to_pool(diff - kept)
+                return
+
+            self.pool.sort(key=lambda actor: self._actors[actor].get("num_cpus", 0))
+            for _ in range(-diff):
+                if self.pool:
+                    self._terminate_actor(self.pool.pop())
+                else:
+                    self._num_to_remove += 1
+
+    def repack(self, max_actors: int) -> int:
+        """Replace the idle actors reserving more CPUs than `actor_resources`.
+
+        The CPUs they free are used by new actors reserving the CPUs set in
+        `actor_resources`, without the pool exceeding `max_actors` actors. Return the
+        number of actors added.
+        """
+        with self._cond:
+            num_cpus = self.actor_resources["num_cpus"]
+            larger = [
+                actor
+                for actor in self.pool
+                if self._actors[actor].get("num_cpus", 0) > num_cpus
+            ]
+            if not larger:
+                return 0
+            freed_cpus = 0.0
+            for actor in larger:
+                freed_cpus += self._actors[actor]["num_cpus"]
+                self.pool.remove(actor)
+                self._terminate_actor(actor)
+            num_new = min(int(freed_cpus / num_cpus), max_actors - self.num_actors)
+            self.add_actors_to_pool(num_new)
+            return num_new
 
     def terminate_all_actors(self) -> None:
         """Terminate actors in pool."""
@@ -452,24 +619,104 @@ class BasicActorPool:
 
         log(DEBUG, "Terminated %i actors", num_terminated)
 
+    def _terminate_actor(self, actor: VirtualClientEngineActor) -> None:
+        """Terminate an actor removed from the pool."""
+        actor.terminate.remote()  # type: ignore
+        del self._actors[actor]
+        self.num_actors -= 1
+
+    def _pop_idle_actor(self) -> VirtualClientEngineActor:
+        """Remove an idle actor from the pool, waiting for one if needed."""
+        with self._cond:
+            self._num_waiting += 1
+            self._cond.wait_for(lambda: len(self.pool) > 0)
+            self._num_waiting -= 1
+            return self.pool.pop()
+
+    def _track_future(self, future: Any, actor: VirtualClientEngineActor) -> None:
+        """Keep track of the actor running a future and of when it started."""
+        with self._cond:
+            self._future_to_actor[future] = actor
+            self._future_to_start[future] = time.monotonic()
+
     def submit(
         self, actor_fn: Any, job: tuple[ClientAppFn, Message, str, Context]
     ) -> Any:
         """On idle actor, submit job and return future."""
         # Remove idle actor from pool
-        actor = self.pool.pop()
+        actor = self._pop_idle_actor()
         # Submit job to actor
         app_fn, mssg, cid, context = job
         future = actor_fn(actor, app_fn, mssg, cid, context)
         # Keep track of future:actor (so we can fetch the actor upon job completion
         # and add it back to the pool)
-        self._future_to_actor[future] = actor
+        self._track_future(future, actor)
+        return future
+
+    def submit_batch(self, app_fn: ClientAppFn, jobs: list[BatchJob]) -> Any:
+        """On idle actor, submit a batch of jobs and return future."""
+        # Remove idle actor from pool
+        actor = self._pop_idle_actor()
+        # Submit the jobs to the actor, to be run back to back
+        future = actor.run_batch.remote(app_fn, jobs)  # type: ignore
+        self._track_future(future, actor)
         return future
 
     def add_actor_back_to_pool(self, future: Any) -> None:
         """Ad actor assigned to run future back into the pool."""
-        actor = self._future_to_actor.pop(future)
-        self.pool.append(actor)
+        with self._cond:
+            actor = self._future_to_actor.pop(future)
+            start = max(self._future_to_start.pop(future), self._window_start)
+            self._busy_time += time.monotonic() - start
+            self._num_jobs += 1
+            if self._num_to_remove > 0:
+                self._num_to_remove -= 1
+                self._terminate_actor(actor)
+                return
+            self.pool.append(actor)
+            self._cond.notify()
+
+    def collect_usage(self, timeout: float) -> list[ActorUsage]:
+        """Collect the resource usage of the actors that answer within `timeout`.
+
+        Busy actors answer once their current job is completed.
+        """
+        with self._cond:
+            actors = list(self._actors)
+        futures = [actor.usage.remote() for actor in actors]
+        ready, _ = ray.wait(futures, num_returns=len(futures), timeout=timeout)
+        usages: list[ActorUsage] = []
+        for future in ready:
+            try:
+                usages.append(ray.get(future))
+            except ray.exceptions.RayActorError:
+                # The actor was terminated in the meantime
+                continue
+        return usages
+
+    def metrics(self) -> ActorPoolMetrics:
+        """Return the utilization of the pool since the previous call."""
+        with self._cond:
+            now = time.monotonic()
+            busy_time = self._busy_time + sum(
+                now - max(start, self._window_start)
+                for start in self._future_to_start.values()
+            )
+            capacity = (now - self._window_start) * self.num_actors
+            metrics = ActorPoolMetrics(
+                num_actors=self.num_actors,
+                num_idle=len(self.pool),
+                num_waiting=self._num_waiting,
+                num_jobs=self._num_jobs,
+                utilization=min(1.0, busy_time / capacity) if capacity > 0 else 0.0,
+                mean_job_time=(
+                    self._busy_time / self._num_jobs if self._num_jobs else 0.0
+                ),
+            )
+            self._window_start = now
+            self._busy_time = 0.0
+            self._num_jobs = 0
+            return metrics
 
     def fetch_result_and_return_actor_to_pool(
         self, future: Any
@@ -481,3 +728,12 @@ class BasicActorPool:
         # Get actor that ran job
         self.add_actor_back_to_pool(future)
         return out_mssg, updated_context
+
+    def fetch_batch_result_and_return_actor_to_pool(
+        self, future: Any
+    ) -> list[tuple[Optional[Message], Context, Optional[JobError]]]:
+        """Pull the results of a batch given a future and add actor back to pool."""
+        results: list[tuple[Optional[Message], Context, Optional[JobError]]]
+        results = ray.get(future)
+        self.add_actor_back_to_pool(future)
+        return results
@@ -172,14 +172,19 @@ def run_simulation(
         ServerApp and receive a Message describing what the ClientApp should perform.
 
     backend_name : str (default: ray)
-        A simulation backend that runs `ClientApp` objects.
+        A simulation backend that runs `ClientApp` objects. Either `ray`, or
+        `process` to run them in a pool of local worker processes.
 
     backend_config : Optional[BackendConfig]
         'A dictionary to configure a backend. Separate dictionaries to configure
         different elements of backend. Supported top-level keys are `init_args`
         for values parsed to initialisation of backend, `client_resources`
-        to define the resources for clients, and `actor` to define the actor
-        parameters. Values supported in <value> are those included by
+        to define the resources for clients, `actor` to define the actor
+        parameters (set `autoscale` to resize the actor pool to the observed load,
+        between `min_actors` and `max_actors`), and `context_store` to keep the
+        `Context` of only `cache_size` nodes in memory and checkpoint their state to
+        the SQLite database at `path` every `checkpoint_interval` seconds. Values
+        supported in <value> are those included by
         `flwr.common.typing.ConfigRecordValues`.
 
     enable_tf_gpu_growth : bool (default: False)
@@ -16,7 +16,7 @@
 
 
 from logging import INFO
-from typing import Optional
+from typing import Callable, Optional
 
 import grpc
 
@@ -59,6 +59,7 @@ def run_exec_api_grpc(
     auth_plugin: Optional[ExecAuthPlugin] = None,
     authz_plugin: Optional[ExecAuthzPlugin] = None,
     event_log_plugin: Optional[EventLogWriterPlugin] = None,
+    on_run_created: Optional[Callable[[], None]] = None,
 ) -> grpc.Server:
     """Run Exec API (gRPC, request-response)."""
     executor.set_config(config)
@@ -73,6 +74,7 @@ def run_exec_api_grpc(
         objectstore_factory=objectstore_factory,
         executor=executor,
         auth_plugin=auth_plugin,
+        on_run_created=on_run_created,
     )
     interceptors: list[grpc.ServerInterceptor] = []
     if license_plugin is not None:
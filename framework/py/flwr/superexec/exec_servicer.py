@@ -15,10 +15,9 @@
 """SuperExec API servicer."""
 
 
-import time
 from collections.abc import Generator
 from logging import ERROR, INFO
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 import grpc
 
@@ -71,6 +70,7 @@ class ExecServicer(exec_pb2_grpc.ExecServicer):
         objectstore_factory: ObjectStoreFactory,
         executor: Executor,
         auth_plugin: Optional[ExecAuthPlugin] = None,
+        on_run_created: Optional[Callable[[], None]] = None,
     ) -> None:
         self.linkstate_factory = linkstate_factory
         self.ffs_factory = ffs_factory
@@ -78,6 +78,7 @@ class ExecServicer(exec_pb2_grpc.ExecServicer):
         self.executor = executor
         self.executor.initialize(linkstate_factory, ffs_factory)
         self.auth_plugin = auth_plugin
+        self.on_run_created = on_run_created
 
     def StartRun(
         self, request: StartRunRequest, context: grpc.ServicerContext
@@ -105,6 +106,10 @@ class ExecServicer(exec_pb2_grpc.ExecServicer):
             log(ERROR, "Executor failed to start run")
             return StartRunResponse()
 
+        # Notify the run scheduler
+        if self.on_run_created is not None:
+            self.on_run_created()
+
         return StartRunResponse(run_id=run_id)
 
     def StreamLogs(  # pylint: disable=C0103
@@ -152,7 +157,8 @@ class ExecServicer(exec_pb2_grpc.ExecServicer):
                 self.objectstore_factory.store().delete_objects_in_run(run_id)
                 break
 
-            time.sleep(LOG_STREAM_INTERVAL)  # Sleep briefly to avoid busy waiting
+            # Wait for new logs, while checking the run status periodically
+            state.wait_for_serverapp_log(run_id, after_timestamp, LOG_STREAM_INTERVAL)
 
     def ListRuns(
         self, request: ListRunsRequest, context: grpc.ServicerContext
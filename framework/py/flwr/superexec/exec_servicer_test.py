@@ -82,6 +82,26 @@ def test_start_run() -> None:
     assert response.run_id == 10
 
 
+def test_start_run_notifies_scheduler() -> None:
+    """Test that StartRun notifies the run scheduler once the run is created."""
+    executor = MagicMock()
+    executor.start_run.side_effect = [10, None]
+    on_run_created = Mock()
+    servicer = ExecServicer(
+        Mock(), Mock(), Mock(), executor=executor, on_run_created=on_run_created
+    )
+    request = StartRunRequest()
+    request.fab.content = b"test"
+
+    # Execute & Assert: successful run creation
+    servicer.StartRun(request, MagicMock())
+    on_run_created.assert_called_once()
+
+    # Execute & Assert: failed run creation
+    servicer.StartRun(request, MagicMock())
+    on_run_created.assert_called_once()
+
+
 class TestExecServicer(unittest.TestCase):
     """Test the Exec API servicer."""
 
@@ -0,0 +1,174 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Pre-aggregation of the replies of child nodes."""
+
+
+from collections.abc import Sequence
+from typing import Optional, cast
+
+import numpy as np
+
+from flwr.common import Array, ArrayRecord, MetricRecord, RecordDict
+from flwr.common.typing import MetricRecordValues, NDArray
+
+
+def _get_weight(content: RecordDict, weighting_key: str) -> Optional[float]:
+    """Return the first value of `weighting_key` found in the MetricRecords."""
+    for record in content.metric_records.values():
+        if weighting_key in record:
+            return float(cast(float, record[weighting_key]))
+    return None
+
+
+def aggregate_replies(  # pylint: disable=R0914
+    contents: Sequence[RecordDict], weighting_key: str = "num-examples"
+) -> RecordDict:
+    """Merge the contents of several replies into the content of a single reply.
+
+    ArrayRecords and the numeric values of MetricRecords are averaged, weighted by
+    the value of `weighting_key` found in the MetricRecords of each reply (1 if
+    missing). The weighting key of the merged reply is set to the sum of the weights,
+    so that a strategy averaging replies weighted by `weighting_key` obtains the same
+    result from the merged reply as from the individual replies. ConfigRecords are
+    taken from the first reply.
+
+    Parameters
+    ----------
+    contents : Sequence[RecordDict]
+        The contents of the replies to merge, all holding the same records.
+    weighting_key : str (default: "num-examples")
+        The key of the MetricRecord value used to weight the replies.
+
+    Returns
+    -------
+    RecordDict
+        The merged content.
+
+    Raises
+    ------
+    ValueError
+        If the replies do not hold the same ArrayRecords and MetricRecords, with the
+        same keys, array shapes, and metric value lengths.
+    """
+    if not contents:
+        raise ValueError("At least one reply is required.")
+    _check_same_structure(contents)
+    weights = [
+        w if (w := _get_weight(content, weighting_key)) is not None else 1.0
+        for content in contents
+    ]
+    total_weight = sum(weights)
+    # Avoid dividing by zero if all replies were computed on zero examples
+    scale = 1.0 / total_weight if total_weight > 0 else 0.0
+
+    merged = RecordDict()
+    first = contents[0]
+    for name in first.array_records:
+        merged[name] = _average_array_records(
+            [content.array_records[name] for content in contents], weights, scale
+        )
+    for name, metric_record in first.metric_records.items():
+        records = [content.metric_records[name] for content in contents]
+        merged_metrics = MetricRecord()
+        for key in metric_record:
+            if key == weighting_key:
+                total = sum(cast(float, record[key]) for record in records)
+                is_int = all(isinstance(record[key], int) for record in records)
+                merged_metrics[key] = int(total) if is_int else float(total)
+                continue
+            merged_metrics[key] = _average_metric(
+                [record[key] for record in records], weights, scale
+            )
+        merged[name] = merged_metrics
+    for name, config_record in first.config_records.items():
+        merged[name] = config_record
+    return merged
+
+
+def _check_same_structure(contents: Sequence[RecordDict]) -> None:
+    """Raise a ValueError if the replies cannot be averaged with each other."""
+    first = contents[0]
+    for idx, content in enumerate(contents[1:], start=1):
+        if set(content.array_records) != set(first.array_records):
+            raise ValueError(
+                f"Reply {idx} holds the ArrayRecords {sorted(content.array_records)}, "
+                f"but reply 0 holds {sorted(first.array_records)}."
+            )
+        if set(content.metric_records) != set(first.metric_records):
+            raise ValueError(
+                f"Reply {idx} holds the MetricRecords "
+                f"{sorted(content.metric_records)}, but reply 0 holds "
+                f"{sorted(first.metric_records)}."
+            )
+        for name, array_record in first.array_records.items():
+            other_arrays = content.array_records[name]
+            if list(other_arrays) != list(array_record):
+                raise ValueError(
+                    f"ArrayRecord '{name}' of reply {idx} holds the keys "
+                    f"{list(other_arrays)}, but reply 0 holds {list(array_record)}."
+                )
+            for key, array in array_record.items():
+                if other_arrays[key].shape != array.shape:
+                    raise ValueError(
+                        f"Array '{key}' of ArrayRecord '{name}' has shape "
+                        f"{other_arrays[key].shape} in reply {idx}, but {array.shape} "
+                        "in reply 0."
+                    )
+        for name, metric_record in first.metric_records.items():
+            other_metrics = content.metric_records[name]
+            if set(other_metrics) != set(metric_record):
+                raise ValueError(
+                    f"MetricRecord '{name}' of reply {idx} holds the keys "
+                    f"{sorted(other_metrics)}, but reply 0 holds "
+                    f"{sorted(metric_record)}."
+                )
+            for key, value in metric_record.items():
+                if _metric_length(other_metrics[key]) != _metric_length(value):
+                    raise ValueError(
+                        f"Metric '{key}' of MetricRecord '{name}' has a different "
+                        f"length in reply {idx} than in reply 0."
+                    )
+
+
+def _metric_length(value: MetricRecordValues) -> Optional[int]:
+    """Return the length of a list metric, or None for a scalar metric."""
+    return len(value) if isinstance(value, list) else None
+
+
+def _average_array_records(
+    records: Sequence[ArrayRecord], weights: Sequence[float], scale: float
+) -> ArrayRecord:
+    """Return the weighted average of ArrayRecords holding the same keys."""
+    averaged = ArrayRecord()
+    for key, first_array in records[0].items():
+        reference = first_array.numpy()
+        # Accumulate in place to only hold one array of the record at a time
+        total: NDArray = np.zeros(reference.shape, dtype=np.float64)
+        for record, weight in zip(records, weights):
+            total += weight * record[key].numpy()
+        total *= scale
+        averaged[key] = Array(total.astype(reference.dtype, copy=False))
+    return averaged
+
+
+def _average_metric(
+    values: Sequence[MetricRecordValues], weights: Sequence[float], scale: float
+) -> MetricRecordValues:
+    """Return the weighted average of metric values, element-wise for lists."""
+    stacked = np.asarray(values, dtype=np.float64)
+    averaged = np.tensordot(np.asarray(weights), stacked, axes=1) * scale
+    if isinstance(values[0], list):
+        return cast(list[float], averaged.tolist())
+    return float(averaged)
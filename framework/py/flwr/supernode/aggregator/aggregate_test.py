@@ -0,0 +1,109 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the pre-aggregation of replies."""
+
+
+import numpy as np
+import pytest
+
+from flwr.common import ArrayRecord, ConfigRecord, MetricRecord, RecordDict
+
+from .aggregate import aggregate_replies
+
+
+def _content(value: float, num_examples: int) -> RecordDict:
+    return RecordDict(
+        {
+            "arrays": ArrayRecord([np.full((2, 2), value, dtype=np.float32)]),
+            "metrics": MetricRecord(
+                {"num-examples": num_examples, "loss": value, "acc": [value, 1.0]}
+            ),
+            "config": ConfigRecord({"round": 3}),
+        }
+    )
+
+
+def test_aggregate_replies_weighted() -> None:
+    """Test that replies are averaged weighted by their number of examples."""
+    # Prepare
+    contents = [_content(1.0, 10), _content(4.0, 30)]
+
+    # Execute
+    merged = aggregate_replies(contents)
+
+    # Assert
+    arrays = merged.array_records["arrays"].to_numpy_ndarrays()
+    metrics = merged.metric_records["metrics"]
+    assert arrays[0].dtype == np.float32
+    np.testing.assert_allclose(arrays[0], np.full((2, 2), 3.25))
+    assert metrics["num-examples"] == 40
+    assert metrics["loss"] == 3.25
+    assert metrics["acc"] == [3.25, 1.0]
+    assert merged.config_records["config"]["round"] == 3
+
+
+def test_aggregate_replies_is_exact_for_weighted_averages() -> None:
+    """Test that merging then averaging equals averaging all replies."""
+    # Prepare
+    contents = [_content(float(i), i + 1) for i in range(6)]
+
+    # Execute
+    merged = aggregate_replies(
+        [aggregate_replies(contents[:2]), aggregate_replies(contents[2:])]
+    )
+
+    # Assert
+    expected = aggregate_replies(contents)
+    np.testing.assert_allclose(
+        merged.array_records["arrays"].to_numpy_ndarrays()[0],
+        expected.array_records["arrays"].to_numpy_ndarrays()[0],
+        rtol=1e-6,
+    )
+    assert merged.metric_records["metrics"]["num-examples"] == 21
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        RecordDict({"arrays": ArrayRecord([np.zeros((2, 2), dtype=np.float32)])}),
+        RecordDict(
+            {
+                "arrays": ArrayRecord([np.zeros((2, 2), dtype=np.float32)]),
+                "metrics": MetricRecord({"num-examples": 1, "loss": 1.0}),
+            }
+        ),
+        RecordDict(
+            {
+                "arrays": ArrayRecord([np.zeros((3,), dtype=np.float32)]),
+                "metrics": MetricRecord(
+                    {"num-examples": 1, "loss": 1.0, "acc": [1.0, 1.0]}
+                ),
+            }
+        ),
+        RecordDict(
+            {
+                "arrays": ArrayRecord([np.zeros((2, 2), dtype=np.float32)]),
+                "metrics": MetricRecord(
+                    {"num-examples": 1, "loss": 1.0, "acc": [1.0, 1.0, 1.0]}
+                ),
+            }
+        ),
+    ],
+)
+def test_aggregate_replies_rejects_mismatched_replies(other: RecordDict) -> None:
+    """Test that replies holding different records, keys, or shapes are rejected."""
+    # Execute & Assert
+    with pytest.raises(ValueError):
+        aggregate_replies([_content(1.0, 10), other])
@@ -0,0 +1,312 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""SuperNode relaying messages to child SuperNodes and merging their replies."""
+
+
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import ERROR, INFO, WARN
+from typing import Optional, cast
+
+import grpc
+
+from flwr.common import GRPC_MAX_MESSAGE_LENGTH, ConfigRecord, Error, Message
+from flwr.common.constant import SUPERLINK_NODE_ID, ErrorCode, MessageType, Status
+from flwr.common.grpc import generic_create_grpc_server
+from flwr.common.inflatable import (
+    get_all_nested_objects,
+    get_object_tree,
+    iterate_object_tree,
+    no_object_id_recompute,
+)
+from flwr.common.inflatable_utils import inflate_object_from_contents
+from flwr.common.logger import log
+from flwr.common.typing import Run, RunStatus
+from flwr.proto.fleet_pb2_grpc import add_FleetServicer_to_server
+from flwr.server.superlink.fleet.grpc_rere.fleet_servicer import FleetServicer
+from flwr.server.superlink.linkstate import LinkState, LinkStateFactory
+from flwr.supercore.ffs import FfsFactory
+from flwr.supercore.object_store import (
+    NoObjectInStoreError,
+    ObjectStore,
+    ObjectStoreFactory,
+)
+
+from .aggregate import aggregate_replies
+
+# Fraction of the remaining TTL of an instruction given to the child nodes, the rest
+# is left to merge their replies and push the result upstream
+CHILD_TTL_FRACTION = 0.9
+
+
+class IntermediateAggregator:  # pylint: disable=R0902
+    """Relay instruction Messages to child SuperNodes and merge their replies.
+
+    The aggregator acts as a SuperLink for the SuperNodes connecting to its Fleet
+    API. It reuses the `LinkState` and `ObjectStore` of the SuperLink: every
+    TRAIN instruction received from upstream is sent to all online child nodes, and
+    their replies are merged by `aggregate_replies` into a single reply. Merging is
+    exact for strategies averaging replies weighted by `weighting_key`, such as
+    `FedAvg`, and reduces the traffic to the upstream SuperLink by the number of child
+    nodes. Other instructions (e.g., EVALUATE or QUERY) are sent to a single child
+    node chosen at random, whose reply is forwarded without merging.
+
+    Parameters
+    ----------
+    ffs_factory : FfsFactory
+        The factory of the Ffs holding the FABs of the runs relayed to child nodes.
+    weighting_key : str (default: "num-examples")
+        The key of the MetricRecord value used to weight the replies.
+    pull_interval : float (default: 0.1)
+        Sleep duration between checks for replies of the child nodes.
+    max_workers : Optional[int] (default: None)
+        The maximum number of instructions relayed concurrently by `submit`. If None,
+        the default of `ThreadPoolExecutor` is used.
+    """
+
+    def __init__(
+        self,
+        ffs_factory: FfsFactory,
+        weighting_key: str = "num-examples",
+        pull_interval: float = 0.1,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.state_factory = LinkStateFactory(":flwr-in-memory-state:")
+        self.objectstore_factory = ObjectStoreFactory()
+        self.ffs_factory = ffs_factory
+        self.weighting_key = weighting_key
+        self.pull_interval = pull_interval
+        # Map the ID of upstream runs to the ID of the runs of the child nodes
+        self._run_ids: dict[int, int] = {}
+        self._run_ids_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="relay"
+        )
+        self._stop_event = threading.Event()
+
+    def start_fleet_api(
+        self,
+        address: str,
+        certificates: Optional[tuple[bytes, bytes, bytes]] = None,
+    ) -> grpc.Server:
+        """Start the Fleet API (gRPC-rere) serving the child nodes."""
+        fleet_servicer = FleetServicer(
+            state_factory=self.state_factory,
+            ffs_factory=self.ffs_factory,
+            objectstore_factory=self.objectstore_factory,
+        )
+        fleet_grpc_server = generic_create_grpc_server(
+            servicer_and_add_fn=(fleet_servicer, add_FleetServicer_to_server),
+            server_address=address,
+            max_message_length=GRPC_MAX_MESSAGE_LENGTH,
+            certificates=certificates,
+        )
+        log(INFO, "Starting Fleet API (gRPC-rere) for child SuperNodes on %s", address)
+        fleet_grpc_server.start()
+        return fleet_grpc_server
+
+    def submit(self, message: Message, run: Run) -> Future[Message]:
+        """Relay `message` on a worker thread and return the future of its reply.
+
+        Relaying waits for the child nodes for most of the TTL of `message`, so it must
+        not block the loop pulling instructions from upstream. The future never raises:
+        unexpected errors are replied as an error to `message`.
+        """
+        return self._executor.submit(self._relay_safely, message, run)
+
+    def shutdown(self) -> None:
+        """Stop waiting for the replies of child nodes and release the workers."""
+        self._stop_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _relay_safely(self, message: Message, run: Run) -> Message:
+        """Relay `message`, replying with an error if relaying raised."""
+        try:
+            return self.relay(message, run)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            message_id = message.metadata.message_id
+            log(ERROR, "Failed to relay message %s: %s", message_id, err)
+            return _error_reply(
+                message, f"Failed to relay the message: {err}", code=ErrorCode.UNKNOWN
+            )
+
+    def relay(self, message: Message, run: Run) -> Message:  # pylint: disable=R0912,R0914
+        """Send `message` to the child nodes and return the reply to `message`."""
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+        run_id = self._get_run_id(state, run)
+
+        node_ids = state.get_nodes(run_id)
+        if not node_ids:
+            return _error_reply(message, "No child SuperNode is online.")
+        # Only the replies to TRAIN instructions are merged, other replies (e.g.,
+        # evaluation metrics or query results) are forwarded from a single child node
+        is_train = message.metadata.message_type.split(".")[0] == MessageType.TRAIN
+        if not is_train:
+            node_ids = {random.choice(sorted(node_ids))}
+
+        remaining = message.metadata.created_at + message.metadata.ttl - time.time()
+        child_ttl = CHILD_TTL_FRACTION * remaining
+        message_ids = self._push_messages(
+            state, store, message, run_id, node_ids, child_ttl
+        )
+
+        # Pull the replies until all child nodes replied or the TTL expired
+        deadline = time.time() + child_ttl
+        replies: list[Message] = []
+        pending = set(message_ids)
+        incomplete: list[Message] = []
+        while pending or incomplete:
+            res_messages = state.get_message_res(message_ids=pending)
+            state.delete_messages(
+                {msg.metadata.reply_to_message_id for msg in res_messages}
+            )
+            pending -= {msg.metadata.reply_to_message_id for msg in res_messages}
+            # The objects of a reply may still be pushed by its node
+            incomplete.extend(res_messages)
+            still_incomplete = []
+            for reply in incomplete:
+                if (inflated := _inflate_reply(store, reply)) is not None:
+                    replies.append(inflated)
+                else:
+                    still_incomplete.append(reply)
+            incomplete = still_incomplete
+            if time.time() >= deadline or self._stop_event.is_set():
+                break
+            if pending or incomplete:
+                self._stop_event.wait(self.pull_interval)
+
+        # Discard the instructions left unanswered
+        state.delete_messages(pending)
+        for message_id in message_ids:
+            store.delete(message_id)
+        if pending:
+            log(WARN, "%s of %s child nodes did not reply", len(pending), len(node_ids))
+
+        contents = [reply.content for reply in replies if not reply.has_error()]
+        if not contents:
+            errors = [reply.error for reply in replies if reply.has_error()]
+            if errors:
+                return _set_message_id(Message(errors[0], reply_to=message))
+            return _error_reply(message, "No child SuperNode replied.")
+        if not is_train:
+            return _set_message_id(Message(contents[0], reply_to=message))
+
+        try:
+            content = aggregate_replies(contents, self.weighting_key)
+        except ValueError as err:
+            log(WARN, "Failed to merge the replies of child nodes: %s", err)
+            return _error_reply(
+                message,
+                f"Failed to merge the replies of child nodes: {err}",
+                code=ErrorCode.UNKNOWN,
+            )
+        return _set_message_id(Message(content, reply_to=message))
+
+    def _get_run_id(self, state: LinkState, run: Run) -> int:
+        """Return the ID of the run relayed to child nodes, creating it if needed."""
+        with self._run_ids_lock:
+            if (run_id := self._run_ids.get(run.run_id)) is not None:
+                return run_id
+            run_id = state.create_run(
+                run.fab_id,
+                run.fab_version,
+                run.fab_hash,
+                run.override_config,
+                ConfigRecord(),
+                run.flwr_aid,
+            )
+            state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+            state.update_run_status(run_id, RunStatus(Status.RUNNING, "", ""))
+            self._run_ids[run.run_id] = run_id
+            return run_id
+
+    def _push_messages(  # pylint: disable=R0913,R0917
+        self,
+        state: LinkState,
+        store: ObjectStore,
+        message: Message,
+        run_id: int,
+        node_ids: set[int],
+        ttl: float,
+    ) -> list[str]:
+        """Store a copy of `message` for each child node."""
+        message_ids: list[str] = []
+        content_objects: dict[str, bytes] = {}
+        with no_object_id_recompute():
+            for node_id in node_ids:
+                msg = Message(
+                    message.content,
+                    dst_node_id=node_id,
+                    message_type=message.metadata.message_type,
+                    ttl=ttl,
+                    group_id=message.metadata.group_id,
+                )
+                msg.metadata.__dict__["_run_id"] = run_id
+                msg.metadata.__dict__["_src_node_id"] = SUPERLINK_NODE_ID
+                msg.metadata.__dict__["_message_id"] = msg.object_id
+                if state.store_message_ins(msg) is None:
+                    continue
+                store.preregister(run_id, get_object_tree(msg))
+                # The content is shared by all copies, so it is only deflated once
+                if not content_objects:
+                    content_objects = {
+                        obj_id: obj.deflate()
+                        for obj_id, obj in get_all_nested_objects(
+                            message.content
+                        ).items()
+                    }
+                    for obj_id, obj_content in content_objects.items():
+                        store.put(obj_id, obj_content)
+                store.put(msg.object_id, msg.deflate())
+                message_ids.append(msg.object_id)
+        return message_ids
+
+
+def _inflate_reply(store: ObjectStore, reply: Message) -> Optional[Message]:
+    """Inflate a reply from the ObjectStore, or return None if it is incomplete."""
+    # Replies generated by the LinkState carry their error and no objects
+    if reply.metadata.src_node_id == SUPERLINK_NODE_ID:
+        return reply
+    message_id = reply.metadata.message_id
+    try:
+        tree = store.get_object_tree(message_id)
+    except NoObjectInStoreError:
+        return None
+    contents: dict[str, bytes] = {}
+    for node in iterate_object_tree(tree):
+        if not (content := store.get(node.object_id)):
+            return None
+        contents[node.object_id] = content
+    inflated = cast(Message, inflate_object_from_contents(message_id, contents))
+    inflated.metadata.__dict__["_message_id"] = message_id
+    store.delete(message_id)
+    return inflated
+
+
+def _error_reply(
+    message: Message, reason: str, code: int = ErrorCode.NODE_UNAVAILABLE
+) -> Message:
+    """Return a reply to `message` carrying an error (NODE_UNAVAILABLE by default)."""
+    error = Error(code, reason)
+    return _set_message_id(Message(error, reply_to=message))
+
+
+def _set_message_id(message: Message) -> Message:
+    """Set the ID of a reply, as done by the ClientApp for the replies it pushes."""
+    message.metadata.__dict__["_message_id"] = message.object_id
+    return message
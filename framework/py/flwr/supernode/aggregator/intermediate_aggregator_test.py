@@ -0,0 +1,226 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for IntermediateAggregator."""
+
+
+import threading
+import time
+from typing import Optional
+from unittest.mock import Mock
+
+import numpy as np
+
+from flwr.common import ArrayRecord, Message, MetricRecord, RecordDict
+from flwr.common.constant import ErrorCode, Status
+from flwr.common.inflatable import get_all_nested_objects, get_object_tree
+from flwr.common.typing import Run, RunStatus
+
+from .intermediate_aggregator import IntermediateAggregator
+
+
+def _run() -> Run:
+    return Run(
+        run_id=123,
+        fab_id="",
+        fab_version="",
+        fab_hash="hash",
+        override_config={},
+        pending_at="",
+        starting_at="",
+        running_at="",
+        finished_at="",
+        status=RunStatus(Status.RUNNING, "", ""),
+        flwr_aid="",
+    )
+
+
+def _instruction(message_type: str = "train") -> Message:
+    content = RecordDict({"arrays": ArrayRecord([np.zeros(3)])})
+    message = Message(content, dst_node_id=7, message_type=message_type, ttl=10.0)
+    message.metadata.__dict__["_run_id"] = 123
+    message.metadata.__dict__["_message_id"] = message.object_id
+    return message
+
+
+def _reply_as_child(
+    aggregator: IntermediateAggregator,
+    node_id: int,
+    num_examples: int,
+    metrics: Optional[dict[str, float]] = None,
+) -> None:
+    """Pull the instruction of a child node and push its reply."""
+    state = aggregator.state_factory.state()
+    while not (messages := state.get_message_ins(node_id=node_id, limit=1)):
+        time.sleep(0.01)
+    _push_reply(aggregator, messages[0], num_examples, metrics)
+
+
+def _reply_as_any_child(
+    aggregator: IntermediateAggregator, node_ids: list[int], num_examples: int
+) -> None:
+    """Pull the first instruction sent to any of the child nodes and push its reply."""
+    state = aggregator.state_factory.state()
+    while True:
+        for node_id in node_ids:
+            if messages := state.get_message_ins(node_id=node_id, limit=1):
+                _push_reply(aggregator, messages[0], num_examples)
+                return
+        time.sleep(0.01)
+
+
+def _push_reply(
+    aggregator: IntermediateAggregator,
+    instruction: Message,
+    num_examples: int,
+    metrics: Optional[dict[str, float]] = None,
+) -> None:
+    """Push the reply of a child node to `instruction`."""
+    state = aggregator.state_factory.state()
+    store = aggregator.objectstore_factory.store()
+    content = RecordDict(
+        {
+            "arrays": ArrayRecord([np.full(3, float(num_examples))]),
+            "metrics": MetricRecord({"num-examples": num_examples, **(metrics or {})}),
+        }
+    )
+    reply = Message(content, reply_to=instruction)
+    reply.metadata.__dict__["_message_id"] = reply.object_id
+    state.store_message_res(reply)
+    store.preregister(instruction.metadata.run_id, get_object_tree(reply))
+    for obj_id, obj in get_all_nested_objects(reply).items():
+        store.put(obj_id, obj.deflate())
+
+
+def test_relay_merges_replies_of_child_nodes() -> None:
+    """Test that the replies of all child nodes are merged into one reply."""
+    # Prepare
+    aggregator = IntermediateAggregator(Mock(), pull_interval=0.01)
+    state = aggregator.state_factory.state()
+    node_ids = [state.create_node(heartbeat_interval=30) for _ in range(3)]
+    instruction = _instruction()
+    threads = [
+        threading.Thread(target=_reply_as_child, args=(aggregator, node_id, i + 1))
+        for i, node_id in enumerate(node_ids)
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Execute
+    reply = aggregator.relay(instruction, _run())
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    expected = (1 * 1 + 2 * 2 + 3 * 3) / 6
+    assert reply.metadata.reply_to_message_id == instruction.metadata.message_id
+    assert reply.metadata.message_id == reply.object_id
+    assert reply.content.metric_records["metrics"]["num-examples"] == 6
+    np.testing.assert_allclose(
+        reply.content.array_records["arrays"].to_numpy_ndarrays()[0],
+        np.full(3, expected),
+    )
+    assert len(aggregator.objectstore_factory.store()) == 0
+
+
+def test_relay_without_child_nodes() -> None:
+    """Test that an error is replied when no child node is online."""
+    # Prepare
+    aggregator = IntermediateAggregator(Mock())
+    instruction = _instruction()
+
+    # Execute
+    reply = aggregator.relay(instruction, _run())
+
+    # Assert
+    assert reply.has_error()
+    assert reply.error.code == ErrorCode.NODE_UNAVAILABLE
+
+
+def test_relay_with_mismatched_replies() -> None:
+    """Test that an error is replied when the replies of child nodes differ."""
+    # Prepare
+    aggregator = IntermediateAggregator(Mock(), pull_interval=0.01)
+    state = aggregator.state_factory.state()
+    node_ids = [state.create_node(heartbeat_interval=30) for _ in range(2)]
+    instruction = _instruction()
+    threads = [
+        threading.Thread(
+            target=_reply_as_child, args=(aggregator, node_ids[0], 1, {"acc": 0.5})
+        ),
+        threading.Thread(target=_reply_as_child, args=(aggregator, node_ids[1], 2)),
+    ]
+    for thread in threads:
+        thread.start()
+
+    # Execute
+    reply = aggregator.relay(instruction, _run())
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert reply.has_error()
+    assert reply.error.code == ErrorCode.UNKNOWN
+    assert reply.metadata.reply_to_message_id == instruction.metadata.message_id
+    assert len(aggregator.objectstore_factory.store()) == 0
+
+
+def test_relay_forwards_evaluate_reply_without_merging() -> None:
+    """Test that a non-TRAIN instruction is sent to one child node and its reply is
+    forwarded as is."""
+    # Prepare
+    aggregator = IntermediateAggregator(Mock(), pull_interval=0.01)
+    state = aggregator.state_factory.state()
+    node_ids = [state.create_node(heartbeat_interval=30) for _ in range(3)]
+    instruction = _instruction(message_type="evaluate")
+    thread = threading.Thread(
+        target=_reply_as_any_child, args=(aggregator, node_ids, 5)
+    )
+    thread.start()
+
+    # Execute
+    reply = aggregator.relay(instruction, _run())
+    thread.join()
+
+    # Assert
+    assert not reply.has_error()
+    assert reply.metadata.reply_to_message_id == instruction.metadata.message_id
+    assert reply.content.metric_records["metrics"]["num-examples"] == 5
+    np.testing.assert_allclose(
+        reply.content.array_records["arrays"].to_numpy_ndarrays()[0], np.full(3, 5.0)
+    )
+    assert all(
+        not state.get_message_ins(node_id=node_id, limit=None) for node_id in node_ids
+    )
+
+
+def test_submit_relays_in_background() -> None:
+    """Test that `submit` returns before the child nodes reply."""
+    # Prepare
+    aggregator = IntermediateAggregator(Mock(), pull_interval=0.01)
+    state = aggregator.state_factory.state()
+    node_id = state.create_node(heartbeat_interval=30)
+    instruction = _instruction()
+
+    # Execute
+    future = aggregator.submit(instruction, _run())
+    assert not future.done()
+    _reply_as_child(aggregator, node_id, 2)
+    reply = future.result(timeout=5.0)
+    aggregator.shutdown()
+
+    # Assert
+    assert not reply.has_error()
+    assert reply.metadata.reply_to_message_id == instruction.metadata.message_id
+    assert reply.content.metric_records["metrics"]["num-examples"] == 2
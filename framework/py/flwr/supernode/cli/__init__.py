@@ -15,10 +15,26 @@
 """Flower command line interface for SuperNode."""
 
 
-from .flower_supernode import flower_supernode
-from .flwr_clientapp import flwr_clientapp
+from typing import TYPE_CHECKING
+
+from flwr.common.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .flower_supernode import flower_supernode as flower_supernode
+    from .flwr_clientapp import flwr_clientapp as flwr_clientapp
 
 __all__ = [
     "flower_supernode",
     "flwr_clientapp",
 ]
+
+# Only import the entry point that is run, `flwr-clientapp` does not need the
+# SuperNode to start
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_attributes(
+        __name__,
+        {
+            "flower_supernode": ".flower_supernode",
+            "flwr_clientapp": ".flwr_clientapp",
+        },
+    )
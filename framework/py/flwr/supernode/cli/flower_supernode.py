@@ -79,6 +79,7 @@ def flower_supernode() -> None:
         flwr_path=args.flwr_dir,
         isolation=args.isolation,
         clientappio_api_address=args.clientappio_api_address,
+        aggregator_api_address=args.aggregator_api_address,
     )
 
 
@@ -118,6 +119,14 @@ def _parse_args_run_supernode() -> argparse.ArgumentParser:
         help="ClientAppIo API (gRPC) server address (IPv4, IPv6, or a domain name). "
         f"By default, it is set to {CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS}.",
     )
+    parser.add_argument(
+        "--aggregator-api-address",
+        default=None,
+        help="Run the SuperNode as an intermediate aggregator serving the Fleet API "
+        "(gRPC-rere, insecure) to child SuperNodes at this address. Messages are "
+        "relayed to the child SuperNodes and their replies are merged, weighted by "
+        "`num-examples`, into a single reply to the SuperLink.",
+    )
 
     return parser
 
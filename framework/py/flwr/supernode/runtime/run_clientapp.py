@@ -25,7 +25,6 @@ from typing import Optional
 import grpc
 
 from flwr.app.error import Error
-from flwr.cli.install import install_from_fab
 from flwr.client.client_app import ClientApp, LoadClientAppError
 from flwr.client.clientapp.utils import get_load_client_app_fn
 from flwr.common import Context, Message
@@ -101,6 +100,11 @@ def run_clientapp(  # pylint: disable=R0913, R0914, R0917
             # Install FAB, if provided
             if fab:
                 log(DEBUG, "[flwr-clientapp] Start FAB installation.")
+                # Only import the CLI (typer) when a FAB is installed
+                from flwr.cli.install import (  # pylint: disable=import-outside-toplevel
+                    install_from_fab,
+                )
+
                 install_from_fab(fab.content, flwr_dir=flwr_dir_, skip_prompt=True)
 
             load_client_app_fn = get_load_client_app_fn(
@@ -19,6 +19,7 @@ import os
 import subprocess
 import time
 from collections.abc import Iterator
+from concurrent.futures import Future
 from contextlib import contextmanager
 from logging import INFO, WARN
 from pathlib import Path
@@ -59,6 +60,7 @@ from flwr.common.typing import Fab, Run, RunNotRunningException, UserConfig
 from flwr.proto.clientappio_pb2_grpc import add_ClientAppIoServicer_to_server
 from flwr.supercore.ffs import Ffs, FfsFactory
 from flwr.supercore.object_store import ObjectStore, ObjectStoreFactory
+from flwr.supernode.aggregator import IntermediateAggregator
 from flwr.supernode.nodestate import NodeState, NodeStateFactory
 from flwr.supernode.servicer.clientappio import ClientAppIoServicer
 
@@ -85,6 +87,7 @@ def start_client_internal(
     flwr_path: Optional[Path] = None,
     isolation: str = ISOLATION_MODE_SUBPROCESS,
     clientappio_api_address: str = CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS,
+    aggregator_api_address: Optional[str] = None,
 ) -> None:
     """Start a Flower client node which connects to a Flower server.
 
@@ -133,6 +136,11 @@ def start_client_internal(
     clientappio_api_address : str
         (default: `CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS`)
         The SuperNode gRPC server address.
+    aggregator_api_address : Optional[str] (default: None)
+        If set, the SuperNode acts as an intermediate aggregator instead of running
+        a `ClientApp`: it serves the Fleet API (gRPC-rere) to child SuperNodes at
+        this address, relays every message to them, and sends a single reply
+        merging their replies to the SuperLink.
     """
     if insecure is None:
         insecure = root_certificates is None
@@ -151,11 +159,22 @@ def start_client_internal(
         certificates=None,
     )
 
+    grpc_servers = [clientappio_server]
+
+    # Launch the Fleet API server for child SuperNodes
+    aggregator: Optional[IntermediateAggregator] = None
+    exit_handlers: list[Callable[[], None]] = []
+    if aggregator_api_address is not None:
+        aggregator = IntermediateAggregator(ffs_factory)
+        grpc_servers.append(aggregator.start_fleet_api(aggregator_api_address))
+        exit_handlers.append(aggregator.shutdown)
+
     # Register handlers for graceful shutdown
     register_exit_handlers(
         event_type=EventType.RUN_SUPERNODE_LEAVE,
         exit_message="SuperNode terminated gracefully.",
-        grpc_servers=[clientappio_server],
+        grpc_servers=grpc_servers,
+        exit_handlers=exit_handlers,
     )
 
     # Initialize NodeState, Ffs, and ObjectStore
@@ -180,6 +199,9 @@ def start_client_internal(
             raise ValueError("Failed to register SuperNode with the SuperLink")
         state.set_node_id(node_id)
 
+        # Replies of the instructions being relayed to child SuperNodes
+        relays: dict[str, Future[Message]] = {}
+
         # pylint: disable=too-many-nested-blocks
         while True:
             # The signature of the function will change after
@@ -204,7 +226,14 @@ def start_client_internal(
             # Mode 1: SuperNode starts ClientApp as subprocess
             start_subprocess = isolation == ISOLATION_MODE_SUBPROCESS
 
-            if start_subprocess and run_id is not None:
+            if aggregator is not None:
+                _relay_messages(
+                    state=state,
+                    object_store=store,
+                    aggregator=aggregator,
+                    relays=relays,
+                )
+            elif start_subprocess and run_id is not None:
                 _octet, _colon, _port = clientappio_api_address.rpartition(":")
                 io_address = (
                     f"{CLIENT_OCTET}:{_port}"
@@ -323,6 +352,31 @@ def _pull_and_store_message(  # pylint: disable=too-many-positional-arguments
     return run_id
 
 
+def _relay_messages(
+    state: NodeState,
+    object_store: ObjectStore,
+    aggregator: IntermediateAggregator,
+    relays: dict[str, Future[Message]],
+) -> None:
+    """Relay pulled messages to the child SuperNodes and store the finished replies.
+
+    Relaying runs in the background, `relays` maps the ID of the messages being
+    relayed to the future of their reply.
+    """
+    for message in state.get_messages(is_reply=False):
+        run = state.get_run(message.metadata.run_id)
+        if run is None:
+            continue
+        relays[message.metadata.message_id] = aggregator.submit(message, run)
+
+    for message_id, future in list(relays.items()):
+        if not future.done():
+            continue
+        del relays[message_id]
+        state.store_message(future.result())
+        object_store.delete(message_id)
+
+
 def _push_messages(
     state: NodeState,
     send: Callable[[Message], None],